@@ -93,6 +93,7 @@ from .checkpoints import (
 from .communication import (
     AgentMailbox,
     MessageBus,
+    MessageLog,
     CommunicationChannel,
     MessageProtocol,
     MessageFactory,
@@ -145,6 +146,7 @@ __all__ = [
     # Communication
     "AgentMailbox",
     "MessageBus",
+    "MessageLog",
     "CommunicationChannel",
     "MessageProtocol",
     "MessageFactory",
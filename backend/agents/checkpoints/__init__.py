@@ -6,8 +6,10 @@ from .manager import (
     create_checkpoint_manager,
     create_hitl_controller,
 )
+from .scheduler import DeadlineHeap
 
 __all__ = [
     "CheckpointRule", "CheckpointManager", "HITLController",
     "create_checkpoint_manager", "create_hitl_controller",
+    "DeadlineHeap",
 ]
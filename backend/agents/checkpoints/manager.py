@@ -10,6 +10,7 @@ Principle: GOUVERNANCE > EXÉCUTION — Human approval for sensitive actions
 
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
+import asyncio
 import logging
 import threading
 import uuid
@@ -21,6 +22,7 @@ from ..core.models import (
     AgentAction,
     ActionType,
 )
+from .scheduler import DeadlineHeap
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +59,10 @@ class CheckpointRule:
             return True  # Fail safe: require checkpoint
 
 
+# Types that need an external decision; the rest resolve automatically
+HUMAN_CHECKPOINT_TYPES = {CheckpointType.HITL, CheckpointType.APPROVAL}
+
+
 # ============================================================================
 # CHECKPOINT MANAGER
 # ============================================================================
@@ -72,6 +78,10 @@ class CheckpointManager:
     - Supports HITL (Human-In-The-Loop)
     - Logs all decisions for audit
     
+    Pending checkpoints are indexed by agent and their timeouts sit in a
+    deadline heap, so check_timeout only touches what is due. Callers can
+    await wait_for_resolution until a decision or the timeout arrives.
+    
     Architecture:
     
         ┌─────────────────────────────────────────────────────────┐
@@ -108,13 +118,16 @@ class CheckpointManager:
         
         if checkpoint:
             # Wait for resolution
-            status = manager.wait_for_resolution(checkpoint.checkpoint_id)
+            status = await manager.wait_for_resolution(checkpoint.checkpoint_id)
     """
     
     def __init__(self):
         self._rules: List[CheckpointRule] = []
         self._checkpoints: Dict[str, Checkpoint] = {}
         self._pending: Dict[str, Checkpoint] = {}
+        self._pending_by_agent: Dict[str, Dict[str, Checkpoint]] = {}
+        self._deadlines = DeadlineHeap()
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
         self._lock = threading.Lock()
         
         # Resolution handlers
@@ -235,6 +248,9 @@ class CheckpointManager:
         with self._lock:
             self._checkpoints[checkpoint.checkpoint_id] = checkpoint
             self._pending[checkpoint.checkpoint_id] = checkpoint
+            self._pending_by_agent.setdefault(agent_id, {})[checkpoint.checkpoint_id] = checkpoint
+            if checkpoint.timeout_at:
+                self._deadlines.push(checkpoint.checkpoint_id, checkpoint.timeout_at)
         
         logger.info(
             f"Checkpoint created: {checkpoint.checkpoint_id} "
@@ -262,8 +278,9 @@ class CheckpointManager:
             checkpoint.resolved_by = resolved_by
             checkpoint.resolution_notes = notes
             
-            if checkpoint_id in self._pending:
-                del self._pending[checkpoint_id]
+            self._remove_pending(checkpoint)
+        
+        self._notify_waiters(checkpoint)
         
         logger.info(
             f"Checkpoint resolved: {checkpoint_id} -> {status.value} "
@@ -316,8 +333,9 @@ class CheckpointManager:
             checkpoint.status = CheckpointStatus.ESCALATED
             checkpoint.resolved_at = datetime.utcnow()
             
-            if checkpoint_id in self._pending:
-                del self._pending[checkpoint_id]
+            self._remove_pending(checkpoint)
+        
+        self._notify_waiters(checkpoint)
         
         logger.info(f"Checkpoint escalated: {checkpoint_id} -> {escalated_to}")
         
@@ -357,7 +375,7 @@ class CheckpointManager:
         self.resolve(checkpoint.checkpoint_id, status, "auto")
         return status
     
-    def wait_for_resolution(
+    async def wait_for_resolution(
         self,
         checkpoint_id: str,
         timeout_seconds: float = 60,
@@ -365,17 +383,48 @@ class CheckpointManager:
         """
         Wait for a checkpoint to be resolved.
         
-        In production, this would be async with webhooks/polling.
+        Human checkpoints (HITL, APPROVAL) suspend until approve, deny or
+        escalate is called, or until the wait times out. If the
+        checkpoint's own deadline has passed by then it is expired as
+        TIMEOUT; otherwise the current status (PENDING) is returned.
+        Other checkpoint types resolve automatically.
         """
         checkpoint = self._checkpoints.get(checkpoint_id)
         if checkpoint is None:
             raise ValueError(f"Checkpoint not found: {checkpoint_id}")
         
-        if checkpoint.is_resolved:
+        if checkpoint_id not in self._pending:
+            return checkpoint.status
+        
+        if checkpoint.checkpoint_type not in HUMAN_CHECKPOINT_TYPES:
+            return self.auto_resolve(checkpoint)
+        
+        wait = timeout_seconds
+        if checkpoint.timeout_at:
+            until_deadline = (checkpoint.timeout_at - datetime.utcnow()).total_seconds()
+            wait = max(0.0, min(wait, until_deadline))
+        
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            still_pending = checkpoint_id in self._pending
+            if still_pending:
+                self._waiters.setdefault(checkpoint_id, []).append(future)
+        
+        if not still_pending:
             return checkpoint.status
         
-        # For now, auto-resolve
-        return self.auto_resolve(checkpoint)
+        try:
+            return await asyncio.wait_for(future, wait)
+        except asyncio.TimeoutError:
+            self.check_timeout()
+            return checkpoint.status
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(checkpoint_id)
+                if waiters and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiters[checkpoint_id]
     
     def get_checkpoint(self, checkpoint_id: str) -> Optional[Checkpoint]:
         """Get checkpoint by ID"""
@@ -387,24 +436,88 @@ class CheckpointManager:
     
     def get_pending_for_agent(self, agent_id: str) -> List[Checkpoint]:
         """Get pending checkpoints for an agent"""
-        return [c for c in self._pending.values() if c.agent_id == agent_id]
+        return list(self._pending_by_agent.get(agent_id, {}).values())
+    
+    def next_timeout(self) -> Optional[datetime]:
+        """Earliest pending checkpoint deadline, or None"""
+        with self._lock:
+            return self._deadlines.next_deadline()
     
     def check_timeout(self) -> List[Checkpoint]:
-        """Check for timed out checkpoints"""
+        """Expire checkpoints whose deadline has passed"""
         now = datetime.utcnow()
         timed_out = []
         
         with self._lock:
-            for checkpoint_id, checkpoint in list(self._pending.items()):
-                if checkpoint.timeout_at and checkpoint.timeout_at < now:
-                    checkpoint.status = CheckpointStatus.TIMEOUT
-                    checkpoint.resolved_at = now
-                    checkpoint.resolved_by = "system"
-                    checkpoint.resolution_notes = "Timeout"
-                    del self._pending[checkpoint_id]
-                    timed_out.append(checkpoint)
+            for checkpoint_id in self._deadlines.pop_due(now):
+                checkpoint = self._pending.get(checkpoint_id)
+                if checkpoint is None:
+                    continue
+                checkpoint.status = CheckpointStatus.TIMEOUT
+                checkpoint.resolved_at = now
+                checkpoint.resolved_by = "system"
+                checkpoint.resolution_notes = "Timeout"
+                self._remove_pending(checkpoint)
+                timed_out.append(checkpoint)
+        
+        for checkpoint in timed_out:
+            self._notify_waiters(checkpoint)
         
         return timed_out
+    
+    async def run_timeout_scheduler(
+        self,
+        stop_event: Optional[asyncio.Event] = None,
+        max_sleep_seconds: float = 60,
+    ) -> None:
+        """
+        Background task that fires check_timeout at each deadline.
+        
+        Sleeps until the next deadline (capped at max_sleep_seconds so
+        newly created checkpoints are picked up) instead of polling.
+        """
+        stop_event = stop_event or asyncio.Event()
+        
+        while not stop_event.is_set():
+            self.check_timeout()
+            
+            next_deadline = self.next_timeout()
+            sleep_for = max_sleep_seconds
+            if next_deadline is not None:
+                until_deadline = (next_deadline - datetime.utcnow()).total_seconds()
+                sleep_for = max(0.0, min(sleep_for, until_deadline))
+            
+            try:
+                await asyncio.wait_for(stop_event.wait(), sleep_for)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _remove_pending(self, checkpoint: Checkpoint) -> None:
+        """Drop a checkpoint from the pending indexes (caller holds the lock)"""
+        checkpoint_id = checkpoint.checkpoint_id
+        self._pending.pop(checkpoint_id, None)
+        self._deadlines.cancel(checkpoint_id)
+        
+        agent_pending = self._pending_by_agent.get(checkpoint.agent_id)
+        if agent_pending is not None:
+            agent_pending.pop(checkpoint_id, None)
+            if not agent_pending:
+                del self._pending_by_agent[checkpoint.agent_id]
+    
+    def _notify_waiters(self, checkpoint: Checkpoint) -> None:
+        """Wake coroutines awaiting this checkpoint"""
+        with self._lock:
+            waiters = self._waiters.pop(checkpoint.checkpoint_id, [])
+        
+        for future in waiters:
+            future.get_loop().call_soon_threadsafe(
+                _set_future_result, future, checkpoint.status,
+            )
+
+
+def _set_future_result(future: asyncio.Future, status: CheckpointStatus) -> None:
+    if not future.done():
+        future.set_result(status)
 
 
 # ============================================================================
@@ -0,0 +1,15 @@
+"""
+============================================================================
+CHE·NU™ V69 — CHECKPOINT DEADLINE SCHEDULER
+============================================================================
+DeadlineHeap lives in app.core.deadlines so the app CheckpointService can
+use it without importing the agents package.
+============================================================================
+"""
+
+try:
+    from ...app.core.deadlines import DeadlineHeap
+except ImportError:  # imported as a top-level package
+    from app.core.deadlines import DeadlineHeap
+
+__all__ = ["DeadlineHeap"]
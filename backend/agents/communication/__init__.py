@@ -2,6 +2,7 @@
 from .messaging import (
     AgentMailbox,
     MessageBus,
+    MessageLog,
     CommunicationChannel,
     MessageProtocol,
     MessageFactory,
@@ -10,7 +11,7 @@ from .messaging import (
 )
 
 __all__ = [
-    "AgentMailbox", "MessageBus", "CommunicationChannel",
+    "AgentMailbox", "MessageBus", "MessageLog", "CommunicationChannel",
     "MessageProtocol", "MessageFactory",
     "create_message_bus", "create_channel",
 ]
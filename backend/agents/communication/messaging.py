@@ -9,11 +9,11 @@ Principle: Structured communication with full traceability
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Set
-from collections import defaultdict
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Union
+from collections import OrderedDict, defaultdict
+import asyncio
 import logging
-import threading
-import queue
 import uuid
 
 from ..core.models import (
@@ -24,6 +24,82 @@ from ..core.models import (
 logger = logging.getLogger(__name__)
 
 
+# Highest priority first
+PRIORITY_ORDER: List[MessagePriority] = [
+    MessagePriority.CRITICAL,
+    MessagePriority.URGENT,
+    MessagePriority.HIGH,
+    MessagePriority.NORMAL,
+    MessagePriority.LOW,
+]
+
+DEFAULT_MAILBOX_RETENTION = 1000
+DEFAULT_BUS_RETENTION = 10000
+
+
+# ============================================================================
+# MESSAGE LOG
+# ============================================================================
+
+class MessageLog:
+    """
+    Append-only JSONL log for messages evicted from memory.
+    
+    Retention limits keep mailboxes and the bus bounded; evicted
+    messages are spilled here so traceability is preserved. Without
+    a path, evicted messages are only counted.
+    
+    The append handle is opened once and kept open; writes are
+    buffered and reach the file on flush(), close() or when the
+    log is read back.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+        self.spilled_count = 0
+        self._file: Optional[IO[str]] = None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+    
+    def append(self, message: AgentMessage) -> None:
+        """Append a message to the log"""
+        self.spilled_count += 1
+        if self.path is None:
+            return
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(message.model_dump_json() + "\n")
+    
+    def flush(self) -> None:
+        """Push buffered lines to the file"""
+        if self._file is not None:
+            self._file.flush()
+    
+    def close(self) -> None:
+        """Flush and release the append handle (reopened on next append)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __iter__(self) -> Iterator[AgentMessage]:
+        if self.path is None:
+            return
+        self.flush()
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield AgentMessage.model_validate_json(line)
+    
+    def find(self, message_id: str) -> Optional[AgentMessage]:
+        """Find a spilled message (cold path: scans the log)"""
+        for message in self:
+            if message.message_id == message_id:
+                return message
+        return None
+
+
 # ============================================================================
 # MESSAGE QUEUE
 # ============================================================================
@@ -33,56 +109,149 @@ class AgentMailbox:
     Mailbox for an individual agent.
     
     Stores incoming messages and tracks delivery/read status.
+    
+    Unread messages sit in one FIFO bucket per MessagePriority, and
+    every retained message is indexed by id, so reads, lookups and
+    mark_read are O(1). Read messages beyond `max_retained` are
+    evicted oldest-first to the message log; unread mail is never
+    dropped. Messages still present in `index` (the bus index) are
+    left for the bus to spill, so each message is logged once.
     """
     
-    def __init__(self, agent_id: str):
+    def __init__(
+        self,
+        agent_id: str,
+        max_retained: int = DEFAULT_MAILBOX_RETENTION,
+        log: Optional[MessageLog] = None,
+        index: Optional[Mapping[str, AgentMessage]] = None,
+    ):
         self.agent_id = agent_id
-        self._inbox: List[AgentMessage] = []
-        self._outbox: List[AgentMessage] = []
-        self._lock = threading.Lock()
+        self.max_retained = max_retained
+        self._log = log or MessageLog()
+        self._index: Mapping[str, AgentMessage] = index if index is not None else {}
+        self._inbox: Dict[str, AgentMessage] = {}
+        self._outbox: "OrderedDict[str, AgentMessage]" = OrderedDict()
+        self._unread: Dict[MessagePriority, "OrderedDict[str, AgentMessage]"] = {
+            priority: OrderedDict() for priority in PRIORITY_ORDER
+        }
+        self._read_order: "OrderedDict[str, None]" = OrderedDict()
+        self._unread_count = 0
+        self._arrival: Optional[asyncio.Event] = None
     
     def receive(self, message: AgentMessage) -> None:
         """Receive a message"""
-        with self._lock:
-            message.delivered = True
-            message.delivered_at = datetime.utcnow()
-            self._inbox.append(message)
+        message.delivered = True
+        message.delivered_at = datetime.utcnow()
+        self._inbox[message.message_id] = message
+        
+        if message.read:
+            self._read_order[message.message_id] = None
+        else:
+            self._unread[message.priority][message.message_id] = message
+            self._unread_count += 1
+            if self._arrival is not None:
+                self._arrival.set()
+        
+        self._enforce_retention()
     
     def send(self, message: AgentMessage) -> None:
         """Record sent message"""
-        with self._lock:
-            self._outbox.append(message)
+        self._outbox[message.message_id] = message
+        # The recipient's inbox owns spilling; the outbox only indexes
+        while len(self._outbox) > self.max_retained:
+            self._outbox.popitem(last=False)
     
     def get_unread(self) -> List[AgentMessage]:
-        """Get unread messages"""
-        with self._lock:
-            return [m for m in self._inbox if not m.read]
+        """Get unread messages, highest priority first"""
+        unread: List[AgentMessage] = []
+        for priority in PRIORITY_ORDER:
+            unread.extend(self._unread[priority].values())
+        return unread
     
     def get_by_priority(self, priority: MessagePriority) -> List[AgentMessage]:
         """Get messages by priority"""
-        with self._lock:
-            return [m for m in self._inbox if m.priority == priority and not m.read]
+        return list(self._unread[priority].values())
+    
+    def get_all(self) -> List[AgentMessage]:
+        """Get all retained inbox messages in arrival order"""
+        return list(self._inbox.values())
     
     def mark_read(self, message_id: str) -> None:
         """Mark a message as read"""
-        with self._lock:
-            for msg in self._inbox:
-                if msg.message_id == message_id:
-                    msg.read = True
-                    msg.read_at = datetime.utcnow()
-                    break
+        msg = self._inbox.get(message_id)
+        if msg is None or msg.read:
+            return
+        
+        msg.read = True
+        msg.read_at = datetime.utcnow()
+        del self._unread[msg.priority][message_id]
+        self._unread_count -= 1
+        self._read_order[message_id] = None
+        
+        self._enforce_retention()
     
     def get_message(self, message_id: str) -> Optional[AgentMessage]:
         """Get a specific message"""
-        with self._lock:
-            for msg in self._inbox + self._outbox:
-                if msg.message_id == message_id:
-                    return msg
+        return self._inbox.get(message_id) or self._outbox.get(message_id)
+    
+    def retains(self, message_id: str) -> bool:
+        """Whether the inbox still holds a message"""
+        return message_id in self._inbox
+    
+    def pop_next(self) -> Optional[AgentMessage]:
+        """Take the highest-priority unread message and mark it read"""
+        if not self._unread_count:
+            return None
+        for priority in PRIORITY_ORDER:
+            bucket = self._unread[priority]
+            if bucket:
+                message = next(iter(bucket.values()))
+                self.mark_read(message.message_id)
+                return message
         return None
     
+    async def next_message(self, timeout_seconds: Optional[float] = None) -> Optional[AgentMessage]:
+        """
+        Await the next unread message (highest priority first).
+        
+        Returns None if nothing arrives within the timeout.
+        """
+        if self._arrival is None:
+            self._arrival = asyncio.Event()
+        
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout_seconds is None else loop.time() + timeout_seconds
+        
+        while not self._unread_count:
+            self._arrival.clear()
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._arrival.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+        
+        return self.pop_next()
+    
+    def _enforce_retention(self) -> None:
+        """Spill oldest read messages once the inbox exceeds retention"""
+        while len(self._inbox) > self.max_retained and self._read_order:
+            message_id, _ = self._read_order.popitem(last=False)
+            evicted = self._inbox.pop(message_id, None)
+            if evicted is not None and message_id not in self._index:
+                self._log.append(evicted)
+    
+    def spill(self) -> None:
+        """Spill every retained inbox message the bus no longer indexes"""
+        for message_id, message in self._inbox.items():
+            if message_id not in self._index:
+                self._log.append(message)
+        self._inbox.clear()
+    
     @property
     def unread_count(self) -> int:
-        return len(self.get_unread())
+        return self._unread_count
 
 
 # ============================================================================
@@ -99,6 +268,13 @@ class MessageBus:
     - Priority queuing
     - Message persistence
     - Delivery tracking
+    - Awaitable request/reply
+    
+    The bus is asyncio-native: it runs on the event loop thread and
+    takes no locks. Recent messages are indexed by id up to
+    `max_retained`; older ones spill to the append-only message log
+    once neither the index nor the recipient's inbox retains them.
+    Call close() to flush the log.
     
     Architecture:
     
@@ -111,9 +287,9 @@ class MessageBus:
         │  Agent C ◀── └─────────┘ ◀── Agent D                   │
         │                   │                                     │
         │                   ▼                                     │
-        │           ┌─────────────┐                              │
-        │           │  MAILBOXES  │                              │
-        │           └─────────────┘                              │
+        │           ┌─────────────┐     ┌─────────────┐          │
+        │           │  MAILBOXES  │ ──▶ │ MESSAGE LOG │          │
+        │           └─────────────┘     └─────────────┘          │
         │                                                         │
         └─────────────────────────────────────────────────────────┘
     
@@ -136,41 +312,58 @@ class MessageBus:
         
         # Receive messages
         messages = bus.get_messages("agent-002")
+        
+        # Or await the next one
+        next_msg = await bus.receive("agent-002", timeout_seconds=5)
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_retained: int = DEFAULT_BUS_RETENTION,
+        mailbox_retention: int = DEFAULT_MAILBOX_RETENTION,
+        log_path: Optional[Union[str, Path]] = None,
+    ):
+        self.max_retained = max_retained
+        self.mailbox_retention = mailbox_retention
+        self._log = MessageLog(log_path)
         self._mailboxes: Dict[str, AgentMailbox] = {}
         self._subscriptions: Dict[str, Set[str]] = defaultdict(set)  # topic -> agents
+        self._agent_topics: Dict[str, Set[str]] = defaultdict(set)  # agent -> topics
         self._message_handlers: Dict[str, Callable] = {}
-        self._lock = threading.Lock()
-        self._all_messages: List[AgentMessage] = []
+        self._messages: "OrderedDict[str, AgentMessage]" = OrderedDict()
+        self._pending_replies: Dict[str, asyncio.Future] = {}
+        self._sent_count = 0
     
     def register_agent(self, agent_id: str) -> AgentMailbox:
         """Register an agent with the message bus"""
-        with self._lock:
-            if agent_id not in self._mailboxes:
-                self._mailboxes[agent_id] = AgentMailbox(agent_id)
+        if agent_id not in self._mailboxes:
+            self._mailboxes[agent_id] = AgentMailbox(
+                agent_id,
+                max_retained=self.mailbox_retention,
+                log=self._log,
+                index=self._messages,
+            )
         return self._mailboxes[agent_id]
     
     def unregister_agent(self, agent_id: str) -> None:
         """Unregister an agent"""
-        with self._lock:
-            if agent_id in self._mailboxes:
-                del self._mailboxes[agent_id]
-            
-            # Remove from subscriptions
-            for topic in self._subscriptions:
-                self._subscriptions[topic].discard(agent_id)
+        mailbox = self._mailboxes.pop(agent_id, None)
+        if mailbox is not None:
+            mailbox.spill()
+        
+        # Remove from subscriptions
+        for topic in self._agent_topics.pop(agent_id, set()):
+            self._subscriptions[topic].discard(agent_id)
     
     def subscribe(self, agent_id: str, topic: str) -> None:
         """Subscribe an agent to a topic"""
-        with self._lock:
-            self._subscriptions[topic].add(agent_id)
+        self._subscriptions[topic].add(agent_id)
+        self._agent_topics[agent_id].add(topic)
     
     def unsubscribe(self, agent_id: str, topic: str) -> None:
         """Unsubscribe an agent from a topic"""
-        with self._lock:
-            self._subscriptions[topic].discard(agent_id)
+        self._subscriptions[topic].discard(agent_id)
+        self._agent_topics[agent_id].discard(topic)
     
     def send(self, message: AgentMessage) -> bool:
         """
@@ -178,27 +371,35 @@ class MessageBus:
         
         Returns True if delivered, False otherwise.
         """
-        with self._lock:
-            # Store message
-            self._all_messages.append(message)
+        # Store message
+        self._store(message)
+        
+        # Record in sender's outbox
+        sender = self._mailboxes.get(message.from_agent_id)
+        if sender is not None:
+            sender.send(message)
+        
+        # Resolve a pending request/reply future
+        if message.reply_to and message.correlation_id:
+            future = self._pending_replies.pop(message.correlation_id, None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        
+        # Deliver to recipient
+        recipient = self._mailboxes.get(message.to_agent_id)
+        if recipient is not None:
+            recipient.receive(message)
             
-            # Record in sender's outbox
-            if message.from_agent_id in self._mailboxes:
-                self._mailboxes[message.from_agent_id].send(message)
+            logger.debug(
+                f"Message {message.message_id} delivered: "
+                f"{message.from_agent_id} -> {message.to_agent_id}"
+            )
             
-            # Deliver to recipient
-            if message.to_agent_id in self._mailboxes:
-                self._mailboxes[message.to_agent_id].receive(message)
-                
-                logger.debug(
-                    f"Message {message.message_id} delivered: "
-                    f"{message.from_agent_id} -> {message.to_agent_id}"
-                )
-                
-                return True
-            else:
-                logger.warning(f"Agent not found: {message.to_agent_id}")
-                return False
+            return True
+        else:
+            logger.warning(f"Agent not found: {message.to_agent_id}")
+            # Dead letter: spilled to the log when it leaves the index
+            return False
     
     def broadcast(self, message: AgentMessage, topic: str) -> int:
         """
@@ -206,7 +407,7 @@ class MessageBus:
         
         Returns number of recipients.
         """
-        subscribers = self._subscriptions.get(topic, set())
+        subscribers = list(self._subscriptions.get(topic, ()))
         delivered = 0
         
         for agent_id in subscribers:
@@ -239,7 +440,16 @@ class MessageBus:
         elif unread_only:
             return mailbox.get_unread()
         else:
-            return mailbox._inbox
+            return mailbox.get_all()
+    
+    async def receive(
+        self,
+        agent_id: str,
+        timeout_seconds: Optional[float] = None,
+    ) -> Optional[AgentMessage]:
+        """Await the next unread message for an agent (highest priority first)"""
+        mailbox = self.register_agent(agent_id)
+        return await mailbox.next_message(timeout_seconds)
     
     def mark_read(self, agent_id: str, message_id: str) -> None:
         """Mark a message as read"""
@@ -251,7 +461,11 @@ class MessageBus:
         """Get an agent's mailbox"""
         return self._mailboxes.get(agent_id)
     
-    def send_and_wait_reply(
+    def get_message(self, message_id: str) -> Optional[AgentMessage]:
+        """Get a retained message by id"""
+        return self._messages.get(message_id)
+    
+    async def send_and_wait_reply(
         self,
         message: AgentMessage,
         timeout_seconds: float = 30,
@@ -259,17 +473,53 @@ class MessageBus:
         """
         Send a message and wait for a reply.
         
-        In production, this would be async.
+        The reply is the first message carrying the same correlation_id
+        with reply_to set (see MessageFactory.create_response). Returns
+        None on timeout or if the message could not be delivered.
         """
         # Set correlation ID
-        correlation_id = message.correlation_id or str(uuid.uuid4())
+        correlation_id = message.correlation_id or message.message_id
         message.correlation_id = correlation_id
         
-        self.send(message)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[correlation_id] = future
         
-        # Wait for reply (simplified)
-        # In production: use async/await or callbacks
-        return None  # Mock
+        try:
+            if not self.send(message):
+                return None
+            return await asyncio.wait_for(future, timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f"No reply to {message.message_id} within {timeout_seconds}s")
+            return None
+        finally:
+            if self._pending_replies.get(correlation_id) is future:
+                del self._pending_replies[correlation_id]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bus statistics"""
+        return {
+            "agents": len(self._mailboxes),
+            "topics": len(self._subscriptions),
+            "messages_sent": self._sent_count,
+            "messages_retained": len(self._messages),
+            "messages_spilled": self._log.spilled_count,
+            "pending_replies": len(self._pending_replies),
+        }
+    
+    def close(self) -> None:
+        """Flush and close the message log"""
+        self._log.close()
+    
+    def _store(self, message: AgentMessage) -> None:
+        """Index a message, spilling the oldest past retention"""
+        self._sent_count += 1
+        self._messages[message.message_id] = message
+        while len(self._messages) > self.max_retained:
+            message_id, evicted = self._messages.popitem(last=False)
+            recipient = self._mailboxes.get(evicted.to_agent_id)
+            # Still in the recipient's inbox: the mailbox spills it later
+            if recipient is None or not recipient.retains(message_id):
+                self._log.append(evicted)
 
 
 # ============================================================================
@@ -457,9 +707,12 @@ class MessageFactory:
 # FACTORY FUNCTIONS
 # ============================================================================
 
-def create_message_bus() -> MessageBus:
+def create_message_bus(
+    max_retained: int = DEFAULT_BUS_RETENTION,
+    log_path: Optional[Union[str, Path]] = None,
+) -> MessageBus:
     """Create a message bus"""
-    return MessageBus()
+    return MessageBus(max_retained=max_retained, log_path=log_path)
 
 
 def create_channel(
@@ -316,6 +316,71 @@ class TestCheckpoints:
         updated = manager.get_checkpoint(checkpoint.checkpoint_id)
         assert updated.status == CheckpointStatus.APPROVED
 
+    def test_check_timeout_and_agent_index(self):
+        manager = CheckpointManager()
+
+        expired = manager.create_checkpoint(
+            agent_id="agent-001",
+            action_id="action-001",
+            checkpoint_type=CheckpointType.HITL,
+            reason="Expires immediately",
+            timeout_minutes=-1,
+        )
+        live = manager.create_checkpoint(
+            agent_id="agent-001",
+            action_id="action-002",
+            checkpoint_type=CheckpointType.HITL,
+            reason="Still open",
+        )
+
+        assert len(manager.get_pending_for_agent("agent-001")) == 2
+
+        timed_out = manager.check_timeout()
+
+        assert [c.checkpoint_id for c in timed_out] == [expired.checkpoint_id]
+        assert expired.status == CheckpointStatus.TIMEOUT
+        assert manager.get_pending_for_agent("agent-001") == [live]
+        assert manager.check_timeout() == []
+        assert manager.next_timeout() == live.timeout_at
+
+    @pytest.mark.asyncio
+    async def test_wait_for_resolution_suspends_until_approved(self):
+        import asyncio
+
+        manager = CheckpointManager()
+        checkpoint = manager.create_checkpoint(
+            agent_id="agent-001",
+            action_id="action-001",
+            checkpoint_type=CheckpointType.HITL,
+            reason="Requires human approval",
+        )
+
+        waiter = asyncio.create_task(
+            manager.wait_for_resolution(checkpoint.checkpoint_id, timeout_seconds=1)
+        )
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        manager.approve(checkpoint.checkpoint_id, "human_user")
+
+        assert await waiter == CheckpointStatus.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_wait_for_resolution_times_out(self):
+        manager = CheckpointManager()
+        checkpoint = manager.create_checkpoint(
+            agent_id="agent-001",
+            action_id="action-001",
+            checkpoint_type=CheckpointType.APPROVAL,
+            reason="Nobody answers",
+            timeout_minutes=-1,
+        )
+
+        status = await manager.wait_for_resolution(checkpoint.checkpoint_id)
+
+        assert status == CheckpointStatus.TIMEOUT
+        assert manager.get_pending() == []
+
 
 # ============================================================================
 # COMMUNICATION TESTS
@@ -388,6 +453,107 @@ class TestCommunication:
         assert response.message_type == MessageProtocol.RESPONSE
         assert response.reply_to == request.message_id
 
+    def test_mailbox_priority_and_unread_count(self):
+        bus = MessageBus()
+
+        bus.register_agent("agent-001")
+        mailbox = bus.register_agent("agent-002")
+
+        low = MessageFactory.create_request(
+            "agent-001", "agent-002", "Low", {}, priority=MessagePriority.LOW,
+        )
+        urgent = MessageFactory.create_request(
+            "agent-001", "agent-002", "Urgent", {}, priority=MessagePriority.URGENT,
+        )
+        bus.send(low)
+        bus.send(urgent)
+
+        assert mailbox.unread_count == 2
+        assert [m.subject for m in bus.get_messages("agent-002")] == ["Urgent", "Low"]
+
+        bus.mark_read("agent-002", urgent.message_id)
+
+        assert mailbox.unread_count == 1
+        assert mailbox.get_message(urgent.message_id).read
+        assert bus.get_messages("agent-002", priority=MessagePriority.URGENT) == []
+
+    def test_mailbox_retention_spills_read_messages(self, tmp_path):
+        log_path = tmp_path / "messages.jsonl"
+        bus = MessageBus(max_retained=2, mailbox_retention=2, log_path=log_path)
+
+        bus.register_agent("agent-001")
+        mailbox = bus.register_agent("agent-002")
+
+        sent = []
+        for i in range(4):
+            msg = MessageFactory.create_request("agent-001", "agent-002", f"M{i}", {})
+            bus.send(msg)
+            bus.mark_read("agent-002", msg.message_id)
+            sent.append(msg)
+
+        assert len(bus.get_messages("agent-002", unread_only=False)) == 2
+        assert mailbox.get_message(sent[0].message_id) is None
+        assert [m.subject for m in mailbox._log] == ["M0", "M1"]
+
+    def test_bus_spills_each_evicted_message_once(self, tmp_path):
+        log_path = tmp_path / "messages.jsonl"
+        bus = MessageBus(max_retained=2, mailbox_retention=2, log_path=log_path)
+
+        bus.register_agent("agent-001")
+        bus.register_agent("agent-002")
+
+        for i in range(4):
+            msg = MessageFactory.create_request("agent-001", "agent-002", f"M{i}", {})
+            bus.send(msg)
+            bus.mark_read("agent-002", msg.message_id)
+        # Dead letters are indexed, then spilled when they leave the index
+        for i in range(3):
+            bus.send(MessageFactory.create_request("agent-001", "nobody", f"D{i}", {}))
+
+        bus.close()
+        lines = log_path.read_text().splitlines()
+        assert [AgentMessage.model_validate_json(line).subject for line in lines] == [
+            "M0", "M1", "D0",
+        ]
+        assert bus.get_stats()["messages_spilled"] == 3
+
+        # Unregistering spills mail that only the mailbox still held
+        bus.unregister_agent("agent-002")
+        assert [m.subject for m in bus._log] == ["M0", "M1", "D0", "M2", "M3"]
+
+    @pytest.mark.asyncio
+    async def test_send_and_wait_reply(self):
+        import asyncio
+
+        bus = MessageBus()
+        bus.register_agent("agent-001")
+        bus.register_agent("agent-002")
+
+        async def responder():
+            request = await bus.receive("agent-002", timeout_seconds=1)
+            bus.send(MessageFactory.create_response(request, {"answer": 42}))
+
+        task = asyncio.create_task(responder())
+        request = MessageFactory.create_request("agent-001", "agent-002", "Question", {})
+        reply = await bus.send_and_wait_reply(request, timeout_seconds=1)
+        await task
+
+        assert reply is not None
+        assert reply.body["answer"] == 42
+        assert reply.reply_to == request.message_id
+
+    @pytest.mark.asyncio
+    async def test_send_and_wait_reply_timeout(self):
+        bus = MessageBus()
+        bus.register_agent("agent-001")
+        bus.register_agent("agent-002")
+
+        request = MessageFactory.create_request("agent-001", "agent-002", "Question", {})
+        reply = await bus.send_and_wait_reply(request, timeout_seconds=0.01)
+
+        assert reply is None
+        assert bus.get_stats()["pending_replies"] == 0
+
 
 # ============================================================================
 # REGISTRY TESTS
@@ -32,6 +32,10 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     
+    # Router startup: "lazy" imports routers on first request, "eager" at boot
+    ROUTER_LOADING: str = Field(default="lazy", description="lazy | eager")
+    ROUTER_WARMUP: bool = False  # Import all lazy routers during lifespan startup
+    
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
     
@@ -103,6 +107,7 @@ class Settings(BaseSettings):
     
     # Rule #1: Human Sovereignty
     CHECKPOINT_TIMEOUT_SECONDS: int = 3600  # 1 hour to approve/reject
+    CHECKPOINT_EXPIRY_MAX_WAIT_SECONDS: float = 60.0  # Longest gap between expiry sweeps
     
     # Rule #5: No Ranking
     DEFAULT_ORDER_BY: str = "created_at"
@@ -133,6 +138,8 @@ class Settings(BaseSettings):
     
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+    LOG_QUEUE_SIZE: int = 10000
+    ACCESS_LOG_SAMPLE_RATE: float = Field(default=1.0, ge=0.0, le=1.0, description="Share of successful requests logged")
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,73 @@
+"""
+============================================================================
+CHE·NU™ V76 — DEADLINE HEAP
+============================================================================
+Version: 1.0.0
+Purpose: Deadline heap for checkpoint timeouts (app CheckpointService and
+         agents CheckpointManager); no dependencies outside the stdlib
+Principle: Expire only what is due — never rescan what is still pending
+============================================================================
+"""
+
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Tuple
+import heapq
+import itertools
+
+
+class DeadlineHeap:
+    """
+    Min-heap of (deadline, key) entries with lazy cancellation.
+
+    push / cancel are O(log n) / O(1); pop_due returns every key whose
+    deadline has passed in O(k log n) for k due entries. Cancelled or
+    rescheduled keys stay in the heap until they surface and are then
+    skipped. Keys may be any hashable id (checkpoint ids are strings
+    here, UUIDs in the governance CheckpointService).
+
+    Usage:
+        deadlines = DeadlineHeap()
+        deadlines.push("cp-001", datetime.utcnow() + timedelta(minutes=5))
+
+        for key in deadlines.pop_due(datetime.utcnow()):
+            expire(key)
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, Hashable]] = []
+        self._live: Dict[Hashable, datetime] = {}
+        self._counter = itertools.count()
+
+    def push(self, key: Hashable, deadline: datetime) -> None:
+        """Schedule (or reschedule) a key"""
+        self._live[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancel a scheduled key"""
+        self._live.pop(key, None)
+
+    def pop_due(self, now: datetime) -> List[Hashable]:
+        """Pop all keys whose deadline is strictly before `now`"""
+        due: List[Hashable] = []
+        while self._heap and self._heap[0][0] < now:
+            deadline, _, key = heapq.heappop(self._heap)
+            if self._live.get(key) == deadline:
+                del self._live[key]
+                due.append(key)
+        return due
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Earliest live deadline, or None"""
+        while self._heap:
+            deadline, _, key = self._heap[0]
+            if self._live.get(key) == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._live
@@ -0,0 +1,109 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CHE·NU™ V76 — NON-BLOCKING LOGGING PIPELINE
+═══════════════════════════════════════════════════════════════════════════════
+Request paths only enqueue log records; a background listener thread
+formats them and performs the I/O.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+import logging
+import queue
+
+DEFAULT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# QUEUE HANDLER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+
+    When the queue is full the record is dropped and counted instead of
+    stalling the event loop behind a slow sink.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SETUP / SHUTDOWN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+_previous_handlers: List[logging.Handler] = []
+_previous_level: int = logging.WARNING
+
+
+def setup_logging(
+    level: str = "INFO",
+    fmt: str = DEFAULT_FORMAT,
+    queue_size: int = 10000,
+    handlers: Optional[List[logging.Handler]] = None,
+) -> QueueListener:
+    """
+    Route the root logger through a bounded queue.
+
+    `handlers` (default: one stderr StreamHandler) run on the listener
+    thread. The root logger's current handlers are set aside until
+    shutdown_logging(). Calling this again returns the running listener.
+    """
+    global _listener, _queue_handler, _previous_handlers, _previous_level
+    if _listener is not None:
+        return _listener
+
+    if not handlers:
+        handlers = [logging.StreamHandler()]
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = DroppingQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    _previous_handlers = list(root.handlers)
+    _previous_level = root.level
+    for handler in _previous_handlers:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the listener and restore the root handlers"""
+    global _listener, _previous_handlers
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for handler in _previous_handlers:
+        root.addHandler(handler)
+    root.setLevel(_previous_level)
+    _previous_handlers = []
+
+
+def get_dropped_count() -> int:
+    """Records dropped because the queue was full"""
+    return _queue_handler.dropped if _queue_handler else 0
@@ -0,0 +1,287 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CHE·NU™ V76 — LAZY ROUTER STARTUP
+═══════════════════════════════════════════════════════════════════════════════
+Routers are declared in a manifest and imported on first use: the first
+request under a router's prefix (or an explicit warm-up) imports and
+mounts it. Import cost is recorded per router module.
+
+Cold-start benchmark:
+    python -m app.core.startup
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import time
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger("chenu.startup")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROUTER MANIFEST
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class RouterSpec:
+    """A router to mount: where it lives and where it is served"""
+    module: str
+    prefix: str
+    tags: List[str]
+    note: str = ""
+    attr: str = "router"
+    # Path prefix that triggers the import (defaults to `prefix`)
+    match: Optional[str] = None
+
+    @property
+    def match_prefix(self) -> str:
+        return self.match or self.prefix
+
+    def matches(self, path: str) -> bool:
+        prefix = self.match_prefix
+        return path == prefix or path.startswith(prefix + "/")
+
+
+ROUTER_MANIFEST: List[RouterSpec] = [
+    # --- AGENT B CORE ROUTERS (Phase B1) ---
+    RouterSpec("app.routers.threads", "/api/v2/threads", ["Threads"]),
+    RouterSpec("app.routers.checkpoints", "/api/v2/checkpoints", ["Checkpoints"], "HTTP 423 active"),
+    RouterSpec("app.routers.dataspace_engine", "/api/v2/dataspace-engine", ["DataSpace Engine"]),
+    RouterSpec("app.routers.nova", "/api/v2/nova", ["Nova Pipeline"]),
+    RouterSpec("app.routers.memory", "/api/v2/memory", ["Memory"]),
+    RouterSpec("app.routers.agents", "/api/v2/agents", ["Agents"], "Rule #4 enforced"),
+    RouterSpec("app.routers.xr", "/api/v2/xr", ["XR Environments"]),
+    RouterSpec("app.routers.files", "/api/v2/files", ["Files"]),
+    # --- AGENT B PHASE B2 ROUTERS ---
+    RouterSpec("app.routers.decisions", "/api/v2/decisions", ["Decisions"], "HTTP 423 active"),
+    RouterSpec("app.routers.identities", "/api/v2/identities", ["Identities"], "9 spheres enforced"),
+    RouterSpec("app.routers.workspaces", "/api/v2/workspaces", ["Workspaces"], "6 bureau sections"),
+    RouterSpec("app.routers.dataspaces", "/api/v2/dataspaces", ["DataSpaces"]),
+    RouterSpec("app.routers.meetings", "/api/v2/meetings", ["Meetings"]),
+    RouterSpec("app.routers.notifications", "/api/v2/notifications", ["Notifications"]),
+    # --- AGENT A PHASE B2/C ROUTERS ---
+    RouterSpec("app.routers.spheres", "/api/v2/spheres", ["Spheres"], "Rule #7: 9 spheres"),
+    RouterSpec("app.routers.layout_engine", "/api/v2/layout-engine", ["Layout Engine"]),
+    RouterSpec("app.routers.oneclick_engine", "/api/v2/oneclick-engine", ["OneClick Engine"]),
+    RouterSpec("app.routers.ocw", "/api/v2/ocw", ["OCW"]),
+    # --- ORIGIN-GENESIS-ULTIMA MODULE ---
+    RouterSpec(
+        "app.api.routes.origin_routes", "/api/v2", ["ORIGIN-GENESIS"],
+        "21 expert agents, 25 endpoints", match="/api/v2/origin",
+    ),
+    # --- AT-OM MAPPING SYSTEM ---
+    RouterSpec("app.routers.atom", "/api/v2/atom", ["AT-OM Mapping"], "8 endpoints, Vibration Engine"),
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LAZY REGISTRY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class RouterLoad:
+    """Outcome of importing one router module"""
+    module: str
+    prefix: str
+    seconds: float
+    new_modules: int
+    mounted: bool
+    error: Optional[str] = None
+    loaded_at: float = field(default_factory=time.time)
+
+
+def _import_router(spec: RouterSpec) -> Tuple[Any, RouterLoad]:
+    """Import a router module, timing it (safe to run in a worker thread)"""
+    before = len(sys.modules)
+    start = time.perf_counter()
+    router, error = None, None
+    try:
+        router = getattr(importlib.import_module(spec.module), spec.attr)
+    except Exception as e:  # a broken router must not take the API down
+        error = str(e)
+    load = RouterLoad(
+        module=spec.module,
+        prefix=spec.prefix,
+        seconds=time.perf_counter() - start,
+        new_modules=len(sys.modules) - before,
+        mounted=router is not None,
+        error=error,
+    )
+    return router, load
+
+
+class LazyRouterRegistry:
+    """
+    Mount manifest routers on demand.
+
+    Nothing is imported at construction. `ensure_loaded(path)` mounts
+    the routers serving a path; `warm_up()` mounts everything (used for
+    eager mode, explicit warm-up and OpenAPI generation).
+    """
+
+    def __init__(self, app: FastAPI, manifest: Optional[List[RouterSpec]] = None):
+        self.app = app
+        self._pending: List[RouterSpec] = list(manifest if manifest is not None else ROUTER_MANIFEST)
+        self._loads: Dict[str, RouterLoad] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> List[RouterSpec]:
+        return list(self._pending)
+
+    def _mount(self, spec: RouterSpec, router: Any, load: RouterLoad) -> None:
+        self._loads[spec.module] = load
+        if spec in self._pending:
+            self._pending.remove(spec)
+
+        if router is None:
+            logger.warning(f"⚠️ {spec.module} router not available: {load.error}")
+            return
+
+        self.app.include_router(router, prefix=spec.prefix, tags=spec.tags)
+        # Regenerate the OpenAPI schema with the new routes
+        self.app.openapi_schema = None
+        note = f" ({spec.note})" if spec.note else ""
+        logger.info(f"✅ {spec.module} router registered{note} in {load.seconds * 1000:.1f}ms")
+
+    def _matching(self, path: str) -> List[RouterSpec]:
+        return [spec for spec in self._pending if spec.matches(path)]
+
+    async def ensure_loaded(self, path: str) -> None:
+        """Mount the routers serving `path`, importing off the event loop"""
+        if not self._pending or not self._matching(path):
+            return
+        async with self._lock:
+            for spec in self._matching(path):
+                router, load = await asyncio.to_thread(_import_router, spec)
+                self._mount(spec, router, load)
+
+    def warm_up(self) -> List[RouterLoad]:
+        """Import and mount every pending router now"""
+        for spec in list(self._pending):
+            router, load = _import_router(spec)
+            self._mount(spec, router, load)
+        return self.report()
+
+    async def warm_up_async(self) -> List[RouterLoad]:
+        """warm_up() without blocking the event loop"""
+        async with self._lock:
+            for spec in list(self._pending):
+                router, load = await asyncio.to_thread(_import_router, spec)
+                self._mount(spec, router, load)
+        return self.report()
+
+    def report(self) -> List[RouterLoad]:
+        """Per-module import cost, slowest first"""
+        return sorted(self._loads.values(), key=lambda load: load.seconds, reverse=True)
+
+    def summary(self) -> Dict[str, Any]:
+        loads = self.report()
+        return {
+            "loaded": sum(1 for load in loads if load.mounted),
+            "failed": sum(1 for load in loads if not load.mounted),
+            "pending": [spec.module for spec in self._pending],
+            "total_import_ms": round(sum(load.seconds for load in loads) * 1000, 1),
+            "modules": [
+                {
+                    "module": load.module,
+                    "prefix": load.prefix,
+                    "import_ms": round(load.seconds * 1000, 1),
+                    "new_modules": load.new_modules,
+                    "mounted": load.mounted,
+                    "error": load.error,
+                }
+                for load in loads
+            ],
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ASGI LOADER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class LazyRouterMiddleware:
+    """
+    Pure ASGI middleware that mounts routers before routing.
+
+    Requests for the OpenAPI schema or docs mount everything so the
+    documentation stays complete.
+    """
+
+    def __init__(self, app: ASGIApp, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+        fastapi_app = registry.app
+        self._docs_paths = {
+            path for path in (fastapi_app.openapi_url, fastapi_app.docs_url, fastapi_app.redoc_url)
+            if path
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.registry._pending:
+            path = scope["path"]
+            if path in self._docs_paths:
+                await self.registry.warm_up_async()
+            else:
+                await self.registry.ensure_loaded(path)
+        await self.app(scope, receive, send)
+
+
+def install_routers(
+    app: FastAPI,
+    mode: str = "lazy",
+    manifest: Optional[List[RouterSpec]] = None,
+) -> LazyRouterRegistry:
+    """
+    Register manifest routers on `app`.
+
+    mode="lazy" defers imports to first use; mode="eager" imports and
+    mounts everything immediately (the historical behaviour).
+    """
+    registry = LazyRouterRegistry(app, manifest)
+    if mode == "eager":
+        registry.warm_up()
+    else:
+        app.add_middleware(LazyRouterMiddleware, registry=registry)
+        logger.info(f"✅ {len(registry.pending)} routers registered (lazy)")
+    return registry
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLD-START BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def measure_cold_start(mode: str = "lazy", target: str = "app.main") -> float:
+    """Seconds to import `target` in a fresh interpreter with ROUTER_LOADING=mode"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {target}; "
+        "print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ, ROUTER_LOADING=mode)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    for mode in ("lazy", "eager"):
+        print(f"cold start ({mode}): {measure_cold_start(mode) * 1000:.0f}ms")
+
+    registry = LazyRouterRegistry(FastAPI())
+    registry.warm_up()
+    print(f"{'module':<40} {'import ms':>10} {'modules':>8}")
+    for load in registry.report():
+        status = "" if load.mounted else f"  ✗ {load.error.strip().splitlines()[0]}"
+        print(f"{load.module:<40} {load.seconds * 1000:>10.1f} {load.new_modules:>8}{status}")
@@ -19,19 +19,33 @@ Agent B: Core Routers (checkpoints, dataspace_engine, nova, memory, agents, xr,
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
-import time
+from contextlib import asynccontextmanager, suppress
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-)
+from app.core.config import settings
+from app.core.logging_pipeline import setup_logging, shutdown_logging
+from app.core.startup import install_routers
+from app.middleware.access_log import AccessLogMiddleware
+
 logger = logging.getLogger("chenu.main")
 
+
+def _configure_logging() -> None:
+    """Install the queue-backed logging pipeline (idempotent)."""
+    setup_logging(
+        level=settings.LOG_LEVEL,
+        fmt=settings.LOG_FORMAT,
+        queue_size=settings.LOG_QUEUE_SIZE,
+    )
+
+
+# Configure logging before anything logs at import time (router
+# registration below); records are written by a background listener
+_configure_logging()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # R&D RULES REFERENCE (7 RÈGLES ABSOLUES)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -87,6 +101,8 @@ RD_RULES = {
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager with database and cache."""
+    # Already configured at import; re-installs after a previous shutdown
+    _configure_logging()
     logger.info("═" * 60)
     logger.info("CHE·NU™ V76 UNIFIED Backend Starting...")
     logger.info("═" * 60)
@@ -104,6 +120,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
     
+    # Expire stale checkpoints in the background (Rule #1)
+    expiry_task = None
+    try:
+        from app.core.database import AsyncSessionLocal
+        from app.services.checkpoint_service import run_expiry_scheduler
+        expiry_task = asyncio.create_task(
+            run_expiry_scheduler(
+                AsyncSessionLocal,
+                max_wait=settings.CHECKPOINT_EXPIRY_MAX_WAIT_SECONDS,
+            )
+        )
+        logger.info("✅ Checkpoint expiry scheduler started")
+    except ImportError:
+        logger.warning("⚠️ Checkpoint expiry scheduler not available (development mode)")
+    
     # Initialize Redis cache
     try:
         from app.core.cache import cache
@@ -114,12 +145,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Redis connection failed: {e}")
     
+    # Explicit warm-up: mount lazy routers before serving traffic
+    if settings.ROUTER_WARMUP:
+        await routers.warm_up_async()
+        logger.info(f"✅ Routers warmed up: {routers.summary()['total_import_ms']}ms")
+    
     logger.info("═" * 60)
     
     yield
     
     # Cleanup
     logger.info("CHE·NU™ V76 Backend Shutting Down...")
+    if expiry_task is not None:
+        expiry_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await expiry_task
     try:
         from app.core.database import close_db
         await close_db()
@@ -130,6 +170,7 @@ async def lifespan(app: FastAPI):
         await cache.disconnect()
     except:
         pass
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -173,24 +214,12 @@ app.add_middleware(
 # REQUEST LOGGING MIDDLEWARE
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests with timing."""
-    start_time = time.time()
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info(
-        f"{request.method} {request.url.path} "
-        f"[{response.status_code}] "
-        f"{process_time:.3f}s"
-    )
-    
-    response.headers["X-Process-Time"] = str(process_time)
-    response.headers["X-CHE-NU-Version"] = "76.0.0"
-    
-    return response
+# Pure ASGI: timing headers + access log, success lines sampled
+app.add_middleware(
+    AccessLogMiddleware,
+    sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+    version="76.0.0",
+)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CUSTOM EXCEPTION HANDLERS
@@ -227,150 +256,10 @@ async def forbidden_exception_handler(request: Request, exc: HTTPException):
 # ROUTER REGISTRATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# --- AGENT B CORE ROUTERS (Phase B1) ---
-try:
-    from app.routers.threads import router as threads_router
-    app.include_router(threads_router, prefix="/api/v2/threads", tags=["Threads"])
-    logger.info("✅ threads router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ threads router not available: {e}")
-
-try:
-    from app.routers.checkpoints import router as checkpoints_router
-    app.include_router(checkpoints_router, prefix="/api/v2/checkpoints", tags=["Checkpoints"])
-    logger.info("✅ checkpoints router registered (HTTP 423 active)")
-except ImportError as e:
-    logger.warning(f"⚠️ checkpoints router not available: {e}")
-
-try:
-    from app.routers.dataspace_engine import router as dataspace_engine_router
-    app.include_router(dataspace_engine_router, prefix="/api/v2/dataspace-engine", tags=["DataSpace Engine"])
-    logger.info("✅ dataspace_engine router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ dataspace_engine router not available: {e}")
-
-try:
-    from app.routers.nova import router as nova_router
-    app.include_router(nova_router, prefix="/api/v2/nova", tags=["Nova Pipeline"])
-    logger.info("✅ nova router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ nova router not available: {e}")
-
-try:
-    from app.routers.memory import router as memory_router
-    app.include_router(memory_router, prefix="/api/v2/memory", tags=["Memory"])
-    logger.info("✅ memory router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ memory router not available: {e}")
-
-try:
-    from app.routers.agents import router as agents_router
-    app.include_router(agents_router, prefix="/api/v2/agents", tags=["Agents"])
-    logger.info("✅ agents router registered (Rule #4 enforced)")
-except ImportError as e:
-    logger.warning(f"⚠️ agents router not available: {e}")
-
-try:
-    from app.routers.xr import router as xr_router
-    app.include_router(xr_router, prefix="/api/v2/xr", tags=["XR Environments"])
-    logger.info("✅ xr router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ xr router not available: {e}")
-
-try:
-    from app.routers.files import router as files_router
-    app.include_router(files_router, prefix="/api/v2/files", tags=["Files"])
-    logger.info("✅ files router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ files router not available: {e}")
-
-# --- AGENT B PHASE B2 ROUTERS ---
-try:
-    from app.routers.decisions import router as decisions_router
-    app.include_router(decisions_router, prefix="/api/v2/decisions", tags=["Decisions"])
-    logger.info("✅ decisions router registered (HTTP 423 active)")
-except ImportError as e:
-    logger.warning(f"⚠️ decisions router not available: {e}")
-
-try:
-    from app.routers.identities import router as identities_router
-    app.include_router(identities_router, prefix="/api/v2/identities", tags=["Identities"])
-    logger.info("✅ identities router registered (9 spheres enforced)")
-except ImportError as e:
-    logger.warning(f"⚠️ identities router not available: {e}")
-
-try:
-    from app.routers.workspaces import router as workspaces_router
-    app.include_router(workspaces_router, prefix="/api/v2/workspaces", tags=["Workspaces"])
-    logger.info("✅ workspaces router registered (6 bureau sections)")
-except ImportError as e:
-    logger.warning(f"⚠️ workspaces router not available: {e}")
-
-try:
-    from app.routers.dataspaces import router as dataspaces_router
-    app.include_router(dataspaces_router, prefix="/api/v2/dataspaces", tags=["DataSpaces"])
-    logger.info("✅ dataspaces router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ dataspaces router not available: {e}")
-
-try:
-    from app.routers.meetings import router as meetings_router
-    app.include_router(meetings_router, prefix="/api/v2/meetings", tags=["Meetings"])
-    logger.info("✅ meetings router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ meetings router not available: {e}")
-
-try:
-    from app.routers.notifications import router as notifications_router
-    app.include_router(notifications_router, prefix="/api/v2/notifications", tags=["Notifications"])
-    logger.info("✅ notifications router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ notifications router not available: {e}")
-
-# --- AGENT A PHASE B2/C ROUTERS ---
-try:
-    from app.routers.spheres import router as spheres_router
-    app.include_router(spheres_router, prefix="/api/v2/spheres", tags=["Spheres"])
-    logger.info("✅ spheres router registered (Rule #7: 9 spheres)")
-except ImportError as e:
-    logger.warning(f"⚠️ spheres router not available: {e}")
-
-try:
-    from app.routers.layout_engine import router as layout_engine_router
-    app.include_router(layout_engine_router, prefix="/api/v2/layout-engine", tags=["Layout Engine"])
-    logger.info("✅ layout_engine router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ layout_engine router not available: {e}")
-
-try:
-    from app.routers.oneclick_engine import router as oneclick_engine_router
-    app.include_router(oneclick_engine_router, prefix="/api/v2/oneclick-engine", tags=["OneClick Engine"])
-    logger.info("✅ oneclick_engine router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ oneclick_engine router not available: {e}")
-
-try:
-    from app.routers.ocw import router as ocw_router
-    app.include_router(ocw_router, prefix="/api/v2/ocw", tags=["OCW"])
-    logger.info("✅ ocw router registered")
-except ImportError as e:
-    logger.warning(f"⚠️ ocw router not available: {e}")
-
-# --- ORIGIN-GENESIS-ULTIMA MODULE ---
-try:
-    from app.api.routes.origin_routes import router as origin_router
-    app.include_router(origin_router, prefix="/api/v2", tags=["ORIGIN-GENESIS"])
-    logger.info("✅ ORIGIN router registered (21 expert agents, 25 endpoints)")
-except ImportError as e:
-    logger.warning(f"⚠️ ORIGIN router not available: {e}")
-
-# --- AT-OM MAPPING SYSTEM ---
-try:
-    from app.routers.atom import router as atom_router
-    app.include_router(atom_router, prefix="/api/v2/atom", tags=["AT-OM Mapping"])
-    logger.info("✅ AT-OM router registered (8 endpoints, Vibration Engine)")
-except ImportError as e:
-    logger.warning(f"⚠️ AT-OM router not available: {e}")
+# Routers are declared in app.core.startup.ROUTER_MANIFEST and imported on
+# the first request under their prefix (ROUTER_LOADING=eager restores
+# import-at-boot; ROUTER_WARMUP=true imports them during startup).
+routers = install_routers(app, mode=settings.ROUTER_LOADING)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ROOT ENDPOINTS
@@ -500,6 +389,11 @@ async def get_stats():
         }
     }
 
+@app.get("/startup-report", tags=["Infrastructure"])
+async def get_startup_report():
+    """Get router import-time breakdown (lazy routers load on first use)."""
+    return routers.summary()
+
 @app.get("/db-status", tags=["Infrastructure"])
 async def get_db_status():
     """Get database connection status."""
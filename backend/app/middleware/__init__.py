@@ -1,4 +1,5 @@
 """CHE·NU Middleware modules."""
 from .identity_boundary import IdentityBoundaryMiddleware, verify_ownership, create_identity_boundary_error
+from .access_log import AccessLogMiddleware
 
-__all__ = ['IdentityBoundaryMiddleware', 'verify_ownership', 'create_identity_boundary_error']
+__all__ = ['IdentityBoundaryMiddleware', 'verify_ownership', 'create_identity_boundary_error', 'AccessLogMiddleware']
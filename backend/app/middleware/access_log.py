@@ -0,0 +1,77 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    CHE·NU™ V76 — ACCESS LOG MIDDLEWARE                       ║
+║                                                                              ║
+║  Pure ASGI: request timing headers + sampled access log                      ║
+║  Errors (status >= 400 or exceptions) are always logged                      ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Optional
+import logging
+import random
+import time
+
+logger = logging.getLogger("chenu.main")
+
+
+class AccessLogMiddleware:
+    """
+    Log every request with its timing and add X-Process-Time.
+
+    Successful requests are logged with probability `sample_rate`; error
+    responses and exceptions are always logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        version: Optional[str] = None,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.version = version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(time.perf_counter() - start_time)
+                if self.version:
+                    headers["X-CHE-NU-Version"] = self.version
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        except Exception:
+            self._log(scope, status_code, start_time, failed=True)
+            raise
+        self._log(scope, status_code, start_time, failed=status_code >= 400)
+
+    def _log(self, scope: Scope, status_code: int, start_time: float, failed: bool) -> None:
+        if not failed and (self.sample_rate <= 0 or random.random() >= self.sample_rate):
+            return
+
+        level = logging.WARNING if failed else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+
+        process_time = time.perf_counter() - start_time
+        logger.log(
+            level,
+            f"{scope['method']} {scope['path']} "
+            f"[{status_code}] "
+            f"{process_time:.3f}s"
+        )
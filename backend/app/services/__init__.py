@@ -21,32 +21,48 @@ R&D COMPLIANCE:
 - Rule #6: Full traceability
 """
 
-from app.services.agent_registry import (
-    AgentRegistryService,
-    get_all_predefined_agents,
-)
-from app.services.agent_execution import (
-    AgentExecutionService,
-    requires_human_gate,
-    SENSITIVE_CAPABILITIES,
-    CONDITIONAL_APPROVAL_CAPABILITIES,
-)
-from app.services.extended_agents import (
-    get_all_extended_agents,
-    EXTENDED_AGENT_COUNTS,
-    TOTAL_EXTENDED_AGENTS,
-    GRAND_TOTAL_SPHERE_AGENTS,
-)
-from app.services.thread_agent_service import (
-    ThreadAgentService,
-    ThreadAgent,
-    ThreadAgentStatus,
-    ThreadAgentCapability,
-    ThreadAgentCreate,
-    ThreadAgentResponse,
-    ThreadAgentExecution,
-    ThreadAgentExecutionResult,
-)
+from importlib import import_module
+
+# Exports are resolved on first access (PEP 562): importing one service
+# module no longer loads every agent registry and template.
+_LAZY_EXPORTS = {
+    # Registry
+    "AgentRegistryService": "app.services.agent_registry",
+    "get_all_predefined_agents": "app.services.agent_registry",
+    # Execution
+    "AgentExecutionService": "app.services.agent_execution",
+    "requires_human_gate": "app.services.agent_execution",
+    "SENSITIVE_CAPABILITIES": "app.services.agent_execution",
+    "CONDITIONAL_APPROVAL_CAPABILITIES": "app.services.agent_execution",
+    # Extended Agents
+    "get_all_extended_agents": "app.services.extended_agents",
+    "EXTENDED_AGENT_COUNTS": "app.services.extended_agents",
+    "TOTAL_EXTENDED_AGENTS": "app.services.extended_agents",
+    "GRAND_TOTAL_SPHERE_AGENTS": "app.services.extended_agents",
+    # Thread Agents
+    "ThreadAgentService": "app.services.thread_agent_service",
+    "ThreadAgent": "app.services.thread_agent_service",
+    "ThreadAgentStatus": "app.services.thread_agent_service",
+    "ThreadAgentCapability": "app.services.thread_agent_service",
+    "ThreadAgentCreate": "app.services.thread_agent_service",
+    "ThreadAgentResponse": "app.services.thread_agent_service",
+    "ThreadAgentExecution": "app.services.thread_agent_service",
+    "ThreadAgentExecutionResult": "app.services.thread_agent_service",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 # Original agent distribution
 AGENT_DISTRIBUTION = {
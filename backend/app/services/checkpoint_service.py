@@ -16,8 +16,9 @@ R&D COMPLIANCE:
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from uuid import UUID, uuid4
+import asyncio
 import logging
 
 from sqlalchemy import select, and_, or_
@@ -36,10 +37,22 @@ from app.core.exceptions import (
     ForbiddenError,
     CheckpointRequiredError,
 )
+from app.core.deadlines import DeadlineHeap
 
 logger = logging.getLogger(__name__)
 
 
+# Process-wide expiry hints: checkpoint id -> expires_at for checkpoints
+# created by this worker. Only used by run_expiry_scheduler to decide when
+# the next sweep is worth running; the database remains the source of truth.
+_expiry_hints = DeadlineHeap()
+
+
+def get_expiry_hints() -> DeadlineHeap:
+    """Get the process-wide checkpoint expiry hint heap"""
+    return _expiry_hints
+
+
 class CheckpointService:
     """
     Service for governance checkpoints.
@@ -52,8 +65,13 @@ class CheckpointService:
     4. Original action executes or cancels
     """
     
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        expiry_hints: Optional[DeadlineHeap] = None,
+    ):
         self.db = db
+        self.expiry_hints = expiry_hints if expiry_hints is not None else _expiry_hints
     
     # =========================================================================
     # CREATE CHECKPOINT
@@ -107,6 +125,9 @@ class CheckpointService:
         self.db.add(checkpoint)
         await self.db.flush()
         
+        if checkpoint.expires_at:
+            self.expiry_hints.push(checkpoint.id, checkpoint.expires_at)
+        
         # Audit log
         await self._audit(
             identity_id=identity_id,
@@ -291,11 +312,13 @@ class CheckpointService:
         if checkpoint.is_expired:
             checkpoint.status = CheckpointStatus.EXPIRED
             await self.db.flush()
+            self.expiry_hints.cancel(checkpoint.id)
             raise ForbiddenError("Checkpoint has expired")
         
         # Approve
         checkpoint.approve(resolved_by=identity_id, reason=reason)
         await self.db.flush()
+        self.expiry_hints.cancel(checkpoint.id)
         
         # Audit log
         await self._audit(
@@ -340,6 +363,7 @@ class CheckpointService:
         # Reject
         checkpoint.reject(resolved_by=identity_id, reason=reason)
         await self.db.flush()
+        self.expiry_hints.cancel(checkpoint.id)
         
         # Audit log
         await self._audit(
@@ -365,7 +389,8 @@ class CheckpointService:
         """
         Expire all checkpoints past their expiration date.
         
-        This should be called periodically by a background task.
+        Called periodically by run_expiry_scheduler (see
+        seconds_until_next_expiry for when the next call is useful).
         
         Returns:
             Number of checkpoints expired
@@ -388,10 +413,29 @@ class CheckpointService:
         
         expired_ids = list(result.scalars().all())
         
+        # The sweep covered every hint that was due
+        self.expiry_hints.pop_due(now)
+        for checkpoint_id in expired_ids:
+            self.expiry_hints.cancel(checkpoint_id)
+        
         logger.info(f"Expired {len(expired_ids)} checkpoints")
         
         return len(expired_ids)
     
+    def seconds_until_next_expiry(self, max_wait: float = 60.0) -> float:
+        """
+        How long the expiry task may sleep before the next sweep.
+        
+        Uses the earliest deadline of checkpoints created by this
+        process, capped at `max_wait` so checkpoints created by other
+        workers are still expired within `max_wait` seconds.
+        """
+        next_deadline = self.expiry_hints.next_deadline()
+        if next_deadline is None:
+            return max_wait
+        remaining = (next_deadline - datetime.utcnow()).total_seconds()
+        return min(max(remaining, 0.0), max_wait)
+    
     # =========================================================================
     # HELPER: RAISE IF CHECKPOINT REQUIRED
     # =========================================================================
@@ -614,3 +658,34 @@ class AuditService:
             .limit(limit)
         )
         return list(result.scalars().all())
+
+
+# =============================================================================
+# EXPIRY SCHEDULER
+# =============================================================================
+
+async def run_expiry_scheduler(
+    session_factory: Callable[[], AsyncSession],
+    max_wait: float = 60.0,
+    expiry_hints: Optional[DeadlineHeap] = None,
+) -> None:
+    """
+    Background task: expire stale checkpoints until cancelled.
+    
+    Each sweep runs in its own session and is committed; the task then
+    sleeps until the earliest hinted deadline, at most `max_wait` seconds.
+    A failed sweep is logged and retried after `max_wait`.
+    
+    Started from the application lifespan.
+    """
+    while True:
+        delay = max_wait
+        try:
+            async with session_factory() as db:
+                service = CheckpointService(db, expiry_hints=expiry_hints)
+                await service.expire_stale_checkpoints()
+                await db.commit()
+                delay = service.seconds_until_next_expiry(max_wait)
+        except Exception as e:
+            logger.error(f"Checkpoint expiry sweep failed: {e}")
+        await asyncio.sleep(delay)
@@ -17,6 +17,11 @@ import hashlib
 import json
 import logging
 
+try:
+    from ...canonical import HashMemoModel, canonical_hash, canonical_json
+except ImportError:  # imported as a top-level package
+    from canonical import HashMemoModel, canonical_hash, canonical_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,7 +89,7 @@ class AuditLevel(str, Enum):
 # AUDIT EVENT
 # ============================================================================
 
-class AuditEvent(BaseModel):
+class AuditEvent(HashMemoModel):
     """
     Single auditable event in CHE·NU™.
     Immutable once created.
@@ -119,18 +124,17 @@ class AuditEvent(BaseModel):
     @property
     def hash(self) -> str:
         """Compute event hash"""
-        content = {
+        return self.memoized_hash("hash", lambda: canonical_hash({
             "event_id": self.event_id,
             "event_type": self.event_type.value,
             "timestamp": self.timestamp.isoformat(),
             "message": self.message,
             "data": self.data,
-        }
-        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        }))
     
     def to_jsonl(self) -> str:
         """Convert to JSONL format"""
-        return json.dumps({
+        return canonical_json({
             "event_id": self.event_id,
             "event_type": self.event_type.value,
             "level": self.level.value,
@@ -142,7 +146,7 @@ class AuditEvent(BaseModel):
             "trace_id": self.trace_id,
             "hash": self.hash,
             "synthetic": self.synthetic,
-        }, sort_keys=True)
+        })
 
 
 # ============================================================================
@@ -0,0 +1,34 @@
+"""
+============================================================================
+CHE·NU™ V69 — CANONICAL ENCODING & HASHING
+============================================================================
+Version: 1.0.0
+Purpose: Shared deterministic encoding for content hashes and signatures
+
+Usage:
+    from ..canonical import canonical_hash, content_hash, HashMemoModel
+
+    digest = canonical_hash({"tick": 3, "slots": {"a": 1.0}})
+============================================================================
+"""
+
+from .hashing import (
+    canonical_json,
+    canonical_bytes,
+    canonical_hash,
+    content_hash,
+    CanonicalHasher,
+    HashMemoModel,
+)
+
+__version__ = "1.0.0"
+
+__all__ = [
+    "__version__",
+    "canonical_json",
+    "canonical_bytes",
+    "canonical_hash",
+    "content_hash",
+    "CanonicalHasher",
+    "HashMemoModel",
+]
@@ -0,0 +1,142 @@
+"""
+============================================================================
+CHE·NU™ V69 — CANONICAL ENCODING & HASHING
+============================================================================
+Version: 1.0.0
+Purpose: One deterministic encoding for every content hash and signature
+Principle: Same content → same bytes → same hash, computed once
+============================================================================
+
+The canonical encoding is exactly `json.dumps(data, sort_keys=True)`
+(optionally with `default=`), so hashes produced here are identical to
+the ones already stored in audit trails, chains and packs.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Optional
+import hashlib
+import json
+
+from pydantic import BaseModel, PrivateAttr
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+# json.dumps builds a fresh JSONEncoder whenever it gets keyword
+# arguments; reuse one per `default` instead.
+_ENCODERS: Dict[Optional[Callable[[Any], Any]], json.JSONEncoder] = {}
+
+
+def _encoder(default: Optional[Callable[[Any], Any]]) -> json.JSONEncoder:
+    encoder = _ENCODERS.get(default)
+    if encoder is None:
+        encoder = _ENCODERS[default] = json.JSONEncoder(sort_keys=True, default=default)
+    return encoder
+
+
+def canonical_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Canonical JSON text, equal to json.dumps(data, sort_keys=True, default=default)"""
+    return _encoder(default).encode(data)
+
+
+def canonical_bytes(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """UTF-8 canonical JSON"""
+    return _encoder(default).encode(data).encode("utf-8")
+
+
+# ============================================================================
+# HASHING
+# ============================================================================
+
+def canonical_hash(data: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """SHA-256 hex digest of the canonical JSON of `data`"""
+    return hashlib.sha256(canonical_bytes(data, default)).hexdigest()
+
+
+def content_hash(data: Any, default: Optional[Callable[[Any], Any]] = str) -> str:
+    """
+    SHA-256 hex digest of arbitrary content.
+
+    Strings are hashed as UTF-8 and bytes as-is; anything else is hashed
+    through its canonical JSON.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    elif not isinstance(data, bytes):
+        data = canonical_bytes(data, default)
+    return hashlib.sha256(data).hexdigest()
+
+
+class CanonicalHasher:
+    """
+    Incremental SHA-256 of the canonical JSON of a list.
+
+    Items are encoded and fed to the digest one at a time, so a large
+    payload is never materialized as a single string. The digest equals
+    canonical_hash(list_of_items).
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any] = (),
+        default: Optional[Callable[[Any], Any]] = None,
+    ):
+        self._encoder = _encoder(default)
+        self._digest = hashlib.sha256(b"[")
+        self._count = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, item: Any) -> None:
+        if self._count:
+            self._digest.update(b", ")
+        self._digest.update(self._encoder.encode(item).encode("utf-8"))
+        self._count += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.add(item)
+
+    def hexdigest(self) -> str:
+        digest = self._digest.copy()
+        digest.update(b"]")
+        return digest.hexdigest()
+
+
+# ============================================================================
+# MEMOIZED HASHES
+# ============================================================================
+
+class HashMemoModel(BaseModel):
+    """
+    Base for immutable-by-convention models whose hashes are computed
+    fields.
+
+    memoized_hash() computes a hash once per instance. Assigning a field
+    or deriving a new instance with model_copy() starts from an empty
+    memo; in-place mutation of nested containers is not tracked, which is
+    why only models that are never mutated in place should use this.
+    """
+
+    _hash_memo: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def memoized_hash(self, name: str, compute: Callable[[], str]) -> str:
+        memo = self._hash_memo
+        value = memo.get(name)
+        if value is None:
+            value = memo[name] = compute()
+        return value
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copy = super().model_copy(update=update, deep=deep)
+        copy._hash_memo = {}
+        return copy
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            # copy.copy() shares the memo dict: replace it, never clear it
+            self._hash_memo = {}
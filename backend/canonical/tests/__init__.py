@@ -0,0 +1 @@
+"""CHE·NU™ V69 — Canonical hashing tests"""
@@ -0,0 +1,119 @@
+"""
+============================================================================
+CHE·NU™ V69 — CANONICAL HASHING TESTS
+============================================================================
+"""
+
+import copy
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict
+
+import pytest
+from pydantic import computed_field
+
+from ..hashing import (
+    canonical_json,
+    canonical_hash,
+    content_hash,
+    CanonicalHasher,
+    HashMemoModel,
+)
+
+
+PAYLOADS = [
+    {"b": 1, "a": [1, 2.5, None], "é": {"z": True, "y": "x\n"}},
+    [3, {"k": -1e-9}, "text"],
+    "plain",
+    42,
+]
+
+
+COMPUTED = []
+
+
+class Snapshot(HashMemoModel):
+    tick: int
+    slots: Dict[str, float]
+
+    @computed_field
+    @property
+    def digest(self) -> str:
+        return self.memoized_hash("digest", self._compute)
+
+    def _compute(self) -> str:
+        COMPUTED.append(self.tick)
+        return canonical_hash({"tick": self.tick, "slots": self.slots})
+
+
+# ============================================================================
+# ENCODING & HASHING
+# ============================================================================
+
+class TestCanonicalEncoding:
+    """Canonical output must match the historical json.dumps hashes"""
+
+    @pytest.mark.parametrize("payload", PAYLOADS)
+    def test_matches_json_dumps(self, payload):
+        expected = json.dumps(payload, sort_keys=True)
+        assert canonical_json(payload) == expected
+        assert canonical_hash(payload) == hashlib.sha256(expected.encode()).hexdigest()
+
+    def test_content_hash(self):
+        stamp = {"at": datetime(2026, 1, 1)}
+        assert content_hash("abc") == hashlib.sha256(b"abc").hexdigest()
+        assert content_hash(b"abc") == hashlib.sha256(b"abc").hexdigest()
+        assert content_hash(stamp) == hashlib.sha256(
+            json.dumps(stamp, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        with pytest.raises(TypeError):
+            content_hash(stamp, default=None)
+
+    def test_incremental_hasher(self):
+        hasher = CanonicalHasher()
+        assert hasher.hexdigest() == canonical_hash([])
+
+        for payload in PAYLOADS:
+            hasher.add(payload)
+        assert len(hasher) == len(PAYLOADS)
+        assert hasher.hexdigest() == canonical_hash(PAYLOADS)
+
+        hasher.extend(PAYLOADS)
+        assert hasher.hexdigest() == canonical_hash(PAYLOADS + PAYLOADS)
+
+
+# ============================================================================
+# MEMOIZATION
+# ============================================================================
+
+class TestHashMemoModel:
+    """Memoized hashes are computed once and reset on change"""
+
+    def test_computed_once(self):
+        COMPUTED.clear()
+        snap = Snapshot(tick=1, slots={"a": 1.0})
+        first = snap.digest
+        assert snap.model_dump()["digest"] == first
+        assert snap.digest == first
+        assert COMPUTED == [1]
+
+    def test_invalidated_by_copy_and_assignment(self):
+        snap = Snapshot(tick=1, slots={"a": 1.0})
+        first = snap.digest
+
+        copied = snap.model_copy(update={"tick": 2})
+        assert copied.digest == canonical_hash({"tick": 2, "slots": {"a": 1.0}})
+        assert snap.digest == first
+
+        snap.slots = {"a": 2.0}
+        assert snap.digest == canonical_hash({"tick": 1, "slots": {"a": 2.0}})
+
+    def test_shallow_copies_do_not_share_the_memo(self):
+        snap = Snapshot(tick=1, slots={"a": 1.0})
+        first = snap.digest
+
+        copied = copy.copy(snap)
+        copied.tick = 2
+        assert copied.digest == canonical_hash({"tick": 2, "slots": {"a": 1.0}})
+        assert snap.digest == first
@@ -79,6 +79,7 @@ from .core import (
     # Inference
     AdjustmentSetFinder,
     CausalEffectEstimator,
+    BatchSensitivityEngine,
     SensitivityAnalyzer,
     CausalEngine,
 )
@@ -130,6 +131,7 @@ __all__ = [
     # Inference
     "AdjustmentSetFinder",
     "CausalEffectEstimator",
+    "BatchSensitivityEngine",
     "SensitivityAnalyzer",
     "CausalEngine",
     # Counterfactual
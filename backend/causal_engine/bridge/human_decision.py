@@ -13,11 +13,15 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 import logging
 import hashlib
-import json
 import uuid
 
 from pydantic import BaseModel, Field
 
+try:
+    from ...canonical import canonical_json
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json
+
 from ..core.models import (
     CausalDAG,
     CausalEffect,
@@ -96,7 +100,7 @@ class DecisionRecord(BaseModel):
             "decider_id": self.decider_id,
             "decided_at": self.decided_at.isoformat() if self.decided_at else None,
         }
-        payload = json.dumps(content, sort_keys=True)
+        payload = canonical_json(content)
         signature = hashlib.sha256(f"{payload}{secret_key}".encode()).hexdigest()
         self.signature = signature
         return signature
@@ -113,7 +117,7 @@ class DecisionRecord(BaseModel):
             "decider_id": self.decider_id,
             "decided_at": self.decided_at.isoformat() if self.decided_at else None,
         }
-        payload = json.dumps(content, sort_keys=True)
+        payload = canonical_json(content)
         expected = hashlib.sha256(f"{payload}{secret_key}".encode()).hexdigest()
         return self.signature == expected
 
@@ -31,6 +31,7 @@ from .dag_builder import (
 from .inference import (
     AdjustmentSetFinder,
     CausalEffectEstimator,
+    BatchSensitivityEngine,
     SensitivityAnalyzer,
     CausalEngine,
 )
@@ -60,6 +61,7 @@ __all__ = [
     # Inference
     "AdjustmentSetFinder",
     "CausalEffectEstimator",
+    "BatchSensitivityEngine",
     "SensitivityAnalyzer",
     "CausalEngine",
 ]
@@ -13,8 +13,11 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 from pydantic import BaseModel, Field, computed_field
 import uuid
-import hashlib
-import json
+
+try:
+    from ...canonical import canonical_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_hash
 
 
 # ============================================================================
@@ -192,7 +195,7 @@ class CausalDAG(BaseModel):
             "edges": sorted([(e.source_id, e.target_id) for e in self.edges]),
             "version": self.version,
         }
-        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()[:16]
+        return canonical_hash(content)[:16]
     
     def add_node(self, node: CausalNode) -> None:
         """Add a node to the DAG"""
@@ -22,7 +22,7 @@ from ..core.models import (
     InterventionType,
 )
 from ..core.dag_builder import DAGBuilder, DAGManager, get_dag_manager
-from ..core.inference import CausalEngine, SensitivityAnalyzer
+from ..core.inference import BatchSensitivityEngine, CausalEngine, SensitivityAnalyzer
 from ..counterfactual.engine import CounterfactualEngine
 from ..bridge.human_decision import HumanDecisionBridge, DecisionStatus
 
@@ -133,6 +133,62 @@ class TestCausalEngine:
         
         assert len(levers) <= 2
         assert all(l.controllability >= 0 for l in levers)
+    
+    def test_batch_effects_match_estimator(self, supply_chain_dag):
+        """Batched path sums match per-pair estimation"""
+        engine = CausalEngine(supply_chain_dag)
+        batch = BatchSensitivityEngine(supply_chain_dag)
+        
+        effects = batch.effects_on("revenue")
+        for node_id, ate in effects.items():
+            if ate is None:
+                continue
+            expected = engine.estimator.estimate_ate(node_id, "revenue").ate
+            assert ate == pytest.approx(expected)
+        
+        # Direct edges with a coefficient override the path sum
+        price_id = engine.sensitivity._resolve_id("price")
+        demand_id = engine.sensitivity._resolve_id("demand")
+        assert effects[demand_id] == pytest.approx(10.0)
+        assert effects[price_id] == pytest.approx(5.0)
+    
+    def test_sensitivity_cached_until_dag_changes(self, supply_chain_dag):
+        """Scores are reused per outcome and invalidated on edits"""
+        analyzer = SensitivityAnalyzer(supply_chain_dag)
+        
+        first = analyzer.analyze_all_variables("revenue")
+        second = analyzer.analyze_all_variables("revenue")
+        assert all(a is b for a, b in zip(first, second))
+        
+        supply_chain_dag.nodes[first[0].node_id].std = 1.0
+        third = analyzer.analyze_all_variables("revenue")
+        assert not any(a is b for a, b in zip(first, third))
+    
+    def test_perturbation_sensitivity(self, supply_chain_dag):
+        """Monte-Carlo perturbation centres on the unperturbed effect"""
+        analyzer = SensitivityAnalyzer(supply_chain_dag)
+        demand_id = analyzer._resolve_id("demand")
+        
+        result = analyzer.perturbation_sensitivity("revenue", samples=4000, noise=0.1, seed=7)
+        
+        assert result[demand_id]["mean"] == pytest.approx(10.0, rel=0.02)
+        assert result[demand_id]["ci_low"] < 10.0 < result[demand_id]["ci_high"]
+        assert result[demand_id]["std"] > 0
+    
+    def test_perturbation_sensitivity_chunking(self, supply_chain_dag):
+        """Chunk size bounds memory without changing the draws"""
+        batch = BatchSensitivityEngine(supply_chain_dag)
+        price_id = batch._resolve_id("price")
+        
+        whole = batch.perturbation_sensitivity("revenue", samples=500, seed=3, chunk_size=500)
+        chunked = batch.perturbation_sensitivity("revenue", samples=500, seed=3, chunk_size=64)
+        exact = batch.perturbation_sensitivity("revenue", samples=10, noise=0.0)
+        
+        assert chunked.keys() == whole.keys()
+        for node_id, stats in whole.items():
+            assert chunked[node_id] == pytest.approx(stats)
+        # Without noise every draw is the unperturbed direct effect
+        assert exact[price_id] == {"mean": 5.0, "std": 0.0, "ci_low": 5.0, "ci_high": 5.0}
 
 
 # ============================================================================
@@ -11,13 +11,15 @@ This is the neural network of CHE·NU™.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Set, Callable, Awaitable
+from typing import Optional, Dict, Any, List, Set, Callable, Awaitable, FrozenSet, Tuple
 from enum import Enum
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
+from contextvars import ContextVar
 import asyncio
 import logging
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +124,7 @@ class SynapticEdge:
     # Runtime state
     fire_count: int = 0
     last_fired: Optional[datetime] = None
+    last_fired_monotonic: Optional[float] = None  # Cooldown clock
     is_active: bool = True
     
     def to_dict(self) -> Dict[str, Any]:
@@ -145,11 +148,11 @@ class SynapticEdge:
         if not self.stability_guard.enabled:
             return True
         
-        if self.last_fired is None:
+        if self.last_fired_monotonic is None:
             return True
         
-        # Check cooldown
-        elapsed = (datetime.utcnow() - self.last_fired).total_seconds()
+        # Check cooldown (monotonic: immune to wall-clock adjustments)
+        elapsed = time.monotonic() - self.last_fired_monotonic
         if elapsed < self.stability_guard.cooldown_seconds:
             return False
         
@@ -159,6 +162,7 @@ class SynapticEdge:
         """Record edge firing"""
         self.fire_count += 1
         self.last_fired = datetime.utcnow()
+        self.last_fired_monotonic = time.monotonic()
 
 
 @dataclass
@@ -174,15 +178,28 @@ class EdgeFireEvent:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
+# Paths ("SRC->DST") already fired in the current causal chain. Each
+# asyncio task inherits a copy, so a handler that fires further edges
+# extends its own chain only; unrelated firings never see each other.
+_causal_chain: ContextVar[FrozenSet[str]] = ContextVar(
+    "synaptic_causal_chain", default=frozenset()
+)
+
+
 class SynapticGraph:
     """
     The neural network of CHE·NU™.
     
     Manages connections between modules and routes signals
     while preventing infinite loops and cascades.
+    
+    Edges matching a trigger fire concurrently. At most
+    `max_concurrency` causal chains run at once; firings nested inside
+    a handler run in their parent's slot, so a chain never waits on
+    itself.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 16):
         # All edges
         self._edges: Dict[UUID, SynapticEdge] = {}
         
@@ -192,14 +209,21 @@ class SynapticGraph:
         # Index: target -> [edges]
         self._incoming: Dict[ModuleID, List[SynapticEdge]] = defaultdict(list)
         
+        # Index: (source, trigger name) -> [edges]
+        self._by_trigger: Dict[Tuple[ModuleID, str], List[SynapticEdge]] = defaultdict(list)
+        
         # Edge handlers
         self._handlers: Dict[str, Callable[[EdgeFireEvent], Awaitable[Any]]] = {}
         
         # Event listeners
         self._listeners: List[Callable[[EdgeFireEvent], Awaitable[None]]] = []
         
-        # Loop detection
-        self._active_paths: Set[str] = set()
+        # Dispatch slots for root firings
+        self._slots = asyncio.Semaphore(max_concurrency)
+        
+        # Paths currently firing, for observability (loop detection
+        # uses the per-chain context instead)
+        self._active_paths: Counter = Counter()
         
         # Initialize default graph
         self._init_default_edges()
@@ -438,6 +462,8 @@ class SynapticGraph:
         self._edges[edge.edge_id] = edge
         self._outgoing[source].append(edge)
         self._incoming[target].append(edge)
+        if trigger:
+            self._by_trigger[(source, trigger.name)].append(edge)
         
         logger.debug(f"Added edge: {source.value} -> {target.value} ({trigger.name})")
         
@@ -467,11 +493,15 @@ class SynapticGraph:
         """Get all edges with specific priority"""
         return [e for e in self._edges.values() if e.priority == priority]
     
+    def get_trigger_edges(self, source: ModuleID, trigger_name: str) -> List[SynapticEdge]:
+        """Get edges from module fired by a trigger"""
+        return self._by_trigger.get((source, trigger_name), [])
+    
     def _check_loop(self, source: ModuleID, target: ModuleID) -> bool:
-        """Check if firing would create a loop"""
+        """Check if firing would create a loop in the current causal chain"""
         path_key = f"{source.value}->{target.value}"
         
-        if path_key in self._active_paths:
+        if path_key in _causal_chain.get():
             logger.warning(f"Loop detected: {path_key}")
             return True
         
@@ -497,15 +527,27 @@ class SynapticGraph:
         payload: Dict[str, Any] = None
     ) -> List[Any]:
         """Fire all edges from source with matching trigger"""
-        results = []
-        
-        for edge in self._outgoing.get(source, []):
-            if edge.trigger and edge.trigger.name == trigger_name:
-                result = await self._fire(edge, payload or {})
-                if result is not None:
-                    results.append(result)
+        edges = self._by_trigger.get((source, trigger_name))
+        if not edges:
+            return []
+        
+        payload = payload or {}
+        if len(edges) == 1:
+            fired = [await self._fire(edges[0], payload)]
+        else:
+            # Let every sibling finish before surfacing a failure, so no
+            # firing is left running unobserved
+            fired = await asyncio.gather(
+                *(self._fire(edge, payload) for edge in edges),
+                return_exceptions=True
+            )
+            errors = [outcome for outcome in fired if isinstance(outcome, BaseException)]
+            for error in errors:
+                logger.error(f"Edge handler error on {source.value}/{trigger_name}: {error!r}")
+            if errors:
+                raise errors[0]
         
-        return results
+        return [result for result in fired if result is not None]
     
     async def _fire(
         self,
@@ -523,9 +565,29 @@ class SynapticGraph:
         if self._check_loop(edge.source, edge.target):
             return None
         
-        # Mark path as active
+        # Nested firings reuse the slot held by their chain's root
+        chain = _causal_chain.get()
+        if chain:
+            return await self._dispatch(edge, payload, chain)
+        
+        async with self._slots:
+            # The guard may have been claimed while waiting for a slot
+            if not edge.can_fire():
+                logger.debug(f"Edge {edge.edge_id} cannot fire (cooldown)")
+                return None
+            return await self._dispatch(edge, payload, chain)
+    
+    async def _dispatch(
+        self,
+        edge: SynapticEdge,
+        payload: Dict[str, Any],
+        chain: FrozenSet[str]
+    ) -> Optional[Any]:
+        """Fire a checked edge within its causal chain"""
+        # Extend the chain for everything this firing causes
         path_key = f"{edge.source.value}->{edge.target.value}"
-        self._active_paths.add(path_key)
+        token = _causal_chain.set(chain | {path_key})
+        self._active_paths[path_key] += 1
         
         try:
             # Create event
@@ -547,11 +609,14 @@ class SynapticGraph:
             )
             
             # Notify listeners
-            for listener in self._listeners:
-                try:
-                    await listener(event)
-                except Exception as e:
-                    logger.error(f"Listener error: {e}")
+            if self._listeners:
+                outcomes = await asyncio.gather(
+                    *(listener(event) for listener in self._listeners),
+                    return_exceptions=True
+                )
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Listener error: {outcome}")
             
             # Execute handler
             result = None
@@ -566,7 +631,10 @@ class SynapticGraph:
             
         finally:
             # Clear path
-            self._active_paths.discard(path_key)
+            _causal_chain.reset(token)
+            self._active_paths[path_key] -= 1
+            if not self._active_paths[path_key]:
+                del self._active_paths[path_key]
     
     def get_graph_summary(self) -> Dict[str, Any]:
         """Get summary of the graph"""
@@ -20,12 +20,15 @@ Features:
 ============================================================================
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
 import copy
 
+import numpy as np
+
 from ..models import (
     Slot,
     CausalDAG,
@@ -53,8 +56,21 @@ class SensitivityAnalyzer:
     Analyze sensitivity and impact of slots.
     
     Per spec: Mesurer l'influence réelle de chaque Slot sur l'objectif final
+    
+    For acyclic graphs, the sum of path strengths from every slot to every
+    other slot is read off (I - W)^-1 and the number of paths off
+    (I - A)^-1, where W holds edge strengths and A edge counts. Both are
+    computed once per DAG revision and shared by every target. Graphs with
+    cycles fall back to explicit path enumeration.
+    
+    Matrices are kept for the `max_cached_dags` most recently analyzed
+    DAGs (one revision each); older ones are evicted.
     """
     
+    def __init__(self, max_cached_dags: int = 16):
+        self.max_cached_dags = max_cached_dags
+        self._matrix_cache: "OrderedDict[str, Tuple[Tuple, Optional[_PathMatrices]]]" = OrderedDict()
+    
     def analyze(
         self,
         dag: CausalDAG,
@@ -72,15 +88,22 @@ class SensitivityAnalyzer:
         
         # Find all ancestors affecting target
         ancestors = self._find_ancestors(dag, target_slot)
+        matrices = self._path_matrices(dag)
         
         # Compute impact for each
         total_impact = 0.0
         impacts = {}
+        path_counts = {}
         
         for slot_name in ancestors:
-            # Sum strength of all paths to target
-            impact = self._compute_path_impact(dag, slot_name, target_slot)
+            if matrices is not None:
+                impact, paths_count = matrices.lookup(slot_name, target_slot)
+            else:
+                # Sum strength of all paths to target
+                impact = self._compute_path_impact(dag, slot_name, target_slot)
+                paths_count = len(self._find_paths(dag, slot_name, target_slot))
             impacts[slot_name] = impact
+            path_counts[slot_name] = paths_count
             total_impact += abs(impact)
         
         # Normalize to percentages
@@ -91,7 +114,7 @@ class SensitivityAnalyzer:
             confidence_width = 0.1 * impact_percent
             
             # Compute instability based on number of paths
-            paths_count = len(self._find_paths(dag, slot_name, target_slot))
+            paths_count = path_counts[slot_name]
             instability = min(1.0, paths_count * 0.1)
             
             is_critical = impact_percent > 50 or instability > 0.5
@@ -108,6 +131,26 @@ class SensitivityAnalyzer:
         
         return scores
     
+    def _path_matrices(self, dag: CausalDAG) -> Optional["_PathMatrices"]:
+        """All-pairs path sums for this DAG revision, or None if cyclic"""
+        fingerprint = (
+            tuple((name, tuple(slot.causal_children)) for name, slot in dag.slots.items()),
+            tuple((e.source_slot, e.target_slot, e.strength) for e in dag.edges),
+        )
+        
+        cached = self._matrix_cache.get(dag.dag_id)
+        if cached is not None and cached[0] == fingerprint:
+            self._matrix_cache.move_to_end(dag.dag_id)
+            return cached[1]
+        
+        # A new revision replaces the DAG's previous entry
+        matrices = _PathMatrices.build(dag)
+        self._matrix_cache[dag.dag_id] = (fingerprint, matrices)
+        self._matrix_cache.move_to_end(dag.dag_id)
+        while len(self._matrix_cache) > self.max_cached_dags:
+            self._matrix_cache.popitem(last=False)
+        return matrices
+    
     def _find_ancestors(self, dag: CausalDAG, target: str) -> Set[str]:
         """Find all ancestors of target"""
         ancestors = set()
@@ -179,6 +222,71 @@ class SensitivityAnalyzer:
                 path.pop()
 
 
+@dataclass
+class _PathMatrices:
+    """Closed-form path sums over an acyclic slot graph"""
+    index: Dict[str, int]
+    impact: np.ndarray
+    paths: np.ndarray
+    
+    @classmethod
+    def build(cls, dag: CausalDAG) -> Optional["_PathMatrices"]:
+        index = {name: i for i, name in enumerate(dag.slots)}
+        n = len(index)
+        
+        # Like _compute_path_impact: the first matching edge gives the
+        # strength, and a hop without an edge record counts as 1.0
+        strengths: Dict[Tuple[str, str], float] = {}
+        for edge in dag.edges:
+            strengths.setdefault((edge.source_slot, edge.target_slot), edge.strength)
+        
+        weights = np.zeros((n, n))
+        counts = np.zeros((n, n))
+        for name, slot in dag.slots.items():
+            i = index[name]
+            for child in slot.causal_children:
+                j = index.get(child)
+                if j is None or j == i:
+                    continue
+                weights[i, j] += strengths.get((name, child), 1.0)
+                counts[i, j] += 1
+        
+        if not cls._is_acyclic(counts):
+            return None
+        
+        identity = np.eye(n)
+        return cls(
+            index=index,
+            impact=np.linalg.solve(identity - weights, identity),
+            paths=np.linalg.solve(identity - counts, identity),
+        )
+    
+    @staticmethod
+    def _is_acyclic(counts: np.ndarray) -> bool:
+        """Kahn's algorithm over the adjacency matrix"""
+        in_degree = (counts > 0).sum(axis=0)
+        ready = [i for i in range(len(in_degree)) if in_degree[i] == 0]
+        visited = 0
+        
+        while ready:
+            i = ready.pop()
+            visited += 1
+            for j in np.flatnonzero(counts[i]):
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    ready.append(j)
+        
+        return visited == len(in_degree)
+    
+    def lookup(self, source: str, target: str) -> Tuple[float, int]:
+        """(sum of path strengths, number of paths) from source to target"""
+        i = self.index.get(source)
+        j = self.index.get(target)
+        if i is None or j is None:
+            return 0.0, 0
+        return float(self.impact[i, j]), int(round(self.paths[i, j]))
+
+
 # ============================================================================
 # OPA GOVERNANCE FOR CAUSALITY
 # ============================================================================
@@ -15,8 +15,11 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 import uuid
-import hashlib
-import json
+
+try:
+    from ..canonical import canonical_json, content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json, content_hash
 
 
 # ============================================================================
@@ -321,16 +324,12 @@ def generate_id() -> str:
 
 def compute_hash(data: Any) -> str:
     """Compute hash of data"""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif not isinstance(data, bytes):
-        data = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data)
 
 
 def sign_artifact(data: Dict[str, Any], signer_id: str) -> str:
     """Sign an artifact (mock PQC)"""
-    payload = json.dumps(data, sort_keys=True, default=str)
+    payload = canonical_json(data, default=str)
     return compute_hash(f"{payload}:{signer_id}")
 
 
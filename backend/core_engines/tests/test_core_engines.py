@@ -212,6 +212,61 @@ class TestCausalDecision:
         
         assert "budget" in scores
         assert scores["budget"].impact_percent > scores["team"].impact_percent
+    
+    def test_matrix_impact_matches_path_enumeration(self):
+        from ..causal_decision.engine import SensitivityAnalyzer
+        from ..causal_inference import create_dag_builder
+        
+        builder = create_dag_builder()
+        dag = (builder
+            .new_dag("Diamond")
+            .add_slot("price", 10)
+            .add_slot("demand", 0)
+            .add_slot("marketing", 5)
+            .add_slot("revenue", 0)
+            .add_edge("price", "demand", -0.6)
+            .add_edge("marketing", "demand", 0.4)
+            .add_edge("demand", "revenue", 0.9)
+            .add_edge("price", "revenue", 0.5)
+            .add_edge("marketing", "revenue", 0.3)
+            .build())
+        
+        analyzer = SensitivityAnalyzer()
+        scores = analyzer.analyze(dag, "revenue")
+        
+        for slot_name in ("price", "demand", "marketing"):
+            matrix_impact = analyzer._path_matrices(dag).lookup(slot_name, "revenue")[0]
+            assert matrix_impact == pytest.approx(
+                analyzer._compute_path_impact(dag, slot_name, "revenue")
+            )
+        
+        # price reaches revenue directly and through demand
+        assert scores["price"].instability_score == pytest.approx(0.2)
+        assert analyzer._path_matrices(dag) is analyzer._path_matrices(dag)
+    
+    def test_matrix_cache_is_bounded(self):
+        from ..causal_decision.engine import SensitivityAnalyzer
+        from ..causal_inference import create_dag_builder
+        
+        analyzer = SensitivityAnalyzer(max_cached_dags=2)
+        dags = []
+        for i in range(3):
+            dags.append(create_dag_builder()
+                .new_dag(f"Chain {i}")
+                .add_slot("a", 1)
+                .add_slot("b", 0)
+                .add_edge("a", "b", 0.5)
+                .build())
+            analyzer.analyze(dags[-1], "b")
+        
+        assert list(analyzer._matrix_cache) == [dags[1].dag_id, dags[2].dag_id]
+        
+        # Touching a DAG keeps it; a new revision replaces its entry
+        analyzer.analyze(dags[1], "b")
+        dags[1].edges[0].strength = 0.8
+        analyzer.analyze(dags[1], "b")
+        analyzer.analyze(dags[0], "b")
+        assert list(analyzer._matrix_cache) == [dags[1].dag_id, dags[0].dag_id]
 
 
 # ============================================================================
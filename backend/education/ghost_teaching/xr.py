@@ -25,7 +25,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import logging
-import math
+
+import numpy as np
 
 from ..models import (
     GhostTrack,
@@ -39,6 +40,87 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+AXES = ("x", "y", "z")
+
+# Assuming normalized positions, max distance ~ sqrt(3) ≈ 1.73
+MAX_DISTANCE = 1.73
+
+
+def positions_to_array(positions: List[Dict[str, float]], missing: float = 0.0) -> np.ndarray:
+    """Stack position dicts into an (n, 3) array, `missing` for absent axes"""
+    return np.array(
+        [[pos.get(axis, missing) for axis in AXES] for pos in positions],
+        dtype=float,
+    ).reshape(-1, len(AXES))
+
+
+def banded_dtw(
+    golds: List[np.ndarray],
+    learner: np.ndarray,
+    band: int = 32,
+) -> np.ndarray:
+    """
+    Align a learner trajectory with each gold trajectory.
+    
+    Dynamic time warping restricted to a Sakoe-Chiba band of `band`
+    frames around the diagonal of each (learner, gold) grid, widened for
+    a gold track much longer than the learner so the band stays
+    connected. All golds advance together one learner frame at a time,
+    holding only the current band row per gold; within a row, the
+    left-to-right recurrence is solved as a prefix minimum.
+    
+    Returns the mean aligned Euclidean distance per gold, taken over the
+    longer of the two tracks (inf when either is empty).
+    """
+    n = len(learner)
+    lengths = np.array([len(g) for g in golds], dtype=np.int64)
+    result = np.full(len(golds), np.inf)
+    live = np.flatnonzero(lengths > 0)
+    if n == 0 or not len(live):
+        return result
+    
+    lengths = lengths[live]
+    gold = np.zeros((len(live), lengths.max(), len(AXES)))
+    for row, g in enumerate(live):
+        gold[row, :lengths[row]] = golds[g]
+    
+    ratio = (lengths - 1) / max(n - 1, 1)
+    halves = np.maximum(band, ratio.astype(np.int64) + 1)
+    half = int(halves.max())
+    width = 2 * half + 1
+    offsets = np.arange(width) - half
+    in_band = np.abs(offsets)[None, :] <= halves[:, None]
+    centers = np.rint(np.arange(n)[None, :] * ratio[:, None]).astype(np.int64)
+    rows = np.arange(len(live))[:, None]
+    pad_left = np.full((len(live), 1), np.inf)
+    pad_right = np.full((len(live), half + 1), np.inf)
+    
+    prev = None
+    for i in range(n):
+        cols = centers[:, i:i + 1] + offsets
+        valid = in_band & (cols >= 0) & (cols < lengths[:, None])
+        diff = gold[rows, np.clip(cols, 0, gold.shape[1] - 1)] - learner[i]
+        cost = np.sqrt((diff * diff).sum(axis=2))
+        
+        if prev is None:
+            enter = np.where(cols == 0, cost, np.inf)
+        else:
+            # Band index in the previous row of this row's columns
+            shift = (centers[:, i] - centers[:, i - 1])[:, None] + np.arange(width)
+            padded = np.concatenate([pad_left, prev, pad_right], axis=1)
+            above = np.take_along_axis(padded, shift + 1, axis=1)
+            diagonal = np.take_along_axis(padded, shift, axis=1)
+            enter = cost + np.minimum(above, diagonal)
+        
+        enter = np.where(valid, enter, np.inf)
+        running = np.cumsum(np.where(valid, cost, 0.0), axis=1)
+        prev = np.minimum.accumulate(enter - running, axis=1) + running
+        prev[~valid] = np.inf
+    
+    final = (lengths - 1) - centers[:, -1] + half
+    result[live] = prev[np.arange(len(live)), final] / np.maximum(lengths, n)
+    return result
+
 
 # ============================================================================
 # GHOST TRACK RECORDER
@@ -172,31 +254,27 @@ class TrackNormalizer:
         if not track.positions:
             return track
         
-        # Find bounds
-        min_pos = {"x": float("inf"), "y": float("inf"), "z": float("inf")}
-        max_pos = {"x": float("-inf"), "y": float("-inf"), "z": float("-inf")}
-        
-        for pos in track.positions:
-            for axis in ["x", "y", "z"]:
-                if axis in pos:
-                    min_pos[axis] = min(min_pos[axis], pos[axis])
-                    max_pos[axis] = max(max_pos[axis], pos[axis])
-        
-        # Normalize to [0, 1] range
-        normalized_positions = []
-        for pos in track.positions:
-            norm_pos = {}
-            for axis in ["x", "y", "z"]:
-                if axis in pos:
-                    range_val = max_pos[axis] - min_pos[axis]
-                    if range_val > 0:
-                        norm_pos[axis] = (pos[axis] - min_pos[axis]) / range_val
-                    else:
-                        norm_pos[axis] = 0.5
-            normalized_positions.append(norm_pos)
-        
-        track.positions = normalized_positions
+        positions = positions_to_array(track.positions, missing=np.nan)
+        normalized = self.normalize_array(positions)
+        
+        # Axes absent from a frame stay absent
+        present = ~np.isnan(positions)
+        track.positions = [
+            {axis: value for axis, value, has in zip(AXES, values, flags) if has}
+            for values, flags in zip(normalized.tolist(), present.tolist())
+        ]
         return track
+    
+    def normalize_array(self, positions: np.ndarray) -> np.ndarray:
+        """Scale each axis to [0, 1]; NaN marks an absent value"""
+        present = ~np.isnan(positions)
+        low = np.where(present, positions, np.inf).min(axis=0)
+        high = np.where(present, positions, -np.inf).max(axis=0)
+        spread = high - low
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scaled = (positions - low) / spread
+        return np.where(spread > 0, scaled, 0.5)
 
 
 # ============================================================================
@@ -290,10 +368,25 @@ class ScoringEngine:
         trajectory_weight: float = 0.4,
         timing_weight: float = 0.3,
         order_weight: float = 0.3,
+        dtw_band: int = 32,
     ):
         self.trajectory_weight = trajectory_weight
         self.timing_weight = timing_weight
         self.order_weight = order_weight
+        self.dtw_band = dtw_band
+        
+        # track_id → (positions list, frame count, array)
+        self._gold_arrays: Dict[str, Tuple[List[Dict[str, float]], int, np.ndarray]] = {}
+    
+    def gold_array(self, track: GhostTrack) -> np.ndarray:
+        """Positions of a gold track as an array, converted once"""
+        cached = self._gold_arrays.get(track.track_id)
+        if cached and cached[0] is track.positions and cached[1] == len(track.positions):
+            return cached[2]
+        
+        array = positions_to_array(track.positions)
+        self._gold_arrays[track.track_id] = (track.positions, len(track.positions), array)
+        return array
     
     def score_trajectory(
         self,
@@ -301,31 +394,33 @@ class ScoringEngine:
         learner_positions: List[Dict[str, float]],
     ) -> float:
         """Score trajectory similarity"""
-        if not gold_positions or not learner_positions:
-            return 0.0
-        
-        # Resample to same length
-        min_len = min(len(gold_positions), len(learner_positions))
-        
-        total_distance = 0.0
-        for i in range(min_len):
-            gold = gold_positions[i]
-            learner = learner_positions[i]
-            
-            # Euclidean distance
-            dist = math.sqrt(
-                (gold.get("x", 0) - learner.get("x", 0)) ** 2 +
-                (gold.get("y", 0) - learner.get("y", 0)) ** 2 +
-                (gold.get("z", 0) - learner.get("z", 0)) ** 2
-            )
-            total_distance += dist
-        
-        avg_distance = total_distance / min_len
+        return float(self.score_trajectories(
+            [positions_to_array(gold_positions)],
+            positions_to_array(learner_positions),
+        )[0])
+    
+    def score_trajectories(
+        self,
+        golds: List[np.ndarray],
+        learner: np.ndarray,
+    ) -> np.ndarray:
+        """Score one learner trajectory against many gold trajectories"""
+        avg_distance = banded_dtw(golds, learner, self.dtw_band)
         
         # Convert to score (closer = higher)
-        # Assuming normalized positions, max distance ~ sqrt(3) ≈ 1.73
-        score = max(0, 1 - avg_distance / 1.73)
-        return score
+        return np.maximum(0.0, 1 - avg_distance / MAX_DISTANCE)
+    
+    def score_against_tracks(
+        self,
+        gold_tracks: List[GhostTrack],
+        learner_positions: List[Dict[str, float]],
+    ) -> Dict[str, float]:
+        """Score learner positions against several gold tracks at once"""
+        scores = self.score_trajectories(
+            [self.gold_array(track) for track in gold_tracks],
+            positions_to_array(learner_positions),
+        )
+        return {track.track_id: float(score) for track, score in zip(gold_tracks, scores)}
     
     def score_timing(
         self,
@@ -408,6 +503,17 @@ class GhostTeachingEngine:
         tracks = self.recorder.get_gold_tracks(skill_id)
         return tracks[0] if tracks else None
     
+    def score_against_gold_tracks(
+        self,
+        skill_id: str,
+        learner_positions: List[Dict[str, float]],
+    ) -> Dict[str, float]:
+        """Trajectory score of learner positions against every gold track of a skill"""
+        return self.scorer.score_against_tracks(
+            self.recorder.get_gold_tracks(skill_id),
+            learner_positions,
+        )
+    
     def start_session(
         self,
         user_id: str,
@@ -465,10 +571,10 @@ class GhostTeachingEngine:
             raise ValueError(f"Gold track {session.track_id} not found")
         
         # Score components
-        session.trajectory_score = self.scorer.score_trajectory(
-            gold_track.positions,
+        session.trajectory_score = self.scorer.score_against_tracks(
+            [gold_track],
             learner_positions,
-        )
+        )[gold_track.track_id]
         
         session.timing_score = self.scorer.score_timing(
             gold_track.duration_seconds,
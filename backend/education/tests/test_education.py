@@ -189,6 +189,33 @@ class TestGhostTeaching:
         assert met is False
         assert "safety_glasses" in unmet
 
+    def test_trajectory_alignment(self):
+        from ..ghost_teaching import create_ghost_teaching_engine
+
+        engine = create_ghost_teaching_engine()
+        recorder = engine.recorder
+
+        gold_ids = []
+        for speed in (0.1, 0.3):
+            recorder.start_recording("skill-1")
+            for i in range(10):
+                recorder.record_frame({"x": min(i * speed, 1.0), "y": 0, "z": 0}, {})
+            track = recorder.stop_recording()
+            recorder.validate_as_gold(track.track_id, "expert-1")
+            gold_ids.append(track.track_id)
+
+        # Same path at half speed: aligned, not truncated
+        gold = recorder.get_track(gold_ids[0]).positions
+        slow = [gold[i // 2] for i in range(20)]
+        assert engine.scorer.score_trajectory(gold, slow) == pytest.approx(1.0)
+
+        scores = engine.score_against_gold_tracks("skill-1", slow)
+        assert set(scores) == set(gold_ids)
+        assert scores[gold_ids[0]] > scores[gold_ids[1]]
+        assert scores[gold_ids[1]] == pytest.approx(
+            engine.scorer.score_trajectory(recorder.get_track(gold_ids[1]).positions, slow)
+        )
+
 
 # ============================================================================
 # SKILL TO EQUITY BRIDGE TESTS
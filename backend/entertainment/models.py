@@ -16,8 +16,11 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import uuid
-import hashlib
-import json
+
+try:
+    from ..canonical import canonical_json, content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json, content_hash
 
 
 # ============================================================================
@@ -313,16 +316,12 @@ def generate_id() -> str:
 
 def compute_hash(data: Any) -> str:
     """Compute hash of data"""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif not isinstance(data, bytes):
-        data = json.dumps(data, sort_keys=True).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data, default=None)
 
 
 def sign_artifact(data: Dict[str, Any], signer_id: str) -> str:
     """Sign an artifact"""
-    payload = json.dumps(data, sort_keys=True)
+    payload = canonical_json(data)
     return compute_hash(f"{payload}:{signer_id}")
 
 
@@ -8,6 +8,8 @@ from .engine import (
     create_simple_simulation,
 )
 
+from .history import BoundedHistory
+
 from .audited import (
     AuditedFeedbackEngine,
     create_audited_simulation,
@@ -17,6 +19,7 @@ __all__ = [
     "L2SafetyController",
     "FeedbackLoopEngine",
     "create_simple_simulation",
+    "BoundedHistory",
     "AuditedFeedbackEngine",
     "create_audited_simulation",
 ]
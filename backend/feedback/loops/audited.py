@@ -22,6 +22,7 @@ from ..models import (
     StabilityStatus,
 )
 from .engine import FeedbackLoopEngine, L2SafetyController
+from .history import BoundedHistory
 from ...audit.logs.immutable import (
     AuditLog,
     AuditEvent,
@@ -209,7 +210,7 @@ class AuditedFeedbackEngine:
         self.audit_log.export_merkle_json(filepath)
     
     @property
-    def states(self) -> List[WorldState]:
+    def states(self) -> BoundedHistory[WorldState]:
         """Access simulation states"""
         return self.inner_engine.states
     
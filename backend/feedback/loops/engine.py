@@ -9,12 +9,13 @@ Principle: GOUVERNANCE > EXÉCUTION - Deterministic, OPA-governed
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 import hashlib
 import json
 
-from .models import (
+from ..models import (
     Slot,
     WorldState,
     FeedbackEdge,
@@ -27,6 +28,7 @@ from .models import (
     SafetyAction,
     StabilityStatus,
 )
+from .history import BoundedHistory
 
 logger = logging.getLogger(__name__)
 
@@ -193,19 +195,52 @@ class FeedbackLoopEngine:
     5. Stability Monitor - L2 safety check
     6. Artifact Generation - Sign and chain
     
+    With `history_dir`, only the states needed by the longest feedback
+    delay (and the last artifact) stay in memory; older ones stream to
+    append-only logs in that directory and remain readable through
+    `states`, `artifacts`, `get_state_at` and `get_artifact_at`.
+    
     Usage:
         engine = FeedbackLoopEngine(config)
         results = engine.run()
+        
+        # Constant-memory long-horizon run
+        engine = FeedbackLoopEngine(config, history_dir="/tmp/sim-001")
+        engine.run()
+        engine.close()
     """
     
-    def __init__(self, config: SimulationConfig):
+    def __init__(
+        self,
+        config: SimulationConfig,
+        history_dir: Optional[Union[str, Path]] = None,
+    ):
         self.config = config
         self.params = config.params
         self.safety = L2SafetyController(self.params)
         
+        # Rule order is fixed for the whole run
+        self._transfer_functions = sorted(
+            config.transfer_functions,
+            key=lambda f: f.priority
+        )
+        self._max_delay = max(
+            (edge.delay_ticks for edge in config.feedback_edges),
+            default=0,
+        )
+        
         # State tracking
-        self.states: List[WorldState] = []
-        self.artifacts: List[SimulationArtifact] = []
+        history_dir = Path(history_dir) if history_dir else None
+        self.states: BoundedHistory[WorldState] = BoundedHistory(
+            WorldState,
+            window=self._max_delay,
+            log_path=history_dir / "states.jsonl" if history_dir else None,
+        )
+        self.artifacts: BoundedHistory[SimulationArtifact] = BoundedHistory(
+            SimulationArtifact,
+            window=1,
+            log_path=history_dir / "artifacts.jsonl" if history_dir else None,
+        )
         self.current_tick = config.t_start
         
         # Build initial state
@@ -334,13 +369,7 @@ class FeedbackLoopEngine:
         """Apply all transfer functions in priority order"""
         applied = []
         
-        # Sort by priority
-        functions = sorted(
-            self.config.transfer_functions,
-            key=lambda f: f.priority
-        )
-        
-        for func in functions:
+        for func in self._transfer_functions:
             try:
                 output_value = func.compute(current)
                 
@@ -370,12 +399,13 @@ class FeedbackLoopEngine:
     ) -> List[str]:
         """Apply all feedback edges to compute T+1 values"""
         applied = []
+        history = self.states.recent() if self._max_delay > 0 else None
         
         for edge in self.config.feedback_edges:
             try:
                 next_value = edge.compute_next_value(
                     current,
-                    self.states if edge.delay_ticks > 0 else None
+                    history if edge.delay_ticks > 0 else None
                 )
                 
                 # Update or create slot
@@ -468,19 +498,28 @@ class FeedbackLoopEngine:
     
     def _verify_chain(self) -> bool:
         """Verify artifact chain integrity"""
+        prev_hash = None
+        
         for i, artifact in enumerate(self.artifacts):
             if not artifact.verify():
                 return False
             
-            if i > 0:
-                expected_prev = self.artifacts[i - 1].hash
-                if artifact.previous_artifact_hash != expected_prev:
-                    return False
+            if i > 0 and artifact.previous_artifact_hash != prev_hash:
+                return False
+            
+            prev_hash = artifact.hash
         
         return True
     
     def get_state_at(self, tick: int) -> Optional[WorldState]:
         """Get state at specific tick (for replay)"""
+        # States advance one tick at a time from t_start
+        index = tick - self.config.t_start
+        if 0 <= index < len(self.states):
+            state = self.states[index]
+            if state.tick == tick:
+                return state
+        
         for state in self.states:
             if state.tick == tick:
                 return state
@@ -488,10 +527,22 @@ class FeedbackLoopEngine:
     
     def get_artifact_at(self, tick: int) -> Optional[SimulationArtifact]:
         """Get artifact for specific transition"""
+        # One artifact per transition, starting at t_start
+        index = tick - self.config.t_start
+        if 0 <= index < len(self.artifacts):
+            artifact = self.artifacts[index]
+            if artifact.t_from == tick:
+                return artifact
+        
         for artifact in self.artifacts:
             if artifact.t_from == tick:
                 return artifact
         return None
+    
+    def close(self) -> None:
+        """Flush and close the history logs (no-op without history_dir)"""
+        self.states.close()
+        self.artifacts.close()
 
 
 # ============================================================================
@@ -505,6 +556,7 @@ def create_simple_simulation(
     transfer_rules: Optional[Dict[str, Dict[str, float]]] = None,
     num_ticks: int = 10,
     params: Optional[FeedbackParams] = None,
+    history_dir: Optional[Union[str, Path]] = None,
 ) -> FeedbackLoopEngine:
     """
     Quick helper to create a simple feedback simulation.
@@ -561,4 +613,4 @@ def create_simple_simulation(
         params=params or FeedbackParams(),
     )
     
-    return FeedbackLoopEngine(config)
+    return FeedbackLoopEngine(config, history_dir=history_dir)
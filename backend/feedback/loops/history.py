@@ -0,0 +1,132 @@
+"""
+============================================================================
+CHE·NU™ V69 — BOUNDED SIMULATION HISTORY
+============================================================================
+Version: 1.0.0
+Purpose: Keep recent WorldStates/artifacts in memory, spill the rest
+Principle: Long-horizon simulations run in constant memory, fully replayable
+============================================================================
+"""
+
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import IO, Generic, Iterator, List, Optional, Type, TypeVar, Union, overload
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class BoundedHistory(Generic[T]):
+    """
+    Append-only sequence of pydantic models with a bounded in-memory window.
+
+    The newest `window` items live in a ring buffer. Older items are
+    streamed to an append-only JSONL log and read back on demand, so
+    indexing and iteration behave like the full list. Only one byte
+    offset per spilled item is kept in memory.
+
+    The log keeps one write handle and one (lazily opened) read handle
+    for its lifetime; spills are buffered and flushed before reads.
+    Call close() when the simulation is done.
+
+    Without a log path the history is unbounded (everything in memory).
+
+    Usage:
+        states = BoundedHistory(WorldState, window=3, log_path="run/states.jsonl")
+        states.append(state)
+
+        latest = states[-1]
+        recent = states.recent()     # newest items, oldest first
+        first = states[0]            # read back from the log if spilled
+    """
+
+    def __init__(
+        self,
+        model: Type[T],
+        window: int = 1,
+        log_path: Optional[Union[str, Path]] = None,
+    ):
+        self.model = model
+        self.log_path = Path(log_path) if log_path else None
+        self.window = max(1, window) if self.log_path else None
+        self._recent: deque = deque()
+        self._offsets = array("q")
+        self._end = 0
+        self._writer: Optional[IO[bytes]] = None
+        self._reader: Optional[IO[bytes]] = None
+
+        if self.log_path:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = self.log_path.open("wb")
+
+    def append(self, item: T) -> None:
+        """Append an item, spilling the oldest one past the window"""
+        self._recent.append(item)
+        if self.window is not None and len(self._recent) > self.window:
+            self._spill(self._recent.popleft())
+
+    def recent(self) -> List[T]:
+        """In-memory items, oldest first"""
+        return list(self._recent)
+
+    @property
+    def spilled_count(self) -> int:
+        return len(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._recent)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+
+        spilled = len(self._offsets)
+        if index >= spilled:
+            return self._recent[index - spilled]
+        return self._read(index)
+
+    def __iter__(self) -> Iterator[T]:
+        spilled = len(self._offsets)
+        if spilled:
+            # Private handle: iteration may interleave with appends/lookups
+            self._writer.flush()
+            with self.log_path.open("rb") as f:
+                for _ in range(spilled):
+                    yield self.model.model_validate_json(f.readline())
+        yield from list(self._recent)
+
+    def close(self) -> None:
+        """Flush the log and release its handles"""
+        for handle in (self._writer, self._reader):
+            if handle is not None:
+                handle.close()
+        self._writer = self._reader = None
+
+    def _spill(self, item: T) -> None:
+        line = item.model_dump_json().encode() + b"\n"
+        self._offsets.append(self._end)
+        self._writer.write(line)
+        self._end += len(line)
+
+    def _read(self, index: int) -> T:
+        self._writer.flush()
+        if self._reader is None:
+            self._reader = self.log_path.open("rb")
+        self._reader.seek(self._offsets[index])
+        return self.model.model_validate_json(self._reader.readline())
@@ -14,7 +14,11 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field, computed_field
 import uuid
 import hashlib
-import json
+
+try:
+    from ..canonical import canonical_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_hash
 
 
 # ============================================================================
@@ -170,7 +174,7 @@ class WorldState(BaseModel):
             "tick": self.tick,
             "slots": {k: v.value for k, v in sorted(self.slots.items())},
         }
-        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        return canonical_hash(content)
     
     def get_slot(self, name: str) -> Optional[Slot]:
         """Get slot by name"""
@@ -442,7 +446,7 @@ class SimulationArtifact(BaseModel):
             "feedback_edges_applied": sorted(self.feedback_edges_applied),
             "safety_actions": self.safety_actions,
         }
-        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+        return canonical_hash(content)
     
     def sign(self, secret_key: str = "mock-key") -> str:
         """Sign the artifact"""
@@ -226,6 +226,58 @@ class TestFeedbackEngine:
                 prev_artifact = engine.artifacts[i - 1]
                 assert artifact.previous_artifact_hash == prev_artifact.hash
 
+    def test_bounded_history_spills_to_disk(self, simple_config, tmp_path):
+        in_memory = FeedbackLoopEngine(simple_config)
+        in_memory.run()
+
+        bounded = FeedbackLoopEngine(simple_config, history_dir=tmp_path)
+        summary = bounded.run()
+
+        assert summary["artifact_chain_valid"] == True
+        assert len(bounded.states.recent()) == 1
+        assert len(bounded.artifacts.recent()) == 1
+        assert len(bounded.states) == len(in_memory.states)
+        assert [s.hash for s in bounded.states] == [s.hash for s in in_memory.states]
+
+        state = bounded.get_state_at(2)
+        assert state.tick == 2
+        assert state.hash == in_memory.get_state_at(2).hash
+        assert bounded.get_artifact_at(0).t_from == 0
+
+        # Reads flush buffered spills; a step after a lookup still appends
+        bounded.config.t_end += 1
+        bounded.step()
+        assert bounded.states[-2].hash == bounded.states[len(bounded.states) - 2].hash
+        assert bounded.get_state_at(0).hash == in_memory.get_state_at(0).hash
+
+        bounded.close()
+        lines = (tmp_path / "states.jsonl").read_text().splitlines()
+        assert len(lines) == bounded.states.spilled_count
+
+    def test_delayed_edges_use_ring_buffer(self, tmp_path):
+        config = SimulationConfig(
+            name="Delay Test",
+            t_start=0,
+            t_end=8,
+            initial_slots=[Slot(name="Stock", value=100.0)],
+            feedback_edges=[
+                FeedbackEdge(
+                    name="delayed_stock",
+                    target_slot="Stock",
+                    source_slots=["Stock"],
+                    coefficients={"Stock": 1.05},
+                    model=FeedbackModel.DELAY,
+                    delay_ticks=3,
+                ),
+            ],
+        )
+
+        in_memory = FeedbackLoopEngine(config)
+        bounded = FeedbackLoopEngine(config, history_dir=tmp_path)
+
+        assert in_memory.run()["final_state"] == bounded.run()["final_state"]
+        assert len(bounded.states.recent()) == 3
+
 
 # ============================================================================
 # L2 SAFETY CONTROLLER TESTS
@@ -21,8 +21,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
-import hashlib
-import json
+
+try:
+    from ..canonical import canonical_json, content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json, content_hash
 
 
 # ============================================================================
@@ -33,14 +36,10 @@ def generate_id() -> str:
     return str(uuid.uuid4())
 
 def compute_hash(data: Any) -> str:
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif not isinstance(data, bytes):
-        data = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data)
 
 def sign_artifact(data: Dict[str, Any], signer: str) -> str:
-    return compute_hash(f"{json.dumps(data, sort_keys=True, default=str)}:{signer}")
+    return compute_hash(f"{canonical_json(data, default=str)}:{signer}")
 
 
 # ============================================================================
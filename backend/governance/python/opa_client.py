@@ -9,8 +9,6 @@ Principle: GOUVERNANCE > EXÉCUTION
 """
 
 import asyncio
-import hashlib
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -18,6 +16,11 @@ from typing import Any, Dict, Optional
 import httpx
 from pydantic import BaseModel
 
+try:
+    from ...canonical import canonical_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_hash
+
 from .models import (
     OPARequest,
     OPADecision,
@@ -136,9 +139,7 @@ class OPAClient:
         input_data = {"input": request.to_opa_input()["request"]}
         
         # Calculate request hash for audit
-        request_hash = hashlib.sha256(
-            json.dumps(input_data, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        request_hash = canonical_hash(input_data, default=str)
 
         # Retry logic
         last_error: Optional[Exception] = None
@@ -191,9 +192,7 @@ class OPAClient:
         client = self._get_sync_client()
         input_data = {"input": request.to_opa_input()["request"]}
         
-        request_hash = hashlib.sha256(
-            json.dumps(input_data, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        request_hash = canonical_hash(input_data, default=str)
 
         last_error: Optional[Exception] = None
         for attempt in range(self.config.retry_count):
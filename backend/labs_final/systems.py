@@ -18,9 +18,13 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 import hashlib
-import json
 import base64
 
+try:
+    from ..canonical import canonical_json
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json
+
 from .models import (
     # LABS Chapter 1
     LABSDomain, TaskStatus, LivingTask, LABSFeature, LABSInnovationTrack,
@@ -520,11 +524,11 @@ class XRPackV16Service:
         Per spec: Private key server-side, public key in pack
         """
         # Mock Ed25519 - in real impl would use nacl/cryptography
-        data = json.dumps({
+        data = canonical_json({
             "pack_id": pack.pack_id,
             "version": pack.version,
             "timestamp": datetime.utcnow().isoformat(),
-        }, sort_keys=True)
+        })
         
         # Mock signature
         signature_bytes = hashlib.sha512(data.encode()).digest()
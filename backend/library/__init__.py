@@ -46,6 +46,7 @@ from .publishing import (
     TextNormalizer,
     OPAScreener,
     SemanticIndexer,
+    VectorIndex,
     create_pipeline,
     create_screener,
     create_indexer,
@@ -98,7 +99,7 @@ __all__ = [
     "generate_id", "compute_hash", "sign_artifact",
     # Publishing
     "PublishingPipeline", "TextNormalizer", "OPAScreener", "SemanticIndexer",
-    "create_pipeline", "create_screener", "create_indexer",
+    "VectorIndex", "create_pipeline", "create_screener", "create_indexer",
     # Immersive Reading
     "ImmersiveReadingEngine", "SceneGenerator", "EmotionExtractor", "AssetLibrary",
     "create_engine", "create_reader_profile",
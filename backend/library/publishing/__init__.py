@@ -1,3 +1,3 @@
 """CHE·NU™ V69 — Library Publishing Protocol"""
-from .protocol import PublishingPipeline, TextNormalizer, OPAScreener, SemanticIndexer, create_pipeline, create_screener, create_indexer
-__all__ = ["PublishingPipeline", "TextNormalizer", "OPAScreener", "SemanticIndexer", "create_pipeline", "create_screener", "create_indexer"]
+from .protocol import PublishingPipeline, TextNormalizer, OPAScreener, SemanticIndexer, VectorIndex, create_pipeline, create_screener, create_indexer
+__all__ = ["PublishingPipeline", "TextNormalizer", "OPAScreener", "SemanticIndexer", "VectorIndex", "create_pipeline", "create_screener", "create_indexer"]
@@ -20,9 +20,12 @@ Pipeline (per spec):
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
 import logging
 import re
 
+import numpy as np
+
 from ..models import (
     BookArtifact,
     ChapterChunk,
@@ -188,31 +191,61 @@ class SemanticIndexer:
         "education": ["apprendre", "cours", "leçon", "exercice", "formation"],
     }
     
+    DIMENSIONS = 128
+    
     def index(self, text: str, title: str = "") -> Dict[str, Any]:
         """Index text content"""
-        text_lower = text.lower()
-        combined = f"{title.lower()} {text_lower}"
-        
-        # Extract tags
-        tags = []
-        for category, keywords in self.SEMANTIC_TAGS.items():
-            if any(kw in combined for kw in keywords):
-                tags.append(category)
-        
-        # Generate mock vector (in production: use real embeddings)
-        vector = self._generate_mock_vector(combined)
+        combined = self._combine(text, title)
         
         return {
-            "tags": tags,
-            "vector": vector,
+            "tags": self._tags_for(combined),
+            # Generate mock vector (in production: use real embeddings)
+            "vector": self._generate_mock_vector(combined),
             "word_count": len(text.split()),
             "indexed_at": datetime.utcnow().isoformat(),
         }
     
-    def _generate_mock_vector(self, text: str, dim: int = 128) -> List[float]:
-        """Generate mock semantic vector"""
-        import hashlib
+    def extract_tags(self, text: str, title: str = "") -> List[str]:
+        """Extract semantic tags, as index(text, title)["tags"]"""
+        return self._tags_for(self._combine(text, title))
+    
+    def _tags_for(self, combined: str) -> List[str]:
+        return [
+            category for category, keywords in self.SEMANTIC_TAGS.items()
+            if any(kw in combined for kw in keywords)
+        ]
+    
+    def embed_batch(
+        self,
+        texts: List[str],
+        titles: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """
+        Embed many texts at once.
+        
+        Returns a float32 matrix of shape (len(texts), DIMENSIONS) whose
+        rows equal index(text, title)["vector"].
+        """
+        if not texts:
+            return np.empty((0, self.DIMENSIONS), dtype=np.float32)
+        titles = titles or [""] * len(texts)
+        digests = b"".join(
+            hashlib.sha256(self._combine(text, title).encode()).digest()
+            for text, title in zip(texts, titles)
+        )
         
+        matrix = np.full((len(texts), self.DIMENSIONS), 0.5, dtype=np.float32)
+        head = min(hashlib.sha256().digest_size, self.DIMENSIONS)
+        raw = np.frombuffer(digests, dtype=np.uint8).reshape(len(texts), -1)
+        matrix[:, :head] = raw[:, :head] / 255.0
+        return matrix
+    
+    @staticmethod
+    def _combine(text: str, title: str = "") -> str:
+        return f"{title.lower()} {text.lower()}"
+    
+    def _generate_mock_vector(self, text: str, dim: int = DIMENSIONS) -> List[float]:
+        """Generate mock semantic vector"""
         # Create deterministic vector from text hash
         h = hashlib.sha256(text.encode()).hexdigest()
         vector = []
@@ -242,6 +275,194 @@ class SemanticIndexer:
         return dot / (norm_a * norm_b)
 
 
+# ============================================================================
+# VECTOR INDEX
+# ============================================================================
+
+class VectorIndex:
+    """
+    Chunk-level embedding index for published books.
+    
+    Embeddings are L2-normalized and stacked in one contiguous float32
+    matrix, kept in memory or memory-mapped from `path`, so a query's
+    cosine scores are a single matrix-vector product. Each row belongs
+    to a book (its whole-text vector or one of its chunks); a book
+    scores as its best row. Rows of removed books are masked out, and
+    compacted away once they exceed COMPACT_RATIO of the rows. Tags are
+    kept as postings lists so a tag filter narrows the rows before
+    scoring.
+    """
+    
+    COMPACT_RATIO = 0.5
+    
+    def __init__(
+        self,
+        dim: int = SemanticIndexer.DIMENSIONS,
+        path: Optional[str] = None,
+        capacity: int = 1024,
+    ):
+        self.dim = dim
+        self.path = path
+        self._size = 0
+        self._matrix = self._allocate(max(1, capacity))
+        self._alive = np.zeros(len(self._matrix), dtype=bool)
+        self._row_books = np.zeros(len(self._matrix), dtype=np.int64)
+        self._row_chunks: List[Optional[str]] = []
+        self._book_ids: List[str] = []
+        self._book_ords: Dict[str, int] = {}
+        self._book_rows: Dict[str, np.ndarray] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._dead = 0  # masked-out rows below _size
+    
+    def __len__(self) -> int:
+        return len(self._book_rows)
+    
+    def __contains__(self, book_id: str) -> bool:
+        return book_id in self._book_rows
+    
+    def add(
+        self,
+        book_id: str,
+        vectors: np.ndarray,
+        chunk_ids: List[Optional[str]],
+        tags: List[List[str]],
+    ) -> None:
+        """Index one book's rows, replacing any rows it already had"""
+        self.remove(book_id)
+        
+        count = len(vectors)
+        self._reserve(self._size + count)
+        rows = np.arange(self._size, self._size + count)
+        
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        self._matrix[rows] = np.divide(
+            vectors, norms, out=np.zeros_like(vectors, dtype=np.float32), where=norms > 0
+        )
+        self._alive[rows] = True
+        if book_id not in self._book_ords:
+            self._book_ords[book_id] = len(self._book_ids)
+            self._book_ids.append(book_id)
+        self._row_books[rows] = self._book_ords[book_id]
+        self._row_chunks.extend(chunk_ids)
+        for row, row_tags in zip(rows.tolist(), tags):
+            for tag in row_tags:
+                self._postings.setdefault(tag, []).append(row)
+        
+        self._book_rows[book_id] = rows
+        self._size += count
+    
+    def remove(self, book_id: str) -> None:
+        rows = self._book_rows.pop(book_id, None)
+        if rows is None:
+            return
+        self._alive[rows] = False
+        self._dead += len(rows)
+        if self._dead > self._size * self.COMPACT_RATIO:
+            self._compact()
+    
+    def search(
+        self,
+        query_vector: np.ndarray,
+        threshold: float = 0.0,
+        top_k: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+    ) -> List[Tuple[str, float, Optional[str]]]:
+        """
+        Return (book_id, score, chunk_id) for each book whose best row
+        reaches `threshold`, best first. chunk_id is None when the best
+        row is the book's whole-text vector.
+        """
+        if tags is None:
+            rows = np.flatnonzero(self._alive[:self._size])
+        else:
+            postings = [self._postings.get(tag, []) for tag in tags]
+            rows = np.unique(np.fromiter(
+                (row for posting in postings for row in posting), dtype=np.int64
+            ))
+            rows = rows[self._alive[rows]]
+        if not len(rows):
+            return []
+        
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        
+        scores = self._matrix[rows] @ (query / norm)
+        keep = scores >= threshold
+        rows, scores = rows[keep], scores[keep]
+        
+        # Best row per book: order by score, then keep each book's first row
+        books = self._row_books[rows]
+        order = np.lexsort((books, -scores))
+        _, first = np.unique(books[order], return_index=True)
+        best = order[np.sort(first)]
+        if top_k is not None:
+            best = best[:top_k]
+        
+        return [
+            (self._book_ids[books[i]], float(scores[i]), self._row_chunks[rows[i]])
+            for i in best
+        ]
+    
+    def flush(self) -> None:
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+    
+    def _compact(self) -> None:
+        """Move live rows to the front and renumber every row reference"""
+        live = np.flatnonzero(self._alive[:self._size])
+        count = len(live)
+        renumber = np.full(self._size, -1, dtype=np.int64)
+        renumber[live] = np.arange(count)
+        
+        self._matrix[:count] = self._matrix[live]
+        self._row_books[:count] = self._row_books[live]
+        self._alive[:count] = True
+        self._alive[count:self._size] = False
+        self._row_chunks = [self._row_chunks[row] for row in live.tolist()]
+        self._book_rows = {book: renumber[rows] for book, rows in self._book_rows.items()}
+        
+        postings = {}
+        for tag, posting in self._postings.items():
+            rows = renumber[posting]
+            rows = rows[rows >= 0]
+            if len(rows):
+                postings[tag] = rows.tolist()
+        self._postings = postings
+        
+        self._size = count
+        self._dead = 0
+    
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, self.dim), dtype=np.float32)
+        return np.memmap(self.path, dtype=np.float32, mode="w+", shape=(capacity, self.dim))
+    
+    def _reserve(self, needed: int) -> None:
+        capacity = len(self._matrix)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        
+        if self.path is None:
+            matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+            matrix[:self._size] = self._matrix[:self._size]
+        else:
+            # Grow the backing file in place and remap it
+            self._matrix.flush()
+            del self._matrix
+            with open(self.path, "r+b") as f:
+                f.truncate(capacity * self.dim * np.dtype(np.float32).itemsize)
+            matrix = np.memmap(self.path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        
+        self._matrix = matrix
+        self._alive = np.resize(self._alive, capacity)
+        self._alive[self._size:] = False
+        self._row_books = np.resize(self._row_books, capacity)
+
+
 # ============================================================================
 # PUBLISHING PIPELINE
 # ============================================================================
@@ -253,13 +474,16 @@ class PublishingPipeline:
     Per spec pipeline: Upload → Normalization → OPA → Indexing → Signing → Publish
     """
     
-    def __init__(self):
+    def __init__(self, vector_index: Optional[VectorIndex] = None):
         self.normalizer = TextNormalizer()
         self.screener = OPAScreener()
         self.indexer = SemanticIndexer()
+        self.vector_index = vector_index or VectorIndex(self.indexer.DIMENSIONS)
         
         # Storage
         self._books: Dict[str, BookArtifact] = {}
+        # Embeddings of indexed books, added to vector_index on publish
+        self._staged: Dict[str, Tuple[np.ndarray, List[Optional[str]], List[List[str]]]] = {}
     
     def upload(
         self,
@@ -363,10 +587,19 @@ class PublishingPipeline:
         book.semantic_vector = index_data["vector"]
         book.semantic_index_ref = f"index://{book_id}"
         
-        # Index individual chunks
-        for chunk in book.chapters:
-            chunk_index = self.indexer.index(chunk.text)
-            chunk.semantic_tags = chunk_index["tags"]
+        # Index individual chunks in one batch
+        chunk_texts = [c.text for c in book.chapters]
+        chunk_vectors = self.indexer.embed_batch(chunk_texts)
+        for chunk, text in zip(book.chapters, chunk_texts):
+            chunk.semantic_tags = self.indexer.extract_tags(text)
+        
+        # Row 0 is the whole book, then one row per chunk
+        self.vector_index.remove(book_id)
+        self._staged[book_id] = (
+            np.vstack([np.asarray(book.semantic_vector, dtype=np.float32), chunk_vectors]),
+            [None] + [c.chunk_id for c in book.chapters],
+            [index_data["tags"]] + [c.semantic_tags for c in book.chapters],
+        )
         
         book.status = PublishingStatus.INDEXED
         logger.info(f"Book {book_id} indexed: tags={index_data['tags']}")
@@ -422,6 +655,11 @@ class PublishingPipeline:
         book.status = PublishingStatus.PUBLISHED
         book.published_at = datetime.utcnow()
         
+        staged = self._staged.pop(book_id, None)
+        if staged is not None:
+            vectors, chunk_ids, tags = staged
+            self.vector_index.add(book_id, vectors, chunk_ids, tags)
+        
         logger.info(f"Book {book_id} published: {book.title}")
         return book
     
@@ -463,25 +701,25 @@ class PublishingPipeline:
         self,
         query: str,
         threshold: float = 0.5,
+        top_k: Optional[int] = None,
+        tags: Optional[List[str]] = None,
     ) -> List[Tuple[BookArtifact, float]]:
         """
         Search books by semantic query.
         
         Per spec: semantic_query, similarity_threshold
+        
+        A book matches through its whole text or its best chunk. `tags`
+        restricts the search to rows carrying any of the given tags.
         """
-        # Index query
-        query_index = self.indexer.index(query)
-        query_vector = query_index["vector"]
+        query_vector = self.indexer.embed_batch([query])[0]
+        hits = self.vector_index.search(query_vector, threshold, top_k, tags)
         
         results = []
-        for book in self._books.values():
-            if book.status == PublishingStatus.PUBLISHED:
-                sim = self.indexer.similarity(query_vector, book.semantic_vector)
-                if sim >= threshold:
-                    results.append((book, sim))
-        
-        # Sort by similarity
-        results.sort(key=lambda x: x[1], reverse=True)
+        for book_id, sim, _ in hits:
+            book = self._books.get(book_id)
+            if book and book.status == PublishingStatus.PUBLISHED:
+                results.append((book, sim))
         return results
     
     def get_book(self, book_id: str) -> Optional[BookArtifact]:
@@ -76,6 +76,56 @@ class TestPublishing:
         results = pipeline.search("space exploration", threshold=0.3)
         assert len(results) >= 0  # May or may not find depending on mock vectors
 
+    def test_chunk_vector_search(self, tmp_path):
+        from ..publishing import PublishingPipeline, VectorIndex
+
+        pipeline = PublishingPipeline(VectorIndex(path=str(tmp_path / "vectors.f32"), capacity=2))
+
+        poem = "Un poème en vers libres.\n\nLa rime revient à chaque strophe."
+        book, success, _ = pipeline.run_full_pipeline("Recueil", "author-1", poem)
+        assert success
+        pipeline.run_full_pipeline("Cours", "author-2", "Une leçon et un exercice pour apprendre.")
+
+        # A chunk's own text finds its book at full similarity
+        chunk = book.chapters[0]
+        results = pipeline.search(chunk.text, threshold=0.99)
+        assert [b.book_id for b, _ in results] == [book.book_id]
+        assert results[0][1] == pytest.approx(1.0)
+
+        # Tag pre-filtering and top_k
+        assert pipeline.search(chunk.text, threshold=0.0, tags=["education"])[0][0] is not book
+        assert len(pipeline.search("lecture", threshold=0.0, top_k=1)) == 1
+
+        # Re-indexing withdraws the book until it is published again
+        pipeline.index_semantically(book.book_id)
+        assert all(b is not book for b, _ in pipeline.search(chunk.text, threshold=0.0))
+
+    def test_embed_empty_batch(self):
+        from ..publishing import SemanticIndexer
+
+        vectors = SemanticIndexer().embed_batch([])
+        assert vectors.shape == (0, SemanticIndexer.DIMENSIONS)
+
+    def test_vector_index_compacts_removed_rows(self):
+        import numpy as np
+        from ..publishing import VectorIndex
+
+        index = VectorIndex(dim=4, capacity=2)
+        vectors = np.eye(4, dtype=np.float32)
+        index.add("a", vectors[:2], [None, "a-1"], [["poetry"], ["poetry"]])
+        index.add("b", vectors[2:3], ["b-1"], [["science"]])
+        index.add("c", vectors[3:], ["c-1"], [["poetry"]])
+
+        index.remove("a")  # 2 of 4 rows dead: still masked
+        assert index._size == 4
+        index.add("b", vectors[2:3], ["b-2"], [["science"]])  # 3 of 5 dead
+
+        assert index._size == 2
+        assert index._row_chunks == ["c-1", "b-2"]
+        assert index._postings == {"poetry": [0], "science": [1]}
+        assert index.search(vectors[3])[0] == ("c", pytest.approx(1.0), "c-1")
+        assert [b for b, _, _ in index.search(vectors[2], tags=["science"])] == ["b"]
+
 
 # ============================================================================
 # IMMERSIVE READING TESTS
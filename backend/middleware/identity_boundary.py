@@ -14,20 +14,24 @@ Author: CHE·NU Team
 Version: 1.0.0
 """
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 import asyncio
 import hashlib
 import json
 import logging
+import random
 import re
 import time
 
 from fastapi import Request, Response, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +86,17 @@ PUBLIC_PREFIXES = [
     "/auth/oauth/",
 ]
 
+# Target identity segments in resource paths, by precedence. The lookahead
+# finds overlapping occurrences so precedence, not position, decides.
+IDENTITY_PATH_SEGMENTS = ["users", "identities", "user", "identity"]
+_IDENTITY_PATH_RE = re.compile(
+    r"(?=/(" + "|".join(IDENTITY_PATH_SEGMENTS) + r")/([a-zA-Z0-9_-]+))"
+)
+_IDENTITY_SEGMENT_RANK = {segment: rank for rank, segment in enumerate(IDENTITY_PATH_SEGMENTS)}
+
+# Second path segment, when it looks like an ID: /{resource}/{id}[/...]
+_RESOURCE_ID_RE = re.compile(r"^/*[^/]+/([a-zA-Z0-9_-]+)(?:/|$)")
+
 
 # =============================================================================
 # DATA MODELS
@@ -137,6 +152,72 @@ class ViolationEvent:
         }
 
 
+class LRUCache:
+    """
+    Bounded mapping with least-recently-used eviction and optional TTL.
+    
+    Tracks hits, misses and evictions for get_stats().
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: str) -> bool:
+        return self.lookup(key, count=False)[0]
+    
+    def lookup(self, key: str, count: bool = True) -> Tuple[bool, Any]:
+        """(found, value); expired entries count as misses"""
+        item = self._data.get(key)
+        if item is not None:
+            expires_at, value = item
+            if expires_at >= time.monotonic():
+                self._data.move_to_end(key)
+                if count:
+                    self.hits += 1
+                return True, value
+            del self._data[key]
+        if count:
+            self.misses += 1
+        return False, None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        found, value = self.lookup(key)
+        return value if found else default
+    
+    def set(self, key: str, value: Any) -> None:
+        ttl = self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+    
+    __setitem__ = set
+    
+    def clear(self) -> None:
+        self._data.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
 @dataclass
 class AuditEntry:
     """Audit log entry"""
@@ -168,15 +249,39 @@ class IdentityBoundaryService:
     - Validate identity ownership of resources
     - Detect cross-identity access attempts
     - Log violations with full audit trail
+    
+    Violations and the audit log are ring buffers: the oldest entries
+    fall off in O(1) once full. Successful accesses are recorded with
+    probability `audit_sample_rate`; denials and violations always are.
+    
+    Decoded bearer tokens are cached for `token_ttl_seconds`, keyed by
+    the token's SHA-256 (tokens themselves are never kept as keys), and
+    identity contexts are kept in an LRU of `max_cached_identities`.
     """
     
-    def __init__(self):
-        self._violations: List[ViolationEvent] = []
-        self._audit_log: List[AuditEntry] = []
-        self._identity_cache: Dict[str, IdentityContext] = {}
-        self._resource_ownership: Dict[str, str] = {}  # resource_id -> identity_id
+    def __init__(
+        self,
+        audit_sample_rate: float = 1.0,
+        max_cached_tokens: int = 10000,
+        token_ttl_seconds: float = 300.0,
+        max_cached_identities: int = 10000,
+    ):
         self._max_violations = 10000
         self._max_audit_entries = 50000
+        self._violations: Deque[ViolationEvent] = deque(maxlen=self._max_violations)
+        self._audit_log: Deque[AuditEntry] = deque(maxlen=self._max_audit_entries)
+        self._identity_cache = LRUCache(max_cached_identities)
+        self._token_cache = LRUCache(max_cached_tokens, ttl_seconds=token_ttl_seconds)
+        self._resource_ownership: Dict[str, str] = {}  # resource_id -> identity_id
+        self.audit_sample_rate = audit_sample_rate
+        
+        # Public path classifier: exact set + one anchored prefix regex
+        self._public_paths = frozenset(PUBLIC_PATHS)
+        self._public_prefix_re = re.compile(
+            "|".join(re.escape(prefix) for prefix in PUBLIC_PREFIXES) or r"(?!)"
+        )
+        self._public_path_checks = 0
+        self._public_path_hits = 0
         
         # Statistics
         self._total_requests = 0
@@ -211,11 +316,11 @@ class IdentityBoundaryService:
             auth_header = request.headers.get("Authorization", "")
             if auth_header.startswith("Bearer "):
                 token = auth_header[7:]
-                extracted = self._extract_from_jwt(token)
+                extracted = self._decode_token(token)
                 if extracted:
                     identity_id = extracted.get("sub")
-                    scopes = extracted.get("scopes", [])
-                    roles = extracted.get("roles", [])
+                    scopes = list(extracted.get("scopes", []))
+                    roles = list(extracted.get("roles", []))
         
         # Try session cookie
         if not identity_id:
@@ -249,6 +354,15 @@ class IdentityBoundaryService:
         
         return context
     
+    def _decode_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Decoded JWT claims, cached by token digest"""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        found, claims = self._token_cache.lookup(key)
+        if not found:
+            claims = self._extract_from_jwt(token)
+            self._token_cache.set(key, claims)
+        return claims
+    
     def _extract_from_jwt(self, token: str) -> Optional[Dict[str, Any]]:
         """Extract claims from JWT (simplified - in production use proper JWT library)"""
         try:
@@ -310,14 +424,12 @@ class IdentityBoundaryService:
     
     def is_public_path(self, path: str) -> bool:
         """Check if path is public (no identity required)"""
-        # Exact match
-        if path in PUBLIC_PATHS:
-            return True
+        self._public_path_checks += 1
         
-        # Prefix match
-        for prefix in PUBLIC_PREFIXES:
-            if path.startswith(prefix):
-                return True
+        # Exact match, then any public prefix in a single regex match
+        if path in self._public_paths or self._public_prefix_re.match(path):
+            self._public_path_hits += 1
+            return True
         
         return False
     
@@ -366,19 +478,15 @@ class IdentityBoundaryService:
     def _extract_identity_from_path(self, path: str) -> Optional[str]:
         """Extract target identity from resource path"""
         # Pattern: /users/{user_id}/... or /identities/{identity_id}/...
-        patterns = [
-            r"/users/([a-zA-Z0-9_-]+)",
-            r"/identities/([a-zA-Z0-9_-]+)",
-            r"/user/([a-zA-Z0-9_-]+)",
-            r"/identity/([a-zA-Z0-9_-]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, path)
-            if match:
-                return match.group(1)
-        
-        return None
+        best_rank, best_id = len(IDENTITY_PATH_SEGMENTS), None
+        for match in _IDENTITY_PATH_RE.finditer(path):
+            rank = _IDENTITY_SEGMENT_RANK[match.group(1)]
+            if rank < best_rank:
+                best_rank, best_id = rank, match.group(2)
+                if rank == 0:
+                    break
+        
+        return best_id
     
     def _extract_identity_from_body(self, body: Dict[str, Any]) -> Optional[str]:
         """Extract target identity from request body"""
@@ -433,10 +541,13 @@ class IdentityBoundaryService:
             f"to {violation.target_identity} "
             f"on {violation.resource_path}"
         )
-        
-        # Trim if too many
-        if len(self._violations) > self._max_violations:
-            self._violations = self._violations[-self._max_violations:]
+    
+    @staticmethod
+    def _tail(entries: Deque[Any], limit: int) -> List[Any]:
+        """Last `limit` entries of a ring buffer without copying it"""
+        if limit <= 0:
+            return []
+        return list(islice(entries, max(len(entries) - limit, 0), None))
     
     def get_violations(
         self,
@@ -445,7 +556,10 @@ class IdentityBoundaryService:
         violation_type: Optional[ViolationType] = None,
     ) -> List[ViolationEvent]:
         """Get recorded violations with optional filters"""
-        violations = self._violations
+        if not identity_id and not violation_type:
+            return self._tail(self._violations, limit)
+        
+        violations = list(self._violations)
         
         if identity_id:
             violations = [
@@ -479,6 +593,18 @@ class IdentityBoundaryService:
         metadata: Optional[Dict[str, Any]] = None,
     ):
         """Log access attempt to audit trail"""
+        self._total_requests += 1
+        
+        # Sample routine successes; denials and violations are always kept
+        sample_rate = self.audit_sample_rate
+        if (
+            success
+            and action == AuditAction.ACCESS_ALLOWED
+            and sample_rate < 1.0
+            and random.random() >= sample_rate
+        ):
+            return
+        
         entry = AuditEntry(
             action=action,
             identity_id=identity_id,
@@ -493,11 +619,6 @@ class IdentityBoundaryService:
         )
         
         self._audit_log.append(entry)
-        self._total_requests += 1
-        
-        # Trim if too many
-        if len(self._audit_log) > self._max_audit_entries:
-            self._audit_log = self._audit_log[-self._max_audit_entries:]
     
     def get_audit_log(
         self,
@@ -505,10 +626,10 @@ class IdentityBoundaryService:
         identity_id: Optional[str] = None,
     ) -> List[AuditEntry]:
         """Get audit log entries"""
-        entries = self._audit_log
+        if not identity_id:
+            return self._tail(self._audit_log, limit)
         
-        if identity_id:
-            entries = [e for e in entries if e.identity_id == identity_id]
+        entries = [e for e in self._audit_log if e.identity_id == identity_id]
         
         return entries[-limit:]
     
@@ -523,6 +644,10 @@ class IdentityBoundaryService:
             "total_violations": self._total_violations,
             "violations_by_type": self._violations_by_type,
             "cached_identities": len(self._identity_cache),
+            "identity_cache": self._identity_cache.stats(),
+            "token_cache": self._token_cache.stats(),
+            "public_path_checks": self._public_path_checks,
+            "public_path_hits": self._public_path_hits,
             "registered_resources": len(self._resource_ownership),
             "pending_violations": len([
                 v for v in self._violations if not v.resolved
@@ -534,35 +659,41 @@ class IdentityBoundaryService:
 # MIDDLEWARE
 # =============================================================================
 
-class IdentityBoundaryMiddleware(BaseHTTPMiddleware):
+class IdentityBoundaryMiddleware:
     """
-    FastAPI Middleware for Identity Boundary Enforcement
+    ASGI Middleware for Identity Boundary Enforcement
     
     Features:
     - Extracts identity from every request
     - Validates identity ownership on resource access
     - Returns HTTP 403 for violations
     - Logs all access attempts
+    
+    Implemented as plain ASGI (no BaseHTTPMiddleware task and stream
+    wrapping per request); the identity is shared with downstream
+    handlers through request.state.
     """
     
-    def __init__(self, app, service: Optional[IdentityBoundaryService] = None):
-        super().__init__(app)
-        self.service = service or _default_service
+    def __init__(self, app: ASGIApp, service: Optional[IdentityBoundaryService] = None):
+        self.app = app
+        self.service = service or get_identity_boundary_service()
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through identity boundary"""
-        start_time = time.time()
-        path = request.url.path
-        method = request.method
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        path = scope["path"]
+        method = scope["method"]
         
         # Skip public paths
         if self.service.is_public_path(path):
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope, receive)
         
         # Extract identity
         identity = self.service.extract_identity(request)
@@ -580,13 +711,15 @@ class IdentityBoundaryMiddleware(BaseHTTPMiddleware):
                 error_message="Missing identity",
             )
             
-            raise HTTPException(
+            response = JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
+                content={"detail": {
                     "error": "authentication_required",
                     "message": "Identity not found in request. Please provide valid authentication.",
-                }
+                }}
             )
+            await response(scope, receive, send)
+            return
         
         # Store identity in request state for downstream use
         request.state.identity = identity
@@ -622,40 +755,26 @@ class IdentityBoundaryMiddleware(BaseHTTPMiddleware):
                     }
                 )
                 
-                raise HTTPException(
+                response = JSONResponse(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail={
+                    content={"detail": {
                         "error": "identity_boundary_violation",
                         "message": "Access denied. You cannot access resources belonging to another identity.",
                         "violation_type": "cross_identity_access",
                         "requesting_identity": identity.identity_id,
                         "target_identity": target_identity,
-                    }
+                    }}
                 )
+                await response(scope, receive, send)
+                return
         
         # Process request
         try:
-            response = await call_next(request)
-            duration_ms = int((time.time() - start_time) * 1000)
-            
-            # Log successful access
-            self.service.log_access(
-                action=AuditAction.ACCESS_ALLOWED,
-                identity_id=identity.identity_id,
-                resource_path=path,
-                request_method=method,
-                ip_address=identity.ip_address,
-                user_agent=identity.user_agent,
-                duration_ms=duration_ms,
-                success=True,
-            )
-            
-            return response
-            
+            await self.app(scope, receive, send)
         except HTTPException:
             raise
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
             
             # Log error
             self.service.log_access(
@@ -670,17 +789,26 @@ class IdentityBoundaryMiddleware(BaseHTTPMiddleware):
                 error_message=str(e),
             )
             raise
+        
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
+        
+        # Log successful access
+        self.service.log_access(
+            action=AuditAction.ACCESS_ALLOWED,
+            identity_id=identity.identity_id,
+            resource_path=path,
+            request_method=method,
+            ip_address=identity.ip_address,
+            user_agent=identity.user_agent,
+            duration_ms=duration_ms,
+            success=True,
+        )
     
     def _extract_resource_id(self, path: str) -> Optional[str]:
         """Extract resource ID from path"""
         # Pattern: /{resource}/{id}/... or /{resource}/{id}
-        parts = path.strip("/").split("/")
-        if len(parts) >= 2:
-            # Check if second part looks like an ID
-            potential_id = parts[1]
-            if re.match(r"^[a-zA-Z0-9_-]+$", potential_id):
-                return potential_id
-        return None
+        match = _RESOURCE_ID_RE.match(path)
+        return match.group(1) if match else None
     
     def _extract_target_identity(
         self,
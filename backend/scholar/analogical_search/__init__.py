@@ -1,3 +1,3 @@
 """CHE·NU™ V69 — Scholar Analogical Search"""
-from .engine import AnalogicalSearchEngine, TopologicalExtractor, PatternMatcher, create_search_engine, create_extractor, create_matcher
-__all__ = ["AnalogicalSearchEngine", "TopologicalExtractor", "PatternMatcher", "create_search_engine", "create_extractor", "create_matcher"]
+from .engine import AnalogicalSearchEngine, TopologicalExtractor, PatternMatcher, PatternIndex, create_search_engine, create_extractor, create_matcher
+__all__ = ["AnalogicalSearchEngine", "TopologicalExtractor", "PatternMatcher", "PatternIndex", "create_search_engine", "create_extractor", "create_matcher"]
@@ -22,6 +22,8 @@ import logging
 import hashlib
 import math
 
+import numpy as np
+
 from ..models import (
     TopologicalPattern,
     AnalogicalMatch,
@@ -107,6 +109,164 @@ class TopologicalExtractor:
         return self._pattern_cache.get(pattern_id)
 
 
+# ============================================================================
+# PATTERN INDEX
+# ============================================================================
+
+# Features produced by TopologicalExtractor, in extraction order
+PATTERN_FEATURES = (
+    "node_count", "edge_count", "avg_in_degree", "avg_out_degree",
+    "max_in_degree", "max_out_degree", "source_count", "sink_count", "density",
+)
+
+HASH_BONUS = 0.1
+
+
+def feature_similarities(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Mean per-feature similarity of `query` against every row of `matrix`.
+    
+    Vectorized PatternMatcher.compute_similarity (without the hash
+    bonus); columns are summed in order so results match the scalar path.
+    """
+    total = np.zeros(len(matrix))
+    for col in range(matrix.shape[1]):
+        a, b = query[col], matrix[:, col]
+        max_val = np.maximum(np.maximum(abs(a), np.abs(b)), 1)
+        total = total + (1 - np.abs(a - b) / max_val)
+    return total / matrix.shape[1]
+
+
+class PatternIndex:
+    """
+    Vector index over indexed patterns.
+    
+    Feature vectors are stacked in one matrix; a query scores only the
+    rows that can still reach the threshold. Since similarity averages
+    len(PATTERN_FEATURES) per-feature scores in [0, 1], a non-twin
+    candidate's node_count must lie within a window around the query's,
+    found by binary search over the rows sorted by node_count. Structural
+    twins (same structure_hash) get a bonus and are always scored from
+    their hash bucket. Recently added rows sit in an unsorted tail
+    (always scored) until it is folded into the sorted order.
+    
+    Patterns whose features are not exactly PATTERN_FEATURES are kept
+    aside and scored one by one.
+    """
+    
+    REBUILD_MIN = 64
+    
+    def __init__(self):
+        self.patterns: List[TopologicalPattern] = []
+        self._vectors = np.zeros((0, len(PATTERN_FEATURES)))
+        self._domains = np.zeros(0, dtype=np.int64)
+        self._hashes = np.zeros(0, dtype=np.int64)
+        self._domain_ids: Dict[str, int] = {}
+        self._hash_ids: Dict[str, int] = {}
+        self._by_hash: Dict[str, List[int]] = {}
+        self._irregular: List[int] = []
+        self._sorted_rows = np.zeros(0, dtype=np.int64)
+        self._sorted_counts = np.zeros(0)
+        self._tail: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self.patterns)
+    
+    def add(self, pattern: TopologicalPattern) -> None:
+        row = len(self.patterns)
+        self.patterns.append(pattern)
+        
+        if len(self._vectors) == row:
+            capacity = max(16, 2 * row)
+            self._vectors = np.resize(self._vectors, (capacity, len(PATTERN_FEATURES)))
+            self._domains = np.resize(self._domains, capacity)
+            self._hashes = np.resize(self._hashes, capacity)
+        
+        self._domains[row] = self._domain_ids.setdefault(
+            pattern.source_domain, len(self._domain_ids)
+        )
+        self._hashes[row] = self._hash_ids.setdefault(
+            pattern.structure_hash, len(self._hash_ids)
+        )
+        if tuple(pattern.features) != PATTERN_FEATURES:
+            self._irregular.append(row)
+            return
+        
+        self._vectors[row] = [pattern.features[k] for k in PATTERN_FEATURES]
+        self._by_hash.setdefault(pattern.structure_hash, []).append(row)
+        self._tail.append(row)
+        if len(self._tail) > max(self.REBUILD_MIN, len(self._sorted_rows) // 8):
+            self._rebuild()
+    
+    def _rebuild(self) -> None:
+        rows = np.concatenate([self._sorted_rows, np.array(self._tail, dtype=np.int64)])
+        counts = self._vectors[rows, 0]
+        order = np.argsort(counts, kind="stable")
+        self._sorted_rows = rows[order]
+        self._sorted_counts = counts[order]
+        self._tail = []
+    
+    def score(
+        self,
+        query: TopologicalPattern,
+        threshold: float,
+        exclude_domain: Optional[str] = None,
+        exclude_pattern_id: Optional[str] = None,
+    ) -> List[Tuple[float, TopologicalPattern]]:
+        """Patterns scoring >= threshold, best first (ties in index order)."""
+        if tuple(query.features) != PATTERN_FEATURES:
+            rows = np.arange(len(self.patterns))
+            scores = np.array([
+                PatternMatcher.compute_similarity(query, self.patterns[r]) for r in rows
+            ])
+        else:
+            rows = self._candidate_rows(query, threshold)
+            vector = np.array([query.features[k] for k in PATTERN_FEATURES], dtype=float)
+            scores = feature_similarities(vector, self._vectors[rows])
+            twins = self._hashes[rows] == self._hash_ids.get(query.structure_hash, -1)
+            scores = np.minimum(np.where(twins, scores + HASH_BONUS, scores), 1.0)
+            
+            if self._irregular:
+                irregular = np.array(self._irregular, dtype=np.int64)
+                rows = np.concatenate([rows, irregular])
+                scores = np.concatenate([scores, [
+                    PatternMatcher.compute_similarity(query, self.patterns[r])
+                    for r in irregular
+                ]])
+        
+        keep = scores >= threshold
+        if exclude_domain is not None and exclude_domain in self._domain_ids:
+            keep &= self._domains[rows] != self._domain_ids[exclude_domain]
+        rows, scores = rows[keep], scores[keep]
+        
+        results = []
+        for i in np.lexsort((rows, -scores)):
+            pattern = self.patterns[rows[i]]
+            if pattern.pattern_id != exclude_pattern_id:
+                results.append((float(scores[i]), pattern))
+        return results
+    
+    def _candidate_rows(self, query: TopologicalPattern, threshold: float) -> np.ndarray:
+        """Rows that can reach `threshold`: node_count window, twins and the tail."""
+        q = float(query.features["node_count"])
+        # Lowest node_count similarity that still allows the mean to reach threshold
+        slack = len(PATTERN_FEATURES) * (1 - threshold)
+        if slack >= 1 or q < 0:
+            window = self._sorted_rows
+        else:
+            lower = q - slack * max(abs(q), 1)
+            upper = max(q / (1 - slack), q + slack)
+            tolerance = 1e-9 * max(abs(q), 1)
+            start = np.searchsorted(self._sorted_counts, lower - tolerance, side="left")
+            stop = np.searchsorted(self._sorted_counts, upper + tolerance, side="right")
+            window = self._sorted_rows[start:stop]
+        
+        extra = self._tail + self._by_hash.get(query.structure_hash, [])
+        if extra:
+            window = np.union1d(window, np.array(extra, dtype=np.int64))
+        return np.sort(window)
+
+
 # ============================================================================
 # PATTERN MATCHER
 # ============================================================================
@@ -121,8 +281,8 @@ class PatternMatcher:
     def __init__(self, similarity_threshold: float = 0.85):
         self.similarity_threshold = similarity_threshold
     
+    @staticmethod
     def compute_similarity(
-        self,
         pattern_a: TopologicalPattern,
         pattern_b: TopologicalPattern,
     ) -> float:
@@ -168,31 +328,42 @@ class PatternMatcher:
         
         Per spec: Pattern matching (>85%)
         """
-        matches = []
-        
+        index = PatternIndex()
         for candidate in candidate_patterns:
-            # Skip same pattern
-            if candidate.pattern_id == query_pattern.pattern_id:
-                continue
-            
-            similarity = self.compute_similarity(query_pattern, candidate)
-            
-            if similarity >= self.similarity_threshold:
-                match = AnalogicalMatch(
-                    match_id=generate_id(),
-                    pattern_a=query_pattern.pattern_id,
-                    pattern_b=candidate.pattern_id,
-                    similarity_score=similarity,
-                    matched_features=self._get_matched_features(query_pattern, candidate),
-                    domain_a=query_pattern.source_domain,
-                    domain_b=candidate.source_domain,
-                    mapping_explanation=self._generate_explanation(query_pattern, candidate, similarity),
-                )
-                matches.append(match)
-        
-        # Sort by similarity
-        matches.sort(key=lambda m: m.similarity_score, reverse=True)
-        return matches[:top_n]
+            index.add(candidate)
+        return self.search_index(query_pattern, index, top_n)
+    
+    def search_index(
+        self,
+        query_pattern: TopologicalPattern,
+        index: PatternIndex,
+        top_n: int = 10,
+        exclude_domain: Optional[str] = None,
+    ) -> List[AnalogicalMatch]:
+        """
+        Find matching patterns in an index.
+        
+        Explanations are only built for the top_n matches returned.
+        """
+        scored = index.score(
+            query_pattern,
+            self.similarity_threshold,
+            exclude_domain=exclude_domain,
+            exclude_pattern_id=query_pattern.pattern_id,
+        )
+        return [
+            AnalogicalMatch(
+                match_id=generate_id(),
+                pattern_a=query_pattern.pattern_id,
+                pattern_b=candidate.pattern_id,
+                similarity_score=similarity,
+                matched_features=self._get_matched_features(query_pattern, candidate),
+                domain_a=query_pattern.source_domain,
+                domain_b=candidate.source_domain,
+                mapping_explanation=self._generate_explanation(query_pattern, candidate, similarity),
+            )
+            for similarity, candidate in scored[:top_n]
+        ]
     
     def _get_matched_features(
         self,
@@ -262,6 +433,7 @@ class AnalogicalSearchEngine:
         # Pattern library
         self._patterns: Dict[str, TopologicalPattern] = {}
         self._patterns_by_domain: Dict[str, Set[str]] = {}
+        self.index = PatternIndex()
     
     def index_pattern(
         self,
@@ -277,6 +449,7 @@ class AnalogicalSearchEngine:
             pattern.name = name
         
         self._patterns[pattern.pattern_id] = pattern
+        self.index.add(pattern)
         
         if domain not in self._patterns_by_domain:
             self._patterns_by_domain[domain] = set()
@@ -300,17 +473,10 @@ class AnalogicalSearchEngine:
         # Extract query pattern
         query_pattern = self.extractor.extract_pattern(query_nodes, query_links)
         
-        # Get candidate patterns
-        candidates = list(self._patterns.values())
-        
-        if exclude_domain:
-            candidates = [
-                p for p in candidates
-                if p.source_domain != exclude_domain
-            ]
-        
-        # Find matches
-        matches = self.matcher.find_matches(query_pattern, candidates, top_n)
+        # Find matches among indexed patterns
+        matches = self.matcher.search_index(
+            query_pattern, self.index, top_n, exclude_domain=exclude_domain or None
+        )
         
         logger.info(f"Found {len(matches)} analogical matches")
         return matches
@@ -326,15 +492,12 @@ class AnalogicalSearchEngine:
         if not query_pattern:
             return []
         
-        candidates = list(self._patterns.values())
-        
-        if exclude_same_domain:
-            candidates = [
-                p for p in candidates
-                if p.source_domain != query_pattern.source_domain
-            ]
-        
-        return self.matcher.find_matches(query_pattern, candidates, top_n)
+        return self.matcher.search_index(
+            query_pattern,
+            self.index,
+            top_n,
+            exclude_domain=query_pattern.source_domain if exclude_same_domain else None,
+        )
     
     def get_cross_domain_suggestions(
         self,
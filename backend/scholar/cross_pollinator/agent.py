@@ -15,11 +15,14 @@ Impact: Création de task-forces spontanées
 ============================================================================
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import logging
 
+import numpy as np
+
 from ..models import (
     CrossPollinationMatch,
     TaskForce,
@@ -74,6 +77,172 @@ class SimilarityType:
     GOAL = "goal"  # Similar objectives
 
 
+# ============================================================================
+# BLOCKED SIMILARITY SCAN
+# ============================================================================
+
+# Jaccard features, in the tie-break order _compute_similarity uses
+SIMILARITY_FEATURES = (
+    SimilarityType.PATTERN,
+    SimilarityType.METHODOLOGICAL,
+    SimilarityType.GOAL,
+)
+GOAL_FEATURE = 2
+
+# Scans smaller than this (in artifact pairs) never start a process pool
+PARALLEL_MIN_PAIRS = 4_000_000
+
+
+@dataclass
+class ArtifactFeatures:
+    """
+    Artifacts encoded as token-id sets, one CSR layout per feature.
+
+    Row i of feature f holds the sorted, de-duplicated token ids of
+    artifact i's keywords (f=0), methods (f=1) or goal words (f=2).
+    """
+    indptr: List[np.ndarray]
+    indices: List[np.ndarray]
+    sizes: np.ndarray  # (features, artifacts)
+    has_goal: np.ndarray  # (artifacts,)
+    
+    @classmethod
+    def encode(cls, artifacts: List[Dict[str, Any]]) -> "ArtifactFeatures":
+        vocabularies: List[Dict[Any, int]] = [{} for _ in SIMILARITY_FEATURES]
+        rows: List[List[np.ndarray]] = [[] for _ in SIMILARITY_FEATURES]
+        has_goal = np.zeros(len(artifacts), dtype=bool)
+        
+        for i, art in enumerate(artifacts):
+            goal = art.get("goal", "").lower()
+            has_goal[i] = bool(goal)
+            token_sets = (
+                set(art.get("keywords", [])),
+                set(art.get("methods", [])),
+                set(goal.split()),
+            )
+            for f, tokens in enumerate(token_sets):
+                vocab = vocabularies[f]
+                ids = [vocab.setdefault(t, len(vocab)) for t in tokens]
+                rows[f].append(np.sort(np.array(ids, dtype=np.int64)))
+        
+        indptr, indices = [], []
+        sizes = np.zeros((len(SIMILARITY_FEATURES), len(artifacts)), dtype=np.int64)
+        for f, feature_rows in enumerate(rows):
+            sizes[f] = [len(r) for r in feature_rows]
+            indptr.append(np.concatenate(([0], np.cumsum(sizes[f]))))
+            indices.append(
+                np.concatenate(feature_rows) if feature_rows else np.zeros(0, dtype=np.int64)
+            )
+        return cls(indptr=indptr, indices=indices, sizes=sizes, has_goal=has_goal)
+    
+    def _gather(self, f: int, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(row position, token id) for every token of `rows`."""
+        starts = self.indptr[f][rows]
+        counts = self.sizes[f][rows]
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        positions = np.arange(counts.sum()) + offsets
+        return np.repeat(np.arange(len(rows)), counts), self.indices[f][positions]
+    
+    def vocabulary(self, f: int, rows: np.ndarray) -> np.ndarray:
+        """Sorted token ids used by `rows`."""
+        return np.unique(self._gather(f, rows)[1])
+    
+    def incidence(self, f: int, rows: np.ndarray, vocab: np.ndarray) -> np.ndarray:
+        """Dense 0/1 matrix of `rows` over the columns `vocab`."""
+        matrix = np.zeros((len(rows), len(vocab)), dtype=np.float32)
+        row_pos, tokens = self._gather(f, rows)
+        cols = np.searchsorted(vocab, tokens)
+        hit = cols < len(vocab)
+        hit[hit] = vocab[cols[hit]] == tokens[hit]
+        matrix[row_pos[hit], cols[hit]] = 1.0
+        return matrix
+
+
+def block_similarity(
+    features: ArtifactFeatures,
+    rows_a: np.ndarray,
+    rows_b: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Similarity and best feature for every pair in rows_a × rows_b.
+    
+    Same result as CrossPollinatorScanner._compute_similarity: the best
+    Jaccard score among the features present, ties going to the earlier
+    feature; pairs with no feature present get 0.0 and type -1
+    (structural). Intersections are one matrix product per feature over
+    the tokens both blocks share.
+    """
+    shape = (len(rows_a), len(rows_b))
+    best = np.full(shape, -1.0)
+    best_type = np.full(shape, -1, dtype=np.int8)
+    
+    for f in range(len(SIMILARITY_FEATURES)):
+        size_a = features.sizes[f][rows_a][:, None]
+        size_b = features.sizes[f][rows_b][None, :]
+        if f == GOAL_FEATURE:
+            present = features.has_goal[rows_a][:, None] & features.has_goal[rows_b][None, :]
+        else:
+            present = (size_a > 0) | (size_b > 0)
+        if not present.any():
+            continue
+        
+        shared = np.intersect1d(
+            features.vocabulary(f, rows_a), features.vocabulary(f, rows_b), assume_unique=True
+        )
+        if len(shared):
+            inter = (
+                features.incidence(f, rows_a, shared) @ features.incidence(f, rows_b, shared).T
+            ).astype(np.float64)
+        else:
+            inter = np.zeros(shape)
+        
+        union = np.maximum(size_a + size_b - inter, 1)
+        sim = np.where(present, inter / union, -1.0)
+        better = sim > best
+        best = np.where(better, sim, best)
+        best_type = np.where(better, f, best_type).astype(np.int8)
+    
+    return np.where(best_type >= 0, best, 0.0), best_type
+
+
+def _scan_block(
+    features: ArtifactFeatures,
+    rows_a: np.ndarray,
+    rows_b: np.ndarray,
+    interop: float,
+    min_similarity: float,
+    floor: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(artifact a, artifact b, score, type) of the block's qualifying pairs."""
+    similarity, sim_type = block_similarity(features, rows_a, rows_b)
+    score = similarity * interop
+    ia, ib = np.nonzero((similarity >= min_similarity) & (score >= floor))
+    a, b = rows_a[ia], rows_b[ib]
+    return np.minimum(a, b), np.maximum(a, b), score[ia, ib], sim_type[ia, ib]
+
+
+_worker_features: Optional[ArtifactFeatures] = None
+
+
+def _init_scan_worker(features: ArtifactFeatures) -> None:
+    global _worker_features
+    _worker_features = features
+
+
+def _scan_block_in_worker(task: Tuple[np.ndarray, np.ndarray, float, float, Optional[int]]):
+    rows_a, rows_b, interop, min_similarity, top_k = task
+    return _keep_top(_scan_block(_worker_features, rows_a, rows_b, interop, min_similarity, 0.0), top_k)
+
+
+def _keep_top(candidates, top_k: Optional[int]):
+    """Order candidates by score (desc) then pair position, keeping top_k."""
+    a, b, score, sim_type = candidates
+    order = np.lexsort((b, a, -score))
+    if top_k is not None:
+        order = order[:top_k]
+    return a[order], b[order], score[order], sim_type[order]
+
+
 # ============================================================================
 # NOTIFICATION
 # ============================================================================
@@ -114,58 +283,115 @@ class CrossPollinatorScanner:
         self,
         min_similarity: float = 0.6,
         min_interoperability: float = 0.5,
+        block_size: int = 1024,
     ):
         self.min_similarity = min_similarity
         self.min_interoperability = min_interoperability
+        self.block_size = block_size
     
     def scan_for_matches(
         self,
         artifacts: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> List[CrossPollinationMatch]:
         """
         Scan artifacts for cross-pollination opportunities.
         
         Per spec: Analyse causale + Mapping via Interoperability Matrix
+        
+        Artifacts are blocked by domain; only domain pairs passing
+        min_interoperability are compared, block against block, as
+        matrix products. With top_k, only the best k matches are kept
+        and blocks that cannot reach the current k-th score are skipped.
+        Large scans are spread across a process pool (max_workers=1
+        keeps them in-process).
         """
-        matches = []
+        # Block artifacts by domain (same-domain pairs are never compared)
+        blocks: Dict[Any, List[int]] = {}
+        for i, art in enumerate(artifacts):
+            blocks.setdefault(art.get("domain"), []).append(i)
+        domains = [
+            (artifacts[rows[0]].get("domain", ""), np.array(rows, dtype=np.int64))
+            for rows in blocks.values()
+        ]
         
-        # Compare all pairs
-        for i, art_a in enumerate(artifacts):
-            for art_b in artifacts[i+1:]:
-                # Skip same domain (we want cross-pollination)
-                if art_a.get("domain") == art_b.get("domain"):
-                    continue
-                
-                # Check interoperability
-                interop = get_domain_interoperability(
-                    art_a.get("domain", ""),
-                    art_b.get("domain", ""),
-                )
-                
+        # Interoperable domain pairs, most interoperable first for pruning
+        tasks = []
+        for x, (domain_a, rows_a) in enumerate(domains):
+            for domain_b, rows_b in domains[x + 1:]:
+                interop = get_domain_interoperability(domain_a, domain_b)
                 if interop < self.min_interoperability:
                     continue
-                
-                # Compute similarity
-                similarity, sim_type = self._compute_similarity(art_a, art_b)
-                
-                if similarity >= self.min_similarity:
-                    match = CrossPollinationMatch(
-                        match_id=generate_id(),
-                        artifact_a=art_a.get("id", ""),
-                        artifact_b=art_b.get("id", ""),
-                        domain_a=art_a.get("domain", ""),
-                        domain_b=art_b.get("domain", ""),
-                        similarity_type=sim_type,
-                        similarity_score=similarity * interop,
-                    )
-                    matches.append(match)
+                for start_a in range(0, len(rows_a), self.block_size):
+                    for start_b in range(0, len(rows_b), self.block_size):
+                        tasks.append((
+                            rows_a[start_a:start_a + self.block_size],
+                            rows_b[start_b:start_b + self.block_size],
+                            interop,
+                        ))
+        tasks.sort(key=lambda t: -t[2])
         
-        # Sort by score
-        matches.sort(key=lambda m: m.similarity_score, reverse=True)
+        features = ArtifactFeatures.encode(artifacts)
+        total_pairs = sum(len(a) * len(b) for a, b, _ in tasks)
+        if max_workers != 1 and len(tasks) > 1 and total_pairs >= PARALLEL_MIN_PAIRS:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_scan_worker,
+                initargs=(features,),
+            ) as pool:
+                parts = list(pool.map(
+                    _scan_block_in_worker,
+                    [(a, b, interop, self.min_similarity, top_k) for a, b, interop in tasks],
+                ))
+        else:
+            parts = self._scan_tasks(features, tasks, top_k)
+        
+        a, b, score, sim_type = _keep_top(
+            tuple(np.concatenate(column) for column in zip(*parts))
+            if parts else (np.zeros(0, np.int64),) * 2 + (np.zeros(0), np.zeros(0, np.int8)),
+            top_k,
+        )
+        
+        matches = []
+        for i, j, match_score, t in zip(a.tolist(), b.tolist(), score.tolist(), sim_type.tolist()):
+            art_a, art_b = artifacts[i], artifacts[j]
+            matches.append(CrossPollinationMatch(
+                match_id=generate_id(),
+                artifact_a=art_a.get("id", ""),
+                artifact_b=art_b.get("id", ""),
+                domain_a=art_a.get("domain", ""),
+                domain_b=art_b.get("domain", ""),
+                similarity_type=SIMILARITY_FEATURES[t] if t >= 0 else SimilarityType.STRUCTURAL,
+                similarity_score=match_score,
+            ))
         
         logger.info(f"Found {len(matches)} cross-pollination matches")
         return matches
     
+    def _scan_tasks(
+        self,
+        features: ArtifactFeatures,
+        tasks: List[Tuple[np.ndarray, np.ndarray, float]],
+        top_k: Optional[int],
+    ) -> List[Tuple[np.ndarray, ...]]:
+        """In-process scan, raising the score floor as the top-k fills."""
+        parts: List[Tuple[np.ndarray, ...]] = []
+        kept = 0
+        floor = 0.0
+        for rows_a, rows_b, interop in tasks:
+            if interop < floor:
+                break  # tasks are sorted: no later block can reach the floor
+            part = _scan_block(features, rows_a, rows_b, interop, self.min_similarity, floor)
+            parts.append(part)
+            kept += len(part[2])
+            if top_k is not None and kept > top_k:
+                parts = [_keep_top(tuple(np.concatenate(c) for c in zip(*parts)), top_k)]
+                kept = len(parts[0][2])
+                if kept and kept == top_k:
+                    floor = float(parts[0][2][-1])
+        return parts
+    
     def _compute_similarity(
         self,
         art_a: Dict[str, Any],
@@ -12,10 +12,13 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-import hashlib
-import json
 import uuid
 
+try:
+    from ..canonical import content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import content_hash
+
 
 # ============================================================================
 # CAUSAL KNOWLEDGE GRAPH MODELS
@@ -537,8 +540,4 @@ def generate_id() -> str:
 
 def compute_hash(data: Any) -> str:
     """Compute SHA-256 hash of data"""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif not isinstance(data, bytes):
-        data = json.dumps(data, sort_keys=True).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data, default=None)
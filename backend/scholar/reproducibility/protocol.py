@@ -25,8 +25,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
-import hashlib
-import json
+
+try:
+    from ...canonical import canonical_json
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json
 
 from ..models import (
     ReproducibilityJob,
@@ -288,12 +291,12 @@ class BadgeGenerator:
         )
         
         # Sign the badge
-        badge_data = json.dumps({
+        badge_data = canonical_json({
             "badge_id": badge.badge_id,
             "artifact_id": artifact_id,
             "score": reproducibility_score,
             "level": badge_level,
-        }, sort_keys=True)
+        })
         
         badge.signature = self._signer(badge_data)
         
@@ -404,12 +407,12 @@ class ReproducibilityProtocol:
     
     def verify_badge(self, badge: VerifiedBadge) -> bool:
         """Verify badge signature"""
-        badge_data = json.dumps({
+        badge_data = canonical_json({
             "badge_id": badge.badge_id,
             "artifact_id": badge.artifact_id,
             "score": badge.reproducibility_score,
             "level": badge.badge_level,
-        }, sort_keys=True)
+        })
         
         expected_sig = self.badge_gen._signer(badge_data)
         return badge.signature == expected_sig
@@ -99,6 +99,45 @@ class TestAnalogicalSearch:
         assert pattern is not None
         assert pattern.node_count == 2
 
+    def test_indexed_search_matches_brute_force(self):
+        from ..analogical_search import create_search_engine
+        from ..models import CausalNode, CausalLink
+
+        engine = create_search_engine(threshold=0.7)
+
+        def chain(size, domain):
+            nodes = [CausalNode(node_id=str(i), title=f"N{i}", domain=domain) for i in range(size)]
+            links = [
+                CausalLink(link_id=f"l{i}", source_id=str(i), target_id=str(i + 1),
+                           p_value=0.01, effect_size=0.5)
+                for i in range(size - 1)
+            ]
+            return nodes, links
+
+        domains = ["biology", "physics", "economics"]
+        patterns = [
+            engine.index_pattern(*chain(size, domains[size % 3]), domains[size % 3])
+            for size in list(range(2, 60)) * 3
+        ]
+        query = patterns[10]
+
+        matches = engine.search_by_pattern_id(query.pattern_id, top_n=5)
+
+        expected = sorted(
+            (
+                (engine.matcher.compute_similarity(query, p), p.pattern_id)
+                for p in patterns
+                if p.source_domain != query.source_domain
+            ),
+            key=lambda m: m[0],
+            reverse=True,
+        )
+        expected = [m for m in expected if m[0] >= 0.7][:5]
+
+        assert [(m.similarity_score, m.pattern_b) for m in matches] == expected
+        assert all(m.domain_b != query.source_domain for m in matches)
+        assert all(m.mapping_explanation.startswith("Similarity:") for m in matches)
+
 
 # ============================================================================
 # IMPACT SIMULATOR TESTS
@@ -313,6 +352,46 @@ class TestCrossPollinator:
         assert tf is not None
         assert tf.status == "proposed"
 
+    def test_blocked_scan_matches_pairwise(self):
+        from ..cross_pollinator import CrossPollinatorScanner
+        from ..cross_pollinator.agent import get_domain_interoperability
+
+        domains = ["biology", "chemistry", "engineering", "physics", "art"]
+        artifacts = [
+            {
+                "id": f"art-{i}",
+                "domain": domains[i % len(domains)],
+                "keywords": [f"kw{(i * 7 + k) % 6}" for k in range(i % 4)],
+                "methods": ["simulation"] if i % 3 == 0 else [],
+                "goal": "Model protein folding" if i % 2 else "",
+            }
+            for i in range(40)
+        ]
+        scanner = CrossPollinatorScanner(min_similarity=0.3, block_size=4)
+
+        # Reference: every cross-domain pair, scored one at a time
+        expected = []
+        for i, art_a in enumerate(artifacts):
+            for art_b in artifacts[i + 1:]:
+                if art_a["domain"] == art_b["domain"]:
+                    continue
+                interop = get_domain_interoperability(art_a["domain"], art_b["domain"])
+                if interop < scanner.min_interoperability:
+                    continue
+                similarity, sim_type = scanner._compute_similarity(art_a, art_b)
+                if similarity >= scanner.min_similarity:
+                    expected.append((art_a["id"], art_b["id"], sim_type, similarity * interop))
+        expected.sort(key=lambda m: m[3], reverse=True)
+
+        matches = scanner.scan_for_matches(artifacts)
+        found = [(m.artifact_a, m.artifact_b, m.similarity_type, m.similarity_score) for m in matches]
+
+        assert expected
+        assert found == expected
+
+        top = scanner.scan_for_matches(artifacts, top_k=5)
+        assert [m.similarity_score for m in top] == [m[3] for m in expected[:5]]
+
 
 # ============================================================================
 # INTEGRATION TESTS
@@ -21,6 +21,8 @@ from .models import (
     SignatureAlgorithm,
     SecurityLevel,
     KeyPair,
+    InclusionProof,
+    BatchSignature,
     AuditEvent,
     EventType,
     MerkleNode,
@@ -70,6 +72,7 @@ __all__ = [
     "__version__",
     # Models
     "Signature", "SignatureAlgorithm", "SecurityLevel", "KeyPair",
+    "InclusionProof", "BatchSignature",
     "AuditEvent", "EventType", "MerkleNode", "MerkleTree", "AuditProof",
     "XRChunk", "XRIntegrityProof",
     "generate_id", "compute_sha256", "compute_merkle_hash",
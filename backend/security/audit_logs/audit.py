@@ -23,9 +23,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import logging
-import json
 import math
 
+try:
+    from ...canonical import canonical_json
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json
+
 from ..models import (
     AuditEvent,
     EventType,
@@ -197,7 +201,7 @@ class EventLogger:
         """
         lines = []
         for event in self._events:
-            line = json.dumps({
+            line = canonical_json({
                 "event_id": event.event_id,
                 "type": event.event_type.value,
                 "timestamp": event.timestamp.isoformat(),
@@ -206,7 +210,7 @@ class EventLogger:
                 "payload": event.payload,
                 "hash": event.event_hash,
                 "previous": event.previous_hash,
-            }, sort_keys=True)
+            })
             lines.append(line)
         return "\n".join(lines)
 
@@ -16,8 +16,11 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import uuid
-import hashlib
-import json
+
+try:
+    from ..canonical import content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import content_hash
 
 
 # ============================================================================
@@ -80,6 +83,30 @@ class KeyPair:
     expires_at: Optional[datetime] = None
 
 
+@dataclass
+class InclusionProof:
+    """Merkle inclusion proof for one item of a signed batch"""
+    index: int
+    leaf_hash: str
+
+    # Sibling hashes from leaf to root; side given by the index bits
+    path: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchSignature:
+    """
+    One signature over the Merkle root of a batch of artifacts.
+
+    Each item is proven by its inclusion proof against the signed root.
+    """
+    batch_id: str
+    merkle_root: str
+    item_count: int
+    signature: Signature
+    proofs: List[InclusionProof] = field(default_factory=list)
+
+
 # ============================================================================
 # AUDIT LOG MODELS
 # ============================================================================
@@ -235,11 +262,7 @@ def compute_sha256(data: Any) -> str:
     
     Per spec: Event Hashing (SHA-256)
     """
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif not isinstance(data, bytes):
-        data = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data)
 
 
 def compute_merkle_hash(left: str, right: str) -> str:
@@ -18,18 +18,28 @@ Integration:
 ============================================================================
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import logging
+import os
+
+try:
+    from ...canonical import content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import content_hash
 
 from ..models import (
     Signature,
     SignatureAlgorithm,
     SecurityLevel,
     KeyPair,
+    InclusionProof,
+    BatchSignature,
     generate_id,
     compute_sha256,
+    compute_merkle_hash,
     mock_pq_sign,
     mock_pq_verify,
 )
@@ -97,62 +107,149 @@ class KeyManager:
         return True
 
 
+# ============================================================================
+# BATCH HASHING
+# ============================================================================
+
+# Component algorithms signed for each key algorithm
+SIGNING_COMPONENTS: Dict[SignatureAlgorithm, Tuple[SignatureAlgorithm, ...]] = {
+    SignatureAlgorithm.HYBRID: (SignatureAlgorithm.ED25519, SignatureAlgorithm.DILITHIUM),
+}
+
+MERKLE_PADDING = compute_sha256("padding")
+
+
+def _leaf_hashes(items: Sequence[Any]) -> List[str]:
+    """Canonical content hash of each item (module level: runs in workers)"""
+    return [content_hash(item) for item in items]
+
+
+def _merkle_levels(leaves: List[str]) -> List[List[str]]:
+    """All tree levels, leaves first, padded to a power of 2"""
+    level = list(leaves)
+    while len(level) & (len(level) - 1) != 0:
+        level.append(MERKLE_PADDING)
+
+    levels = [level]
+    while len(level) > 1:
+        level = [
+            compute_merkle_hash(level[i], level[i + 1])
+            for i in range(0, len(level), 2)
+        ]
+        levels.append(level)
+    return levels
+
+
+def _root_from_proof(leaf_hash: str, proof: InclusionProof) -> str:
+    """Walk an inclusion proof from its leaf up to the root"""
+    current = leaf_hash
+    idx = proof.index
+    for sibling in proof.path:
+        if idx & 1:
+            current = compute_merkle_hash(sibling, current)
+        else:
+            current = compute_merkle_hash(current, sibling)
+        idx >>= 1
+    return current
+
+
+def _batch_message(merkle_root: str, item_count: int) -> str:
+    """Message actually signed for a batch: root bound to its size"""
+    return f"batch:{item_count}:{merkle_root}"
+
+
 # ============================================================================
 # SIGNATURE SERVICE
 # ============================================================================
 
+@dataclass
+class _ExpandedKey:
+    """Validated key with its signing components resolved"""
+    key: KeyPair
+    components: Tuple[SignatureAlgorithm, ...]
+
+
 class SignatureService:
     """
     Create and verify cryptographic signatures.
     
     Per spec algorithms: CRYSTALS-Dilithium, Falcon, Hybrid
+
+    Batches are signed once: items are canonically hashed into a Merkle
+    tree and only the root is signed, each item keeping an inclusion
+    proof. Batches of at least PARALLEL_MIN_ITEMS are hashed in a
+    process pool.
     """
+
+    PARALLEL_MIN_ITEMS = 4096
     
-    def __init__(self, key_manager: KeyManager):
+    def __init__(
+        self,
+        key_manager: KeyManager,
+        max_workers: Optional[int] = None,
+    ):
         self.keys = key_manager
+        self.max_workers = max_workers
+        self._expanded: Dict[str, _ExpandedKey] = {}
     
-    def sign(
-        self,
-        data: Any,
-        key_id: str,
-    ) -> Signature:
-        """Sign data with specified key"""
-        key = self.keys.get_key(key_id)
-        if not key:
-            raise ValueError(f"Key {key_id} not found")
+    def _expand_key(self, key_id: str) -> _ExpandedKey:
+        """Look up, validate and cache a signing key"""
+        expanded = self._expanded.get(key_id)
+        if expanded is None:
+            key = self.keys.get_key(key_id)
+            if not key:
+                raise ValueError(f"Key {key_id} not found")
+            expanded = _ExpandedKey(
+                key=key,
+                components=SIGNING_COMPONENTS.get(key.algorithm, (key.algorithm,)),
+            )
+            self._expanded[key_id] = expanded
         
-        if not self.keys.is_key_valid(key_id):
+        expires_at = expanded.key.expires_at
+        if expires_at and expires_at < datetime.utcnow():
+            del self._expanded[key_id]
             raise ValueError(f"Key {key_id} has expired")
         
-        # Serialize data
-        data_str = str(data) if not isinstance(data, str) else data
+        return expanded
+    
+    def _sign_message(self, data_str: str, expanded: _ExpandedKey) -> Signature:
+        """Sign a serialized message with every component of the key"""
+        key = expanded.key
+        sigs = [mock_pq_sign(data_str, algorithm) for algorithm in expanded.components]
         
-        # Create signature based on algorithm
         if key.algorithm == SignatureAlgorithm.HYBRID:
             # Sign with both classical and PQ
-            classical_sig = mock_pq_sign(data_str, SignatureAlgorithm.ED25519)
-            pq_sig = mock_pq_sign(data_str, SignatureAlgorithm.DILITHIUM)
-            combined_sig = f"{classical_sig}:{pq_sig}"
-            
-            signature = Signature(
+            classical_sig, pq_sig = sigs
+            return Signature(
                 signature_id=generate_id(),
                 algorithm=SignatureAlgorithm.HYBRID,
-                signature_bytes=combined_sig,
+                signature_bytes=f"{classical_sig}:{pq_sig}",
                 public_key_ref=key.public_key,
                 classical_signature=classical_sig,
                 pq_signature=pq_sig,
             )
-        else:
-            sig_bytes = mock_pq_sign(data_str, key.algorithm)
-            
-            signature = Signature(
-                signature_id=generate_id(),
-                algorithm=key.algorithm,
-                signature_bytes=sig_bytes,
-                public_key_ref=key.public_key,
-            )
         
-        logger.info(f"Signed with {key.algorithm.value}: {signature.signature_id}")
+        return Signature(
+            signature_id=generate_id(),
+            algorithm=key.algorithm,
+            signature_bytes=sigs[0],
+            public_key_ref=key.public_key,
+        )
+    
+    def sign(
+        self,
+        data: Any,
+        key_id: str,
+    ) -> Signature:
+        """Sign data with specified key"""
+        expanded = self._expand_key(key_id)
+        
+        # Serialize data
+        data_str = str(data) if not isinstance(data, str) else data
+        
+        signature = self._sign_message(data_str, expanded)
+        
+        logger.info(f"Signed with {expanded.key.algorithm.value}: {signature.signature_id}")
         return signature
     
     def verify(
@@ -183,6 +280,108 @@ class SignatureService:
                 signature.algorithm,
             )
     
+    def hash_items(self, items: Sequence[Any]) -> List[str]:
+        """Canonical content hashes, in a process pool for large batches"""
+        workers = self.max_workers or os.cpu_count() or 1
+        if len(items) < self.PARALLEL_MIN_ITEMS or workers == 1:
+            return _leaf_hashes(items)
+        
+        # A few chunks per worker: few pickling round-trips, balanced load
+        size = -(-len(items) // (workers * 4))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hashes: List[str] = []
+            for part in pool.map(_leaf_hashes, chunks):
+                hashes.extend(part)
+        return hashes
+    
+    def sign_batch(
+        self,
+        items: Sequence[Any],
+        key_id: str,
+    ) -> BatchSignature:
+        """Sign a batch of artifacts with a single signature"""
+        if not items:
+            raise ValueError("Cannot sign an empty batch")
+        
+        expanded = self._expand_key(key_id)
+        
+        leaves = self.hash_items(items)
+        levels = _merkle_levels(leaves)
+        merkle_root = levels[-1][0]
+        
+        proofs = []
+        for index, leaf_hash in enumerate(leaves):
+            path = []
+            idx = index
+            for level in levels[:-1]:
+                path.append(level[idx ^ 1])
+                idx >>= 1
+            proofs.append(InclusionProof(index=index, leaf_hash=leaf_hash, path=path))
+        
+        signature = self._sign_message(_batch_message(merkle_root, len(items)), expanded)
+        
+        batch = BatchSignature(
+            batch_id=generate_id(),
+            merkle_root=merkle_root,
+            item_count=len(items),
+            signature=signature,
+            proofs=proofs,
+        )
+        
+        logger.info(
+            f"Signed batch of {len(items)} with {expanded.key.algorithm.value}: "
+            f"{signature.signature_id}"
+        )
+        return batch
+    
+    def verify_inclusion(
+        self,
+        data: Any,
+        proof: InclusionProof,
+        batch: BatchSignature,
+        leaf_hash: Optional[str] = None,
+    ) -> bool:
+        """Check one item against the batch root (root signature not checked)"""
+        if leaf_hash is None:
+            leaf_hash = content_hash(data)
+        if leaf_hash != proof.leaf_hash:
+            return False
+        if not 0 <= proof.index < batch.item_count:
+            return False
+        
+        # A proof must reach the root from the leaf level exactly
+        depth = max(batch.item_count - 1, 0).bit_length()
+        if len(proof.path) != depth:
+            return False
+        
+        return _root_from_proof(leaf_hash, proof) == batch.merkle_root
+    
+    def verify_batch(
+        self,
+        items: Sequence[Any],
+        batch: BatchSignature,
+    ) -> List[bool]:
+        """
+        Verify a signed batch.
+        
+        The root signature is checked once. If the items rebuild the
+        signed root they are all valid; otherwise each item is checked
+        against its own inclusion proof, so tampering is localized.
+        """
+        message = _batch_message(batch.merkle_root, batch.item_count)
+        if len(items) != batch.item_count or not self.verify(message, batch.signature):
+            return [False] * len(items)
+        
+        leaves = self.hash_items(items)
+        if _merkle_levels(leaves)[-1][0] == batch.merkle_root:
+            return [True] * len(items)
+        
+        return [
+            self.verify_inclusion(item, proof, batch, leaf_hash=leaf)
+            for item, proof, leaf in zip(items, batch.proofs, leaves)
+        ]
+    
     def sign_xr_pack(
         self,
         xr_data: Dict[str, Any],
@@ -269,21 +468,23 @@ class PostQuantumSecuritySystem:
         self.keys.generate_key_pair(SignatureAlgorithm.FALCON)
         self.keys.generate_key_pair(SignatureAlgorithm.HYBRID)
     
+    def _client_key(self, client_id: str) -> KeyPair:
+        """Key for the algorithm recommended for a client"""
+        algorithm = self.config.get_recommended_algorithm(client_id)
+        
+        # Get or generate key
+        keys = self.keys.get_keys_by_algorithm(algorithm)
+        if not keys:
+            return self.keys.generate_key_pair(algorithm)
+        return keys[0]
+    
     def sign_artifact(
         self,
         artifact_data: Dict[str, Any],
         client_id: str,
     ) -> Signature:
         """Sign artifact with appropriate algorithm for client"""
-        algorithm = self.config.get_recommended_algorithm(client_id)
-        
-        # Get or generate key
-        keys = self.keys.get_keys_by_algorithm(algorithm)
-        if not keys:
-            key = self.keys.generate_key_pair(algorithm)
-        else:
-            key = keys[0]
-        
+        key = self._client_key(client_id)
         return self.signatures.sign(artifact_data, key.key_id)
     
     def verify_artifact(
@@ -294,6 +495,23 @@ class PostQuantumSecuritySystem:
         """Verify artifact signature"""
         return self.signatures.verify(artifact_data, signature)
     
+    def sign_artifacts(
+        self,
+        artifacts: Sequence[Dict[str, Any]],
+        client_id: str,
+    ) -> BatchSignature:
+        """Sign many artifacts (e.g. a whole simulation) with one signature"""
+        key = self._client_key(client_id)
+        return self.signatures.sign_batch(artifacts, key.key_id)
+    
+    def verify_artifacts(
+        self,
+        artifacts: Sequence[Dict[str, Any]],
+        batch: BatchSignature,
+    ) -> List[bool]:
+        """Verify artifacts against their batch signature"""
+        return self.signatures.verify_batch(artifacts, batch)
+    
     def protect_audit_log(
         self,
         audit_data: Dict[str, Any],
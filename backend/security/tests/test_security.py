@@ -59,6 +59,32 @@ class TestPostQuantumSecurity:
         
         assert system.verify_artifact(data, signature)
 
+    def test_batch_signature(self):
+        from ..post_quantum import create_security_system
+        from ..models import SignatureAlgorithm
+
+        system = create_security_system()
+        artifacts = [{"step": i, "state": {"x": i * 0.5}} for i in range(5)]
+
+        batch = system.sign_artifacts(artifacts, "client-1")
+        assert batch.signature.algorithm == SignatureAlgorithm.HYBRID
+        assert batch.item_count == 5
+        assert all(system.verify_artifacts(artifacts, batch))
+
+        # Each proof stands alone against the signed root
+        proof = batch.proofs[3]
+        assert system.signatures.verify_inclusion(artifacts[3], proof, batch)
+        assert not system.signatures.verify_inclusion(artifacts[2], proof, batch)
+
+        # Tampering is pinned to the altered item
+        tampered = list(artifacts)
+        tampered[3] = {"step": 3, "state": {"x": 0.0}}
+        assert system.verify_artifacts(tampered, batch) == [True, True, True, False, True]
+
+        # A forged root fails the signature check for every item
+        batch.merkle_root = batch.proofs[0].leaf_hash
+        assert not any(system.verify_artifacts(artifacts, batch))
+
 
 # ============================================================================
 # AUDIT LOG TESTS
@@ -200,6 +226,33 @@ class TestXRVerification:
         assert status["chain_length"] == 3
         assert status["chain_valid"] == True
 
+    def test_persistent_ledger(self, tmp_path):
+        from ..xr_verification import create_xr_verification_system, create_ledger
+        from ..xr_verification.blockchain import BLOCK_RECORD, SESSION_ID_BYTES
+
+        path = str(tmp_path / "xr.ledger")
+        system = create_xr_verification_system(path)
+        for i in range(3):
+            system.process_xr_session(f"session-{i}", [{"data": f"{i}-{j}"} for j in range(5)])
+        assert system.ledger.verify_chain()
+        system.ledger.close()
+
+        # Blocks and the verified height survive a restart
+        ledger = create_ledger(path)
+        assert ledger.get_chain_length() == 3
+        assert ledger.get_block(2).session_id == "session-2"
+        assert ledger.verify_chain()
+        ledger.close()
+
+        # Rewrite a session id in the first record: only a full pass rehashes it
+        with open(path, "r+b") as f:
+            f.seek(BLOCK_RECORD.size - SESSION_ID_BYTES)
+            f.write(b"X")
+        ledger = create_ledger(path)
+        assert ledger.verify_chain()
+        assert not ledger.verify_chain(full=True)
+        ledger.close()
+
 
 # ============================================================================
 # INTEGRATION TESTS
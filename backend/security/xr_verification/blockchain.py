@@ -23,10 +23,22 @@ Value: Investor-grade trust, Common Operating Picture
 ============================================================================
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
 import logging
+import mmap
+import os
+import struct
+import uuid
+
+try:
+    from ...canonical import canonical_bytes
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_bytes
 
 from ..models import (
     XRChunk,
@@ -64,16 +76,75 @@ class LedgerBlock:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
+# Fixed-size block record: number, timestamp (µs since epoch), block id,
+# merkle root, previous hash, block hash, chunk count, session id
+BLOCK_RECORD = struct.Struct("<Qq16s32s32s32sIH128s")
+SESSION_ID_BYTES = 128
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def _is_digest(value: str) -> bool:
+    """Whether value is a lowercase SHA-256 hex digest"""
+    try:
+        return len(value) == 64 and bytes.fromhex(value).hex() == value
+    except ValueError:
+        return False
+
+
 class LightweightLedger:
     """
     A lightweight blockchain for XR integrity.
     
     Per spec: Lightweight blockchain or ledger
+    
+    Blocks are fixed-size records in an append-only segment, kept in
+    memory or in the file at `path`. A file segment is memory-mapped, so
+    block n is read at offset n * record size without loading the chain.
+    verify_chain() recomputes every block hash and link, then records the
+    verified height as a checkpoint (a sidecar file for file-backed
+    ledgers); the next call only rehashes blocks appended since.
     """
     
-    def __init__(self):
-        self._blocks: List[LedgerBlock] = []
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
         self._genesis_hash = compute_sha256("CHE-NU-XR-GENESIS")
+        
+        self._segment = bytearray()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._tip_hash = self._genesis_hash
+        
+        # Verification checkpoint
+        self._verified_height = 0
+        self._verified_tip = self._genesis_hash
+        
+        if path is not None:
+            self._open()
+    
+    def _open(self) -> None:
+        self._file = open(self.path, "a+b")
+        
+        # Drop a record torn by a crash mid-append
+        size = os.path.getsize(self.path)
+        if size % BLOCK_RECORD.size:
+            size -= size % BLOCK_RECORD.size
+            self._file.truncate(size)
+        
+        self._count = size // BLOCK_RECORD.size
+        if self._count:
+            self._tip_hash = self.get_block(self._count - 1).block_hash
+        
+        checkpoint = self._checkpoint_path()
+        if os.path.exists(checkpoint):
+            with open(checkpoint) as f:
+                data = json.load(f)
+            self._verified_height = data["height"]
+            self._verified_tip = data["tip_hash"]
+    
+    def _checkpoint_path(self) -> str:
+        return f"{self.path}.checkpoint"
     
     def add_block(
         self,
@@ -82,61 +153,149 @@ class LightweightLedger:
         chunk_count: int,
     ) -> LedgerBlock:
         """Add a new block to the ledger"""
-        block_number = len(self._blocks)
-        previous_hash = (
-            self._blocks[-1].block_hash
-            if self._blocks
-            else self._genesis_hash
-        )
+        if len(session_id.encode("utf-8")) > SESSION_ID_BYTES:
+            raise ValueError(f"Session id longer than {SESSION_ID_BYTES} bytes: {session_id[:32]}...")
+        if not _is_digest(merkle_root):
+            raise ValueError(f"Merkle root is not a SHA-256 hex digest: {merkle_root[:32]}")
         
         block = LedgerBlock(
             block_id=generate_id(),
-            block_number=block_number,
+            block_number=self._count,
             merkle_root=merkle_root,
             session_id=session_id,
             chunk_count=chunk_count,
-            previous_hash=previous_hash,
+            previous_hash=self._tip_hash,
             block_hash="",  # Will compute
         )
         
         # Compute block hash
-        block.block_hash = compute_sha256({
-            "number": block.block_number,
-            "root": block.merkle_root,
-            "session": block.session_id,
-            "previous": block.previous_hash,
-            "timestamp": block.timestamp.isoformat(),
-        })
+        block.block_hash = self._hash_block(block)
+        
+        record = self._encode(block)
+        if self._file is not None:
+            self._file.write(record)
+            self._file.flush()
+        else:
+            self._segment += record
         
-        self._blocks.append(block)
+        self._count += 1
+        self._tip_hash = block.block_hash
         logger.info(f"Added ledger block {block.block_number}: {block.block_hash[:16]}...")
         return block
     
     def get_block(self, block_number: int) -> Optional[LedgerBlock]:
         """Get block by number"""
-        if 0 <= block_number < len(self._blocks):
-            return self._blocks[block_number]
+        if 0 <= block_number < self._count:
+            return self._decode(self._record(block_number))
         return None
     
-    def verify_chain(self) -> bool:
-        """Verify the entire chain integrity"""
-        if not self._blocks:
-            return True
+    def verify_chain(self, full: bool = False) -> bool:
+        """
+        Verify chain integrity.
         
-        # Check first block
-        if self._blocks[0].previous_hash != self._genesis_hash:
+        Rehashes the blocks appended since the last verified height, or
+        the entire chain when `full` is set.
+        """
+        start = 0 if full else self._verified_height
+        if start > self._count:
             return False
         
-        # Check chain
-        for i in range(1, len(self._blocks)):
-            if self._blocks[i].previous_hash != self._blocks[i-1].block_hash:
+        previous = self._genesis_hash
+        if start:
+            # The checkpointed tip must still be in place
+            previous = self._verified_tip
+            if self.get_block(start - 1).block_hash != previous:
+                return False
+        
+        for number in range(start, self._count):
+            block = self.get_block(number)
+            if (
+                block.block_number != number
+                or block.previous_hash != previous
+                or self._hash_block(block) != block.block_hash
+            ):
                 return False
+            previous = block.block_hash
         
+        self._checkpoint(self._count, previous)
         return True
     
     def get_chain_length(self) -> int:
         """Get chain length"""
-        return len(self._blocks)
+        return self._count
+    
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _checkpoint(self, height: int, tip_hash: str) -> None:
+        self._verified_height = height
+        self._verified_tip = tip_hash
+        if self.path is None:
+            return
+        
+        tmp = f"{self._checkpoint_path()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"height": height, "tip_hash": tip_hash}, f)
+        os.replace(tmp, self._checkpoint_path())
+    
+    def _record(self, block_number: int) -> bytes:
+        offset = block_number * BLOCK_RECORD.size
+        if self._file is None:
+            return bytes(self._segment[offset:offset + BLOCK_RECORD.size])
+        
+        # Remap once the segment has grown past the mapped region
+        if self._map is None or len(self._map) < offset + BLOCK_RECORD.size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + BLOCK_RECORD.size]
+    
+    @staticmethod
+    def _hash_block(block: LedgerBlock) -> str:
+        return compute_sha256({
+            "number": block.block_number,
+            "root": block.merkle_root,
+            "session": block.session_id,
+            "previous": block.previous_hash,
+            "timestamp": block.timestamp.isoformat(),
+        })
+    
+    @staticmethod
+    def _encode(block: LedgerBlock) -> bytes:
+        session = block.session_id.encode("utf-8")
+        return BLOCK_RECORD.pack(
+            block.block_number,
+            (block.timestamp - EPOCH) // timedelta(microseconds=1),
+            uuid.UUID(block.block_id).bytes,
+            bytes.fromhex(block.merkle_root),
+            bytes.fromhex(block.previous_hash),
+            bytes.fromhex(block.block_hash),
+            block.chunk_count,
+            len(session),
+            session,
+        )
+    
+    @staticmethod
+    def _decode(record: bytes) -> LedgerBlock:
+        (
+            number, micros, block_id, root, previous, block_hash,
+            chunk_count, session_len, session,
+        ) = BLOCK_RECORD.unpack(record)
+        return LedgerBlock(
+            block_id=str(uuid.UUID(bytes=block_id)),
+            block_number=number,
+            merkle_root=root.hex(),
+            session_id=session[:session_len].decode("utf-8"),
+            chunk_count=chunk_count,
+            previous_hash=previous.hex(),
+            block_hash=block_hash.hex(),
+            timestamp=EPOCH + timedelta(microseconds=micros),
+        )
 
 
 # ============================================================================
@@ -148,37 +307,63 @@ class XRChunkHasher:
     Hash XR chunks for integrity.
     
     Per spec: Hash XR chunks
+    
+    Frames are encoded on the calling thread; once a sequence holds at
+    least PARALLEL_MIN_BYTES of encoded content, the SHA-256 passes run
+    in a thread pool (hashlib releases the GIL on large buffers).
     """
     
+    PARALLEL_MIN_BYTES = 1 << 20
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+    
     def hash_chunk(
         self,
         frame_number: int,
         content: Dict[str, Any],
     ) -> XRChunk:
         """Hash an XR chunk"""
-        content_hash = compute_sha256({
-            "frame": frame_number,
-            "content": content,
-        })
-        
-        chunk = XRChunk(
-            chunk_id=generate_id(),
-            frame_number=frame_number,
-            content_hash=content_hash,
-        )
-        
-        return chunk
+        return self._chunk(frame_number, compute_sha256(self._payload(frame_number, content)))
     
     def hash_frame_sequence(
         self,
         frames: List[Dict[str, Any]],
     ) -> List[XRChunk]:
         """Hash a sequence of frames"""
-        chunks = []
-        for i, frame in enumerate(frames):
-            chunk = self.hash_chunk(i, frame)
-            chunks.append(chunk)
-        return chunks
+        encoded = [
+            canonical_bytes(self._payload(i, frame), default=str)
+            for i, frame in enumerate(frames)
+        ]
+        
+        if self.max_workers > 1 and sum(map(len, encoded)) >= self.PARALLEL_MIN_BYTES:
+            step = -(-len(encoded) // (4 * self.max_workers))
+            slices = [encoded[i:i + step] for i in range(0, len(encoded), step)]
+            with ThreadPoolExecutor(self.max_workers) as pool:
+                hashes = [h for part in pool.map(_sha256_all, slices) for h in part]
+        else:
+            hashes = _sha256_all(encoded)
+        
+        return [self._chunk(i, content_hash) for i, content_hash in enumerate(hashes)]
+    
+    @staticmethod
+    def _payload(frame_number: int, content: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "frame": frame_number,
+            "content": content,
+        }
+    
+    @staticmethod
+    def _chunk(frame_number: int, content_hash: str) -> XRChunk:
+        return XRChunk(
+            chunk_id=generate_id(),
+            frame_number=frame_number,
+            content_hash=content_hash,
+        )
+
+
+def _sha256_all(payloads: List[bytes]) -> List[str]:
+    return [hashlib.sha256(payload).hexdigest() for payload in payloads]
 
 
 # ============================================================================
@@ -249,7 +434,8 @@ class XRIntegrityVerifier:
         if len(hashes) == 1:
             return hashes[0]
         
-        # Pad to power of 2
+        # Pad to power of 2 (on a copy: callers keep their list)
+        hashes = list(hashes)
         while len(hashes) & (len(hashes) - 1) != 0:
             hashes.append(compute_sha256("padding"))
         
@@ -348,8 +534,8 @@ class XRBlockchainVerificationSystem:
     Differentiation vs traditional XR dashboards
     """
     
-    def __init__(self):
-        self.ledger = LightweightLedger()
+    def __init__(self, ledger_path: Optional[str] = None):
+        self.ledger = LightweightLedger(ledger_path)
         self.hasher = XRChunkHasher()
         self.verifier = XRIntegrityVerifier(self.ledger)
     
@@ -422,11 +608,11 @@ class XRBlockchainVerificationSystem:
 # FACTORY FUNCTIONS
 # ============================================================================
 
-def create_xr_verification_system() -> XRBlockchainVerificationSystem:
+def create_xr_verification_system(ledger_path: Optional[str] = None) -> XRBlockchainVerificationSystem:
     """Create XR blockchain verification system"""
-    return XRBlockchainVerificationSystem()
+    return XRBlockchainVerificationSystem(ledger_path)
 
 
-def create_ledger() -> LightweightLedger:
+def create_ledger(path: Optional[str] = None) -> LightweightLedger:
     """Create lightweight ledger"""
-    return LightweightLedger()
+    return LightweightLedger(path)
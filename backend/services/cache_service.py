@@ -29,6 +29,11 @@ from functools import wraps
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    from ..canonical import canonical_json
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_json
+
 logger = logging.getLogger(__name__)
 
 # Type variable for generic caching
@@ -154,7 +159,7 @@ class CacheKeyBuilder:
     def _hash_params(params: Dict[str, Any]) -> str:
         """Create a hash of parameters for cache key."""
         # Sort keys for consistent hashing
-        sorted_params = json.dumps(params, sort_keys=True, default=str)
+        sorted_params = canonical_json(params, default=str)
         return hashlib.md5(sorted_params.encode()).hexdigest()[:12]
 
 
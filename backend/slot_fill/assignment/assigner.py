@@ -44,23 +44,35 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 class AssignmentRule:
-    """Rule for agent assignment"""
+    """
+    Rule for agent assignment.
+    
+    `slot_type` restricts the rule to one slot type and lets the assigner
+    index it; `condition` (optional when `slot_type` is set) is checked on
+    top of it.
+    """
     
     def __init__(
         self,
         name: str,
-        condition: Callable[[Slot], bool],
+        condition: Optional[Callable[[Slot], bool]],
         agent: AgentType,
         priority: int = 0,
+        slot_type: Optional[SlotType] = None,
     ):
+        if condition is None and slot_type is None:
+            raise ValueError(f"Rule {name} needs a condition or a slot_type")
         self.name = name
         self.condition = condition
         self.agent = agent
         self.priority = priority
+        self.slot_type = slot_type
     
     def applies(self, slot: Slot) -> bool:
         """Check if rule applies to slot"""
-        return self.condition(slot)
+        if self.slot_type is not None and slot.slot_type != self.slot_type:
+            return False
+        return self.condition is None or self.condition(slot)
 
 
 class AssignmentResult(Enum):
@@ -87,6 +99,8 @@ class SlotAssigner:
     
     def __init__(self):
         self._rules: List[AssignmentRule] = []
+        # slot_type → candidate rules in priority order (compiled lazily)
+        self._decision_table: Optional[Dict[SlotType, List[AssignmentRule]]] = None
         self._assignment_history: List[Dict[str, Any]] = []
         self._active_assignments: Dict[str, AgentType] = {}  # slot_id → agent
         
@@ -99,17 +113,49 @@ class SlotAssigner:
             self._rules.append(
                 AssignmentRule(
                     name=f"default_{slot_type.value}",
-                    condition=lambda s, st=slot_type: s.slot_type == st,
+                    condition=None,
                     agent=agent_type,
                     priority=0,
+                    slot_type=slot_type,
                 )
             )
+        self._decision_table = None
     
     def add_rule(self, rule: AssignmentRule) -> None:
         """Add custom assignment rule"""
         self._rules.append(rule)
         # Sort by priority (higher first)
         self._rules.sort(key=lambda r: r.priority, reverse=True)
+        self._decision_table = None
+    
+    def _compile_rules(self) -> Dict[SlotType, List[AssignmentRule]]:
+        """
+        Build the decision table: for each slot type, the rules that can
+        match it, in evaluation order.
+        
+        A typed rule without condition always matches its type, so the
+        candidates stop there.
+        """
+        table: Dict[SlotType, List[AssignmentRule]] = {}
+        for slot_type in SlotType:
+            candidates = []
+            for rule in self._rules:
+                if rule.slot_type is not None and rule.slot_type != slot_type:
+                    continue
+                candidates.append(rule)
+                if rule.condition is None:
+                    break
+            table[slot_type] = candidates
+        return table
+    
+    def _match_rule(self, slot: Slot) -> Optional[AssignmentRule]:
+        """First rule matching the slot, via the decision table"""
+        if self._decision_table is None:
+            self._decision_table = self._compile_rules()
+        for rule in self._decision_table[slot.slot_type]:
+            if rule.condition is None or rule.condition(slot):
+                return rule
+        return None
     
     def assign(self, slot: Slot) -> tuple[AssignmentResult, Optional[AgentType]]:
         """
@@ -129,14 +175,14 @@ class SlotAssigner:
             return AssignmentResult.REQUIRES_HITL, None
         
         # Find matching rule
-        for rule in self._rules:
-            if rule.applies(slot):
-                slot.assigned_agent = rule.agent
-                self._active_assignments[slot.slot_id] = rule.agent
-                self._record_assignment(slot, rule.agent, AssignmentResult.SUCCESS)
-                
-                logger.info(f"Assigned slot {slot.slot_id} to {rule.agent.value}")
-                return AssignmentResult.SUCCESS, rule.agent
+        rule = self._match_rule(slot)
+        if rule is not None:
+            slot.assigned_agent = rule.agent
+            self._active_assignments[slot.slot_id] = rule.agent
+            self._record_assignment(slot, rule.agent, AssignmentResult.SUCCESS)
+            
+            logger.info(f"Assigned slot {slot.slot_id} to {rule.agent.value}")
+            return AssignmentResult.SUCCESS, rule.agent
         
         # No matching rule - use auto-assign
         agent = slot.auto_assign_agent()
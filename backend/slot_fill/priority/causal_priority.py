@@ -22,10 +22,12 @@ Outputs:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import logging
 import math
 
+import numpy as np
+
 from ..models import (
     Slot,
     SlotStatus,
@@ -108,10 +110,7 @@ class CausalImpactCalculator:
         factors = ImpactFactors()
         
         # Calculate outcome sensitivity
-        if slot.slot_type.value in self._impact_functions:
-            factors.outcome_sensitivity = self._impact_functions[slot.slot_type.value](slot)
-        else:
-            factors.outcome_sensitivity = self._default_outcome_sensitivity(slot)
+        factors.outcome_sensitivity = self._outcome_sensitivity(slot)
         
         # Calculate downstream effects
         downstream = self._get_downstream_slots(slot.slot_id)
@@ -155,6 +154,59 @@ class CausalImpactCalculator:
         # Clamp to 0-1
         return max(0.0, min(1.0, impact))
     
+    def calculate_graph_factors(
+        self,
+        slot_ids: List[str],
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Downstream counts and propagation depths for many slots.
+        
+        Depths come from a single pass over the causal graph instead of
+        one traversal per slot.
+        """
+        depths = self._propagation_depths(slot_ids)
+        downstream = [len(self._get_downstream_slots(slot_id)) for slot_id in slot_ids]
+        return downstream, [depths[slot_id] for slot_id in slot_ids]
+    
+    def calculate_batch(self, slots: List[Slot]) -> Dict[str, np.ndarray]:
+        """
+        Vectorized causal impact, sensitivity, uncertainty and
+        negligibility for a list of slots.
+        
+        Matches calculate_causal_impact / calculate_sensitivity /
+        is_negligible slot by slot.
+        """
+        downstream, depths = self.calculate_graph_factors([slot.slot_id for slot in slots])
+        outcome = np.array([self._outcome_sensitivity(slot) for slot in slots], dtype=float)
+        uncertainty = np.array([self._calculate_uncertainty(slot) for slot in slots], dtype=float)
+        time_sensitivity = np.array(
+            [self._calculate_time_sensitivity(slot) for slot in slots], dtype=float
+        )
+        
+        weights = ImpactFactors().weights
+        downstream_normalized = np.minimum(np.array(downstream, dtype=float) / 10, 1.0)
+        depth_normalized = np.minimum(np.array(depths, dtype=float) / 5, 1.0)
+        downstream_effect = (downstream_normalized + depth_normalized) / 2
+        
+        impact = np.clip(
+            weights["outcome_sensitivity"] * outcome +
+            weights["downstream_effect"] * downstream_effect +
+            weights["uncertainty"] * uncertainty +
+            weights["time_sensitivity"] * time_sensitivity,
+            0.0, 1.0,
+        )
+        sensitivity = np.clip(0.6 * outcome + 0.4 * downstream_normalized, 0.0, 1.0)
+        
+        return {
+            "causal_impact": impact,
+            "sensitivity": sensitivity,
+            "uncertainty": uncertainty,
+            "is_negligible": (
+                (impact < self.impact_threshold) &
+                (sensitivity < self.sensitivity_threshold)
+            ),
+        }
+    
     def calculate_sensitivity(self, slot: Slot) -> float:
         """
         Calculate sensitivity score (0-1).
@@ -187,6 +239,12 @@ class CausalImpactCalculator:
             sensitivity < self.sensitivity_threshold
         )
     
+    def _outcome_sensitivity(self, slot: Slot) -> float:
+        """Custom impact function for the slot type, or the default"""
+        if slot.slot_type.value in self._impact_functions:
+            return self._impact_functions[slot.slot_type.value](slot)
+        return self._default_outcome_sensitivity(slot)
+    
     def _default_outcome_sensitivity(self, slot: Slot) -> float:
         """Default outcome sensitivity based on slot properties"""
         base_sensitivity = 0.3  # Default
@@ -210,30 +268,44 @@ class CausalImpactCalculator:
         """Get all slots that depend on this slot"""
         return self._dependencies.get(slot_id, [])
     
-    def _calculate_propagation_depth(
-        self,
-        slot_id: str,
-        visited: set = None,
-    ) -> int:
+    def _calculate_propagation_depth(self, slot_id: str) -> int:
         """Calculate how deep the causal chain goes"""
-        if visited is None:
-            visited = set()
-        
-        if slot_id in visited:
-            return 0
-        
-        visited.add(slot_id)
-        downstream = self._get_downstream_slots(slot_id)
-        
-        if not downstream:
-            return 0
+        return self._propagation_depths([slot_id])[slot_id]
+    
+    def _propagation_depths(self, roots: Iterable[str]) -> Dict[str, int]:
+        """
+        Longest downstream chain for every slot reachable from `roots`.
         
-        max_depth = 0
-        for child_id in downstream:
-            depth = self._calculate_propagation_depth(child_id, visited)
-            max_depth = max(max_depth, depth)
+        One iterative DFS: a slot's depth is settled once all its
+        downstream slots are (reverse topological order). A dependency
+        cycle is cut where it closes.
+        """
+        depths: Dict[str, int] = {}
+        on_path: set = set()
         
-        return max_depth + 1
+        for root in roots:
+            if root in depths:
+                continue
+            on_path.add(root)
+            stack = [(root, iter(self._get_downstream_slots(root)))]
+            
+            while stack:
+                slot_id, children = stack[-1]
+                for child_id in children:
+                    if child_id not in depths and child_id not in on_path:
+                        on_path.add(child_id)
+                        stack.append((child_id, iter(self._get_downstream_slots(child_id))))
+                        break
+                else:
+                    stack.pop()
+                    on_path.discard(slot_id)
+                    downstream = self._get_downstream_slots(slot_id)
+                    depths[slot_id] = 1 + max(
+                        (depths.get(child_id, 0) for child_id in downstream),
+                        default=-1,
+                    )
+        
+        return depths
     
     def _calculate_uncertainty(self, slot: Slot) -> float:
         """Calculate uncertainty in slot value"""
@@ -260,6 +332,14 @@ class CausalImpactCalculator:
 # PRIORITY RANKER
 # ============================================================================
 
+# Contributing factors flagged by impact, sensitivity and uncertainty > 0.5
+_SCORE_FACTORS = (
+    "High outcome sensitivity",
+    "Many downstream dependencies",
+    "High uncertainty in current value",
+)
+
+
 class SlotPriorityRanker:
     """
     Ranks slots by priority based on causal impact.
@@ -283,27 +363,62 @@ class SlotPriorityRanker:
         
         Returns list of (slot, priority) tuples sorted by priority (high to low).
         """
-        priorities: List[Tuple[Slot, CausalPriority]] = []
+        if not slots:
+            return []
+        
+        # Single vectorized scoring pass
+        scores = self.calculator.calculate_batch(slots)
+        impact = scores["causal_impact"]
+        sensitivity = scores["sensitivity"]
+        uncertainty = scores["uncertainty"]
+        negligible = scores["is_negligible"]
+        
+        priorities = [
+            CausalPriority(
+                slot_id=slot.slot_id,
+                causal_impact=float(impact[i]),
+                sensitivity=float(sensitivity[i]),
+                uncertainty=float(uncertainty[i]),
+            )
+            for i, slot in enumerate(slots)
+        ]
         
-        for slot in slots:
-            priority = self._compute_priority(slot)
-            
-            # Skip negligible slots unless requested
-            if priority.is_negligible and not include_negligible:
-                logger.debug(f"Skipping negligible slot {slot.slot_id}")
-                continue
+        # Combined priority score (CausalPriority.compute_priority)
+        thresholds = np.array([p.impact_threshold for p in priorities], dtype=float)
+        priority_scores = np.where(
+            impact < thresholds,
+            0.0,
+            0.5 * impact + 0.3 * sensitivity + 0.2 * uncertainty,
+        )
+        
+        for i, (slot, priority) in enumerate(zip(slots, priorities)):
+            priority.priority_score = float(priority_scores[i])
+            priority.is_negligible = bool(negligible[i])
             
-            priorities.append((slot, priority))
+            slot.causal_impact = priority.causal_impact
+            slot.sensitivity_score = priority.sensitivity
         
-        # Sort by priority score (descending)
-        priorities.sort(key=lambda x: x[1].priority_score, reverse=True)
+        # Skip negligible slots unless requested
+        keep = np.arange(len(slots))
+        if not include_negligible:
+            keep = keep[~negligible]
+            if len(keep) < len(slots):
+                logger.debug(f"Skipping {len(slots) - len(keep)} negligible slots")
         
-        # Assign ranks
-        for rank, (slot, priority) in enumerate(priorities, start=1):
+        # Explanations only for the slots that are returned
+        self._explain(slots, priorities, keep, scores)
+        
+        # Sort by priority score (descending, stable)
+        order = keep[np.argsort(-priority_scores[keep], kind="stable")]
+        
+        ranked: List[Tuple[Slot, CausalPriority]] = []
+        for rank, i in enumerate(order, start=1):
+            slot, priority = slots[i], priorities[i]
             priority.priority_rank = rank
             slot.priority_rank = rank
+            ranked.append((slot, priority))
         
-        return priorities
+        return ranked
     
     def rank_document(
         self,
@@ -323,77 +438,52 @@ class SlotPriorityRanker:
         ranked = self.rank_slots(slots)
         return ranked[:top_n]
     
-    def _compute_priority(self, slot: Slot) -> CausalPriority:
-        """Compute priority for a single slot"""
-        causal_impact = self.calculator.calculate_causal_impact(slot)
-        sensitivity = self.calculator.calculate_sensitivity(slot)
-        uncertainty = self.calculator._calculate_uncertainty(slot)
-        
-        priority = CausalPriority(
-            slot_id=slot.slot_id,
-            causal_impact=causal_impact,
-            sensitivity=sensitivity,
-            uncertainty=uncertainty,
-        )
-        
-        # Compute combined priority score
-        priority.compute_priority()
-        
-        # Check if negligible
-        priority.is_negligible = self.calculator.is_negligible(slot)
-        
-        # Generate justification
-        priority.justification = self._generate_justification(slot, priority)
-        priority.contributing_factors = self._get_contributing_factors(slot, priority)
-        
-        # Update slot
-        slot.causal_impact = causal_impact
-        slot.sensitivity_score = sensitivity
-        
-        return priority
-    
-    def _generate_justification(
+    def _explain(
         self,
-        slot: Slot,
-        priority: CausalPriority,
-    ) -> str:
-        """Generate human-readable justification"""
-        if priority.is_negligible:
-            return f"Slot '{slot.name}' has low causal impact ({priority.causal_impact:.2f}) and can be deferred."
-        
-        impact_level = "high" if priority.causal_impact > 0.6 else "medium" if priority.causal_impact > 0.3 else "low"
-        sensitivity_level = "high" if priority.sensitivity > 0.6 else "medium" if priority.sensitivity > 0.3 else "low"
-        
-        return (
-            f"Slot '{slot.name}' has {impact_level} causal impact ({priority.causal_impact:.2f}) "
-            f"and {sensitivity_level} sensitivity ({priority.sensitivity:.2f}). "
-            f"Priority rank: {priority.priority_rank}."
-        )
-    
-    def _get_contributing_factors(
-        self,
-        slot: Slot,
-        priority: CausalPriority,
-    ) -> List[str]:
-        """Get list of contributing factors"""
-        factors = []
-        
-        if priority.causal_impact > 0.5:
-            factors.append("High outcome sensitivity")
-        
-        if priority.sensitivity > 0.5:
-            factors.append("Many downstream dependencies")
-        
-        if priority.uncertainty > 0.5:
-            factors.append("High uncertainty in current value")
-        
-        if slot.risk_level.value in ["high", "critical"]:
-            factors.append(f"Risk level: {slot.risk_level.value}")
-        
-        if slot.dependencies:
-            factors.append(f"{len(slot.dependencies)} upstream dependencies")
+        slots: List[Slot],
+        priorities: List[CausalPriority],
+        indices: np.ndarray,
+        scores: Dict[str, np.ndarray],
+    ) -> None:
+        """
+        Fill justification and contributing factors for slots[indices].
         
-        return factors
+        Impact / sensitivity levels and the score-based factors are
+        classified for the whole batch at once; only the final strings
+        are assembled per slot.
+        """
+        impact = scores["causal_impact"]
+        sensitivity = scores["sensitivity"]
+        levels = np.array(["low", "medium", "high"])
+        impact_level = levels[(impact > 0.3).astype(int) + (impact > 0.6)]
+        sensitivity_level = levels[(sensitivity > 0.3).astype(int) + (sensitivity > 0.6)]
+        flags = np.stack([
+            impact > 0.5,
+            sensitivity > 0.5,
+            scores["uncertainty"] > 0.5,
+        ], axis=1)
+        
+        for i in indices.tolist():
+            slot, priority = slots[i], priorities[i]
+            
+            if priority.is_negligible:
+                priority.justification = (
+                    f"Slot '{slot.name}' has low causal impact ({priority.causal_impact:.2f}) "
+                    f"and can be deferred."
+                )
+            else:
+                priority.justification = (
+                    f"Slot '{slot.name}' has {impact_level[i]} causal impact ({priority.causal_impact:.2f}) "
+                    f"and {sensitivity_level[i]} sensitivity ({priority.sensitivity:.2f}). "
+                    f"Priority rank: {priority.priority_rank}."
+                )
+            
+            factors = [label for label, flag in zip(_SCORE_FACTORS, flags[i]) if flag]
+            if slot.risk_level.value in ["high", "critical"]:
+                factors.append(f"Risk level: {slot.risk_level.value}")
+            if slot.dependencies:
+                factors.append(f"{len(slot.dependencies)} upstream dependencies")
+            priority.contributing_factors = factors
 
 
 # ============================================================================
@@ -136,6 +136,26 @@ class TestAssignment:
         verifier = assigner.get_verifier(AgentType.WRITING_AGENT)
         assert verifier != AgentType.WRITING_AGENT
     
+    def test_rule_priority_over_slot_type(self):
+        from ..assignment import create_assigner, AssignmentRule
+        
+        assigner = create_assigner()
+        assigner.add_rule(AssignmentRule(
+            name="medium_legal",
+            condition=lambda s: s.risk_level == RiskLevel.MEDIUM,
+            agent=AgentType.VERIFICATION_AGENT,
+            priority=5,
+            slot_type=SlotType.LEGAL,
+        ))
+        
+        medium = Slot(name="Clause", slot_type=SlotType.LEGAL, risk_level=RiskLevel.MEDIUM)
+        low = Slot(name="Note", slot_type=SlotType.LEGAL)
+        text = Slot(name="Intro", slot_type=SlotType.TEXT, risk_level=RiskLevel.MEDIUM)
+        
+        assert assigner.assign(medium)[1] == AgentType.VERIFICATION_AGENT
+        assert assigner.assign(low)[1] == AgentType.COMPLIANCE_AGENT
+        assert assigner.assign(text)[1] == AgentType.WRITING_AGENT
+    
     def test_orchestrator_fill_slot(self):
         from ..assignment import create_orchestrator
         
@@ -201,6 +221,61 @@ class TestPriority:
         assert len(ranked) == 2
         # High risk should be ranked higher
         assert ranked[0][0].name == "High"
+    
+    def test_rank_matches_per_slot_scores(self):
+        from ..priority import create_impact_calculator, create_priority_ranker
+        
+        calc = create_impact_calculator()
+        # a → b, a → c, b → c, c → d: longest chain from a is 3
+        calc.set_dependencies({"a": ["b", "c"], "b": ["c"], "c": ["d"]})
+        slots = [
+            Slot(slot_id=slot_id, name=slot_id, slot_type=SlotType.TEXT)
+            for slot_id in ["d", "c", "b", "a"]
+        ]
+        
+        assert calc.calculate_impact(slots[3]).propagation_depth == 3
+        assert calc.calculate_graph_factors(["a", "b", "c", "d"]) == ([2, 1, 1, 0], [3, 2, 1, 0])
+        
+        ranked = create_priority_ranker(calc).rank_slots(slots, include_negligible=True)
+        
+        assert [slot.slot_id for slot, _ in ranked] == ["a", "b", "c", "d"]
+        for slot, priority in ranked:
+            assert priority.causal_impact == calc.calculate_causal_impact(slot)
+            assert priority.sensitivity == calc.calculate_sensitivity(slot)
+    
+    def test_rank_explains_returned_slots(self):
+        from ..priority import create_impact_calculator, create_priority_ranker
+        
+        ranker = create_priority_ranker(create_impact_calculator(sensitivity_threshold=0.1))
+        slots = [
+            Slot(name="High", slot_type=SlotType.FINANCE, risk_level=RiskLevel.CRITICAL,
+                 dependencies=["x", "y"]),
+            Slot(name="Low", slot_type=SlotType.TEXT, risk_level=RiskLevel.LOW,
+                 status=SlotStatus.VALIDATED),
+        ]
+        
+        ranked = ranker.rank_slots(slots, include_negligible=True)
+        (high, top), (low, bottom) = ranked
+        
+        assert high.name == "High"
+        assert top.justification == (
+            f"Slot 'High' has medium causal impact ({top.causal_impact:.2f}) "
+            f"and medium sensitivity ({top.sensitivity:.2f}). Priority rank: 0."
+        )
+        assert top.contributing_factors == [
+            "High outcome sensitivity",
+            "High uncertainty in current value",
+            "Risk level: critical",
+            "2 upstream dependencies",
+        ]
+        assert bottom.is_negligible
+        assert bottom.justification == (
+            f"Slot 'Low' has low causal impact ({bottom.causal_impact:.2f}) and can be deferred."
+        )
+        assert bottom.contributing_factors == []
+        
+        # Negligible slots are dropped before being explained
+        assert [slot.name for slot, _ in ranker.rank_slots(slots)] == ["High"]
 
 
 # ============================================================================
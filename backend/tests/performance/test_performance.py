@@ -501,3 +501,50 @@ class TestBenchmarkSuite:
         # Seuils
         assert results['p95'] < 500, "P95 exceeds 500ms"
         assert results['mean'] < 200, "Mean exceeds 200ms"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLD START
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestColdStart:
+    """Tests de démarrage à froid (routers chargés à la demande)."""
+    
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    def test_lazy_cold_start_under_one_second(self):
+        """📊 Un worker est prêt en moins d'une seconde."""
+        from app.core.startup import measure_cold_start
+        
+        cold_start = measure_cold_start("lazy")
+        print(f"\n📊 Cold start (lazy routers): {cold_start * 1000:.0f}ms")
+        
+        assert cold_start < 1.0, f"Cold start took {cold_start:.2f}s"
+    
+    @pytest.mark.performance
+    async def test_router_mounted_on_first_hit(self):
+        """✅ Le router n'est importé qu'à la première requête sous son préfixe."""
+        import types
+        from fastapi import APIRouter, FastAPI
+        from app.core.startup import LazyRouterRegistry, RouterSpec
+        
+        module = types.ModuleType("lazy_probe_router")
+        module.router = APIRouter()
+        module.router.add_api_route("/ping", lambda: {"pong": True})
+        sys.modules[module.__name__] = module
+        
+        app = FastAPI()
+        registry = LazyRouterRegistry(app, [RouterSpec(module.__name__, "/api/v2/probe", ["Probe"])])
+        
+        await registry.ensure_loaded("/api/v2/other")
+        assert len(registry.pending) == 1
+        
+        await registry.ensure_loaded("/api/v2/probe/ping")
+        assert registry.pending == []
+        assert "/api/v2/probe/ping" in app.openapi()["paths"]
+        
+        report = registry.summary()
+        assert report["loaded"] == 1
+        assert report["modules"][0]["module"] == module.__name__
+        
+        del sys.modules[module.__name__]
@@ -0,0 +1,214 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CHE·NU™ — CHECKPOINT SERVICE EXPIRY TESTS
+═══════════════════════════════════════════════════════════════════════════════
+FOCUS: R&D Rule #1 (Human Sovereignty)
+- expire_stale_checkpoints: le UPDATE SQL reste la source de vérité
+- les deadlines en mémoire ne servent qu'à planifier le prochain balayage
+- run_expiry_scheduler: balayage commité, puis sommeil jusqu'à la deadline
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import asyncio
+import operator
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.deadlines import DeadlineHeap
+from app.services.checkpoint_service import CheckpointService, run_expiry_scheduler
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES SPÉCIFIQUES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _update_result(ids):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(ids)
+    return result
+
+
+@pytest.fixture
+def db():
+    """Session async mock: execute() renvoie les ids expirés."""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_update_result([]))
+    session.flush = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def hints():
+    return DeadlineHeap()
+
+
+@pytest.fixture
+def session_factory(db):
+    """Fabrique de sessions: chaque appel ouvre la même session mock."""
+    db.commit = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=db)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory
+
+
+def _stop_after(sweeps):
+    """Remplace asyncio.sleep: note les délais, annule après `sweeps` tours."""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+        if len(delays) == sweeps:
+            raise asyncio.CancelledError
+
+    return delays, patch("app.services.checkpoint_service.asyncio.sleep", sleep)
+
+
+@pytest.fixture
+def service(db, hints):
+    return CheckpointService(db, expiry_hints=hints)
+
+
+@pytest.fixture
+def plain_rows():
+    """Lignes ORM remplacées par des objets simples (pas de mapper)."""
+    with patch(
+        "app.services.checkpoint_service.GovernanceCheckpoint",
+        side_effect=lambda **kw: SimpleNamespace(**kw),
+    ), patch(
+        "app.services.checkpoint_service.AuditLog",
+        side_effect=lambda **kw: SimpleNamespace(**kw),
+    ):
+        yield
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestCheckpointExpiry:
+    """Tests du balayage d'expiration."""
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_1
+    async def test_sweep_runs_date_range_update_without_hints(self, service, db):
+        """Les checkpoints d'autres workers expirent même sans deadline locale."""
+        other_worker_ids = [uuid4(), uuid4()]
+        db.execute.return_value = _update_result(other_worker_ids)
+
+        expired = await service.expire_stale_checkpoints()
+
+        assert expired == 2
+        statement = db.execute.await_args.args[0]
+        conditions = {
+            (clause.left.key, clause.operator) for clause in statement.whereclause.clauses
+        }
+        assert ("expires_at", operator.lt) in conditions
+        assert ("status", operator.eq) in conditions
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_1
+    async def test_sweep_drops_due_and_expired_hints(self, service, db, hints):
+        now = datetime.utcnow()
+        due, expired_elsewhere, future = uuid4(), uuid4(), uuid4()
+        hints.push(due, now - timedelta(seconds=5))
+        hints.push(expired_elsewhere, now + timedelta(milliseconds=1))
+        hints.push(future, now + timedelta(hours=1))
+        db.execute.return_value = _update_result([due, expired_elsewhere])
+
+        await service.expire_stale_checkpoints()
+
+        assert due not in hints
+        assert expired_elsewhere not in hints
+        assert future in hints
+        assert len(hints) == 1
+
+    @pytest.mark.unit
+    async def test_create_checkpoint_records_hint(self, service, hints, user_id, plain_rows):
+        checkpoint = await service.create_checkpoint(
+            identity_id=user_id,
+            checkpoint_type="governance",
+            reason="Export dataspace",
+            action_data={"action": "export_dataspace"},
+            expires_in_minutes=5,
+        )
+
+        assert checkpoint.id in hints
+        assert hints.next_deadline() == checkpoint.expires_at
+
+    @pytest.mark.unit
+    async def test_checkpoint_without_expiry_has_no_hint(self, service, hints, user_id, plain_rows):
+        await service.create_checkpoint(
+            identity_id=user_id,
+            checkpoint_type="governance",
+            reason="Archive thread",
+            action_data={},
+            expires_in_minutes=None,
+        )
+
+        assert len(hints) == 0
+
+
+class TestExpiryWakeUp:
+    """Tests de la planification du prochain balayage."""
+
+    @pytest.mark.unit
+    def test_no_hint_waits_max_interval(self, service):
+        assert service.seconds_until_next_expiry(max_wait=30) == 30
+
+    @pytest.mark.unit
+    def test_wakes_up_at_next_deadline(self, service, hints):
+        hints.push(uuid4(), datetime.utcnow() + timedelta(seconds=10))
+        hints.push(uuid4(), datetime.utcnow() + timedelta(minutes=10))
+
+        wait = service.seconds_until_next_expiry(max_wait=60)
+
+        assert 0 < wait <= 10
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    def test_overdue_hint_wakes_up_immediately(self, service, hints):
+        hints.push(uuid4(), datetime.utcnow() - timedelta(seconds=1))
+
+        assert service.seconds_until_next_expiry(max_wait=60) == 0.0
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    def test_far_deadline_is_capped(self, service, hints):
+        hints.push(uuid4(), datetime.utcnow() + timedelta(hours=2))
+
+        assert service.seconds_until_next_expiry(max_wait=60) == 60
+
+
+class TestExpiryScheduler:
+    """Tests de la tâche de fond démarrée par le lifespan."""
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_1
+    async def test_commits_each_sweep_and_sleeps_until_next_hint(
+        self, session_factory, db, hints
+    ):
+        hints.push(uuid4(), datetime.utcnow() + timedelta(seconds=10))
+        delays, fake_sleep = _stop_after(2)
+
+        with fake_sleep, pytest.raises(asyncio.CancelledError):
+            await run_expiry_scheduler(session_factory, max_wait=60, expiry_hints=hints)
+
+        assert db.execute.await_count == 2
+        assert db.commit.await_count == 2
+        assert all(0 < delay <= 10 for delay in delays)
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    async def test_failed_sweep_is_retried_after_max_wait(self, session_factory, db, hints):
+        db.execute.side_effect = [RuntimeError("db down"), _update_result([])]
+        delays, fake_sleep = _stop_after(2)
+
+        with fake_sleep, pytest.raises(asyncio.CancelledError):
+            await run_expiry_scheduler(session_factory, max_wait=30, expiry_hints=hints)
+
+        assert delays == [30, 30]
+        assert db.commit.await_count == 1
@@ -0,0 +1,411 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CHE·NU™ — ASGI MIDDLEWARE & LOGGING PIPELINE TESTS
+═══════════════════════════════════════════════════════════════════════════════
+FOCUS: R&D Rule #3 (Identity Boundary)
+- IdentityBoundaryMiddleware: 401 sans identité, 403 inter-identités,
+  identité transmise via request.state
+- LRUCache / IdentityBoundaryService: TTL, éviction LRU, compteurs,
+  cache des jetons, extraction par regex identique à l'ancienne boucle
+- AccessLogMiddleware: en-têtes de timing, journalisation échantillonnée
+- setup_logging / shutdown_logging: handlers racine restaurés
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import base64
+import importlib.util
+import json
+import logging
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core import logging_pipeline
+from app.middleware.access_log import AccessLogMiddleware
+
+
+def _load_identity_boundary():
+    """
+    Charge middleware/identity_boundary.py seul: le __init__ du paquet
+    importe middleware.governance, qui dépend de config.settings (absent
+    de l'arbre de tests).
+    """
+    name = "middleware_identity_boundary"
+    if name not in sys.modules:
+        path = Path(__file__).resolve().parents[2] / "middleware" / "identity_boundary.py"
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+identity_boundary = _load_identity_boundary()
+IdentityBoundaryMiddleware = identity_boundary.IdentityBoundaryMiddleware
+IdentityBoundaryService = identity_boundary.IdentityBoundaryService
+LRUCache = identity_boundary.LRUCache
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES SPÉCIFIQUES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/threads")
+    async def threads(request: Request):
+        identity = request.state.identity
+        return {"identity_id": identity.identity_id, "request_id": identity.request_id}
+
+    @app.get("/users/{user_id}/threads")
+    async def user_threads(user_id: str):
+        return {"user_id": user_id}
+
+    @app.get("/missing")
+    async def missing():
+        return {"status": "missing"}
+
+    return app
+
+
+def _jwt(claims) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def _legacy_identity_from_path(path):
+    """Ancienne boucle: un re.search par segment, dans l'ordre de priorité."""
+    for pattern in [
+        r"/users/([a-zA-Z0-9_-]+)",
+        r"/identities/([a-zA-Z0-9_-]+)",
+        r"/user/([a-zA-Z0-9_-]+)",
+        r"/identity/([a-zA-Z0-9_-]+)",
+    ]:
+        match = re.search(pattern, path)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _legacy_resource_id(path):
+    """Ancienne extraction: deuxième segment s'il ressemble à un ID."""
+    parts = path.strip("/").split("/")
+    if len(parts) >= 2 and re.match(r"^[a-zA-Z0-9_-]+$", parts[1]):
+        return parts[1]
+    return None
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge monotone contrôlée pour les TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(identity_boundary.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def boundary():
+    return IdentityBoundaryService()
+
+
+@pytest.fixture
+def client(boundary):
+    app = _build_app()
+    app.add_middleware(IdentityBoundaryMiddleware, service=boundary)
+    app.add_middleware(AccessLogMiddleware, version="76.0")
+    return TestClient(app)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestIdentityBoundaryMiddleware:
+    """Tests du middleware ASGI de frontière d'identité."""
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_3
+    def test_missing_identity_returns_401_json(self, client, boundary):
+        response = client.get("/threads")
+
+        assert response.status_code == 401
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["detail"]["error"] == "authentication_required"
+        assert boundary.get_stats()["total_requests"] == 1
+
+    @pytest.mark.unit
+    def test_public_path_needs_no_identity(self, client):
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_3
+    def test_identity_is_shared_through_request_state(self, client, user_id):
+        response = client.get("/threads", headers={"X-Identity-ID": str(user_id)})
+
+        assert response.status_code == 200
+        assert response.json()["identity_id"] == str(user_id)
+        assert response.json()["request_id"]
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_3
+    def test_cross_identity_access_returns_403(self, client, user_id, other_user_id):
+        response = client.get(
+            f"/users/{other_user_id}/threads", headers={"X-Identity-ID": str(user_id)}
+        )
+
+        assert response.status_code == 403
+        detail = response.json()["detail"]
+        assert detail["error"] == "identity_boundary_violation"
+        assert detail["target_identity"] == str(other_user_id)
+
+    @pytest.mark.unit
+    def test_own_resources_are_allowed(self, client, user_id):
+        response = client.get(
+            f"/users/{user_id}/threads", headers={"X-Identity-ID": str(user_id)}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"user_id": str(user_id)}
+
+
+class TestLRUCache:
+    """Tests du cache LRU borné avec TTL."""
+
+    @pytest.mark.unit
+    def test_entries_expire_after_ttl(self, clock):
+        cache = LRUCache(max_size=10, ttl_seconds=5)
+        cache.set("token", {"sub": "u1"})
+
+        clock[0] += 5
+        assert cache.get("token") == {"sub": "u1"}
+
+        clock[0] += 0.1
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" devient le moins récemment utilisé
+
+        cache.set("c", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_counters_track_hits_and_misses(self, clock):
+        cache = LRUCache(max_size=10, ttl_seconds=5)
+        cache.set("a", None)  # une valeur None reste un hit
+
+        cache.get("a")
+        cache.get("missing")
+        "a" in cache  # __contains__ ne compte pas
+        clock[0] += 10
+        cache.get("a")  # expiré: compte comme miss
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert stats["hit_rate"] == round(1 / 3, 4)
+
+
+class TestIdentityBoundaryService:
+    """Tests du service: cache des jetons, statistiques, extraction des chemins."""
+
+    @pytest.mark.unit
+    def test_decode_token_is_cached(self, boundary, monkeypatch):
+        decoded = []
+        extract = boundary._extract_from_jwt
+
+        def counting_extract(token):
+            decoded.append(token)
+            return extract(token)
+
+        monkeypatch.setattr(boundary, "_extract_from_jwt", counting_extract)
+        token = _jwt({"sub": "u1", "scopes": ["read"]})
+
+        first = boundary._decode_token(token)
+        second = boundary._decode_token(token)
+
+        assert first == second == {"sub": "u1", "scopes": ["read"]}
+        assert decoded == [token]
+        assert boundary.get_stats()["token_cache"]["hits"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    def test_invalid_token_result_is_cached_too(self, boundary, monkeypatch):
+        calls = []
+        monkeypatch.setattr(boundary, "_extract_from_jwt", lambda token: calls.append(token))
+
+        assert boundary._decode_token("not-a-jwt") is None
+        assert boundary._decode_token("not-a-jwt") is None
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_expired_token_is_decoded_again(self, clock):
+        boundary = IdentityBoundaryService(token_ttl_seconds=60)
+        token = _jwt({"sub": "u1"})
+
+        boundary._decode_token(token)
+        clock[0] += 61
+        boundary._decode_token(token)
+
+        stats = boundary.get_stats()["token_cache"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (0, 2, 1)
+
+    @pytest.mark.unit
+    def test_get_stats_reports_cache_counters(self, client, boundary, user_id):
+        token = _jwt({"sub": str(user_id)})
+        for _ in range(3):
+            client.get("/threads", headers={"Authorization": f"Bearer {token}"})
+        client.get("/health")
+
+        stats = boundary.get_stats()
+        assert stats["token_cache"]["misses"] == 1
+        assert stats["token_cache"]["hits"] == 2
+        assert stats["cached_identities"] == 1
+        assert stats["identity_cache"]["size"] == 1
+        assert stats["public_path_hits"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_3
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/users/u1/threads", "u1"),
+            ("/identities/i1/users/u1", "u1"),  # users prime sur la position
+            ("/user/a/identities/i1", "i1"),
+            ("/identity/x/user/a", "a"),
+            ("/users/u1/users/u2", "u1"),  # première occurrence du segment
+            ("/v1/identity/x", "x"),
+            ("/users/", None),
+            ("/usersx/u1", None),
+            ("/threads/t1", None),
+        ],
+    )
+    def test_identity_path_precedence(self, boundary, path, expected):
+        assert boundary._extract_identity_from_path(path) == expected
+        assert _legacy_identity_from_path(path) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/threads/t1", "t1"),
+            ("/threads/t1/messages", "t1"),
+            ("threads/t1", "t1"),
+            ("//threads/t1/", "t1"),
+            ("/threads", None),
+            ("/threads/t.1", None),
+            ("/threads//t1", None),
+            ("/", None),
+        ],
+    )
+    def test_resource_id_extraction(self, path, expected):
+        middleware = IdentityBoundaryMiddleware(app=None, service=IdentityBoundaryService())
+
+        assert middleware._extract_resource_id(path) == expected
+        assert _legacy_resource_id(path) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    def test_regex_extraction_matches_legacy_loop_on_random_paths(self, boundary):
+        rng = random.Random(47)
+        middleware = IdentityBoundaryMiddleware(app=None, service=boundary)
+        segments = ["users", "identities", "user", "identity", "threads", "x-1", "a_b", "v.2", ""]
+
+        for _ in range(2000):
+            path = "/" * rng.randint(0, 2) + "/".join(
+                rng.choice(segments) for _ in range(rng.randint(0, 6))
+            ) + "/" * rng.randint(0, 1)
+
+            assert boundary._extract_identity_from_path(path) == _legacy_identity_from_path(path), path
+            assert middleware._extract_resource_id(path) == _legacy_resource_id(path), path
+
+
+class TestAccessLogMiddleware:
+    """Tests du journal d'accès ASGI."""
+
+    @pytest.mark.unit
+    def test_adds_timing_and_version_headers(self, client, user_id):
+        for response in (
+            client.get("/health"),
+            client.get("/threads"),  # 401 produit par le middleware interne
+            client.get("/threads", headers={"X-Identity-ID": str(user_id)}),
+        ):
+            assert float(response.headers["X-Process-Time"]) >= 0
+            assert response.headers["X-CHE-NU-Version"] == "76.0"
+
+    @pytest.mark.unit
+    def test_errors_are_always_logged(self, caplog):
+        app = _build_app()
+        app.add_middleware(AccessLogMiddleware, sample_rate=0.0)
+        client = TestClient(app)
+
+        with caplog.at_level(logging.INFO, logger="chenu.main"):
+            client.get("/health")
+            client.get("/nowhere")
+
+        records = [r for r in caplog.records if r.name == "chenu.main"]
+        assert len(records) == 1
+        assert records[0].levelno == logging.WARNING
+        assert "GET /nowhere [404]" in records[0].getMessage()
+
+    @pytest.mark.unit
+    def test_successful_requests_are_logged_when_sampled(self, caplog):
+        app = _build_app()
+        app.add_middleware(AccessLogMiddleware, sample_rate=1.0)
+        client = TestClient(app)
+
+        with caplog.at_level(logging.INFO, logger="chenu.main"):
+            client.get("/health")
+
+        messages = [r.getMessage() for r in caplog.records if r.name == "chenu.main"]
+        assert len(messages) == 1 and "GET /health [200]" in messages[0]
+
+
+class TestLoggingPipeline:
+    """Tests de l'installation et du retrait du pipeline de logs."""
+
+    @pytest.mark.unit
+    def test_shutdown_restores_root_handlers(self):
+        root = logging.getLogger()
+        before, level = list(root.handlers), root.level
+        sink = logging.NullHandler()
+
+        logging_pipeline.setup_logging(level="DEBUG", handlers=[sink])
+        try:
+            assert len(root.handlers) == 1
+            assert isinstance(root.handlers[0], logging_pipeline.DroppingQueueHandler)
+        finally:
+            logging_pipeline.shutdown_logging()
+
+        assert root.handlers == before
+        assert root.level == level
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    def test_shutdown_without_setup_is_a_no_op(self):
+        root = logging.getLogger()
+        before = list(root.handlers)
+
+        logging_pipeline.shutdown_logging()
+
+        assert root.handlers == before
@@ -0,0 +1,205 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CHE·NU™ — SYNAPTIC GRAPH DISPATCH TESTS
+═══════════════════════════════════════════════════════════════════════════════
+FOCUS: Anti-loop protection
+- fire_trigger: seules les arêtes du déclencheur partent, en parallèle
+- détection de boucle par chaîne causale, pas globale
+- nombre de chaînes simultanées borné, cooldown respecté
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import asyncio
+import pytest
+
+from backend.core.synaptic.synaptic_graph import (
+    EdgeAction,
+    EdgeTrigger,
+    ModuleID,
+    Priority,
+    StabilityGuard,
+    SynapticGraph,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES SPÉCIFIQUES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _connect(graph, source, target, trigger, handler, cooldown=0):
+    """Arête de test dont l'action appelle `handler`."""
+    name = f"{source.value}->{target.value}:{trigger}"
+    graph.register_handler(name, handler)
+    return graph.add_edge(
+        source=source,
+        target=target,
+        priority=Priority.P2,
+        trigger=EdgeTrigger(trigger, "test trigger"),
+        action=EdgeAction(name, "test action", handler=name),
+        stability_guard=StabilityGuard(cooldown_seconds=cooldown),
+    )
+
+
+def _returning(value, delay=0.0):
+    async def handler(event):
+        await asyncio.sleep(delay)
+        return value
+    return handler
+
+
+@pytest.fixture
+def graph():
+    return SynapticGraph(max_concurrency=2)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestTriggerDispatch:
+    """Tests du routage des déclencheurs."""
+
+    @pytest.mark.unit
+    async def test_fires_only_matching_edges(self, graph):
+        src = ModuleID.MOD_20_LIBRARY
+        _connect(graph, src, ModuleID.MOD_21_EDU, "test_published", _returning("edu"))
+        _connect(graph, src, ModuleID.MOD_23_COMMUNITY, "test_published", _returning("community"))
+        other = _connect(graph, src, ModuleID.MOD_24_RESONANCE, "test_retracted", _returning("resonance"))
+
+        results = await graph.fire_trigger(src, "test_published", {"book": "b1"})
+
+        assert sorted(results) == ["community", "edu"]
+        assert other.fire_count == 0
+        assert await graph.fire_trigger(src, "test_unknown") == []
+
+    @pytest.mark.unit
+    async def test_failing_edge_does_not_orphan_siblings(self, graph):
+        src = ModuleID.MOD_20_LIBRARY
+        finished = []
+
+        async def failing(event):
+            raise RuntimeError("handler failed")
+
+        async def slow(event):
+            await asyncio.sleep(0.01)
+            finished.append(event.target)
+            return "done"
+
+        _connect(graph, src, ModuleID.MOD_21_EDU, "test_published", failing)
+        _connect(graph, src, ModuleID.MOD_23_COMMUNITY, "test_published", slow)
+
+        with pytest.raises(RuntimeError, match="handler failed"):
+            await graph.fire_trigger(src, "test_published")
+
+        # Le frère a terminé avant que l'erreur ne remonte
+        assert finished == [ModuleID.MOD_23_COMMUNITY]
+        assert graph.get_graph_summary()["active_paths"] == []
+
+
+class TestLoopDetection:
+    """Tests de la détection de boucle par chaîne causale."""
+
+    @pytest.mark.unit
+    @pytest.mark.rd_rule_1
+    async def test_loop_is_cut_within_a_chain(self, graph):
+        a, b = ModuleID.MOD_20_LIBRARY, ModuleID.MOD_21_EDU
+        calls = []
+
+        async def forward(event):
+            calls.append("a->b")
+            return await graph.fire_trigger(b, "test_echo")
+
+        async def back(event):
+            calls.append("b->a")
+            return await graph.fire_trigger(a, "test_ping")
+
+        _connect(graph, a, b, "test_ping", forward)
+        _connect(graph, b, a, "test_echo", back)
+
+        await asyncio.wait_for(graph.fire_trigger(a, "test_ping"), timeout=1)
+
+        assert calls == ["a->b", "b->a"]
+
+    @pytest.mark.unit
+    async def test_unrelated_chains_do_not_block_each_other(self, graph):
+        src, dst = ModuleID.MOD_20_LIBRARY, ModuleID.MOD_21_EDU
+        _connect(graph, src, dst, "test_ping", _returning("pong", delay=0.01))
+
+        first, second = await asyncio.gather(
+            graph.fire_trigger(src, "test_ping"),
+            graph.fire_trigger(src, "test_ping"),
+        )
+
+        # Le même chemin en vol dans une autre chaîne n'est pas une boucle
+        assert first == ["pong"] and second == ["pong"]
+
+
+class TestConcurrency:
+    """Tests de la borne de concurrence et du cooldown."""
+
+    @pytest.mark.unit
+    async def test_root_chains_are_bounded(self, graph):
+        src = ModuleID.MOD_22_ORCH
+        running, peak = 0, 0
+
+        async def tracked(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return event.target
+
+        targets = [ModuleID.MOD_01_OPA, ModuleID.MOD_03_CAUSAL, ModuleID.MOD_06_XR,
+                   ModuleID.MOD_11_NEURO, ModuleID.MOD_13_MATTER]
+        for target in targets:
+            _connect(graph, src, target, "test_fanout", tracked)
+
+        results = await graph.fire_trigger(src, "test_fanout")
+
+        assert sorted(results) == sorted(targets)
+        assert peak == 2
+
+    @pytest.mark.unit
+    @pytest.mark.edge_case
+    async def test_nested_firing_reuses_parent_slot(self):
+        graph = SynapticGraph(max_concurrency=1)
+        a, b = ModuleID.MOD_20_LIBRARY, ModuleID.MOD_21_EDU
+
+        async def nested(event):
+            return await graph.fire_trigger(b, "test_nested")
+
+        _connect(graph, a, b, "test_outer", nested)
+        _connect(graph, b, ModuleID.MOD_23_COMMUNITY, "test_nested", _returning("inner"))
+
+        results = await asyncio.wait_for(graph.fire_trigger(a, "test_outer"), timeout=1)
+
+        assert results == [["inner"]]
+
+    @pytest.mark.unit
+    async def test_cooldown_blocks_refiring(self, graph):
+        src, dst = ModuleID.MOD_20_LIBRARY, ModuleID.MOD_21_EDU
+        edge = _connect(graph, src, dst, "test_ping", _returning("pong"), cooldown=60)
+
+        assert await graph.fire_trigger(src, "test_ping") == ["pong"]
+        assert await graph.fire_trigger(src, "test_ping") == []
+        assert await graph.fire_edge(edge.edge_id) is None
+        assert edge.fire_count == 1
+
+    @pytest.mark.unit
+    async def test_active_paths_drain_to_zero(self, graph):
+        a, b = ModuleID.MOD_20_LIBRARY, ModuleID.MOD_21_EDU
+        seen = []
+
+        async def observe(event):
+            seen.append(list(graph.get_graph_summary()["active_paths"]))
+            await asyncio.sleep(0.01)
+
+        _connect(graph, a, b, "test_ping", observe)
+        _connect(graph, a, ModuleID.MOD_23_COMMUNITY, "test_ping", observe)
+
+        await asyncio.gather(*(graph.fire_trigger(a, "test_ping") for _ in range(3)))
+
+        assert all(paths for paths in seen)
+        assert graph.get_graph_summary()["active_paths"] == []
+        assert not graph._active_paths
@@ -18,6 +18,8 @@ import hashlib
 import json
 import logging
 
+from ..dependency_graph import DependencyGraph
+
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -312,6 +314,11 @@ class CanonEngine:
     def __init__(self):
         self.elements: Dict[str, CanonicalElement] = {}
         self.pending_changes: Dict[UUID, CanonicalChange] = {}
+        self.dependency_graph = DependencyGraph()
+        # Arêtes refusées par le graphe parce qu'elles fermeraient un cycle
+        self._cycles: Dict[str, List[str]] = {}
+        # element_id -> (version, content, hash): hash mémoïsé par version
+        self._hash_cache: Dict[str, Tuple[str, str, str]] = {}
         
         # Charger les éléments canoniques de base
         self._initialize_core_elements()
@@ -325,13 +332,35 @@ class CanonEngine:
         """Initialise les éléments canoniques de base."""
         for element_id, element in CORE_CANONICAL_ELEMENTS.items():
             # Calculer hash du contenu
-            element.hash = self._compute_hash(element.content)
+            element.hash = self._element_hash(element)
             self.elements[element_id] = element
+            self._index_element(element)
+    
+    def _index_element(self, element: CanonicalElement):
+        """Enregistre un élément et ses dépendances dans le graphe."""
+        graph = self.dependency_graph
+        rejected = graph.set_dependencies(element.id, element.dependencies)
+        cycles = [graph.cycle_through(element.id, dep_id) for dep_id in rejected]
+        for cycle in cycles:
+            logger.warning(f"Circular dependency rejected: {cycle}")
+        if cycles:
+            self._cycles[element.id] = cycles
+        else:
+            self._cycles.pop(element.id, None)
     
     def _compute_hash(self, content: str) -> str:
         """Calcule le hash SHA-256 du contenu."""
         return hashlib.sha256(content.strip().encode()).hexdigest()[:16]
     
+    def _element_hash(self, element: CanonicalElement) -> str:
+        """Hash du contenu, recalculé seulement si version ou contenu change."""
+        cached = self._hash_cache.get(element.id)
+        if cached and cached[0] == element.version and cached[1] is element.content:
+            return cached[2]
+        digest = self._compute_hash(element.content)
+        self._hash_cache[element.id] = (element.version, element.content, digest)
+        return digest
+    
     # ═══════════════════════════════════════════════════════════════════════
     # VALIDATION
     # ═══════════════════════════════════════════════════════════════════════
@@ -520,9 +549,11 @@ class CanonEngine:
         element_id: str
     ) -> List[CanonicalElement]:
         """Récupère les éléments qui dépendent de celui-ci."""
+        dependents = self.dependency_graph.reverse_edges.get(element_id, set())
         return [
-            e for e in self.elements.values()
-            if element_id in e.dependencies
+            self.elements[dep_id]
+            for dep_id in self.dependency_graph.ordered(dependents)
+            if dep_id in self.elements
         ]
     
     # ═══════════════════════════════════════════════════════════════════════
@@ -606,7 +637,7 @@ class CanonEngine:
             element = self.elements.get(change.element_id)
             if element and change.proposed_content:
                 element.content = change.proposed_content
-                element.hash = self._compute_hash(change.proposed_content)
+                element.hash = self._element_hash(element)
         elif change.change_type == "deprecate":
             element = self.elements.get(change.element_id)
             if element:
@@ -641,7 +672,7 @@ class CanonEngine:
         
         for element_id, element in self.elements.items():
             # Vérifier hash
-            computed_hash = self._compute_hash(element.content)
+            computed_hash = self._element_hash(element)
             if computed_hash == element.hash:
                 results["hash_verified"] += 1
             else:
@@ -670,36 +701,8 @@ class CanonEngine:
         return results
     
     async def _detect_cycles(self) -> List[str]:
-        """Détecte les dépendances circulaires."""
-        cycles = []
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(element_id: str, path: List[str]) -> bool:
-            visited.add(element_id)
-            rec_stack.add(element_id)
-            path.append(element_id)
-            
-            element = self.elements.get(element_id)
-            if element:
-                for dep_id in element.dependencies:
-                    if dep_id not in visited:
-                        if dfs(dep_id, path):
-                            return True
-                    elif dep_id in rec_stack:
-                        cycle_start = path.index(dep_id)
-                        cycles.append(" -> ".join(path[cycle_start:] + [dep_id]))
-                        return True
-            
-            path.pop()
-            rec_stack.remove(element_id)
-            return False
-        
-        for element_id in self.elements:
-            if element_id not in visited:
-                dfs(element_id, [])
-        
-        return cycles
+        """Dépendances circulaires refusées à l'insertion dans le graphe."""
+        return [cycle for cycles in self._cycles.values() for cycle in cycles]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -17,6 +17,8 @@ from dataclasses import dataclass, field
 import logging
 import json
 
+from ..dependency_graph import DependencyGraph
+
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -87,13 +89,6 @@ class ModuleEntry:
     lines_of_code: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
-class DependencyGraph:
-    """Graphe des dépendances entre modules"""
-    nodes: Set[str]
-    edges: Dict[str, Set[str]]  # module_id -> set of dependencies
-    reverse_edges: Dict[str, Set[str]]  # module_id -> set of dependents
-
 @dataclass
 class CatalogStats:
     """Statistiques du catalogue"""
@@ -335,11 +330,11 @@ class CatalogEngine:
     
     def __init__(self):
         self.modules: Dict[str, ModuleEntry] = {}
-        self.dependency_graph: DependencyGraph = DependencyGraph(
-            nodes=set(),
-            edges={},
-            reverse_edges={}
-        )
+        self.dependency_graph: DependencyGraph = DependencyGraph()
+        # name -> module id (unicité des noms sans parcours du catalogue)
+        self._names: Dict[str, str] = {}
+        # Arêtes refusées par le graphe parce qu'elles fermeraient un cycle
+        self._cycles: List[str] = []
         
         self._initialize_modules()
         self._build_dependency_graph()
@@ -354,23 +349,29 @@ class CatalogEngine:
         # Charger modules V75
         for module in V75_MODULES:
             self.modules[module.id] = module
+            self._names[module.name] = module.id
         
         # Charger verticals
         for module in VERTICAL_MODULES:
             self.modules[module.id] = module
+            self._names[module.name] = module.id
     
     def _build_dependency_graph(self):
         """Construit le graphe de dépendances."""
         for module_id in self.modules:
-            self.dependency_graph.nodes.add(module_id)
-            self.dependency_graph.edges[module_id] = set()
-            self.dependency_graph.reverse_edges[module_id] = set()
+            self.dependency_graph.add_node(module_id)
         
         for module_id, module in self.modules.items():
             for dep_id in module.dependencies:
                 if dep_id in self.modules:
-                    self.dependency_graph.edges[module_id].add(dep_id)
-                    self.dependency_graph.reverse_edges[dep_id].add(module_id)
+                    self._add_dependency(module_id, dep_id)
+    
+    def _add_dependency(self, module_id: str, dep_id: str):
+        """Ajoute une arête au graphe; un cycle est signalé, pas enregistré."""
+        if not self.dependency_graph.add_edge(module_id, dep_id):
+            cycle = self.dependency_graph.cycle_through(module_id, dep_id)
+            logger.warning(f"Circular dependency rejected: {cycle}")
+            self._cycles.append(cycle)
     
     # ═══════════════════════════════════════════════════════════════════════
     # CRUD OPERATIONS
@@ -391,8 +392,7 @@ class CatalogEngine:
             raise ValueError(f"Module {module.id} already exists")
         
         # Vérifier nom unique
-        existing_names = {m.name for m in self.modules.values()}
-        if module.name in existing_names:
+        if module.name in self._names:
             raise ValueError(f"Module name '{module.name}' already exists")
         
         # Vérifier dépendances existent
@@ -404,14 +404,12 @@ class CatalogEngine:
         module.created_by = registered_by
         module.created_at = datetime.utcnow()
         self.modules[module.id] = module
+        self._names[module.name] = module.id
         
-        # Mettre à jour graphe
-        self.dependency_graph.nodes.add(module.id)
-        self.dependency_graph.edges[module.id] = set(module.dependencies)
-        self.dependency_graph.reverse_edges[module.id] = set()
-        
+        # Mettre à jour graphe (incrémental)
+        self.dependency_graph.add_node(module.id)
         for dep_id in module.dependencies:
-            self.dependency_graph.reverse_edges[dep_id].add(module.id)
+            self._add_dependency(module.id, dep_id)
         
         logger.info(f"Module {module.id} registered by {registered_by}")
         
@@ -545,26 +543,24 @@ class CatalogEngine:
             dep_ids = self.dependency_graph.edges.get(module_id, set())
             return [self.modules[d] for d in dep_ids if d in self.modules]
         
-        # Récursif - BFS
-        all_deps = set()
-        to_visit = list(self.dependency_graph.edges.get(module_id, set()))
-        
-        while to_visit:
-            dep_id = to_visit.pop(0)
-            if dep_id not in all_deps and dep_id in self.modules:
-                all_deps.add(dep_id)
-                to_visit.extend(
-                    self.dependency_graph.edges.get(dep_id, set())
-                )
-        
-        return [self.modules[d] for d in all_deps]
+        # Récursif - fermeture transitive en cache
+        all_deps = self.dependency_graph.transitive_dependencies(module_id)
+        return [self.modules[d] for d in all_deps if d in self.modules]
     
     async def get_dependents(
         self,
-        module_id: str
+        module_id: str,
+        recursive: bool = False
     ) -> List[ModuleEntry]:
-        """Récupère les modules qui dépendent de celui-ci."""
-        dep_ids = self.dependency_graph.reverse_edges.get(module_id, set())
+        """
+        Récupère les modules qui dépendent de celui-ci.
+        
+        Si recursive=True, inclut tous les dépendants transitifs.
+        """
+        if recursive:
+            dep_ids = self.dependency_graph.transitive_dependents(module_id)
+        else:
+            dep_ids = self.dependency_graph.reverse_edges.get(module_id, set())
         return [self.modules[d] for d in dep_ids if d in self.modules]
     
     # ═══════════════════════════════════════════════════════════════════════
@@ -659,34 +655,8 @@ class CatalogEngine:
         }
     
     async def _detect_cycles(self) -> List[str]:
-        """Détecte les dépendances circulaires."""
-        cycles = []
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(module_id: str, path: List[str]) -> bool:
-            visited.add(module_id)
-            rec_stack.add(module_id)
-            path.append(module_id)
-            
-            for dep_id in self.dependency_graph.edges.get(module_id, set()):
-                if dep_id not in visited:
-                    if dfs(dep_id, path):
-                        return True
-                elif dep_id in rec_stack:
-                    cycle_start = path.index(dep_id)
-                    cycles.append(" -> ".join(path[cycle_start:] + [dep_id]))
-                    return True
-            
-            path.pop()
-            rec_stack.remove(module_id)
-            return False
-        
-        for module_id in self.modules:
-            if module_id not in visited:
-                dfs(module_id, [])
-        
-        return cycles
+        """Dépendances circulaires refusées à l'insertion dans le graphe."""
+        return list(self._cycles)
     
     def _calculate_health_score(
         self,
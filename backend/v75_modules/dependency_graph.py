@@ -0,0 +1,257 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════════════╗
+║                       CHE·NU™ V75 - INCREMENTAL DEPENDENCY GRAPH                     ║
+║                                                                                      ║
+║  Graphe de dépendances partagé par le Catalog Engine et le Canon Engine             ║
+║  Maintenu à chaque enregistrement: aucun recalcul global par requête                ║
+║                                                                                      ║
+║  Version: 75.0 | Status: CANON | License: Proprietary                               ║
+╚══════════════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DEPENDENCY GRAPH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class DependencyGraph:
+    """
+    Graphe orienté incrémental: une arête `a -> b` signifie "a dépend de b".
+
+    - `edges` / `reverse_edges`: adjacences avant et arrière, tenues à jour
+      par add_node / add_edge / remove_edge / remove_node (lecture seule
+      pour les appelants).
+    - Le graphe reste acyclique: un ordre topologique (dépendances
+      d'abord) est maintenu et réparé localement à chaque insertion
+      (Pearce-Kelly); seul le segment d'ordre entre les deux extrémités
+      est exploré. Une arête qui fermerait un cycle est refusée et le
+      graphe reste inchangé.
+    - Dépendants / dépendances transitifs mis en cache, invalidés
+      uniquement le long du sous-graphe touché par une modification.
+    """
+
+    def __init__(self):
+        self.edges: Dict[str, Set[str]] = {}          # node -> set of dependencies
+        self.reverse_edges: Dict[str, Set[str]] = {}  # node -> set of dependents
+
+        self._seq: Dict[str, int] = {}   # insertion order
+        self._pos: Dict[str, int] = {}   # topological position (dependencies first)
+        self._next = 0
+
+        self._order: Optional[List[str]] = None
+        self._dependents: Dict[str, FrozenSet[str]] = {}
+        self._dependencies: Dict[str, FrozenSet[str]] = {}
+
+    @property
+    def nodes(self):
+        return self._seq.keys()
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._seq
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # MUTATIONS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def add_node(self, node: str) -> None:
+        """Ajoute un nœud isolé (placé en fin d'ordre topologique)."""
+        if node in self._seq:
+            return
+        self._seq[node] = self._next
+        self._pos[node] = self._next
+        self._next += 1
+        self.edges[node] = set()
+        self.reverse_edges[node] = set()
+        self._order = None
+
+    def add_edge(self, node: str, dependency: str) -> bool:
+        """
+        Ajoute `node -> dependency`.
+
+        Retourne False, sans rien modifier, si l'arête fermerait un cycle
+        (voir cycle_through() pour le décrire).
+        """
+        if node == dependency:
+            return False
+        # Un nœud nouveau n'a pas d'arêtes: seul un couple existant peut
+        # être refusé, les add_node ci-dessous ne changent alors rien
+        self.add_node(node)
+        self.add_node(dependency)
+        if dependency in self.edges[node]:
+            return True
+        if not self._reorder(node, dependency):
+            return False
+
+        self._invalidate(node, dependency)
+        self.edges[node].add(dependency)
+        self.reverse_edges[dependency].add(node)
+        return True
+
+    def remove_edge(self, node: str, dependency: str) -> None:
+        """Retire `node -> dependency` (retirer une arête ne casse pas l'ordre)."""
+        if dependency not in self.edges.get(node, ()):
+            return
+        self._invalidate(node, dependency)
+        self.edges[node].discard(dependency)
+        self.reverse_edges[dependency].discard(node)
+
+    def set_dependencies(self, node: str, dependencies: Iterable[str]) -> List[str]:
+        """
+        Remplace les dépendances de `node` en ne touchant que le diff.
+
+        Retourne les dépendances refusées parce qu'elles fermeraient un
+        cycle.
+        """
+        self.add_node(node)
+        wanted = dict.fromkeys(dependencies)
+        for dep in self.edges[node] - wanted.keys():
+            self.remove_edge(node, dep)
+        return [
+            dep for dep in wanted
+            if dep not in self.edges[node] and not self.add_edge(node, dep)
+        ]
+
+    def remove_node(self, node: str) -> None:
+        """Retire un nœud et toutes ses arêtes."""
+        if node not in self._seq:
+            return
+        for dep in list(self.edges[node]):
+            self.remove_edge(node, dep)
+        for dependent in list(self.reverse_edges[node]):
+            self.remove_edge(dependent, node)
+        del self.edges[node]
+        del self.reverse_edges[node]
+        del self._seq[node]
+        del self._pos[node]
+        self._dependents.pop(node, None)
+        self._dependencies.pop(node, None)
+        self._order = None
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def ordered(self, nodes: Iterable[str]) -> List[str]:
+        """Trie des nœuds par ordre d'insertion."""
+        return sorted((n for n in nodes if n in self._seq), key=self._seq.__getitem__)
+
+    def topological_order(self) -> List[str]:
+        """Nœuds triés dépendances d'abord."""
+        if self._order is None:
+            self._order = sorted(self._pos, key=self._pos.__getitem__)
+        return list(self._order)
+
+    def transitive_dependents(self, node: str) -> FrozenSet[str]:
+        """Tous les nœuds qui dépendent (directement ou non) de `node`."""
+        if node not in self._seq:
+            return frozenset()
+        cached = self._dependents.get(node)
+        if cached is None:
+            cached = self._dependents[node] = self._reach(node, self.reverse_edges)
+        return cached
+
+    def transitive_dependencies(self, node: str) -> FrozenSet[str]:
+        """Toutes les dépendances (directes ou non) de `node`."""
+        if node not in self._seq:
+            return frozenset()
+        cached = self._dependencies.get(node)
+        if cached is None:
+            cached = self._dependencies[node] = self._reach(node, self.edges)
+        return cached
+
+    def cycle_through(self, node: str, dependency: str) -> Optional[str]:
+        """
+        Cycle que fermerait l'arête `node -> dependency`, sous la forme
+        "a -> b -> a", ou None si l'arête peut être ajoutée.
+        """
+        if node == dependency:
+            return f"{node} -> {node}"
+        if node not in self._seq or dependency not in self._seq:
+            return None
+
+        # Chemin dependency -> ... -> node en suivant les dépendances
+        parents: Dict[str, str] = {dependency: dependency}
+        stack = [dependency]
+        while stack:
+            current = stack.pop()
+            if current == node:
+                path = [node]
+                while path[-1] != dependency:
+                    path.append(parents[path[-1]])
+                return " -> ".join([node] + path[::-1])
+            for dep in self.ordered(self.edges[current]):
+                if dep not in parents:
+                    parents[dep] = current
+                    stack.append(dep)
+        return None
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # INTERNALS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _reach(self, start: str, adjacency: Dict[str, Set[str]]) -> FrozenSet[str]:
+        seen: Set[str] = set()
+        stack = list(adjacency.get(start, ()))
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(adjacency[current])
+        return frozenset(seen)
+
+    def _invalidate(self, node: str, dependency: str) -> None:
+        """Purge les fermetures transitives touchées par l'arête node -> dependency."""
+        if self._dependents:
+            # dependency et ses dépendances voient leurs dépendants changer
+            for affected in self._reach(dependency, self.edges) | {dependency}:
+                self._dependents.pop(affected, None)
+        if self._dependencies:
+            # node et ses dépendants voient leurs dépendances changer
+            for affected in self._reach(node, self.reverse_edges) | {node}:
+                self._dependencies.pop(affected, None)
+
+    def _reorder(self, node: str, dependency: str) -> bool:
+        """
+        Répare l'ordre pour l'arête node -> dependency (Pearce-Kelly).
+
+        Retourne False si l'arête ferme un cycle.
+        """
+        lower, upper = self._pos[node], self._pos[dependency]
+        if upper < lower:
+            return True
+
+        # node et ses dépendants placés avant `dependency`
+        forward: Set[str] = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current == dependency:
+                return False
+            if current in forward:
+                continue
+            forward.add(current)
+            stack.extend(d for d in self.reverse_edges[current] if self._pos[d] <= upper)
+
+        # dependency et ses dépendances placées après `node`
+        backward: Set[str] = set()
+        stack = [dependency]
+        while stack:
+            current = stack.pop()
+            if current in backward:
+                continue
+            backward.add(current)
+            stack.extend(d for d in self.edges[current] if self._pos[d] > lower)
+
+        moved = sorted(backward, key=self._pos.__getitem__) + sorted(forward, key=self._pos.__getitem__)
+        slots = sorted(self._pos[n] for n in moved)
+        for n, slot in zip(moved, slots):
+            self._pos[n] = slot
+        self._order = None
+        return True
+
+
+__all__ = ['DependencyGraph']
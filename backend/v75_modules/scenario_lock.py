@@ -17,8 +17,11 @@ from uuid import UUID, uuid4
 from enum import Enum
 from dataclasses import dataclass, field
 from pydantic import BaseModel
-import hashlib
-import json
+
+try:
+    from ..canonical import canonical_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_hash
 
 # ============================================================================
 # ENUMS
@@ -164,8 +167,7 @@ class ScenarioLockService:
         # Calculer hash du contenu
         content_hash = ""
         if content:
-            content_str = json.dumps(content, sort_keys=True, default=str)
-            content_hash = hashlib.sha256(content_str.encode()).hexdigest()
+            content_hash = canonical_hash(content, default=str)
         
         # Créer expiration si spécifiée
         expiration = None
@@ -272,8 +274,7 @@ class ScenarioLockService:
         if not lock:
             return False
         
-        content_str = json.dumps(content, sort_keys=True, default=str)
-        current_hash = hashlib.sha256(content_str.encode()).hexdigest()
+        current_hash = canonical_hash(content, default=str)
         
         return current_hash == lock.content_hash
     
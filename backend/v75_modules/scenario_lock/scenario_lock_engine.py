@@ -9,15 +9,20 @@
 ╚══════════════════════════════════════════════════════════════════════════════════════╝
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
-import hashlib
-import json
+import asyncio
 import logging
 import copy
+import time
+
+try:
+    from ...canonical import canonical_hash
+except ImportError:  # imported as a top-level package
+    from canonical import canonical_hash
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +114,36 @@ class StepResult:
     duration_ms: int
     error: Optional[str] = None
 
+# Assertion précompilée: (nom, prédicat sur les outputs réels)
+Check = Tuple[str, Callable[[Dict[str, Any]], bool]]
+
+@dataclass
+class CompiledStep:
+    """Étape prête pour le replay: dépendances résolues en index"""
+    index: int
+    step: ScenarioStep
+    # depends_on -> index de la première étape antérieure portant cet id
+    depends_on: List[Tuple[str, Optional[int]]]
+    # Étapes à attendre avant de lancer celle-ci
+    waits_for: List[int]
+    has_references: bool
+    checks: List[Check]
+
+@dataclass
+class ReplayPlan:
+    """DAG d'étapes compilé depuis un scénario verrouillé"""
+    scenario_id: UUID
+    scenario_hash: str
+    steps: List[CompiledStep]
+
+    @property
+    def depth(self) -> int:
+        """Longueur du plus long chemin de dépendances"""
+        levels: List[int] = []
+        for compiled in self.steps:
+            levels.append(1 + max((levels[i] for i in compiled.waits_for), default=0))
+        return max(levels, default=0)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # GOLDEN FLOWS DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -216,6 +251,66 @@ GOLDEN_FLOWS = {
     },
 }
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ASSERTION COMPILER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _compile_assertion(assertion: str) -> Callable[[Dict[str, Any]], bool]:
+    """Parse une assertion une seule fois (validation simplifiée)."""
+    try:
+        if "exists" in assertion:
+            field_name = assertion.split(" ")[0].replace("response.", "")
+            return lambda actual: field_name in actual
+        if "==" in assertion:
+            parts = assertion.split("==")
+            left = parts[0].strip().replace("response.", "")
+            right = parts[1].strip()
+            return lambda actual: str(actual.get(left)) == right
+        if ">=" in assertion:
+            parts = assertion.split(">=")
+            left = parts[0].strip().replace("response.", "")
+            right = int(parts[1].strip())
+            return lambda actual: actual.get(left, 0) >= right
+    except ValueError as e:
+        # Assertion invalide: l'erreur est levée à l'évaluation, comme avant
+        error = e
+
+        def invalid(actual: Dict[str, Any]) -> bool:
+            raise error
+        return invalid
+    return lambda actual: True  # Par défaut
+
+def _compile_expectation(key: str, value: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Prédicat pour une entrée de expected_outputs."""
+    if key == "status":
+        return lambda actual: actual.get("status") == value
+    if key == "has_token":
+        return lambda actual: "token" in actual
+    if key == "has_spheres":
+        return lambda actual: "spheres" in actual
+    if key == "has_events":
+        return lambda actual: "events" in actual and len(actual["events"]) > 0
+    return lambda actual: actual.get(key) == value
+
+def _compile_checks(
+    assertions: List[str],
+    expected: Dict[str, Any]
+) -> List[Check]:
+    """Précompile les assertions et expected outputs d'une étape."""
+    checks = [(assertion, _compile_assertion(assertion)) for assertion in assertions]
+    checks.extend(
+        (f"expected.{key}", _compile_expectation(key, value))
+        for key, value in expected.items()
+    )
+    return checks
+
+def _run_checks(checks: List[Check], actual: Dict[str, Any]) -> Dict[str, bool]:
+    """Évalue des assertions précompilées."""
+    return {name: predicate(actual) for name, predicate in checks}
+
+def _is_reference(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("{") and value.endswith("}")
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SCENARIO LOCK ENGINE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -234,6 +329,8 @@ class ScenarioLockEngine:
         self.locked_scenarios: Dict[UUID, LockedScenario] = {}
         self.executions: Dict[UUID, ScenarioExecution] = {}
         self.golden_flows = GOLDEN_FLOWS
+        # Plans de replay compilés (un scénario verrouillé est immuable)
+        self._plans: Dict[UUID, ReplayPlan] = {}
         
         logger.info(
             f"ScenarioLockEngine V{MODULE_VERSION} initialized with "
@@ -276,9 +373,7 @@ class ScenarioLockEngine:
             "expected_final_state": expected_final_state
         }
         
-        hash_value = hashlib.sha256(
-            json.dumps(scenario_data, sort_keys=True).encode()
-        ).hexdigest()[:16]
+        hash_value = canonical_hash(scenario_data)[:16]
         
         scenario = LockedScenario(
             id=uuid4(),
@@ -344,6 +439,7 @@ class ScenarioLockEngine:
         
         scenario.status = LockStatus.RELEASED
         scenario.release_reason = reason
+        self._plans.pop(scenario_id, None)
         
         logger.info(
             f"Scenario {scenario_id} released by {released_by}. Reason: {reason}"
@@ -421,6 +517,7 @@ class ScenarioLockEngine:
             raise ValueError("No more steps to execute")
         
         step = scenario.steps[execution.current_step]
+        compiled = self.compile_scenario(scenario).steps[execution.current_step]
         
         # Vérifier dépendances
         for dep_id in step.depends_on:
@@ -455,12 +552,8 @@ class ScenarioLockEngine:
                 (datetime.utcnow() - start_time).total_seconds() * 1000
             )
             
-            # Valider assertions
-            assertion_results = self._validate_assertions(
-                step.assertions,
-                step.expected_outputs,
-                actual_outputs
-            )
+            # Valider assertions (précompilées)
+            assertion_results = _run_checks(compiled.checks, actual_outputs)
             
             passed = all(assertion_results.values())
             
@@ -542,41 +635,201 @@ class ScenarioLockEngine:
         actual: Dict[str, Any]
     ) -> Dict[str, bool]:
         """Valide les assertions d'une étape."""
-        results = {}
-        
-        for assertion in assertions:
-            # Validation simplifiée - en production utiliserait un parser
-            if "exists" in assertion:
-                field = assertion.split(" ")[0].replace("response.", "")
-                results[assertion] = field in actual
-            elif "==" in assertion:
-                parts = assertion.split("==")
-                left = parts[0].strip().replace("response.", "")
-                right = parts[1].strip()
-                results[assertion] = str(actual.get(left)) == right
-            elif ">=" in assertion:
-                parts = assertion.split(">=")
-                left = parts[0].strip().replace("response.", "")
-                right = int(parts[1].strip())
-                results[assertion] = actual.get(left, 0) >= right
-            else:
-                results[assertion] = True  # Par défaut
-        
-        # Vérifier expected outputs
-        for key, value in expected.items():
-            assertion = f"expected.{key}"
-            if key == "status":
-                results[assertion] = actual.get("status") == value
-            elif key == "has_token":
-                results[assertion] = "token" in actual
-            elif key == "has_spheres":
-                results[assertion] = "spheres" in actual
-            elif key == "has_events":
-                results[assertion] = "events" in actual and len(actual["events"]) > 0
+        return _run_checks(_compile_checks(assertions, expected), actual)
+    
+    # ═══════════════════════════════════════════════════════════════════════
+    # PIPELINED REPLAY
+    # ═══════════════════════════════════════════════════════════════════════
+    
+    def compile_scenario(self, scenario: LockedScenario) -> ReplayPlan:
+        """
+        Compile un scénario verrouillé en DAG d'étapes (mis en cache).
+        
+        Une étape attend ses depends_on antérieurs. Une étape dont les
+        inputs contiennent une référence ({ref}) attend toutes les étapes
+        précédentes, car la résolution parcourt leurs résultats dans l'ordre.
+        """
+        plan = self._plans.get(scenario.id)
+        if plan is not None:
+            return plan
+        
+        first_index: Dict[str, int] = {}
+        steps: List[CompiledStep] = []
+        
+        for index, step in enumerate(scenario.steps):
+            # Seules les étapes antérieures peuvent satisfaire une dépendance
+            depends_on = [(dep_id, first_index.get(dep_id)) for dep_id in step.depends_on]
+            has_references = any(_is_reference(v) for v in step.inputs.values())
+            
+            if has_references:
+                waits_for = list(range(index))
             else:
-                results[assertion] = actual.get(key) == value
+                waits_for = sorted({i for _, i in depends_on if i is not None})
+            
+            steps.append(CompiledStep(
+                index=index,
+                step=step,
+                depends_on=depends_on,
+                waits_for=waits_for,
+                has_references=has_references,
+                checks=_compile_checks(step.assertions, step.expected_outputs)
+            ))
+            first_index.setdefault(step.id, index)
+        
+        plan = ReplayPlan(scenario_id=scenario.id, scenario_hash=scenario.hash, steps=steps)
+        self._plans[scenario.id] = plan
+        return plan
+    
+    async def replay(
+        self,
+        scenario_id: UUID,
+        step_executor: Callable[[ScenarioStep, Dict[str, Any]], Dict[str, Any]],
+        executor_id: UUID,
+        mode: ReplayMode = ReplayMode.ACCELERATED,
+        max_concurrency: int = 8
+    ) -> ScenarioExecution:
+        """
+        Rejoue un scénario verrouillé complet.
+        
+        Les étapes indépendantes s'exécutent en parallèle (au plus
+        `max_concurrency` à la fois). Les résultats sont enregistrés dans
+        l'ordre du scénario, par lots contigus, et sont identiques à ceux
+        d'une boucle sur execute_step. STEP_BY_STEP reste séquentiel.
+        """
+        execution = await self.start_execution(scenario_id, executor_id, mode)
+        plan = self.compile_scenario(self.locked_scenarios[scenario_id])
+        
+        records: List[Optional[Tuple[Dict[str, Any], Optional[str]]]] = [None] * len(plan.steps)
+        flushed = 0
+        
+        def flush():
+            # Enregistre le plus long préfixe terminé
+            nonlocal flushed
+            batch = []
+            while flushed < len(records) and records[flushed] is not None:
+                batch.append(records[flushed])
+                flushed += 1
+            if batch:
+                execution.step_results.extend(record for record, _ in batch)
+                execution.errors.extend(error for _, error in batch if error is not None)
+                execution.current_step = flushed
+        
+        if mode == ReplayMode.STEP_BY_STEP:
+            for compiled in plan.steps:
+                records[compiled.index] = await self._replay_step(compiled, step_executor, records)
+                flush()
+        else:
+            slots = asyncio.Semaphore(max(1, max_concurrency))
+            tasks: List[asyncio.Task] = []
+            
+            async def run(compiled: CompiledStep):
+                if compiled.waits_for:
+                    await asyncio.gather(*(tasks[i] for i in compiled.waits_for))
+                async with slots:
+                    records[compiled.index] = await self._replay_step(
+                        compiled, step_executor, records
+                    )
+                flush()
+            
+            for compiled in plan.steps:
+                tasks.append(asyncio.create_task(run(compiled)))
+            await asyncio.gather(*tasks)
+        
+        execution.status = "passed" if all(
+            r.get("passed") for r in execution.step_results
+        ) else "failed"
+        execution.completed_at = datetime.utcnow()
+        
+        logger.info(
+            f"Execution {execution.id} replayed {len(plan.steps)} steps "
+            f"(depth {plan.depth}): {execution.status}"
+        )
+        
+        return execution
+    
+    async def _replay_step(
+        self,
+        compiled: CompiledStep,
+        step_executor: Callable[[ScenarioStep, Dict[str, Any]], Dict[str, Any]],
+        records: List[Optional[Tuple[Dict[str, Any], Optional[str]]]]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Exécute une étape compilée: (résultat enregistré, erreur d'exécution)."""
+        step = compiled.step
+        
+        # Vérifier dépendances (déjà terminées)
+        for dep_id, index in compiled.depends_on:
+            if index is None or not records[index][0]["passed"]:
+                record = {
+                    "step_id": step.id,
+                    "passed": False,
+                    "duration_ms": 0,
+                    "error": f"Dependency {dep_id} not satisfied"
+                }
+                return record, None
+        
+        start_time = time.perf_counter()
+        error = None
+        
+        try:
+            previous = (
+                [records[i][0] for i in range(compiled.index)]
+                if compiled.has_references else []
+            )
+            resolved_inputs = self._resolve_inputs(step.inputs, previous)
+            actual_outputs = await step_executor(step, resolved_inputs)
+            passed = all(_run_checks(compiled.checks, actual_outputs).values())
+        except Exception as e:
+            passed = False
+            error = str(e)
+        
+        record = {
+            "step_id": step.id,
+            "passed": passed,
+            "duration_ms": int((time.perf_counter() - start_time) * 1000),
+            "error": error
+        }
+        
+        logger.debug(f"Step {step.id} replayed: passed={passed}")
+        
+        return record, error
+    
+    async def replay_many(
+        self,
+        scenario_ids: List[UUID],
+        step_executor: Callable[[ScenarioStep, Dict[str, Any]], Dict[str, Any]],
+        executor_id: UUID,
+        mode: ReplayMode = ReplayMode.ACCELERATED,
+        max_workers: int = 4,
+        max_concurrency: int = 8
+    ) -> List[ScenarioExecution]:
+        """
+        Rejoue une suite de scénarios verrouillés (ex: tous les Golden Flows).
+        
+        Au plus `max_workers` scénarios sont rejoués simultanément; les
+        exécutions sont retournées dans l'ordre de `scenario_ids`.
+        """
+        # Tout valider avant de lancer quoi que ce soit
+        for scenario_id in scenario_ids:
+            scenario = self.locked_scenarios.get(scenario_id)
+            if scenario is None:
+                raise ValueError(f"Scenario {scenario_id} not found")
+            if scenario.status != LockStatus.ACTIVE:
+                raise ValueError(f"Scenario {scenario_id} is not active")
+        
+        workers = asyncio.Semaphore(max(1, max_workers))
+        
+        async def worker(scenario_id: UUID) -> ScenarioExecution:
+            async with workers:
+                return await self.replay(
+                    scenario_id, step_executor, executor_id, mode, max_concurrency
+                )
+        
+        executions = await asyncio.gather(*(worker(sid) for sid in scenario_ids))
+        
+        passed = sum(1 for e in executions if e.status == "passed")
+        logger.info(f"Replayed {len(executions)} scenarios: {passed} passed")
         
-        return results
+        return list(executions)
     
     # ═══════════════════════════════════════════════════════════════════════
     # QUERIES
@@ -666,6 +919,8 @@ __all__ = [
     'LockedScenario',
     'ScenarioExecution',
     'StepResult',
+    'CompiledStep',
+    'ReplayPlan',
     'GOLDEN_FLOWS',
     'MODULE_VERSION',
 ]
@@ -0,0 +1 @@
+"""CHE·NU™ V75 — Modules Tests"""
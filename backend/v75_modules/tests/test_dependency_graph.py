@@ -0,0 +1,226 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════════════╗
+║                    CHE·NU™ V75 - DEPENDENCY GRAPH TESTS                              ║
+╚══════════════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import random
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+
+from ..dependency_graph import DependencyGraph
+from ..canon import canon_engine
+from ..canon.canon_engine import CanonEngine
+from ..catalog.catalog_engine import CatalogEngine, ModuleCategory, ModuleEntry, ModuleStatus
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HELPERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def snapshot(graph: DependencyGraph):
+    return (
+        {n: set(deps) for n, deps in graph.edges.items()},
+        {n: set(deps) for n, deps in graph.reverse_edges.items()},
+        graph.topological_order(),
+        len(graph),
+    )
+
+
+def reach(edges, start):
+    """Parcours naïf de référence (BFS, comme avant le graphe incrémental)."""
+    seen, to_visit = set(), list(edges.get(start, ()))
+    while to_visit:
+        current = to_visit.pop(0)
+        if current not in seen:
+            seen.add(current)
+            to_visit.extend(edges.get(current, ()))
+    return seen
+
+
+def random_dag(rng: random.Random, size: int, density: float):
+    """Arêtes node -> dependency d'un DAG aléatoire, dans un ordre mélangé."""
+    nodes = [f"n{i}" for i in range(size)]
+    rank = nodes[:]
+    rng.shuffle(rank)
+    edges = [
+        (rank[i], rank[j])
+        for i in range(size) for j in range(i)
+        if rng.random() < density
+    ]
+    rng.shuffle(edges)
+    return nodes, edges
+
+
+def assert_topological(graph: DependencyGraph):
+    position = {n: i for i, n in enumerate(graph.topological_order())}
+    assert set(position) == set(graph.nodes)
+    for node, deps in graph.edges.items():
+        for dep in deps:
+            assert position[dep] < position[node]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GRAPH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestDependencyGraph:
+    """Incremental order, cycle rejection and cached closures"""
+
+    def test_cycle_rejection_leaves_graph_unchanged(self):
+        graph = DependencyGraph()
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "c")
+        graph.add_edge("d", "c")
+        assert graph.transitive_dependents("c") == {"a", "b", "d"}
+        assert graph.transitive_dependencies("a") == {"b", "c"}
+        before = snapshot(graph)
+
+        assert graph.add_edge("c", "a") is False
+        assert graph.add_edge("b", "b") is False
+        assert graph.add_edge("z", "z") is False
+
+        assert snapshot(graph) == before
+        assert "z" not in graph
+        assert graph.transitive_dependents("c") == {"a", "b", "d"}
+        assert graph.transitive_dependencies("c") == frozenset()
+        assert graph.cycle_through("c", "a") == "c -> a -> b -> c"
+        assert graph.cycle_through("b", "b") == "b -> b"
+        assert graph.cycle_through("a", "d") is None
+
+    def test_set_dependencies_reports_rejected(self):
+        graph = DependencyGraph()
+        graph.set_dependencies("a", ["b"])
+        graph.set_dependencies("b", ["c"])
+
+        assert graph.set_dependencies("c", ["a", "d"]) == ["a"]
+        assert graph.edges["c"] == {"d"}
+        assert_topological(graph)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_order_holds_for_any_insertion_order(self, seed):
+        rng = random.Random(seed)
+        nodes, edges = random_dag(rng, size=40, density=0.15)
+        graph = DependencyGraph()
+        for node in nodes:
+            graph.add_node(node)
+
+        for node, dep in edges:
+            assert graph.add_edge(node, dep)
+            assert_topological(graph)
+
+        # Toute arête inverse ferme un cycle et est refusée
+        for node, dep in rng.sample(edges, min(10, len(edges))):
+            assert graph.add_edge(dep, node) is False
+        assert_topological(graph)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_transitive_sets_match_naive_traversal(self, seed):
+        rng = random.Random(seed)
+        nodes, edges = random_dag(rng, size=30, density=0.2)
+        graph = DependencyGraph()
+        forward = {n: set() for n in nodes}
+
+        def check():
+            backward = {n: set() for n in forward}
+            for node, deps in forward.items():
+                for dep in deps:
+                    backward[dep].add(node)
+            for node in forward:
+                assert graph.transitive_dependencies(node) == reach(forward, node)
+                assert graph.transitive_dependents(node) == reach(backward, node)
+
+        for step, (node, dep) in enumerate(edges):
+            graph.add_edge(node, dep)
+            forward[node].add(dep)
+            if step % 7 == 0:
+                check()
+
+        for node, dep in rng.sample(edges, len(edges) // 3):
+            graph.remove_edge(node, dep)
+            forward[node].discard(dep)
+        check()
+
+        removed = rng.choice(nodes)
+        graph.remove_node(removed)
+        del forward[removed]
+        for deps in forward.values():
+            deps.discard(removed)
+        check()
+        assert_topological(graph)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ENGINES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestEngines:
+    """Engine outputs match the pre-graph traversals"""
+
+    async def test_catalog_dependencies(self):
+        catalog = CatalogEngine()
+        edges = {
+            m.id: {d for d in m.dependencies if d in catalog.modules}
+            for m in catalog.modules.values()
+        }
+        dependents = {m: {n for n, deps in edges.items() if m in deps} for m in edges}
+
+        for module_id in catalog.modules:
+            direct = await catalog.get_dependencies(module_id)
+            recursive = await catalog.get_dependencies(module_id, recursive=True)
+            users = await catalog.get_dependents(module_id)
+            assert {m.id for m in direct} == edges[module_id]
+            assert {m.id for m in recursive} == reach(edges, module_id)
+            assert {m.id for m in users} == dependents[module_id]
+
+        assert await catalog._detect_cycles() == []
+
+    async def test_catalog_names_are_unique(self):
+        catalog = CatalogEngine()
+        existing = next(iter(catalog.modules.values()))
+        module = ModuleEntry(
+            id="TEST_001",
+            name="TestEngine",
+            path="backend/v75_modules/test_engine.py",
+            category=ModuleCategory.V75,
+            status=ModuleStatus.PLANNED,
+            sphere=None,
+            version="75.0",
+            description="Test module",
+            dependencies=[existing.id],
+        )
+
+        with pytest.raises(ValueError):
+            await catalog.register_module(replace(module, name=existing.name), uuid4())
+
+        await catalog.register_module(module, uuid4())
+        with pytest.raises(ValueError):
+            await catalog.register_module(replace(module, id="TEST_002"), uuid4())
+        assert "TEST_001" in {m.id for m in await catalog.get_dependents(existing.id)}
+
+    async def test_canon_dependents_keep_element_order(self):
+        canon = CanonEngine()
+
+        for element_id in canon.elements:
+            expected = [e for e in canon.elements.values() if element_id in e.dependencies]
+            assert await canon.get_dependents(element_id) == expected
+
+        integrity = await canon.verify_integrity()
+        assert integrity["circular_dependencies"] == []
+
+    async def test_canon_reports_rejected_cycles(self, monkeypatch):
+        base = canon_engine.CORE_CANONICAL_ELEMENTS["RD_RULE_1"]
+        elements = {
+            "A": replace(base, id="A", dependencies=["B"]),
+            "B": replace(base, id="B", dependencies=["A"]),
+        }
+        monkeypatch.setattr(canon_engine, "CORE_CANONICAL_ELEMENTS", elements)
+
+        canon = CanonEngine()
+        integrity = await canon.verify_integrity()
+
+        assert integrity["circular_dependencies"] == ["B -> A -> B"]
+        assert integrity["integrity_ok"] is False
+        assert canon.dependency_graph.topological_order() == ["B", "A"]
@@ -0,0 +1,132 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════════════╗
+║                    CHE·NU™ V75 - SCENARIO LOCK REPLAY TESTS                          ║
+╚══════════════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import asyncio
+import random
+import zlib
+from uuid import uuid4
+
+import pytest
+
+from ..scenario_lock.scenario_lock_engine import (
+    ReplayMode,
+    ScenarioLockEngine,
+    ScenarioStep,
+    ScenarioType,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HELPERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def random_steps(rng: random.Random):
+    """Étapes aléatoires: dépendances avant/après/absentes, ids répétés, références."""
+    count = rng.randint(0, 9)
+    return [
+        ScenarioStep(
+            id=f"s{rng.randrange(count + 1)}",
+            name=f"step {i}",
+            action="act",
+            inputs={"a": rng.choice([1, "{x}", "{token}", "plain", "{y"])},
+            expected_outputs=rng.choice([{}, {"status": 200}, {"has_token": True}, {"y": 3}]),
+            assertions=rng.sample(
+                ["response.x exists", "response.y == 3", "response.z >= 2", "response.y == None"],
+                rng.randint(0, 2),
+            ),
+            depends_on=[f"s{rng.randrange(count + 1)}" for _ in range(rng.choice([0, 0, 0, 0, 1, 2]))],
+        )
+        for i in range(count)
+    ]
+
+
+def make_executor(seed: int):
+    """Exécuteur déterministe par (étape, inputs), qui termine dans le désordre."""
+    async def execute(step, inputs):
+        rng = random.Random(zlib.crc32(f"{seed}:{step.id}:{sorted(inputs.items())}".encode()))
+        for _ in range(rng.randrange(4)):
+            await asyncio.sleep(0)
+        roll = rng.random()
+        if roll < 0.05:
+            raise RuntimeError(f"boom {step.id}")
+        if roll < 0.07:
+            return None
+        return {
+            key: rng.choice([3, 200, [], [1], 2, "v"])
+            for key in ("x", "y", "z", "status", "token", "events")
+            if rng.random() < 0.5
+        }
+    return execute
+
+
+def strip(results):
+    return [{k: v for k, v in r.items() if k != "duration_ms"} for r in results]
+
+
+async def run_serially(steps, executor):
+    engine = ScenarioLockEngine()
+    scenario = await engine.lock_scenario("s", ScenarioType.E2E_TEST, steps, {}, {}, uuid4())
+    execution = await engine.start_execution(scenario.id, uuid4())
+    for _ in steps:
+        await engine.execute_step(execution.id, executor)
+    return execution
+
+
+def assert_same_as_serial(serial, replayed, steps):
+    done = len(serial.step_results)
+    assert strip(replayed.step_results)[:done] == strip(serial.step_results)
+    if done == len(steps):
+        assert replayed.errors == serial.errors
+        assert replayed.current_step == len(steps)
+        if steps:
+            assert replayed.status == serial.status
+    else:
+        # execute_step n'avance pas après une dépendance en échec; replay
+        # enregistre l'échec et continue
+        assert "not satisfied" in replayed.step_results[done]["error"]
+        assert len(replayed.step_results) == len(steps)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# REPLAY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestReplay:
+    """replay / replay_many match a loop over execute_step"""
+
+    @pytest.mark.parametrize("mode", list(ReplayMode))
+    async def test_replay_matches_serial_execution(self, mode):
+        for seed in range(150):
+            rng = random.Random(seed)
+            steps = random_steps(rng)
+            executor = make_executor(seed)
+            serial = await run_serially(steps, executor)
+
+            engine = ScenarioLockEngine()
+            scenario = await engine.lock_scenario("s", ScenarioType.E2E_TEST, steps, {}, {}, uuid4())
+            replayed = await engine.replay(
+                scenario.id, executor, uuid4(), mode, max_concurrency=rng.randint(1, 4)
+            )
+
+            assert_same_as_serial(serial, replayed, steps)
+
+    async def test_replay_many_matches_serial_execution(self):
+        rng = random.Random(7)
+        engine = ScenarioLockEngine()
+        suites = [random_steps(rng) for _ in range(40)]
+        scenarios = [
+            await engine.lock_scenario(f"s{i}", ScenarioType.E2E_TEST, steps, {}, {}, uuid4())
+            for i, steps in enumerate(suites)
+        ]
+        executor = make_executor(7)
+
+        executions = await engine.replay_many(
+            [s.id for s in scenarios], executor, uuid4(), max_workers=4, max_concurrency=3
+        )
+
+        assert [e.scenario_id for e in executions] == [s.id for s in scenarios]
+        for steps, replayed in zip(suites, executions):
+            assert_same_as_serial(await run_serially(steps, executor), replayed, steps)
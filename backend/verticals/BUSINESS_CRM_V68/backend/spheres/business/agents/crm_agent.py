@@ -18,11 +18,14 @@
 import os
 import uuid
 import asyncio
+import hashlib
 import logging
 import httpx
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Dict, Any, Optional, List, Iterable, Tuple, AsyncIterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from decimal import Decimal
@@ -197,23 +200,179 @@ class EmailDraft:
 # AI ENGINE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def lead_fingerprint(contact: Contact, company: Optional[Company] = None) -> str:
+    """Hash of every contact/company field that lead scoring reads."""
+    fields = [
+        contact.first_name, contact.last_name, contact.email, contact.title,
+        contact.lead_source.value, contact.lead_status.value,
+    ]
+    if company:
+        fields += [company.name, company.industry, company.size, str(company.annual_revenue)]
+    return hashlib.sha256(json.dumps(fields).encode()).hexdigest()
+
+
 class CRMAIEngine:
-    """AI engine for CRM intelligence."""
+    """
+    AI engine for CRM intelligence.
+    
+    Claude requests share one pooled HTTP client and at most
+    `max_concurrency` are in flight at once. Lead scores are cached by
+    lead_fingerprint, so unchanged contacts are never rescored.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        cache_size: int = 100_000,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self.anthropic_key = os.environ.get("ANTHROPIC_API_KEY", "")
         self.openai_key = os.environ.get("OPENAI_API_KEY", "")
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+        
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._semaphore: Optional[asyncio.BoundedSemaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._score_cache: "OrderedDict[str, LeadScoreResult]" = OrderedDict()
+    
+    def _limiter(self) -> asyncio.BoundedSemaphore:
+        """In-flight request limit for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+            if self._loop is not None and self._owns_client:
+                # Pooled connections belong to the previous loop
+                self._client = None
+            self._loop = loop
+        return self._semaphore
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared client; connections are kept alive across requests."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def score_lead(self, contact: Contact, company: Optional[Company] = None) -> LeadScoreResult:
         """Score a lead using AI."""
+        fingerprint = lead_fingerprint(contact, company)
+        cached = self._cached_score(fingerprint)
+        if cached:
+            return cached
         
         if self.anthropic_key:
-            return await self._score_with_claude(contact, company)
+            result = await self._score_with_claude(contact, company)
+            if result is None:
+                return self._local_scoring(contact, company)
         else:
-            return self._local_scoring(contact, company)
+            result = self._local_scoring(contact, company)
+        
+        self._cache_score(fingerprint, result)
+        return result
+    
+    async def score_leads_bulk(
+        self,
+        leads: Iterable[Tuple[Contact, Optional[Company]]],
+        remote_budget: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[Contact, LeadScoreResult]]:
+        """
+        Score many leads, yielding (contact, result) as each one finishes.
+        
+        Cache hits are yielded immediately. At most `remote_budget` cache
+        misses go to Claude (None = no limit); the overflow is scored
+        locally. Only a bounded window of requests is pending at a time,
+        so arbitrarily large inputs run in constant memory.
+        """
+        window = self.max_concurrency * 2
+        pending = set()
+        remote_left = remote_budget
+        
+        # The caller may stop iterating (break, aclose, error) at any
+        # yield; in-flight requests are cancelled rather than orphaned.
+        try:
+            for contact, company in leads:
+                fingerprint = lead_fingerprint(contact, company)
+                cached = self._cached_score(fingerprint)
+                if cached:
+                    yield contact, cached
+                    continue
+                
+                if not self.anthropic_key or remote_left == 0:
+                    result = self._local_scoring(contact, company)
+                    if not self.anthropic_key:
+                        self._cache_score(fingerprint, result)
+                    yield contact, result
+                    continue
+                
+                if remote_left is not None:
+                    remote_left -= 1
+                pending.add(asyncio.ensure_future(self._score_bulk_item(contact, company, fingerprint)))
+                
+                if len(pending) >= window:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
     
-    async def _score_with_claude(self, contact: Contact, company: Optional[Company]) -> LeadScoreResult:
-        """Score with Claude."""
+    async def _score_bulk_item(
+        self,
+        contact: Contact,
+        company: Optional[Company],
+        fingerprint: str,
+    ) -> Tuple[Contact, LeadScoreResult]:
+        result = await self._score_with_claude(contact, company)
+        if result is None:
+            return contact, self._local_scoring(contact, company)
+        self._cache_score(fingerprint, result)
+        return contact, result
+    
+    def _cached_score(self, fingerprint: str) -> Optional[LeadScoreResult]:
+        result = self._score_cache.get(fingerprint)
+        if result is None:
+            return None
+        self._score_cache.move_to_end(fingerprint)
+        return self._copy_score(result)
+    
+    def _cache_score(self, fingerprint: str, result: LeadScoreResult) -> None:
+        # Callers keep (and may edit) the breakdown, so cache a private copy
+        self._score_cache[fingerprint] = self._copy_score(result)
+        self._score_cache.move_to_end(fingerprint)
+        while len(self._score_cache) > self.cache_size:
+            self._score_cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_score(result: LeadScoreResult) -> LeadScoreResult:
+        return replace(
+            result,
+            breakdown=dict(result.breakdown),
+            insights=list(result.insights),
+            next_actions=list(result.next_actions),
+        )
+    
+    async def _score_with_claude(self, contact: Contact, company: Optional[Company]) -> Optional[LeadScoreResult]:
+        """Score with Claude (None if the request or response failed)."""
         
         company_info = ""
         if company:
@@ -247,9 +406,9 @@ Respond ONLY with valid JSON:
     "probability_to_close": 0-100
 }}"""
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
+        try:
+            async with self._limiter():
+                response = await self._get_client().post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
                         "x-api-key": self.anthropic_key,
@@ -262,31 +421,31 @@ Respond ONLY with valid JSON:
                         "messages": [{"role": "user", "content": prompt}]
                     }
                 )
+            
+            if response.status_code == 200:
+                data = response.json()
+                text = data["content"][0]["text"]
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    text = data["content"][0]["text"]
+                json_start = text.find("{")
+                json_end = text.rfind("}") + 1
+                if json_start >= 0 and json_end > json_start:
+                    result = json.loads(text[json_start:json_end])
                     
-                    json_start = text.find("{")
-                    json_end = text.rfind("}") + 1
-                    if json_start >= 0 and json_end > json_start:
-                        result = json.loads(text[json_start:json_end])
-                        
-                        total = result.get("total_score", 50)
-                        grade = "A" if total >= 80 else "B" if total >= 60 else "C" if total >= 40 else "D" if total >= 20 else "F"
-                        
-                        return LeadScoreResult(
-                            total_score=total,
-                            grade=grade,
-                            breakdown=result.get("breakdown", {}),
-                            insights=result.get("insights", []),
-                            next_actions=result.get("next_actions", []),
-                            probability_to_close=result.get("probability_to_close", total),
-                        )
-            except Exception as e:
-                logger.error(f"Claude scoring failed: {e}")
-        
-        return self._local_scoring(contact, company)
+                    total = result.get("total_score", 50)
+                    grade = "A" if total >= 80 else "B" if total >= 60 else "C" if total >= 40 else "D" if total >= 20 else "F"
+                    
+                    return LeadScoreResult(
+                        total_score=total,
+                        grade=grade,
+                        breakdown=result.get("breakdown", {}),
+                        insights=result.get("insights", []),
+                        next_actions=result.get("next_actions", []),
+                        probability_to_close=result.get("probability_to_close", total),
+                    )
+        except Exception as e:
+            logger.error(f"Claude scoring failed: {e}")
+        
+        return None
     
     def _local_scoring(self, contact: Contact, company: Optional[Company]) -> LeadScoreResult:
         """Local fallback scoring."""
@@ -401,9 +560,9 @@ Respond ONLY with valid JSON:
     "personalization_points": ["point1", "point2"]
 }}"""
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
+        try:
+            async with self._limiter():
+                response = await self._get_client().post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
                         "x-api-key": self.anthropic_key,
@@ -416,24 +575,24 @@ Respond ONLY with valid JSON:
                         "messages": [{"role": "user", "content": prompt}]
                     }
                 )
+            
+            if response.status_code == 200:
+                data = response.json()
+                text = data["content"][0]["text"]
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    text = data["content"][0]["text"]
-                    
-                    json_start = text.find("{")
-                    json_end = text.rfind("}") + 1
-                    if json_start >= 0 and json_end > json_start:
-                        result = json.loads(text[json_start:json_end])
-                        return EmailDraft(
-                            subject=result.get("subject", "Following up"),
-                            body=result.get("body", ""),
-                            tone=result.get("tone", "professional"),
-                            cta=result.get("cta", ""),
-                            personalization_points=result.get("personalization_points", []),
-                        )
-            except Exception as e:
-                logger.error(f"Claude email failed: {e}")
+                json_start = text.find("{")
+                json_end = text.rfind("}") + 1
+                if json_start >= 0 and json_end > json_start:
+                    result = json.loads(text[json_start:json_end])
+                    return EmailDraft(
+                        subject=result.get("subject", "Following up"),
+                        body=result.get("body", ""),
+                        tone=result.get("tone", "professional"),
+                        cta=result.get("cta", ""),
+                        personalization_points=result.get("personalization_points", []),
+                    )
+        except Exception as e:
+            logger.error(f"Claude email failed: {e}")
         
         return self._local_email_draft(contact, purpose, company)
     
@@ -513,7 +672,13 @@ class CRMAgent:
     - Email Generation
     """
     
-    def __init__(self):
+    def __init__(self, repository: Optional[Any] = None):
+        """
+        Args:
+            repository: Optional EntityRepository (verticals/shared); when
+                given, contacts and deals are stored durably and loaded
+                per user on demand instead of living in process memory.
+        """
         self.ai_engine = CRMAIEngine()
         
         # In-memory storage
@@ -522,6 +687,15 @@ class CRMAgent:
         self._deals: Dict[str, Dict[str, Deal]] = {}
         self._activities: Dict[str, Dict[str, Activity]] = {}
         
+        # Durable storage, partitioned per user like the dicts above
+        if repository is not None:
+            self._contacts = repository.collection(
+                "crm.contacts", Contact, tenant="user_id"
+            ).by_tenant()
+            self._deals = repository.collection(
+                "crm.deals", Deal, tenant="user_id"
+            ).by_tenant()
+        
         logger.info("CRMAgent initialized")
     
     # ═══════════════════════════════════════════════════════════════════════════
@@ -755,6 +929,33 @@ class CRMAgent:
         
         return result
     
+    async def score_contacts_bulk(
+        self,
+        user_id: str,
+        contact_ids: Optional[List[str]] = None,
+        remote_budget: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[Contact, LeadScoreResult]]:
+        """Rescore many contacts (default: all), updating each as its score arrives."""
+        
+        contacts = self._contacts.get(user_id, {})
+        if contact_ids is None:
+            selected = list(contacts.values())
+        else:
+            selected = [contacts[cid] for cid in contact_ids if cid in contacts]
+        
+        leads = (
+            (c, self.get_company(c.company_id, user_id) if c.company_id else None)
+            for c in selected
+        )
+        
+        # aclosing: stopping this generator early also cancels in-flight scoring
+        async with aclosing(self.ai_engine.score_leads_bulk(leads, remote_budget=remote_budget)) as scored:
+            async for contact, result in scored:
+                contact.lead_score = result.total_score
+                contact.lead_score_breakdown = result.breakdown
+                contact.updated_at = datetime.now(timezone.utc)
+                yield contact, result
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # DEAL OPERATIONS
     # ═══════════════════════════════════════════════════════════════════════════
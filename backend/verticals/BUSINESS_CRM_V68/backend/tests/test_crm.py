@@ -8,6 +8,7 @@
 
 import pytest
 import asyncio
+import httpx
 from decimal import Decimal
 from datetime import datetime, timezone, timedelta
 
@@ -266,6 +267,131 @@ class TestCRMAIEngine:
         assert "New Corp" in draft.body
 
 
+def make_lead(index: int, title: str = "Engineer") -> Contact:
+    """Minimal lead for bulk scoring tests."""
+    now = datetime.now(timezone.utc)
+    return Contact(
+        id=f"lead_{index}",
+        first_name=f"Lead{index}",
+        last_name="Bulk",
+        email=f"lead{index}@corp.com",
+        phone=None,
+        title=title,
+        company_id=None,
+        company_name=None,
+        contact_type=ContactType.LEAD,
+        lead_status=LeadStatus.NEW,
+        lead_source=LeadSource.WEBSITE,
+        lead_score=0,
+        lead_score_breakdown={},
+        last_contacted=None,
+        last_activity=None,
+        linkedin_url=None,
+        tags=[],
+        owner_id="user",
+        created_at=now,
+        updated_at=now,
+        user_id="user",
+    )
+
+
+class TestBulkLeadScoring:
+    """Tests for concurrent bulk lead scoring."""
+    
+    @staticmethod
+    def claude_engine(max_concurrency: int = 3):
+        """Engine whose Claude calls hit a counting mock transport."""
+        stats = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+        
+        async def handler(request):
+            stats["calls"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            await asyncio.sleep(0.01)
+            stats["in_flight"] -= 1
+            text = '{"total_score": 72, "breakdown": {"fit": 18}, "probability_to_close": 60}'
+            return httpx.Response(200, json={"content": [{"text": text}]})
+        
+        engine = CRMAIEngine(
+            max_concurrency=max_concurrency,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        engine.anthropic_key = "test-key"
+        return engine, stats
+    
+    @pytest.mark.asyncio
+    async def test_bulk_scoring_bounded_and_cached(self):
+        """Test bulk scoring limits in-flight requests and caches results."""
+        engine, stats = self.claude_engine(max_concurrency=3)
+        leads = [(make_lead(i), None) for i in range(20)]
+        
+        results = [r async for r in engine.score_leads_bulk(leads)]
+        
+        assert {c.id for c, _ in results} == {c.id for c, _ in leads}
+        assert all(r.total_score == 72 and r.grade == "B" for _, r in results)
+        assert stats["calls"] == 20
+        assert stats["max_in_flight"] <= 3
+        
+        # Unchanged leads are served from the cache
+        again = [r async for r in engine.score_leads_bulk(leads)]
+        assert len(again) == 20
+        assert stats["calls"] == 20
+        
+        # A scoring-relevant change invalidates the fingerprint
+        leads[0][0].title = "CEO"
+        await engine.score_lead(leads[0][0])
+        assert stats["calls"] == 21
+        await engine.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_scoring_overflow_is_local(self):
+        """Test cache misses beyond the remote budget use local scoring."""
+        engine, stats = self.claude_engine()
+        leads = [(make_lead(i), None) for i in range(10)]
+        
+        results = [r async for r in engine.score_leads_bulk(leads, remote_budget=4)]
+        
+        assert len(results) == 10
+        assert stats["calls"] == 4
+        assert sum(1 for _, r in results if r.total_score == 72) == 4
+        await engine.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_scoring_cancels_pending_on_early_stop(self):
+        """Test stopping iteration early cancels in-flight requests."""
+        stats = {"calls": 0, "cancelled": 0}
+        
+        async def handler(request):
+            stats["calls"] += 1
+            try:
+                # Only the first request answers promptly
+                await asyncio.sleep(0 if stats["calls"] == 1 else 10)
+            except asyncio.CancelledError:
+                stats["cancelled"] += 1
+                raise
+            text = '{"total_score": 72, "breakdown": {}, "probability_to_close": 60}'
+            return httpx.Response(200, json={"content": [{"text": text}]})
+        
+        engine = CRMAIEngine(
+            max_concurrency=3,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        engine.anthropic_key = "test-key"
+        leads = [(make_lead(i), None) for i in range(20)]
+        
+        scored = engine.score_leads_bulk(leads)
+        async for _, result in scored:
+            assert result.total_score == 72
+            break
+        await scored.aclose()
+        
+        # Every request still waiting on the slow handler was cancelled
+        assert stats["calls"] > 1
+        assert stats["cancelled"] == stats["calls"] - 1
+        assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+        await engine.aclose()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMPANY TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
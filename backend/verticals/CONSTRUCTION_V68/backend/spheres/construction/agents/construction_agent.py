@@ -279,7 +279,14 @@ class ConstructionAgent:
     - Rule #6: Full audit trail with UUID, timestamps, created_by
     """
     
-    def __init__(self):
+    def __init__(self, repository: Optional[Any] = None):
+        """
+        Args:
+            repository: Optional EntityRepository (verticals/shared); when
+                given, projects, RFIs and punch items are stored durably
+                (RFIs and punch items loaded per project on demand) and
+                sequence numbers resume from the stored entities.
+        """
         self.projects: Dict[UUID, Project] = {}
         self.rfis: Dict[UUID, RFI] = {}
         self.daily_logs: Dict[UUID, DailyLog] = {}
@@ -290,11 +297,41 @@ class ConstructionAgent:
         self.subcontractors: Dict[UUID, Subcontractor] = {}
         self.tasks: Dict[UUID, Task] = {}
         
-        # Counters for sequential numbering
-        self._project_counter = 0
+        if repository is not None:
+            self.projects = repository.collection(
+                "construction.projects", Project, key_type=UUID
+            )
+            self.rfis = repository.collection(
+                "construction.rfis", RFI, key_type=UUID, tenant="project_id"
+            )
+            self.punch_items = repository.collection(
+                "construction.punch_items", PunchItem, key_type=UUID, tenant="project_id"
+            )
+        
+        # Counters for sequential numbering; per-project counters missing
+        # after a restart are recounted from the project's entities
+        self._project_counter = len(self.projects)
         self._rfi_counters: Dict[UUID, int] = {}  # Per project
         self._co_counters: Dict[UUID, int] = {}  # Per project
     
+    @staticmethod
+    def _project_items(store: Dict[UUID, Any], project_id: UUID) -> List[Any]:
+        """A project's entities, from a tenant view when the store is durable."""
+        if isinstance(store, dict):
+            return [e for e in store.values() if e.project_id == project_id]
+        return list(store.tenant(project_id).values())
+    
+    @staticmethod
+    def _next_number(counters: Dict[UUID, int], store: Dict[UUID, Any], project_id: UUID) -> int:
+        """Next per-project sequence number."""
+        if project_id not in counters:
+            if isinstance(store, dict):
+                counters[project_id] = sum(1 for e in store.values() if e.project_id == project_id)
+            else:
+                counters[project_id] = len(store.tenant(project_id))
+        counters[project_id] += 1
+        return counters[project_id]
+    
     # ========================================================================
     # PROJECT MANAGEMENT
     # ========================================================================
@@ -390,8 +427,7 @@ class ConstructionAgent:
         if project_id not in self.projects:
             raise ValueError(f"Project not found: {project_id}")
         
-        self._rfi_counters[project_id] += 1
-        rfi_number = f"RFI-{self._rfi_counters[project_id]:03d}"
+        rfi_number = f"RFI-{self._next_number(self._rfi_counters, self.rfis, project_id):03d}"
         
         rfi = RFI(
             id=uuid4(),
@@ -460,7 +496,7 @@ class ConstructionAgent:
         Get RFIs for project - CHRONOLOGICAL by created_at (Rule #5)
         NOT sorted by priority or status
         """
-        rfis = [r for r in self.rfis.values() if r.project_id == project_id]
+        rfis = self._project_items(self.rfis, project_id)
         # RULE #5: CHRONOLOGICAL, NOT by priority
         return sorted(rfis, key=lambda r: r.created_at, reverse=True)
     
@@ -605,7 +641,7 @@ class ConstructionAgent:
         Get punch items for project - ALPHABETICAL by location (Rule #5)
         NOT sorted by priority or status
         """
-        items = [i for i in self.punch_items.values() if i.project_id == project_id]
+        items = self._project_items(self.punch_items, project_id)
         # RULE #5: ALPHABETICAL by location
         return sorted(items, key=lambda i: i.location.lower())
     
@@ -723,8 +759,7 @@ class ConstructionAgent:
         if project_id not in self.projects:
             raise ValueError(f"Project not found: {project_id}")
         
-        self._co_counters[project_id] += 1
-        co_number = f"CO-{self._co_counters[project_id]:03d}"
+        co_number = f"CO-{self._next_number(self._co_counters, self.change_orders, project_id):03d}"
         
         co = ChangeOrder(
             id=uuid4(),
@@ -1016,8 +1051,8 @@ class ConstructionAgent:
         
         project = self.projects[project_id]
         
-        rfis = [r for r in self.rfis.values() if r.project_id == project_id]
-        punch_items = [p for p in self.punch_items.values() if p.project_id == project_id]
+        rfis = self._project_items(self.rfis, project_id)
+        punch_items = self._project_items(self.punch_items, project_id)
         inspections = [i for i in self.safety_inspections.values() if i.project_id == project_id]
         change_orders = [c for c in self.change_orders.values() if c.project_id == project_id]
         tasks = [t for t in self.tasks.values() if t.project_id == project_id]
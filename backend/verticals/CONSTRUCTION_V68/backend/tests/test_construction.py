@@ -14,7 +14,11 @@ from datetime import datetime, date
 from decimal import Decimal
 
 import sys
+from pathlib import Path
 sys.path.insert(0, '/home/claude/CONSTRUCTION_V68/backend')
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))  # verticals/shared
+
+from shared.repository import EntityRepository
 
 from spheres.construction.agents.construction_agent import (
     ConstructionAgent,
@@ -513,6 +517,49 @@ async def test_project_analytics(agent, user_id):
     assert "open_rfis" in stats["counts"]
 
 
+# ============================================================
+# DURABLE STORAGE TESTS
+# ============================================================
+
+@pytest.mark.asyncio
+async def test_projects_and_numbering_survive_restart(tmp_path, user_id):
+    """Projects are stored, and RFI/project numbers continue after a restart."""
+    db_path = str(tmp_path / "construction.db")
+    repository = EntityRepository(db_path)
+    agent = ConstructionAgent(repository=repository)
+    
+    project = await agent.create_project(
+        name="Test Project", description="Test", client_name="Test",
+        location="Test", budget=Decimal("100000.00"),
+        start_date=date(2026, 1, 1), created_by=user_id
+    )
+    for subject in ("Beams", "Footings"):
+        await agent.create_rfi(
+            project_id=project.id, subject=subject,
+            question="Specs?", submitted_by=user_id
+        )
+    await agent.update_project_status(project.id, ProjectStatus.IN_PROGRESS, user_id)
+    repository.close()
+    
+    restarted = ConstructionAgent(repository=EntityRepository(db_path))
+    stored = await restarted.get_project(project.id)
+    assert stored.project_number == "PRJ-001"
+    assert stored.status == ProjectStatus.IN_PROGRESS
+    
+    rfi = await restarted.create_rfi(
+        project_id=project.id, subject="Rebar",
+        question="Spacing?", submitted_by=user_id
+    )
+    assert rfi.rfi_number == "RFI-003"
+    
+    second = await restarted.create_project(
+        name="Second", description="Test", client_name="Test",
+        location="Test", budget=Decimal("1.00"),
+        start_date=date(2026, 1, 1), created_by=user_id
+    )
+    assert second.project_number == "PRJ-002"
+
+
 # ============================================================
 # AGENT INITIALIZATION TEST
 # ============================================================
@@ -17,11 +17,13 @@ Features:
 GOVERNED INTELLIGENCE: All actions require human approval
 """
 
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set, Tuple
 from uuid import uuid4
 import logging
 
@@ -219,6 +221,28 @@ class Employee:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     created_by: str = ""
+    
+    # Fields the owning HRAgent indexes; assigning one re-indexes the employee
+    INDEXED_FIELDS = frozenset({
+        "employee_number", "email", "department_id", "manager_id", "employment_status",
+    })
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in Employee.INDEXED_FIELDS:
+            listener = self.__dict__.get("_index_listener")
+            if listener is not None:
+                listener(self)
+    
+    @property
+    def email_key(self) -> str:
+        """Case-insensitive email, as looked up by HRAgent."""
+        return self.email.lower()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_index_listener", None)
+        return state
 
 
 @dataclass
@@ -482,6 +506,185 @@ class Document:
     expiry_date: Optional[date] = None
 
 
+# =============================================================================
+# INDEXES
+# =============================================================================
+
+class DateIntervalTree:
+    """
+    Centered interval tree over closed date ranges.
+    
+    Overlap queries cost O(log n + k). New intervals are buffered and
+    scanned linearly until the buffer outgrows a fraction of the tree,
+    then the tree is rebuilt, so interleaved inserts and queries stay
+    cheap without a self-balancing structure.
+    """
+    
+    REBUILD_MIN = 64
+    
+    def __init__(self):
+        self._items: List[Tuple[int, int, Any]] = []
+        self._pending: List[Tuple[int, int, Any]] = []
+        self._root: Optional[tuple] = None
+    
+    def __len__(self) -> int:
+        return len(self._items) + len(self._pending)
+    
+    def add(self, start: date, end: date, value: Any) -> None:
+        """Add the closed range [start, end]."""
+        self._pending.append((start.toordinal(), end.toordinal(), value))
+        if len(self._pending) > max(self.REBUILD_MIN, len(self._items) // 8):
+            self._rebuild()
+    
+    def overlapping(self, start: date, end: date) -> List[Any]:
+        """Values whose range overlaps [start, end]."""
+        lo, hi = start.toordinal(), end.toordinal()
+        found = [v for s, e, v in self._pending if s <= hi and e >= lo]
+        
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+            
+            if hi < center:
+                # Every interval here contains center, so it overlaps iff it starts by hi
+                for s, e, v in by_start:
+                    if s > hi:
+                        break
+                    found.append(v)
+                stack.append(left)
+            elif lo > center:
+                for s, e, v in by_end:
+                    if e < lo:
+                        break
+                    found.append(v)
+                stack.append(right)
+            else:
+                found.extend(v for _, _, v in by_start)
+                stack.append(left)
+                stack.append(right)
+        
+        return found
+    
+    def _rebuild(self) -> None:
+        self._items.extend(self._pending)
+        self._pending = []
+        self._root = self._build(self._items)
+    
+    def _build(self, items: List[Tuple[int, int, Any]]) -> Optional[tuple]:
+        if not items:
+            return None
+        
+        midpoints = sorted((s + e) // 2 for s, e, _ in items)
+        center = midpoints[len(midpoints) // 2]
+        
+        here, left, right = [], [], []
+        for item in items:
+            if item[1] < center:
+                left.append(item)
+            elif item[0] > center:
+                right.append(item)
+            else:
+                here.append(item)
+        
+        return (
+            center,
+            sorted(here, key=lambda i: i[0]),
+            sorted(here, key=lambda i: i[1], reverse=True),
+            self._build(left),
+            self._build(right),
+        )
+
+
+# =============================================================================
+# PAYROLL CALCULATION
+# =============================================================================
+
+PERIODS_PER_YEAR = {
+    PayFrequency.BIWEEKLY: 26,
+    PayFrequency.SEMI_MONTHLY: 24,
+    PayFrequency.MONTHLY: 12,
+}
+
+# Simplified Canadian payroll: (annual salary upper bounds, marginal rates)
+FEDERAL_TAX_BRACKETS = (
+    (53359, 106717, 165430),
+    (Decimal("0.15"), Decimal("0.205"), Decimal("0.26"), Decimal("0.29")),
+)
+# Provincial tax (using Quebec as default, ~15-25.75%)
+PROVINCIAL_TAX_BRACKETS = (
+    (49275, 98540),
+    (Decimal("0.14"), Decimal("0.19"), Decimal("0.2575")),
+)
+CPP_RATE = Decimal("0.0595")          # 5.95% up to max $3,754.45 annual
+CPP_PERIOD_MAX = Decimal("144.40")    # Bi-weekly max approx
+EI_RATE = Decimal("0.0163")           # 1.63% up to max $1,002.45 annual
+EI_PERIOD_MAX = Decimal("38.56")      # Bi-weekly max approx
+HOURS_PER_YEAR = Decimal(2080)
+OVERTIME_MULTIPLIER = Decimal("1.5")
+CENT = Decimal("0.01")
+
+PAYROLL_AMOUNT_FIELDS = (
+    "gross_pay", "federal_tax", "provincial_tax", "cpp_contribution",
+    "ei_contribution", "benefit_deductions", "total_deductions", "net_pay",
+)
+
+
+def _bracket_rate(brackets: Tuple[Tuple[int, ...], Tuple[Decimal, ...]], annual_salary: float) -> Decimal:
+    bounds, rates = brackets
+    return rates[bisect_right(bounds, annual_salary)]
+
+
+def calculate_pay(
+    salary: Decimal,
+    pay_frequency: PayFrequency,
+    overtime_hours: float,
+    benefit_deductions: Decimal,
+) -> Dict[str, Decimal]:
+    """
+    Compute one pay period's amounts, rounded to the cent.
+    
+    Pure function of its inputs so single-employee and batch payroll
+    runs (including worker processes) produce identical records.
+    """
+    periods_per_year = PERIODS_PER_YEAR.get(pay_frequency, 52)
+    
+    base_pay = salary / Decimal(periods_per_year)
+    overtime_rate = (salary / HOURS_PER_YEAR) * OVERTIME_MULTIPLIER  # 1.5x hourly
+    overtime_pay = overtime_rate * Decimal(str(overtime_hours))
+    gross_pay = base_pay + overtime_pay
+    
+    annual_salary = float(salary)
+    federal_tax = gross_pay * _bracket_rate(FEDERAL_TAX_BRACKETS, annual_salary)
+    provincial_tax = gross_pay * _bracket_rate(PROVINCIAL_TAX_BRACKETS, annual_salary)
+    cpp_contribution = min(gross_pay * CPP_RATE, CPP_PERIOD_MAX)
+    ei_contribution = min(gross_pay * EI_RATE, EI_PERIOD_MAX)
+    
+    total_deductions = federal_tax + provincial_tax + cpp_contribution + ei_contribution + benefit_deductions
+    net_pay = gross_pay - total_deductions
+    
+    amounts = {
+        "gross_pay": gross_pay,
+        "federal_tax": federal_tax,
+        "provincial_tax": provincial_tax,
+        "cpp_contribution": cpp_contribution,
+        "ei_contribution": ei_contribution,
+        "benefit_deductions": benefit_deductions,
+        "total_deductions": total_deductions,
+        "net_pay": net_pay,
+    }
+    return {name: amounts[name].quantize(CENT) for name in PAYROLL_AMOUNT_FIELDS}
+
+
+def _calculate_pay_chunk(
+    rows: List[Tuple[Decimal, PayFrequency, float, Decimal]],
+) -> List[Dict[str, Decimal]]:
+    """Worker entry point for batch payroll runs."""
+    return [calculate_pay(*row) for row in rows]
+
+
 # =============================================================================
 # HR AGENT SERVICE
 # =============================================================================
@@ -497,7 +700,12 @@ class HRAgent:
     - Performance ratings are human-validated
     """
     
-    def __init__(self):
+    def __init__(self, repository: Optional[Any] = None):
+        """
+        Args:
+            repository: Optional EntityRepository (verticals/shared); when
+                given, employees are stored durably instead of in memory.
+        """
         # Data stores
         self.departments: Dict[str, Department] = {}
         self.positions: Dict[str, JobPosition] = {}
@@ -515,6 +723,35 @@ class HRAgent:
         self.payroll_records: Dict[str, PayrollRecord] = {}
         self.documents: Dict[str, Document] = {}
         
+        # Secondary indexes (Employee re-indexes itself on assignment)
+        self._employee_order: Dict[str, int] = {}
+        self._employee_by_number: Dict[str, str] = {}
+        self._employee_by_email: Dict[str, str] = {}
+        self._employees_by_department: Dict[str, Set[str]] = {}
+        self._employees_by_manager: Dict[str, Set[str]] = {}
+        self._employees_by_status: Dict[EmploymentStatus, Set[str]] = {}
+        self._employee_index_keys: Dict[str, Tuple[str, str, Optional[str], EmploymentStatus]] = {}
+        self._employee_unique: Dict[str, Dict[str, str]] = {
+            "employee_number": self._employee_by_number,
+            "email_key": self._employee_by_email,
+        }
+        self._employee_buckets: Dict[str, Dict[Any, Set[str]]] = {
+            "department_id": self._employees_by_department,
+            "manager_id": self._employees_by_manager,
+            "employment_status": self._employees_by_status,
+        }
+        self._leave_order: Dict[str, int] = {}
+        self._approved_leave = DateIntervalTree()
+        
+        # Durable storage: employees are queried through the repository's
+        # indexes instead of being loaded into the in-memory ones
+        self._durable = repository is not None
+        if repository is not None:
+            self.employees = repository.collection(
+                "hr.employees", Employee,
+                indexes=(*self._employee_unique, *self._employee_buckets),
+            )
+        
         logger.info("HRAgent initialized - GOVERNED INTELLIGENCE active")
     
     # =========================================================================
@@ -563,32 +800,31 @@ class HRAgent:
     
     def get_org_chart(self) -> Dict[str, Any]:
         """Generate organization chart structure."""
-        def build_tree(parent_id: Optional[str] = None) -> List[Dict]:
-            children = []
-            for dept in self.departments.values():
-                if dept.parent_department_id == parent_id:
-                    dept_data = {
-                        "id": dept.id,
-                        "name": dept.name,
-                        "code": dept.code,
-                        "manager_id": dept.manager_id,
-                        "manager_name": "",
-                        "headcount": self._get_department_headcount(dept.id),
-                        "children": build_tree(dept.id)
-                    }
-                    if dept.manager_id and dept.manager_id in self.employees:
-                        mgr = self.employees[dept.manager_id]
-                        dept_data["manager_name"] = f"{mgr.first_name} {mgr.last_name}"
-                    children.append(dept_data)
-            return children
-        
-        return {"departments": build_tree(None)}
+        # One pass to group departments by parent, one to emit the tree
+        nodes: Dict[Optional[str], List[Dict]] = {}
+        
+        for dept in self.departments.values():
+            dept_data = {
+                "id": dept.id,
+                "name": dept.name,
+                "code": dept.code,
+                "manager_id": dept.manager_id,
+                "manager_name": "",
+                "headcount": self._get_department_headcount(dept.id),
+                "children": nodes.setdefault(dept.id, [])
+            }
+            if dept.manager_id and dept.manager_id in self.employees:
+                mgr = self.employees[dept.manager_id]
+                dept_data["manager_name"] = f"{mgr.first_name} {mgr.last_name}"
+            nodes.setdefault(dept.parent_department_id, []).append(dept_data)
+        
+        return {"departments": nodes.get(None, [])}
     
     def _get_department_headcount(self, department_id: str) -> int:
         """Get number of employees in department."""
-        return sum(1 for emp in self.employees.values() 
-                   if emp.department_id == department_id 
-                   and emp.employment_status == EmploymentStatus.ACTIVE)
+        return len(self._employee_ids(
+            department_id=department_id, employment_status=EmploymentStatus.ACTIVE
+        ))
     
     # =========================================================================
     # POSITION MANAGEMENT
@@ -658,9 +894,8 @@ class HRAgent:
             raise ValueError(f"Department {department_id} not found")
         
         # Check for duplicate email
-        for emp in self.employees.values():
-            if emp.email.lower() == email.lower():
-                raise ValueError(f"Employee with email '{email}' already exists")
+        if self._employee_id_by("email_key", email.lower()):
+            raise ValueError(f"Employee with email '{email}' already exists")
         
         # Generate employee number
         employee_number = f"EMP{len(self.employees) + 1:05d}"
@@ -693,6 +928,10 @@ class HRAgent:
         )
         
         self.employees[employee.id] = employee
+        if not self._durable:
+            self._employee_order[employee.id] = len(self._employee_order)
+            self._index_employee(employee)
+            self._attach_employee(employee)
         logger.info(f"Created employee: {first_name} {last_name} ({employee_number})")
         
         # Auto-create onboarding checklist
@@ -706,10 +945,8 @@ class HRAgent:
     
     def get_employee_by_number(self, employee_number: str) -> Optional[Employee]:
         """Get employee by employee number."""
-        for emp in self.employees.values():
-            if emp.employee_number == employee_number:
-                return emp
-        return None
+        employee_id = self._employee_id_by("employee_number", employee_number)
+        return self.employees.get(employee_id) if employee_id else None
     
     def list_employees(
         self,
@@ -718,16 +955,80 @@ class HRAgent:
         manager_id: Optional[str] = None
     ) -> List[Employee]:
         """List employees with optional filters."""
-        employees = list(self.employees.values())
-        
+        criteria: Dict[str, Any] = {}
         if department_id:
-            employees = [e for e in employees if e.department_id == department_id]
+            criteria["department_id"] = department_id
         if status:
-            employees = [e for e in employees if e.employment_status == status]
+            criteria["employment_status"] = status
         if manager_id:
-            employees = [e for e in employees if e.manager_id == manager_id]
-        
-        return employees
+            criteria["manager_id"] = manager_id
+        
+        if not criteria:
+            return list(self.employees.values())
+        return self._find_employees(**criteria)
+    
+    def _employee_id_by(self, field_name: str, value: str) -> Optional[str]:
+        """ID of the employee with a unique indexed field (number, email_key)."""
+        if self._durable:
+            found = self.employees.find(**{field_name: value})
+            return found[0].id if found else None
+        return self._employee_unique[field_name].get(value)
+    
+    def _employee_ids(self, **criteria: Any) -> Set[str]:
+        """IDs of employees matching every indexed field in `criteria`."""
+        if self._durable:
+            return {employee.id for employee in self.employees.find(**criteria)}
+        buckets = [self._employee_buckets[name].get(value, set())
+                   for name, value in criteria.items()]
+        buckets.sort(key=len)
+        return buckets[0].intersection(*buckets[1:])
+    
+    def _find_employees(self, **criteria: Any) -> List[Employee]:
+        """Employees matching every indexed field in `criteria`, in creation order."""
+        if self._durable:
+            return self.employees.find(**criteria)
+        return self._employees_in(self._employee_ids(**criteria))
+    
+    def _attach_employee(self, employee: Employee) -> None:
+        object.__setattr__(employee, "_index_listener", self._reindex_employee)
+    
+    def _reindex_employee(self, employee: Employee) -> None:
+        if employee.id in self._employee_index_keys:
+            self._unindex_employee(employee.id)
+            self._index_employee(employee)
+    
+    def _index_employee(self, employee: Employee) -> None:
+        keys = (employee.employee_number, employee.email.lower(),
+                employee.department_id, employee.manager_id, employee.employment_status)
+        number, email, department_id, manager_id, status = keys
+        
+        self._employee_index_keys[employee.id] = keys
+        self._employee_by_number[number] = employee.id
+        self._employee_by_email[email] = employee.id
+        self._employees_by_department.setdefault(department_id, set()).add(employee.id)
+        if manager_id:
+            self._employees_by_manager.setdefault(manager_id, set()).add(employee.id)
+        self._employees_by_status.setdefault(status, set()).add(employee.id)
+    
+    def _unindex_employee(self, employee_id: str) -> None:
+        keys = self._employee_index_keys.pop(employee_id, None)
+        if keys is None:
+            return
+        number, email, department_id, manager_id, status = keys
+        
+        if self._employee_by_number.get(number) == employee_id:
+            del self._employee_by_number[number]
+        if self._employee_by_email.get(email) == employee_id:
+            del self._employee_by_email[email]
+        self._employees_by_department.get(department_id, set()).discard(employee_id)
+        if manager_id:
+            self._employees_by_manager.get(manager_id, set()).discard(employee_id)
+        self._employees_by_status.get(status, set()).discard(employee_id)
+    
+    def _employees_in(self, employee_ids: Iterable[str]) -> List[Employee]:
+        """Employees for a set of IDs, in creation order."""
+        ordered = sorted(employee_ids, key=self._employee_order.__getitem__)
+        return [self.employees[i] for i in ordered]
     
     def update_employee_status(
         self,
@@ -773,7 +1074,7 @@ class HRAgent:
     
     def get_direct_reports(self, manager_id: str) -> List[Employee]:
         """Get employees reporting to a manager."""
-        return [e for e in self.employees.values() if e.manager_id == manager_id]
+        return self._find_employees(manager_id=manager_id)
     
     def search_employees(self, query: str) -> List[Employee]:
         """Search employees by name or email."""
@@ -912,6 +1213,7 @@ class HRAgent:
         )
         
         self.leave_requests[request.id] = request
+        self._leave_order[request.id] = len(self._leave_order)
         logger.info(f"Leave request created: {employee_id} - {leave_type.value} ({days} days)")
         return request
     
@@ -937,6 +1239,7 @@ class HRAgent:
         request.status = LeaveStatus.APPROVED
         request.approved_by = approved_by
         request.approved_at = datetime.utcnow()
+        self._approved_leave.add(request.start_date, request.end_date, request.id)
         
         logger.info(f"Leave request {request_id} approved by {approved_by}")
         return request
@@ -976,15 +1279,16 @@ class HRAgent:
         end_date: date
     ) -> List[Dict]:
         """Get approved leave for a manager's team."""
-        direct_reports = self.get_direct_reports(manager_id)
-        team_ids = {e.id for e in direct_reports}
+        team_ids = self._employee_ids(manager_id=manager_id)
+        
+        overlapping = self._approved_leave.overlapping(start_date, end_date)
+        overlapping.sort(key=self._leave_order.__getitem__)
         
         calendar = []
-        for request in self.leave_requests.values():
+        for request_id in overlapping:
+            request = self.leave_requests[request_id]
             if (request.employee_id in team_ids and
-                request.status == LeaveStatus.APPROVED and
-                request.start_date <= end_date and
-                request.end_date >= start_date):
+                request.status == LeaveStatus.APPROVED):
                 emp = self.employees[request.employee_id]
                 calendar.append({
                     "employee_id": request.employee_id,
@@ -999,13 +1303,15 @@ class HRAgent:
     
     def _calculate_business_days(self, start: date, end: date) -> float:
         """Calculate business days between dates."""
-        days = 0
-        current = start
-        while current <= end:
-            if current.weekday() < 5:  # Monday to Friday
-                days += 1
-            current += timedelta(days=1)
-        return float(days)
+        total = (end - start).days + 1
+        if total <= 0:
+            return 0.0
+        
+        # Five business days per full week, then count the leftover days
+        weeks, remainder = divmod(total, 7)
+        first = start.weekday()
+        extra = sum(1 for i in range(remainder) if (first + i) % 7 < 5)  # Monday to Friday
+        return float(weeks * 5 + extra)
     
     def accrue_pto(self, employee_id: str, leave_type: LeaveType, days: float) -> float:
         """Accrue PTO for an employee (typically called monthly)."""
@@ -1597,65 +1903,15 @@ class HRAgent:
         regular_hours = sum(min(e.total_hours, 8) for e in time_entries)
         overtime_hours = sum(e.overtime_hours for e in time_entries)
         
-        # Calculate gross pay
-        if employee.pay_frequency == PayFrequency.BIWEEKLY:
-            periods_per_year = 26
-        elif employee.pay_frequency == PayFrequency.SEMI_MONTHLY:
-            periods_per_year = 24
-        elif employee.pay_frequency == PayFrequency.MONTHLY:
-            periods_per_year = 12
-        else:
-            periods_per_year = 52
-        
-        base_pay = employee.salary / Decimal(periods_per_year)
-        overtime_rate = (employee.salary / Decimal(2080)) * Decimal("1.5")  # 1.5x hourly
-        overtime_pay = overtime_rate * Decimal(str(overtime_hours))
-        gross_pay = base_pay + overtime_pay
-        
-        # Calculate deductions (simplified Canadian payroll)
-        # Federal tax (approximate 15-33% marginal)
-        annual_salary = float(employee.salary)
-        if annual_salary < 53359:
-            fed_rate = Decimal("0.15")
-        elif annual_salary < 106717:
-            fed_rate = Decimal("0.205")
-        elif annual_salary < 165430:
-            fed_rate = Decimal("0.26")
-        else:
-            fed_rate = Decimal("0.29")
-        federal_tax = gross_pay * fed_rate
-        
-        # Provincial tax (using Quebec as default, ~15-25.75%)
-        if annual_salary < 49275:
-            prov_rate = Decimal("0.14")
-        elif annual_salary < 98540:
-            prov_rate = Decimal("0.19")
-        else:
-            prov_rate = Decimal("0.2575")
-        provincial_tax = gross_pay * prov_rate
-        
-        # CPP (5.95% up to max $3,754.45 annual)
-        cpp_rate = Decimal("0.0595")
-        cpp_contribution = min(gross_pay * cpp_rate, Decimal("144.40"))  # Bi-weekly max approx
-        
-        # EI (1.63% up to max $1,002.45 annual)
-        ei_rate = Decimal("0.0163")
-        ei_contribution = min(gross_pay * ei_rate, Decimal("38.56"))  # Bi-weekly max approx
-        
         # Benefit deductions
+        plan_deductions = self._benefit_deductions_by_plan()
         benefit_deductions = Decimal("0")
         for enrollment in self.enrollments.values():
             if enrollment.employee_id == employee_id and enrollment.status == "active":
-                plan = self.benefit_plans.get(enrollment.plan_id)
-                if plan:
-                    # Convert to per-pay-period amount
-                    if plan.contribution_frequency == PayFrequency.MONTHLY:
-                        benefit_deductions += plan.employee_contribution / Decimal("2")
-                    else:
-                        benefit_deductions += plan.employee_contribution
+                benefit_deductions += plan_deductions.get(enrollment.plan_id, Decimal("0"))
         
-        total_deductions = federal_tax + provincial_tax + cpp_contribution + ei_contribution + benefit_deductions
-        net_pay = gross_pay - total_deductions
+        # Calculate gross pay and deductions (simplified Canadian payroll)
+        amounts = calculate_pay(employee.salary, employee.pay_frequency, overtime_hours, benefit_deductions)
         
         record = PayrollRecord(
             employee_id=employee_id,
@@ -1664,22 +1920,124 @@ class HRAgent:
             pay_date=pay_date,
             regular_hours=regular_hours,
             overtime_hours=overtime_hours,
-            gross_pay=gross_pay.quantize(Decimal("0.01")),
-            federal_tax=federal_tax.quantize(Decimal("0.01")),
-            provincial_tax=provincial_tax.quantize(Decimal("0.01")),
-            cpp_contribution=cpp_contribution.quantize(Decimal("0.01")),
-            ei_contribution=ei_contribution.quantize(Decimal("0.01")),
-            benefit_deductions=benefit_deductions.quantize(Decimal("0.01")),
-            total_deductions=total_deductions.quantize(Decimal("0.01")),
-            net_pay=net_pay.quantize(Decimal("0.01")),
             status="pending",
-            created_by=created_by
+            created_by=created_by,
+            **amounts
         )
         
         self.payroll_records[record.id] = record
-        logger.info(f"Generated payroll for {employee_id}: Gross ${gross_pay}, Net ${net_pay}")
+        logger.info(f"Generated payroll for {employee_id}: Gross ${record.gross_pay}, Net ${record.net_pay}")
         return record
     
+    def run_payroll(
+        self,
+        pay_period_start: date,
+        pay_period_end: date,
+        pay_date: date,
+        employee_ids: Optional[List[str]] = None,
+        created_by: str = "",
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[PayrollRecord]:
+        """
+        Generate payroll records for many employees in one run.
+        
+        Time entries and benefit enrollments are grouped by employee in a
+        single pass. Runs larger than one chunk are computed across a
+        process pool (max_workers=1 keeps everything in-process). Records
+        are yielded and stored as each chunk completes, and match
+        generate_payroll to the cent.
+        
+        Defaults to all active employees.
+        """
+        if employee_ids is None:
+            employee_ids = [e.id for e in self.list_employees(status=EmploymentStatus.ACTIVE)]
+        for employee_id in employee_ids:
+            if employee_id not in self.employees:
+                raise ValueError(f"Employee {employee_id} not found")
+        
+        # Group the period's time entries and active enrollments by employee
+        wanted = set(employee_ids)
+        hours: Dict[str, List[float]] = {}
+        for entry in self.time_entries.values():
+            if entry.employee_id in wanted and pay_period_start <= entry.date <= pay_period_end:
+                totals = hours.setdefault(entry.employee_id, [0, 0])
+                totals[0] += min(entry.total_hours, 8)
+                totals[1] += entry.overtime_hours
+        
+        plan_deductions = self._benefit_deductions_by_plan()
+        benefits: Dict[str, Decimal] = {}
+        for enrollment in self.enrollments.values():
+            if enrollment.employee_id in wanted and enrollment.status == "active":
+                benefits[enrollment.employee_id] = (
+                    benefits.get(enrollment.employee_id, Decimal("0"))
+                    + plan_deductions.get(enrollment.plan_id, Decimal("0"))
+                )
+        
+        rows = []
+        for employee_id in employee_ids:
+            employee = self.employees[employee_id]
+            regular_hours, overtime_hours = hours.get(employee_id, (0, 0))
+            rows.append((
+                employee_id,
+                regular_hours,
+                (employee.salary, employee.pay_frequency, overtime_hours,
+                 benefits.get(employee_id, Decimal("0"))),
+            ))
+        
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        inputs = [[row[2] for row in chunk] for chunk in chunks]
+        
+        if len(chunks) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from self._emit_payroll(
+                    chunks, executor.map(_calculate_pay_chunk, inputs),
+                    pay_period_start, pay_period_end, pay_date, created_by
+                )
+        else:
+            yield from self._emit_payroll(
+                chunks, map(_calculate_pay_chunk, inputs),
+                pay_period_start, pay_period_end, pay_date, created_by
+            )
+        
+        logger.info(f"Payroll run {pay_period_start} - {pay_period_end}: {len(rows)} employees")
+    
+    def _emit_payroll(
+        self,
+        chunks: List[List[Tuple[str, float, Tuple]]],
+        results: Iterable[List[Dict[str, Decimal]]],
+        pay_period_start: date,
+        pay_period_end: date,
+        pay_date: date,
+        created_by: str
+    ) -> Iterator[PayrollRecord]:
+        for chunk, amounts in zip(chunks, results):
+            for (employee_id, regular_hours, row), chunk_amounts in zip(chunk, amounts):
+                record = PayrollRecord(
+                    employee_id=employee_id,
+                    pay_period_start=pay_period_start,
+                    pay_period_end=pay_period_end,
+                    pay_date=pay_date,
+                    regular_hours=regular_hours,
+                    overtime_hours=row[2],
+                    status="pending",
+                    created_by=created_by,
+                    **chunk_amounts
+                )
+                self.payroll_records[record.id] = record
+                yield record
+    
+    def _benefit_deductions_by_plan(self) -> Dict[str, Decimal]:
+        """Per-pay-period employee contribution for each benefit plan."""
+        deductions = {}
+        for plan in self.benefit_plans.values():
+            # Convert to per-pay-period amount
+            if plan.contribution_frequency == PayFrequency.MONTHLY:
+                deductions[plan.id] = plan.employee_contribution / Decimal("2")
+            else:
+                deductions[plan.id] = plan.employee_contribution
+        return deductions
+    
     def process_payroll(self, record_id: str) -> PayrollRecord:
         """Process payroll record (mark as paid)."""
         if record_id not in self.payroll_records:
@@ -1854,7 +2212,7 @@ class HRAgent:
             raise ValueError(f"Department {department_id} not found")
         
         department = self.departments[department_id]
-        employees = [e for e in self.employees.values() if e.department_id == department_id]
+        employees = self._find_employees(department_id=department_id)
         
         # Collect required skills from positions
         required_skills = set()
@@ -1902,7 +2260,7 @@ class HRAgent:
     def get_workforce_analytics(self) -> Dict[str, Any]:
         """Get overall workforce analytics."""
         employees = list(self.employees.values())
-        active = [e for e in employees if e.employment_status == EmploymentStatus.ACTIVE]
+        active = self._find_employees(employment_status=EmploymentStatus.ACTIVE)
         
         # Headcount by department
         by_department = {}
@@ -11,7 +11,11 @@ from fastapi import FastAPI
 
 # Import agent and routes
 import sys
+from pathlib import Path
 sys.path.insert(0, '/home/claude/HR_V68/backend')
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))  # verticals/shared
+
+from shared.repository import EntityRepository
 
 from spheres.hr.agents.hr_agent import (
     HRAgent,
@@ -24,6 +28,8 @@ from spheres.hr.agents.hr_agent import (
     BenefitType,
     OnboardingStatus,
     TaskStatus,
+    PayFrequency,
+    PAYROLL_AMOUNT_FIELDS,
 )
 from spheres.hr.api.hr_routes import router
 
@@ -150,6 +156,29 @@ class TestDepartments:
         assert "departments" in chart
         assert len(chart["departments"]) == 1  # Top-level
         assert len(chart["departments"][0]["children"]) == 2  # Children
+    
+    def test_org_chart_headcount_follows_status(self, agent, setup_basic_data):
+        """Test org chart headcounts track status and department changes."""
+        data = setup_basic_data
+        child = agent.create_department(
+            name="Platform",
+            code="PLT",
+            parent_department_id=data["department"].id,
+            created_by="test"
+        )
+        
+        chart = agent.get_org_chart()
+        eng = chart["departments"][0]
+        assert eng["headcount"] == 1
+        assert eng["children"][0]["headcount"] == 0
+        
+        data["employee"].department_id = child.id
+        chart = agent.get_org_chart()
+        assert chart["departments"][0]["headcount"] == 0
+        assert chart["departments"][0]["children"][0]["headcount"] == 1
+        
+        agent.update_employee_status(data["employee"].id, EmploymentStatus.ON_LEAVE, "test")
+        assert agent._get_department_headcount(child.id) == 0
 
 
 class TestPositions:
@@ -305,6 +334,32 @@ class TestEmployees:
         reports = agent.get_direct_reports(manager.id)
         assert len(reports) == 1
         assert reports[0].id == data["employee"].id
+    
+    def test_employee_indexes(self, agent, setup_basic_data):
+        """Test lookups by number, department and status."""
+        data = setup_basic_data
+        emp = data["employee"]
+        
+        assert agent.get_employee_by_number(emp.employee_number) is emp
+        assert agent.get_employee_by_number("EMP99999") is None
+        
+        assert agent.list_employees(
+            department_id=data["department"].id,
+            status=EmploymentStatus.ACTIVE
+        ) == [emp]
+        assert agent.list_employees(status=EmploymentStatus.TERMINATED) == []
+        
+        with pytest.raises(ValueError):
+            agent.create_employee(
+                first_name="Jane",
+                last_name="Doe",
+                email="JOHN@test.com",
+                position_id=data["position"].id,
+                department_id=data["department"].id,
+                hire_date=date.today(),
+                salary=Decimal("70000"),
+                created_by="test"
+            )
 
 
 # =============================================================================
@@ -401,6 +456,45 @@ class TestLeave:
         
         assert rejected.status == LeaveStatus.REJECTED
         assert "coverage" in rejected.rejection_reason
+    
+    def test_business_days(self, agent):
+        """Test business day count across weekends."""
+        monday = date(2024, 1, 1)
+        
+        assert agent._calculate_business_days(monday, monday) == 1.0
+        assert agent._calculate_business_days(monday, monday + timedelta(days=6)) == 5.0
+        assert agent._calculate_business_days(monday + timedelta(days=5), monday + timedelta(days=6)) == 0.0
+        assert agent._calculate_business_days(monday + timedelta(days=4), monday + timedelta(days=14)) == 7.0
+        assert agent._calculate_business_days(monday, monday - timedelta(days=1)) == 0.0
+    
+    def test_team_calendar(self, agent, setup_basic_data):
+        """Test team calendar returns approved leave overlapping the range."""
+        data = setup_basic_data
+        emp = data["employee"]
+        emp.manager_id = "manager-1"
+        start = date.today() + timedelta(days=30)
+        
+        approved = agent.request_leave(
+            employee_id=emp.id,
+            leave_type=LeaveType.VACATION,
+            start_date=start,
+            end_date=start + timedelta(days=2),
+            created_by=emp.id
+        )
+        agent.approve_leave(approved.id, "manager-1")
+        agent.request_leave(
+            employee_id=emp.id,
+            leave_type=LeaveType.SICK,
+            start_date=start,
+            end_date=start,
+            created_by=emp.id
+        )
+        
+        calendar = agent.get_team_calendar("manager-1", start + timedelta(days=2), start + timedelta(days=10))
+        assert [c["leave_type"] for c in calendar] == ["vacation"]
+        
+        assert agent.get_team_calendar("manager-1", start + timedelta(days=3), start + timedelta(days=10)) == []
+        assert agent.get_team_calendar("manager-2", start, start + timedelta(days=10)) == []
 
 
 # =============================================================================
@@ -845,6 +939,53 @@ class TestPayroll:
         
         assert processed.status == "processed"
         assert processed.processed_at is not None
+    
+    @pytest.mark.parametrize("max_workers,chunk_size", [(1, 2), (2, 1)])
+    def test_run_payroll_matches_single(self, agent, setup_basic_data, max_workers, chunk_size):
+        """Test batch payroll matches per-employee payroll to the cent."""
+        data = setup_basic_data
+        employees = [data["employee"]]
+        for i, salary in enumerate(["52000", "120000.55", "250000"]):
+            emp = agent.create_employee(
+                first_name=f"Worker{i}",
+                last_name="Batch",
+                email=f"worker{i}@test.com",
+                position_id=data["position"].id,
+                department_id=data["department"].id,
+                hire_date=date.today() - timedelta(days=400),
+                salary=Decimal(salary),
+                created_by="test"
+            )
+            agent.update_employee_status(emp.id, EmploymentStatus.ACTIVE, "test")
+            employees.append(emp)
+        employees[2].pay_frequency = PayFrequency.MONTHLY
+        
+        entry = agent.clock_in(employees[1].id, "test")
+        agent.clock_out(employees[1].id)
+        entry.total_hours, entry.overtime_hours = 10.25, 2.25
+        
+        plan = agent.create_benefit_plan(
+            name="Dental",
+            benefit_type=BenefitType.DENTAL,
+            provider="Provider",
+            employee_contribution=Decimal("45.33"),
+            employer_contribution=Decimal("60"),
+            created_by="test"
+        )
+        for emp in employees[:2]:
+            agent.enroll_in_benefit(emp.id, plan.id, "employee_only", date.today())
+        
+        period = (date.today() - timedelta(days=14), date.today(), date.today() + timedelta(days=5))
+        batch = list(agent.run_payroll(*period, max_workers=max_workers, chunk_size=chunk_size))
+        
+        assert [r.employee_id for r in batch] == [e.id for e in employees]
+        for record in batch:
+            single = agent.generate_payroll(record.employee_id, *period)
+            assert record.regular_hours == single.regular_hours
+            assert record.overtime_hours == single.overtime_hours
+            for name in PAYROLL_AMOUNT_FIELDS:
+                assert getattr(record, name) == getattr(single, name)
+            assert record.id in agent.payroll_records
 
 
 # =============================================================================
@@ -910,6 +1051,80 @@ class TestAnalytics:
         assert "quick_stats" in dashboard
 
 
+# =============================================================================
+# DURABLE STORAGE TESTS
+# =============================================================================
+
+class TestDurableStorage:
+    """Test opting into the shared entity repository."""
+    
+    def test_employees_survive_restart(self, tmp_path):
+        """Employees and their indexes are restored from the repository."""
+        db_path = str(tmp_path / "hr.db")
+        repository = EntityRepository(db_path, cache_size=2)
+        agent = HRAgent(repository=repository)
+        
+        dept = agent.create_department(name="Engineering", code="ENG", created_by="test")
+        position = agent.create_position(
+            title="Developer",
+            department_id=dept.id,
+            level="Mid",
+            salary_min=Decimal("60000"),
+            salary_max=Decimal("90000"),
+            created_by="test"
+        )
+        employees = [
+            agent.create_employee(
+                first_name=f"Dev{i}",
+                last_name="Test",
+                email=f"dev{i}@test.com",
+                position_id=position.id,
+                department_id=dept.id,
+                hire_date=date.today(),
+                salary=Decimal("70000"),
+                created_by="test"
+            )
+            for i in range(5)
+        ]
+        # In-place update of an entity that has left the identity map
+        agent.get_employee(employees[0].id).manager_id = employees[1].id
+        repository.close()
+        
+        restarted = HRAgent(repository=EntityRepository(db_path))
+        # Nothing is loaded at startup; queries go through the stored indexes
+        assert len(restarted.employees._identity) == 0
+        
+        assert [e.id for e in restarted.list_employees(department_id=dept.id)] == \
+            [e.id for e in employees]
+        assert restarted.get_employee_by_number(employees[3].employee_number).id == employees[3].id
+        assert [e.id for e in restarted.get_direct_reports(employees[1].id)] == [employees[0].id]
+        
+        # Re-indexing still follows in-place updates after a reload
+        restarted.get_employee(employees[2].id).manager_id = employees[1].id
+        assert len(restarted.get_direct_reports(employees[1].id)) == 2
+        
+        # Departments and positions are not durable; the email check is
+        dept = restarted.create_department(name="Sales", code="SAL", created_by="test")
+        position = restarted.create_position(
+            title="Rep",
+            department_id=dept.id,
+            level="Mid",
+            salary_min=Decimal("50000"),
+            salary_max=Decimal("70000"),
+            created_by="test"
+        )
+        with pytest.raises(ValueError, match="already exists"):
+            restarted.create_employee(
+                first_name="Dup",
+                last_name="Test",
+                email="DEV4@test.com",
+                position_id=position.id,
+                department_id=dept.id,
+                hire_date=date.today(),
+                salary=Decimal("70000"),
+            )
+
+
 # =============================================================================
 # API ENDPOINT TESTS
 # =============================================================================
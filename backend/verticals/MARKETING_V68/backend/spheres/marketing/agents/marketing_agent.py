@@ -12,10 +12,11 @@ Features:
 - AI: Subject optimization, send time, content suggestions
 """
 
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from uuid import uuid4
 import re
 import random
@@ -603,6 +604,194 @@ class MarketingAIEngine:
         return segments
 
 
+# ============================================================================
+# SEGMENT ENGINE
+# ============================================================================
+
+def _status_value(status: Any) -> Any:
+    return status.value if isinstance(status, Enum) else status
+
+
+def compile_segment_predicate(conditions: List[Dict[str, Any]]) -> Callable[[Contact], bool]:
+    """Compile segment conditions into a single-contact membership test"""
+    checks: List[Callable[[Contact], bool]] = []
+    
+    for condition in conditions:
+        field = condition.get("field")
+        operator = condition.get("operator")
+        value = condition.get("value")
+        
+        if field == "tag":
+            if operator == "contains":
+                checks.append(lambda c, v=value: v in c.tags)
+            elif operator == "not_contains":
+                checks.append(lambda c, v=value: v not in c.tags)
+        elif field == "lead_score":
+            if operator == "greater_than":
+                checks.append(lambda c, v=value: c.lead_score > v)
+            elif operator == "less_than":
+                checks.append(lambda c, v=value: c.lead_score < v)
+        elif field == "status":
+            checks.append(lambda c, v=value: _status_value(c.status) == v)
+    
+    return lambda contact: all(check(contact) for check in checks)
+
+
+class SegmentIndex:
+    """
+    Bitmap indexes over contacts for segment evaluation.
+    
+    Every contact gets a dense integer slot; tag and status indexes are
+    Python ints used as bitsets, and lead scores are grouped into one
+    bitmap per distinct score kept in a sorted array. Segment conditions
+    compile to AND / AND-NOT over those bitmaps, so evaluating a segment
+    costs a handful of word-parallel operations instead of a contact scan.
+    
+    Registered segments keep their member bitmap; upsert() re-tests only
+    the changed contact and reports the segments it joined or left.
+    """
+    
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._keys: Dict[int, Tuple[frozenset, Any, Any]] = {}
+        self._all = 0
+        self._by_tag: Dict[str, int] = {}
+        self._by_status: Dict[Any, int] = {}
+        self._by_score: Dict[Any, int] = {}
+        self._score_values: List[Any] = []
+        self._score_prefix: Optional[List[int]] = None
+        self._segments: Dict[str, Tuple[List[Dict[str, Any]], Callable[[Contact], bool], int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    # -- contacts ------------------------------------------------------------
+    
+    def upsert(self, contact: Contact) -> Tuple[List[str], List[str]]:
+        """Index (or re-index) a contact; returns (joined, left) segment IDs"""
+        slot = self._slots.get(contact.id)
+        if slot is None:
+            slot = len(self._ids)
+            self._slots[contact.id] = slot
+            self._ids.append(contact.id)
+            self._all |= 1 << slot
+        
+        keys = (frozenset(contact.tags), _status_value(contact.status), contact.lead_score)
+        old = self._keys.get(slot)
+        if old != keys:
+            if old is not None:
+                self._unset(slot, old)
+            self._set(slot, keys)
+            self._keys[slot] = keys
+        
+        bit = 1 << slot
+        joined, left = [], []
+        for segment_id, (conditions, predicate, members) in self._segments.items():
+            is_member = predicate(contact)
+            if is_member and not members & bit:
+                self._segments[segment_id] = (conditions, predicate, members | bit)
+                joined.append(segment_id)
+            elif not is_member and members & bit:
+                self._segments[segment_id] = (conditions, predicate, members & ~bit)
+                left.append(segment_id)
+        return joined, left
+    
+    def _set(self, slot: int, keys: Tuple[frozenset, Any, Any]) -> None:
+        tags, status, score = keys
+        bit = 1 << slot
+        for tag in tags:
+            self._by_tag[tag] = self._by_tag.get(tag, 0) | bit
+        self._by_status[status] = self._by_status.get(status, 0) | bit
+        if score not in self._by_score:
+            insort(self._score_values, score)
+        self._by_score[score] = self._by_score.get(score, 0) | bit
+        self._score_prefix = None
+    
+    def _unset(self, slot: int, keys: Tuple[frozenset, Any, Any]) -> None:
+        tags, status, score = keys
+        mask = ~(1 << slot)
+        for tag in tags:
+            self._by_tag[tag] &= mask
+        self._by_status[status] &= mask
+        self._by_score[score] &= mask
+        self._score_prefix = None
+        if not self._by_score[score]:
+            del self._by_score[score]
+            self._score_values.pop(bisect_left(self._score_values, score))
+    
+    # -- evaluation ----------------------------------------------------------
+    
+    def evaluate(self, conditions: List[Dict[str, Any]]) -> int:
+        """Bitmap of contacts matching all conditions"""
+        bits = self._all
+        
+        for condition in conditions:
+            field = condition.get("field")
+            operator = condition.get("operator")
+            value = condition.get("value")
+            
+            if field == "tag":
+                if operator == "contains":
+                    bits &= self._by_tag.get(value, 0)
+                elif operator == "not_contains":
+                    bits &= ~self._by_tag.get(value, 0)
+            elif field == "lead_score":
+                if operator == "greater_than":
+                    bits &= ~self._scores_below(bisect_right(self._score_values, value))
+                elif operator == "less_than":
+                    bits &= self._scores_below(bisect_left(self._score_values, value))
+            elif field == "status":
+                bits &= self._by_status.get(value, 0)
+        
+        return bits
+    
+    def _scores_below(self, end: int) -> int:
+        """Contacts whose score is one of the lowest `end` distinct scores"""
+        # Score bitmaps are disjoint, so prefix ORs also answer "above"
+        # queries as the complement; rebuilt lazily after score changes
+        if self._score_prefix is None:
+            prefix = [0]
+            for score in self._score_values:
+                prefix.append(prefix[-1] | self._by_score[score])
+            self._score_prefix = prefix
+        return self._score_prefix[end]
+    
+    def contact_ids(self, bits: int) -> List[str]:
+        """Contact IDs in a bitmap, in slot (creation) order"""
+        ids = []
+        digits = bin(bits)[:1:-1]  # least significant bit first
+        slot = digits.find("1")
+        while slot >= 0:
+            ids.append(self._ids[slot])
+            slot = digits.find("1", slot + 1)
+        return ids
+    
+    @staticmethod
+    def count(bits: int) -> int:
+        return bits.bit_count()
+    
+    # -- segments ------------------------------------------------------------
+    
+    def register_segment(self, segment_id: str, conditions: List[Dict[str, Any]]) -> int:
+        """Evaluate and track a segment; returns its member bitmap"""
+        members = self.evaluate(conditions)
+        self._segments[segment_id] = (
+            [dict(c) for c in conditions], compile_segment_predicate(conditions), members,
+        )
+        return members
+    
+    def tracked_conditions(self, segment_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Conditions a segment was registered with (None if untracked)"""
+        tracked = self._segments.get(segment_id)
+        return tracked[0] if tracked else None
+    
+    def segment_members(self, segment_id: str) -> int:
+        """Member bitmap of a tracked segment"""
+        tracked = self._segments.get(segment_id)
+        return tracked[2] if tracked else 0
+
+
 # ============================================================================
 # MAIN SERVICE
 # ============================================================================
@@ -623,6 +812,7 @@ class MarketingAutomationService:
         self.email_events: List[EmailEvent] = []
         self.ab_tests: Dict[str, ABTest] = {}
         self.ai_engine = MarketingAIEngine()
+        self.segment_index = SegmentIndex()
     
     # ========================================================================
     # CONTACTS
@@ -661,6 +851,7 @@ class MarketingAutomationService:
         )
         
         self.contacts[contact.id] = contact
+        self._index_contact(contact)
         return contact
     
     def get_contact(self, contact_id: str) -> Optional[Contact]:
@@ -682,6 +873,7 @@ class MarketingAutomationService:
                 setattr(contact, key, value)
         
         contact.last_activity = datetime.utcnow()
+        self._index_contact(contact)
         return contact
     
     def add_tags(self, contact_id: str, tags: List[str]) -> Optional[Contact]:
@@ -691,6 +883,7 @@ class MarketingAutomationService:
                 if tag not in contact.tags:
                     contact.tags.append(tag)
             contact.last_activity = datetime.utcnow()
+            self._index_contact(contact)
         return contact
     
     def remove_tags(self, contact_id: str, tags: List[str]) -> Optional[Contact]:
@@ -698,8 +891,26 @@ class MarketingAutomationService:
         if contact:
             contact.tags = [t for t in contact.tags if t not in tags]
             contact.last_activity = datetime.utcnow()
+            self._index_contact(contact)
+        return contact
+    
+    def reindex_contact(self, contact_id: str) -> Optional[Contact]:
+        """Refresh segment indexes after a Contact was edited in place"""
+        contact = self.contacts.get(contact_id)
+        if contact:
+            self._index_contact(contact)
         return contact
     
+    def _index_contact(self, contact: Contact) -> None:
+        joined, left = self.segment_index.upsert(contact)
+        for segment_id in joined:
+            contact.segments.append(segment_id)
+            self.segments[segment_id].contact_count += 1
+        for segment_id in left:
+            if segment_id in contact.segments:
+                contact.segments.remove(segment_id)
+            self.segments[segment_id].contact_count -= 1
+    
     def list_contacts(
         self,
         workspace_id: str = None,
@@ -711,13 +922,14 @@ class MarketingAutomationService:
         offset: int = 0
     ) -> List[Contact]:
         """List contacts with filters"""
-        contacts = list(self.contacts.values())
-        
-        if status:
-            contacts = [c for c in contacts if c.status == status]
-        
-        if tag:
-            contacts = [c for c in contacts if tag in c.tags]
+        if status or tag:
+            bits = self.segment_index.evaluate(
+                ([{"field": "status", "value": _status_value(status)}] if status else []) +
+                ([{"field": "tag", "operator": "contains", "value": tag}] if tag else [])
+            )
+            contacts = [self.contacts[i] for i in self.segment_index.contact_ids(bits)]
+        else:
+            contacts = list(self.contacts.values())
         
         if segment_id:
             contacts = [c for c in contacts if segment_id in c.segments]
@@ -740,6 +952,7 @@ class MarketingAutomationService:
         if contact:
             contact.status = ContactStatus.UNSUBSCRIBED
             contact.last_activity = datetime.utcnow()
+            self._index_contact(contact)
         return contact
     
     # ========================================================================
@@ -764,35 +977,35 @@ class MarketingAutomationService:
             description=description
         )
         
-        # Calculate initial count
-        segment.contact_count = len(self._get_segment_contacts(segment))
+        # Calculate initial membership
+        self._register_segment(segment)
         
         self.segments[segment.id] = segment
         return segment
     
-    def _get_segment_contacts(self, segment: Segment) -> List[Contact]:
-        """Get contacts matching segment conditions"""
-        contacts = list(self.contacts.values())
+    def _register_segment(self, segment: Segment) -> int:
+        """(Re-)evaluate a segment and sync contact.segments / contact_count"""
+        index = self.segment_index
+        old = index.segment_members(segment.id)
+        new = index.register_segment(segment.id, segment.conditions)
         
-        for condition in segment.conditions:
-            field = condition.get("field")
-            operator = condition.get("operator")
-            value = condition.get("value")
-            
-            if field == "tag":
-                if operator == "contains":
-                    contacts = [c for c in contacts if value in c.tags]
-                elif operator == "not_contains":
-                    contacts = [c for c in contacts if value not in c.tags]
-            elif field == "lead_score":
-                if operator == "greater_than":
-                    contacts = [c for c in contacts if c.lead_score > value]
-                elif operator == "less_than":
-                    contacts = [c for c in contacts if c.lead_score < value]
-            elif field == "status":
-                contacts = [c for c in contacts if c.status.value == value]
+        for contact_id in index.contact_ids(old & ~new):
+            self.contacts[contact_id].segments.remove(segment.id)
+        for contact_id in index.contact_ids(new & ~old):
+            self.contacts[contact_id].segments.append(segment.id)
         
-        return contacts
+        segment.contact_count = index.count(new)
+        return new
+    
+    def _get_segment_contacts(self, segment: Segment) -> List[Contact]:
+        """Get contacts matching segment conditions"""
+        if segment.id not in self.segments:
+            members = self.segment_index.evaluate(segment.conditions)
+        elif self.segment_index.tracked_conditions(segment.id) != segment.conditions:
+            members = self._register_segment(segment)
+        else:
+            members = self.segment_index.segment_members(segment.id)
+        return [self.contacts[i] for i in self.segment_index.contact_ids(members)]
     
     def get_segment(self, segment_id: str) -> Optional[Segment]:
         return self.segments.get(segment_id)
@@ -1288,10 +1501,12 @@ class MarketingAutomationService:
                 tags=form.tags_to_add.copy()
             )
             self.contacts[contact.id] = contact
+            self._index_contact(contact)
         elif contact and form.tags_to_add:
             for tag in form.tags_to_add:
                 if tag not in contact.tags:
                     contact.tags.append(tag)
+            self._index_contact(contact)
         
         # Create submission
         submission = FormSubmission(
@@ -237,6 +237,51 @@ class TestSegments:
         
         assert len(segments) == 1
         assert segments[0].id == sample_segment.id
+    
+    def test_segment_membership_updates_incrementally(self, service, workspace_id, user_id, sample_contact):
+        """Test segment membership follows contact changes"""
+        segment = service.create_segment(
+            name="Hot Customers",
+            workspace_id=workspace_id,
+            created_by=user_id,
+            conditions=[
+                {"field": "tag", "operator": "contains", "value": "customer"},
+                {"field": "lead_score", "operator": "greater_than", "value": 50},
+                {"field": "status", "operator": "equals", "value": "active"},
+            ]
+        )
+        assert segment.contact_count == 0
+        
+        service.update_contact(sample_contact.id, {"lead_score": 80}, user_id)
+        assert segment.contact_count == 1
+        assert segment.id in sample_contact.segments
+        assert service.list_contacts(segment_id=segment.id) == [sample_contact]
+        
+        service.remove_tags(sample_contact.id, ["customer"])
+        assert segment.contact_count == 0
+        assert segment.id not in sample_contact.segments
+        
+        service.add_tags(sample_contact.id, ["customer"])
+        service.unsubscribe_contact(sample_contact.id)
+        assert service._get_segment_contacts(segment) == []
+    
+    def test_segment_index_score_ranges(self, service, user_id):
+        """Test lead score conditions over the sorted score index"""
+        for score in [10, 50, 50, 90]:
+            contact = service.create_contact(email=f"s{score}-{uuid4()}@example.com", created_by=user_id)
+            service.update_contact(contact.id, {"lead_score": score}, user_id)
+        
+        index = service.segment_index
+        above = index.evaluate([{"field": "lead_score", "operator": "greater_than", "value": 50}])
+        below = index.evaluate([{"field": "lead_score", "operator": "less_than", "value": 50}])
+        middle = index.evaluate([
+            {"field": "lead_score", "operator": "greater_than", "value": 10},
+            {"field": "lead_score", "operator": "less_than", "value": 90},
+        ])
+        
+        assert [service.contacts[i].lead_score for i in index.contact_ids(above)] == [90]
+        assert [service.contacts[i].lead_score for i in index.contact_ids(below)] == [10]
+        assert index.count(middle) == 2
 
 
 # ============================================================================
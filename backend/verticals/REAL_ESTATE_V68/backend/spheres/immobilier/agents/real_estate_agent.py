@@ -571,7 +571,13 @@ class RealEstateAgent:
     - Document management
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, repository: Optional[Any] = None):
+        """
+        Args:
+            repository: Optional EntityRepository (verticals/shared); when
+                given, properties and leases are stored durably and loaded
+                per user on demand.
+        """
         self.ai_engine = RealEstateAIEngine(api_key)
         self.rbq_service = RBQVerificationService()
         
@@ -583,6 +589,21 @@ class RealEstateAgent:
         self._contractors: Dict[str, Contractor] = {}
         self._payments: Dict[str, Payment] = {}
         self._documents: Dict[str, Document] = {}
+        
+        if repository is not None:
+            self._properties = repository.collection(
+                "real_estate.properties", Property, tenant="user_id"
+            )
+            self._leases = repository.collection(
+                "real_estate.leases", Lease, tenant="user_id"
+            )
+    
+    @staticmethod
+    def _owned_by(store: Dict[str, Any], user_id: str) -> List[Any]:
+        """A user's entities, from a tenant view when the store is durable."""
+        if isinstance(store, dict):
+            return [e for e in store.values() if e.user_id == user_id]
+        return list(store.tenant(user_id).values())
     
     # ═══════════════════════════════════════════════════════════════════════════
     # PROPERTY OPERATIONS
@@ -654,7 +675,7 @@ class RealEstateAgent:
         limit: int = 50,
     ) -> List[Property]:
         """List properties with filters."""
-        properties = [p for p in self._properties.values() if p.user_id == user_id]
+        properties = self._owned_by(self._properties, user_id)
         
         if property_type:
             properties = [p for p in properties if p.property_type == property_type]
@@ -797,7 +818,7 @@ class RealEstateAgent:
         limit: int = 50,
     ) -> List[Lease]:
         """List leases with filters."""
-        leases = [l for l in self._leases.values() if l.user_id == user_id]
+        leases = self._owned_by(self._leases, user_id)
         
         if property_id:
             leases = [l for l in leases if l.property_id == property_id]
@@ -30,7 +30,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Set
 from uuid import UUID, uuid4
 import asyncio
 
@@ -368,6 +368,138 @@ class BestTimeSlot:
     audience_active_percent: Decimal
 
 
+# ============================================================================
+# ANALYTICS ROLLUPS
+# ============================================================================
+
+ENGAGEMENT_FIELDS = ("likes", "comments", "shares", "reach", "impressions")
+
+
+@dataclass
+class DailyRollup:
+    """
+    Pre-aggregated analytics for one user on one day.
+
+    Published posts and their engagement are attributed to the day the
+    post was created (the date `get_posts` filters on); per-platform
+    post counters to the day it was published.
+    """
+    published_posts: int = 0
+    engagement: Dict[Platform, Dict[str, int]] = field(default_factory=dict)
+    platform_posts: Dict[Platform, int] = field(default_factory=dict)
+
+
+class SocialRollupStore:
+    """
+    Incremental analytics store for the dashboard.
+
+    Keeps per-user post indexes by status and daily per-platform
+    counters, updated on every status transition and engagement sync,
+    so dashboards read O(days × platforms) cells instead of rescanning
+    every post. Only the latest engagement per (post, platform) counts,
+    matching `get_post_engagement`.
+    """
+
+    def __init__(self):
+        self.by_status: Dict[str, Dict[PostStatus, Dict[UUID, None]]] = {}
+        self.daily: Dict[str, Dict[date, DailyRollup]] = {}
+        self.latest_engagement: Dict[UUID, Dict[Platform, PostEngagement]] = {}
+
+    def post_ids(self, user_id: str, status: PostStatus) -> List[UUID]:
+        """Ids of a user's posts in a status, in transition order."""
+        return list(self.by_status.get(user_id, {}).get(status, ()))
+
+    def count(self, user_id: str, status: PostStatus) -> int:
+        return len(self.by_status.get(user_id, {}).get(status, ()))
+
+    def transition(self, post: SocialPost, old: Optional[PostStatus]) -> None:
+        """Move a post between status indexes and fold it into the rollups."""
+        statuses = self.by_status.setdefault(post.user_id, {})
+        if old is not None:
+            statuses.get(old, {}).pop(post.id, None)
+        statuses.setdefault(post.status, {})[post.id] = None
+
+        if old == PostStatus.PUBLISHED:
+            self._apply_published(post, -1)
+        if post.status == PostStatus.PUBLISHED:
+            self._apply_published(post, 1)
+
+    def record_engagement(self, post: Optional[SocialPost], engagement: PostEngagement) -> None:
+        """Replace the latest engagement for (post, platform)."""
+        latest = self.latest_engagement.setdefault(engagement.post_id, {})
+        previous = latest.get(engagement.platform)
+        latest[engagement.platform] = engagement
+
+        if post is not None and post.status == PostStatus.PUBLISHED:
+            cell = self._cell(post.user_id, post.created_at.date())
+            if previous is not None:
+                self._apply_engagement(cell, previous, -1)
+            self._apply_engagement(cell, engagement, 1)
+
+    def engagement_totals(
+        self,
+        user_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, int]:
+        """Published post count and engagement sums over a date range."""
+        totals = dict.fromkeys(("published_posts",) + ENGAGEMENT_FIELDS, 0)
+        for day, cell in self._days(user_id, start_date, end_date):
+            totals["published_posts"] += cell.published_posts
+            for sums in cell.engagement.values():
+                for name in ENGAGEMENT_FIELDS:
+                    totals[name] += sums[name]
+        return totals
+
+    def platform_posts(
+        self,
+        user_id: str,
+        start_date: Optional[date] = None
+    ) -> Dict[Platform, int]:
+        """Posts published per platform since `start_date`."""
+        counts = dict.fromkeys(Platform, 0)
+        for _, cell in self._days(user_id, start_date, None):
+            for platform, count in cell.platform_posts.items():
+                counts[platform] += count
+        return counts
+
+    def _days(self, user_id: str, start_date: Optional[date], end_date: Optional[date]):
+        for day, cell in self.daily.get(user_id, {}).items():
+            if start_date and day < start_date:
+                continue
+            if end_date and day > end_date:
+                continue
+            yield day, cell
+
+    def _cell(self, user_id: str, day: date) -> DailyRollup:
+        days = self.daily.setdefault(user_id, {})
+        cell = days.get(day)
+        if cell is None:
+            cell = days[day] = DailyRollup()
+        return cell
+
+    def _apply_published(self, post: SocialPost, sign: int) -> None:
+        cell = self._cell(post.user_id, post.created_at.date())
+        cell.published_posts += sign
+        for engagement in self.latest_engagement.get(post.id, {}).values():
+            self._apply_engagement(cell, engagement, sign)
+
+        if post.published_at:
+            published = self._cell(post.user_id, post.published_at.date())
+            for platform in post.platforms:
+                published.platform_posts[platform] = (
+                    published.platform_posts.get(platform, 0) + sign
+                )
+
+    @staticmethod
+    def _apply_engagement(cell: DailyRollup, engagement: PostEngagement, sign: int) -> None:
+        sums = cell.engagement.get(engagement.platform)
+        if sums is None:
+            sums = cell.engagement[engagement.platform] = dict.fromkeys(ENGAGEMENT_FIELDS, 0)
+        for name in ENGAGEMENT_FIELDS:
+            sums[name] += sign * getattr(engagement, name)
+
+
 # ============================================================================
 # SOCIAL MEDIA AGENT
 # ============================================================================
@@ -382,7 +514,12 @@ class SocialMediaAgent:
     - Draft → Review → Approve → Publish workflow
     """
     
-    def __init__(self):
+    def __init__(self, repository: Optional[Any] = None):
+        """
+        Args:
+            repository: Optional EntityRepository (verticals/shared); when
+                given, posts are stored durably and loaded per user on demand.
+        """
         # In-memory storage (production: database)
         self.accounts: Dict[UUID, SocialAccount] = {}
         self.templates: Dict[UUID, ContentTemplate] = {}
@@ -394,6 +531,18 @@ class SocialMediaAgent:
         self.competitors: Dict[UUID, Competitor] = {}
         self.calendar_entries: Dict[UUID, ContentCalendarEntry] = {}
         
+        # Status indexes and daily analytics rollups
+        self.rollups = SocialRollupStore()
+        
+        # Durable storage: a user's stored posts are folded into the
+        # rollups the first time that user is touched (None: in memory)
+        self._rollup_users: Optional[Set[str]] = None
+        if repository is not None:
+            self.posts = repository.collection(
+                "social.posts", SocialPost, key_type=UUID, tenant="user_id"
+            )
+            self._rollup_users = set()
+        
         # Platform configurations
         self.platform_limits = {
             Platform.TWITTER: {"char_limit": 280, "hashtag_limit": 5, "image_limit": 4},
@@ -622,9 +771,26 @@ class SocialMediaAgent:
             created_by=user_id
         )
         
+        rollups = self._rollups_for(user_id)
         self.posts[post.id] = post
+        rollups.transition(post, None)
         return post
     
+    def _set_post_status(self, post: SocialPost, status: PostStatus) -> None:
+        """Change a post's status, keeping the rollups in sync."""
+        rollups = self._rollups_for(post.user_id)
+        old = post.status
+        post.status = status
+        rollups.transition(post, old)
+    
+    def _rollups_for(self, user_id: str) -> SocialRollupStore:
+        """The rollups, with `user_id`'s stored posts folded in on first use."""
+        if self._rollup_users is not None and user_id not in self._rollup_users:
+            self._rollup_users.add(user_id)
+            for post in self.posts.tenant(user_id).values():
+                self.rollups.transition(post, None)
+        return self.rollups
+    
     async def submit_for_review(
         self,
         post_id: UUID,
@@ -645,7 +811,7 @@ class SocialMediaAgent:
         if post.status != PostStatus.DRAFT:
             raise ValueError(f"Cannot submit post in {post.status.value} status")
         
-        post.status = PostStatus.PENDING_REVIEW
+        self._set_post_status(post, PostStatus.PENDING_REVIEW)
         post.submitted_for_review = datetime.utcnow()
         post.updated_at = datetime.utcnow()
         
@@ -668,14 +834,14 @@ class SocialMediaAgent:
         if post.status != PostStatus.PENDING_REVIEW:
             raise ValueError(f"Cannot approve post in {post.status.value} status")
         
-        post.status = PostStatus.APPROVED
+        self._set_post_status(post, PostStatus.APPROVED)
         post.reviewed_by = reviewer_id
         post.reviewed_at = datetime.utcnow()
         post.updated_at = datetime.utcnow()
         
         # If scheduled, update status
         if post.scheduled_time and post.scheduled_time > datetime.utcnow():
-            post.status = PostStatus.SCHEDULED
+            self._set_post_status(post, PostStatus.SCHEDULED)
         
         return post
     
@@ -697,7 +863,7 @@ class SocialMediaAgent:
         if post.status != PostStatus.PENDING_REVIEW:
             raise ValueError(f"Cannot reject post in {post.status.value} status")
         
-        post.status = PostStatus.REJECTED
+        self._set_post_status(post, PostStatus.REJECTED)
         post.reviewed_by = reviewer_id
         post.reviewed_at = datetime.utcnow()
         post.rejection_reason = reason
@@ -725,7 +891,7 @@ class SocialMediaAgent:
                 "Post must be approved first."
             )
         
-        post.status = PostStatus.PUBLISHING
+        self._set_post_status(post, PostStatus.PUBLISHING)
         post.updated_at = datetime.utcnow()
         
         # Simulate publishing to each platform
@@ -737,17 +903,17 @@ class SocialMediaAgent:
             except Exception as e:
                 post.publish_errors[platform] = str(e)
         
+        post.published_at = datetime.utcnow()
+        post.updated_at = datetime.utcnow()
+        
         # Check results
         if post.publish_errors:
             if len(post.publish_errors) == len(post.platforms):
-                post.status = PostStatus.FAILED
+                self._set_post_status(post, PostStatus.FAILED)
             else:
-                post.status = PostStatus.PUBLISHED  # Partial success
+                self._set_post_status(post, PostStatus.PUBLISHED)  # Partial success
         else:
-            post.status = PostStatus.PUBLISHED
-        
-        post.published_at = datetime.utcnow()
-        post.updated_at = datetime.utcnow()
+            self._set_post_status(post, PostStatus.PUBLISHED)
         
         return post
     
@@ -761,10 +927,10 @@ class SocialMediaAgent:
         end_date: Optional[date] = None
     ) -> List[SocialPost]:
         """Get posts sorted chronologically (newest first) - NO ranking."""
-        posts = [p for p in self.posts.values() if p.user_id == user_id]
-        
         if status:
-            posts = [p for p in posts if p.status == status]
+            posts = self._posts_with_status(user_id, status)
+        else:
+            posts = self._user_posts(user_id)
         
         if platform:
             posts = [p for p in posts if platform in p.platforms]
@@ -783,18 +949,24 @@ class SocialMediaAgent:
     
     async def get_pending_reviews(self, user_id: str) -> List[SocialPost]:
         """Get posts awaiting review - chronological order."""
-        posts = [p for p in self.posts.values() 
-                 if p.user_id == user_id and p.status == PostStatus.PENDING_REVIEW]
+        posts = self._posts_with_status(user_id, PostStatus.PENDING_REVIEW)
         # RULE #5: Chronological (oldest first for review queue)
         return sorted(posts, key=lambda p: p.submitted_for_review or p.created_at)
     
     async def get_scheduled_posts(self, user_id: str) -> List[SocialPost]:
         """Get scheduled posts - chronological by scheduled time."""
-        posts = [p for p in self.posts.values() 
-                 if p.user_id == user_id and p.status == PostStatus.SCHEDULED]
+        posts = self._posts_with_status(user_id, PostStatus.SCHEDULED)
         # RULE #5: Chronological by scheduled time
         return sorted(posts, key=lambda p: p.scheduled_time or datetime.max)
     
+    def _user_posts(self, user_id: str) -> List[SocialPost]:
+        if isinstance(self.posts, dict):
+            return [p for p in self.posts.values() if p.user_id == user_id]
+        return list(self.posts.tenant(user_id).values())
+    
+    def _posts_with_status(self, user_id: str, status: PostStatus) -> List[SocialPost]:
+        return [self.posts[pid] for pid in self._rollups_for(user_id).post_ids(user_id, status)]
+    
     async def revert_to_draft(
         self,
         post_id: UUID,
@@ -811,7 +983,7 @@ class SocialMediaAgent:
         if post.status != PostStatus.REJECTED:
             raise ValueError("Can only revert rejected posts to draft")
         
-        post.status = PostStatus.DRAFT
+        self._set_post_status(post, PostStatus.DRAFT)
         post.rejection_reason = ""
         post.reviewed_by = None
         post.reviewed_at = None
@@ -864,6 +1036,9 @@ class SocialMediaAgent:
         )
         
         self.engagements[engagement.id] = engagement
+        post = self.posts.get(post_id)
+        rollups = self._rollups_for(post.user_id) if post is not None else self.rollups
+        rollups.record_engagement(post, engagement)
         return engagement
     
     async def get_post_engagement(
@@ -871,11 +1046,7 @@ class SocialMediaAgent:
         post_id: UUID
     ) -> Dict[Platform, PostEngagement]:
         """Get engagement for a post across platforms."""
-        result = {}
-        for eng in self.engagements.values():
-            if eng.post_id == post_id:
-                result[eng.platform] = eng
-        return result
+        return dict(self.rollups.latest_engagement.get(post_id, {}))
     
     async def get_engagement_summary(
         self,
@@ -883,28 +1054,13 @@ class SocialMediaAgent:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> Dict[str, Any]:
-        """Get engagement summary across all posts."""
-        posts = await self.get_posts(
-            user_id=user_id,
-            status=PostStatus.PUBLISHED,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        total_likes = 0
-        total_comments = 0
-        total_shares = 0
-        total_reach = 0
-        total_impressions = 0
-        
-        for post in posts:
-            engagements = await self.get_post_engagement(post.id)
-            for eng in engagements.values():
-                total_likes += eng.likes
-                total_comments += eng.comments
-                total_shares += eng.shares
-                total_reach += eng.reach
-                total_impressions += eng.impressions
+        """Get engagement summary across all published posts (from rollups)."""
+        totals = self._rollups_for(user_id).engagement_totals(user_id, start_date, end_date)
+        total_likes = totals["likes"]
+        total_comments = totals["comments"]
+        total_shares = totals["shares"]
+        total_reach = totals["reach"]
+        total_impressions = totals["impressions"]
         
         avg_engagement_rate = Decimal("0")
         if total_reach > 0:
@@ -914,7 +1070,7 @@ class SocialMediaAgent:
             )
         
         return {
-            "total_posts": len(posts),
+            "total_posts": totals["published_posts"],
             "total_likes": total_likes,
             "total_comments": total_comments,
             "total_shares": total_shares,
@@ -1594,36 +1750,26 @@ class SocialMediaAgent:
         """Get comprehensive analytics dashboard."""
         start_date = date.today() - timedelta(days=days)
         
-        # Get engagement summary
-        engagement = await self.get_engagement_summary(
-            user_id=user_id,
-            start_date=start_date
+        # Independent sub-queries run concurrently
+        engagement, accounts, campaigns = await asyncio.gather(
+            self.get_engagement_summary(user_id=user_id, start_date=start_date),
+            self.get_accounts(user_id),  # alphabetical
+            self.get_campaigns(user_id, status=CampaignStatus.ACTIVE),
         )
         
-        # Get accounts - alphabetical
-        accounts = await self.get_accounts(user_id)
-        
-        # Get scheduled posts
-        scheduled = await self.get_scheduled_posts(user_id)
-        
-        # Get pending reviews
-        pending = await self.get_pending_reviews(user_id)
-        
-        # Get active campaigns
-        campaigns = await self.get_campaigns(user_id, status=CampaignStatus.ACTIVE)
+        # Queue sizes come straight from the status indexes
+        rollups = self._rollups_for(user_id)
+        scheduled_count = rollups.count(user_id, PostStatus.SCHEDULED)
+        pending_count = rollups.count(user_id, PostStatus.PENDING_REVIEW)
         
         # Platform breakdown
+        published = rollups.platform_posts(user_id, start_date)
+        connected_platforms = {a.platform for a in accounts}
         platform_stats = {}
         for platform in Platform:
-            posts = [p for p in self.posts.values()
-                    if p.user_id == user_id and
-                    platform in p.platforms and
-                    p.status == PostStatus.PUBLISHED and
-                    p.published_at and p.published_at.date() >= start_date]
-            
             platform_stats[platform.value] = {
-                "posts_count": len(posts),
-                "connected": any(a.platform == platform for a in accounts)
+                "posts_count": published[platform],
+                "connected": platform in connected_platforms
             }
         
         return {
@@ -1635,8 +1781,8 @@ class SocialMediaAgent:
                 "platforms": [a.platform.value for a in accounts]
             },
             "posts": {
-                "scheduled": len(scheduled),
-                "pending_review": len(pending),
+                "scheduled": scheduled_count,
+                "pending_review": pending_count,
                 "published_period": engagement["total_posts"]
             },
             "campaigns": {
@@ -22,7 +22,11 @@ from decimal import Decimal
 from uuid import uuid4
 
 import sys
+from pathlib import Path
 sys.path.insert(0, '/home/claude/SOCIAL_V68')
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))  # verticals/shared
+
+from shared.repository import EntityRepository
 
 from backend.spheres.social.agents.social_agent import (
     SocialMediaAgent,
@@ -940,7 +944,56 @@ class TestAnalytics:
         assert "posts" in dashboard
         assert "campaigns" in dashboard
         assert "platform_breakdown" in dashboard
-    
+
+    @pytest.mark.asyncio
+    async def test_analytics_dashboard_rollups(self, agent, user_id):
+        """Dashboard reads incremental rollups for posts and engagement."""
+        await create_connected_account(agent, user_id)
+
+        published = await create_draft_post(agent, user_id)
+        await agent.submit_for_review(published.id, user_id)
+        await agent.approve_post(published.id, "reviewer")
+
+        # Engagement recorded before publishing is folded in on publish
+        await agent.record_engagement(
+            post_id=published.id,
+            platform=Platform.INSTAGRAM,
+            platform_post_id="ig_1",
+            likes=10,
+            reach=100
+        )
+        await agent.publish_post(published.id, user_id)
+
+        # Only the latest sync per platform counts
+        await agent.record_engagement(
+            post_id=published.id,
+            platform=Platform.INSTAGRAM,
+            platform_post_id="ig_1",
+            likes=40,
+            comments=5,
+            reach=400
+        )
+
+        pending = await create_draft_post(agent, user_id)
+        await agent.submit_for_review(pending.id, user_id)
+        await create_draft_post(agent, user_id)
+
+        dashboard = await agent.get_analytics_dashboard(user_id, days=30)
+
+        assert dashboard["engagement_summary"]["total_posts"] == 1
+        assert dashboard["engagement_summary"]["total_likes"] == 40
+        assert dashboard["engagement_summary"]["total_reach"] == 400
+        assert dashboard["posts"]["pending_review"] == 1
+        assert dashboard["posts"]["published_period"] == 1
+        assert dashboard["platform_breakdown"]["instagram"] == {
+            "posts_count": 1, "connected": True
+        }
+        assert dashboard["platform_breakdown"]["facebook"]["posts_count"] == 1
+        assert dashboard["platform_breakdown"]["twitter"]["posts_count"] == 0
+
+        drafts = await agent.get_posts(user_id, status=PostStatus.DRAFT)
+        assert len(drafts) == 1
+
     @pytest.mark.asyncio
     async def test_health_check(self, agent):
         """Test health check."""
@@ -951,6 +1004,43 @@ class TestAnalytics:
         assert health["version"] == "V68"
 
 
+# ============================================================================
+# DURABLE STORAGE TESTS
+# ============================================================================
+
+class TestDurableStorage:
+    """Test opting into the shared entity repository."""
+
+    @pytest.mark.asyncio
+    async def test_posts_survive_restart(self, user_id, tmp_path):
+        """Rollups are rebuilt per user on first use, not at startup."""
+        db_path = str(tmp_path / "social.db")
+        repository = EntityRepository(db_path)
+        agent = SocialMediaAgent(repository=repository)
+
+        published = await create_draft_post(agent, user_id)
+        await agent.submit_for_review(published.id, user_id)
+        await agent.approve_post(published.id, "reviewer")
+        await agent.publish_post(published.id, user_id)
+        pending = await create_draft_post(agent, user_id)
+        await agent.submit_for_review(pending.id, user_id)
+        await create_draft_post(agent, "other_user")
+        repository.close()
+
+        restarted = SocialMediaAgent(repository=EntityRepository(db_path))
+        assert len(restarted.posts._identity) == 0
+
+        dashboard = await restarted.get_analytics_dashboard(user_id, days=30)
+        assert dashboard["posts"]["pending_review"] == 1
+        assert dashboard["posts"]["published_period"] == 1
+        assert restarted._rollup_users == {user_id}
+
+        # Transitions after the reload keep the rollups consistent
+        await restarted.approve_post(pending.id, "reviewer")
+        reviews = await restarted.get_pending_reviews(user_id)
+        assert reviews == []
+
+
 # ============================================================================
 # API ENDPOINT TESTS
 # ============================================================================
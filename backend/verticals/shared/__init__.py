@@ -0,0 +1,9 @@
+"""CHE·NU™ V68 - Shared infrastructure for vertical agents"""
+from .repository import (
+    EntityRepository,
+    Collection,
+    TenantView,
+    TenantPartitions,
+)
+
+__all__ = ["EntityRepository", "Collection", "TenantView", "TenantPartitions"]
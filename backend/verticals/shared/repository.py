@@ -0,0 +1,1008 @@
+"""
+CHE·NU™ V68 - Shared Entity Repository
+Durable, indexed storage that vertical agents can opt into
+
+Agents keep their domain state in plain dicts by default. Passing an
+EntityRepository swaps those dicts for dict-compatible collections
+backed by SQLite, so state survives restarts, workers can share one
+database and cold tenants stop occupying RAM:
+
+- Rows live in one `entities` table as JSON (dataclass fields, decoded
+  against the entity type's annotations); declared secondary indexes
+  live in `entity_index`, maintained on every write
+- Hot entities sit in a bounded, per-collection identity map (LRU)
+- Writes are buffered and flushed in batches (write-behind): assigned
+  and deleted keys are tracked explicitly, and entities handed out
+  since the last flush are compared with their stored JSON, so only
+  what changed is written
+- Entities evicted while a caller still holds them stay tracked (weakly),
+  so writes made through such references are not lost
+- Reads never flush: counts, queries and iteration merge pending
+  changes over the stored rows
+- Rows written during a call are committed before it returns, and a
+  timer flushes buffered changes `flush_interval` seconds after they
+  were made, so an idle worker never holds the SQLite write lock
+- Rows carry a version: a cached entity that another worker rewrote is
+  refreshed in place on its next read, unless it has local changes
+  (then the last write wins)
+- Tenant views lazy-load one tenant's entities on demand
+
+Usage:
+    repository = EntityRepository("hr.db")
+    agent = HRAgent(repository=repository)
+    ...
+    repository.close()   # flushes pending writes
+"""
+
+from collections import OrderedDict
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache, partial
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional,
+    Sequence, Set, Tuple, Union, get_args, get_origin, get_type_hints,
+)
+from uuid import UUID
+import json
+import sqlite3
+import threading
+import time as clock
+import weakref
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    tenant TEXT,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    UNIQUE (collection, key)
+);
+CREATE INDEX IF NOT EXISTS entities_by_tenant ON entities (collection, tenant, seq);
+CREATE TABLE IF NOT EXISTS entity_index (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS entity_index_lookup ON entity_index (collection, field, value);
+CREATE INDEX IF NOT EXISTS entity_index_by_key ON entity_index (collection, key);
+"""
+
+_MISSING = object()
+
+# SQLite's default limit on bound parameters is 999
+_KEY_CHUNK = 500
+# Assigned and fetched entities are written (if changed) into the open
+# transaction in groups this size, which keeps the in-memory overlay that
+# reads merge over the stored rows small
+_STAGE_SIZE = 64
+
+
+def index_value(value: Any) -> Optional[str]:
+    """Normalize an attribute value for storage in an index."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+# ============================================================================
+# JSON CODEC
+# ============================================================================
+
+def encode_entity(entity: Any) -> str:
+    """Serialize a dataclass entity to JSON."""
+    return json.dumps(_to_json(entity), separators=(",", ":"))
+
+
+def decode_entity(entity_type: type, data: Any) -> Any:
+    """
+    Rebuild a dataclass entity from its JSON (text or parsed dict).
+
+    Fields are decoded against the type's annotations and set without
+    calling __init__/__post_init__, so generated ids and timestamps are
+    not regenerated. Fields missing from older rows take their default.
+    Values under `Any` annotations come back as plain JSON values.
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+    hints = _type_hints(entity_type)
+    entity = entity_type.__new__(entity_type)
+    for f in fields(entity_type):
+        if f.name in data:
+            value = _from_json(data[f.name], hints.get(f.name, Any))
+        elif f.default is not MISSING:
+            value = f.default
+        elif f.default_factory is not MISSING:
+            value = f.default_factory()
+        else:
+            raise ValueError(f"Stored {entity_type.__name__} lacks field {f.name!r}")
+        object.__setattr__(entity, f.name, value)
+    return entity
+
+
+@lru_cache(maxsize=None)
+def _type_hints(entity_type: type) -> Dict[str, Any]:
+    return get_type_hints(entity_type)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return _to_json(value.value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_json(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, dict):
+        return {index_value(k): _to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_json(v) for v in value]
+    raise TypeError(f"Cannot store {type(value).__name__} values")
+
+
+def _from_json(value: Any, hint: Any) -> Any:
+    if value is None or hint is Any:
+        return value
+
+    origin, args = get_origin(hint), get_args(hint)
+    if origin is Union:
+        for option in args:
+            if option is type(None):
+                continue
+            try:
+                return _from_json(value, option)
+            except (TypeError, ValueError):
+                continue
+        return value
+    if origin in (list, set, frozenset):
+        item = args[0] if args else Any
+        return origin(_from_json(v, item) for v in value)
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(_from_json(v, args[0]) for v in value)
+        if args:
+            return tuple(_from_json(v, a) for v, a in zip(value, args))
+        return tuple(value)
+    if origin is dict:
+        key_hint, value_hint = args or (Any, Any)
+        return {
+            _from_json_key(k, key_hint): _from_json(v, value_hint)
+            for k, v in value.items()
+        }
+
+    if not isinstance(hint, type):
+        return value
+    if issubclass(hint, Enum):
+        return hint(value)
+    if is_dataclass(hint):
+        return decode_entity(hint, value)
+    if issubclass(hint, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(hint, date):
+        return date.fromisoformat(value)
+    if issubclass(hint, time):
+        return time.fromisoformat(value)
+    if hint in (Decimal, UUID, float):
+        return hint(value)
+    return value
+
+
+def _from_json_key(key: str, hint: Any) -> Any:
+    """JSON object keys are strings; convert them back to the key type."""
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        for member in hint:
+            if index_value(member) == key:
+                return member
+        raise ValueError(f"{key!r} is not a valid {hint.__name__}")
+    if hint in (int, float):
+        return hint(key)
+    return _from_json(key, hint)
+
+
+# ============================================================================
+# REPOSITORY
+# ============================================================================
+
+class EntityRepository:
+    """
+    SQLite-backed store shared by the collections of one or more agents.
+
+    All collections share a single connection. Assigned and changed
+    entities are buffered and written by `flush()`, which runs once
+    `batch_size` writes are pending or, from a timer, `flush_interval`
+    seconds after the first buffered change; rows written in between
+    (staged batches, evicted entities) are committed when the call that
+    wrote them returns.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        cache_size: int = 10_000,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+        self._lock = _CommitLock(self)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._collections: Dict[str, "Collection"] = {}
+        self._last_flush = clock.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def collection(
+        self,
+        name: str,
+        entity_type: type,
+        key_type: Callable[[str], Any] = str,
+        key_attr: str = "id",
+        tenant: Optional[str] = None,
+        indexes: Sequence[str] = (),
+        on_load: Optional[Callable[[Any], None]] = None,
+        cache_size: Optional[int] = None,
+    ) -> "Collection":
+        """
+        Open (or return) a named collection.
+
+        Args:
+            entity_type: Dataclass stored in the collection
+            key_type: Converts stored keys back to the agent's key type (e.g. UUID)
+            key_attr: Entity attribute holding its key
+            tenant: Entity attribute that partitions the collection
+            indexes: Entity attributes (or properties) to maintain secondary indexes on
+            on_load: Called with every entity materialized from storage
+        """
+        if not (isinstance(entity_type, type) and is_dataclass(entity_type)):
+            raise TypeError(f"Collection {name} needs a dataclass entity type")
+        with self._lock:
+            if name not in self._collections:
+                self._collections[name] = Collection(
+                    self, name, entity_type, key_type, key_attr, tenant,
+                    tuple(indexes), on_load, cache_size or self.cache_size,
+                )
+            return self._collections[name]
+
+    def flush(self) -> None:
+        """Write pending and changed entities, then commit."""
+        with self._lock:
+            for collection in self._collections.values():
+                collection._write_pending()
+            self._conn.commit()
+            self._last_flush = clock.monotonic()
+
+    def close(self) -> None:
+        """Write every changed entity, including ones held across flushes, and close."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            for collection in self._collections.values():
+                collection._write_pending(final=True)
+            self._conn.commit()
+            self._conn.close()
+            self._closed = True
+
+    def _maybe_flush(self) -> None:
+        pending = sum(c._pending_count() for c in self._collections.values())
+        if (pending >= self.batch_size
+                or clock.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def _released(self) -> None:
+        """Outermost lock release: commit written rows, schedule buffered ones."""
+        if self._closed:
+            return
+        if self._conn.in_transaction:
+            self._conn.commit()
+        if self._timer is None and any(c._buffered() for c in self._collections.values()):
+            self._timer = threading.Timer(self.flush_interval, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self) -> None:
+        with self._lock:
+            self._timer = None
+            if not self._closed:
+                self.flush()
+
+
+class _CommitLock:
+    """
+    Reentrant repository lock that commits when its outermost holder
+    releases it, so no write transaction outlives the call that opened it.
+    """
+
+    def __init__(self, repository: EntityRepository):
+        self._repository = repository
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    def __enter__(self) -> "_CommitLock":
+        self._lock.acquire()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            self._depth -= 1
+            if self._depth == 0:
+                self._repository._released()
+        finally:
+            self._lock.release()
+
+
+class _Detached:
+    """An entity evicted from the identity map while possibly still referenced."""
+
+    __slots__ = ("ref", "state", "snapshot")
+
+    def __init__(self, ref: "weakref.ref", state: Dict[str, Any], snapshot: str):
+        self.ref = ref
+        self.state = state          # the entity's __dict__, shared with it
+        self.snapshot = snapshot    # JSON as last written
+
+
+class Collection(MutableMapping):
+    """
+    Dict-compatible view of one entity type, backed by the repository.
+
+    Iteration follows first-insertion order, like a dict. Entities handed
+    out stay identical (`is`) for as long as they are referenced; mutate
+    them in place and the change is persisted by the next flush (for
+    entities fetched since the previous write-out), when they leave the
+    identity map, or when the last reference to an evicted one is
+    dropped. Assigning `collection[key] = entity` marks it explicitly.
+    """
+
+    def __init__(
+        self,
+        repository: EntityRepository,
+        name: str,
+        entity_type: type,
+        key_type: Callable[[str], Any],
+        key_attr: str,
+        tenant: Optional[str],
+        indexes: Tuple[str, ...],
+        on_load: Optional[Callable[[Any], None]],
+        cache_size: int,
+    ):
+        self.repository = repository
+        self.name = name
+        self.entity_type = entity_type
+        self.key_type = key_type
+        self.key_attr = key_attr
+        self.tenant_attr = tenant
+        self.indexes = indexes
+        self.on_load = on_load
+        self.cache_size = max(1, cache_size)
+
+        # key -> (entity, JSON as last written/read; None if never stored)
+        self._identity: "OrderedDict[str, Tuple[Any, Optional[str]]]" = OrderedDict()
+        self._dirty: Dict[str, None] = {}       # assigned since the last stage
+        self._touched: Set[str] = set()         # handed out since the last stage
+        self._deleted: Dict[str, None] = {}
+        self._detached: Dict[str, _Detached] = {}
+        # Evicted entities released with unwritten changes: key -> (entity, snapshot)
+        self._orphans: Dict[str, Tuple[Any, str]] = {}
+        # key -> stored (seq, tenant), None if no row; dropped when the row is written
+        self._row_cache: Dict[str, Optional[Tuple[int, Optional[str]]]] = {}
+        # key -> version of the stored row an identity-map entry was read or written as
+        self._versions: Dict[str, int] = {}
+        self._staged = 0  # rows written since the last commit
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        return self.repository._conn
+
+    # ------------------------------------------------------------------
+    # Mapping protocol
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: Any) -> Any:
+        entity = self.get(key, _MISSING)
+        if entity is _MISSING:
+            raise KeyError(key)
+        return entity
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        skey = str(key)
+        with self.repository._lock:
+            entity = self._cached(skey)
+            if entity is not None:
+                return entity
+            if skey in self._deleted:
+                return default
+            row = self._conn.execute(
+                "SELECT data, version FROM entities WHERE collection = ? AND key = ?",
+                (self.name, skey),
+            ).fetchone()
+            if row is None:
+                return default
+            return self._materialize(skey, *row)
+
+    def __setitem__(self, key: Any, entity: Any) -> None:
+        skey = str(key)
+        with self.repository._lock:
+            cached = self._identity.get(skey)
+            # A new object for the key supersedes any evicted one
+            self._detached.pop(skey, None)
+            self._orphans.pop(skey, None)
+            self._identity[skey] = (entity, cached[1] if cached else None)
+            self._identity.move_to_end(skey)
+            self._dirty[skey] = None
+            self._evict()
+            if len(self._dirty) + len(self._touched) >= _STAGE_SIZE:
+                self._stage()
+            self.repository._maybe_flush()
+
+    def __delitem__(self, key: Any) -> None:
+        skey = str(key)
+        with self.repository._lock:
+            if skey not in self:
+                raise KeyError(key)
+            self._identity.pop(skey, None)
+            self._dirty.pop(skey, None)
+            self._touched.discard(skey)
+            self._detached.pop(skey, None)
+            self._orphans.pop(skey, None)
+            self._deleted[skey] = None
+            self.repository._maybe_flush()
+
+    def __contains__(self, key: Any) -> bool:
+        skey = str(key)
+        with self.repository._lock:
+            if skey in self._identity or skey in self._orphans:
+                return True
+            if skey in self._deleted:
+                return False
+            if skey in self._detached:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM entities WHERE collection = ? AND key = ?",
+                (self.name, skey),
+            ).fetchone()
+            return row is not None
+
+    def __iter__(self) -> Iterator[Any]:
+        for skey, _ in self._scan(load=False):
+            yield self.key_type(skey)
+
+    def __len__(self) -> int:
+        return self._count()
+
+    def values(self) -> Iterator[Any]:  # type: ignore[override]
+        """Stream every entity, oldest first."""
+        for _, entity in self._scan():
+            yield entity
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:  # type: ignore[override]
+        for skey, entity in self._scan():
+            yield self.key_type(skey), entity
+
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find(self, tenant: Any = None, **criteria: Any) -> List[Any]:
+        """Entities matching every indexed attribute in `criteria`, oldest first."""
+        unknown = set(criteria) - set(self.indexes)
+        if unknown:
+            raise ValueError(f"Not indexed in {self.name}: {', '.join(sorted(unknown))}")
+        return [entity for _, entity in self._scan(tenant, criteria)]
+
+    def tenant(self, tenant: Any) -> "TenantView":
+        """Dict-compatible view of one tenant's entities."""
+        if self.tenant_attr is None:
+            raise ValueError(f"Collection {self.name} is not partitioned by tenant")
+        return TenantView(self, tenant)
+
+    def by_tenant(self) -> "TenantPartitions":
+        """Mapping of tenant -> TenantView, a drop-in for Dict[tenant, Dict[key, entity]]."""
+        return TenantPartitions(self)
+
+    def evict(self) -> None:
+        """Write changed entities and drop the whole identity map."""
+        with self.repository._lock:
+            while self._identity:
+                self._evict_oldest()
+
+    # ------------------------------------------------------------------
+    # Reads: stored rows with pending changes merged over them
+    # ------------------------------------------------------------------
+
+    def _overlay(self) -> Dict[str, Any]:
+        """Entities whose in-memory state may differ from their stored row."""
+        overlay = {skey: self._identity[skey][0] for skey in self._dirty}
+        for skey in self._touched:
+            overlay.setdefault(skey, self._identity[skey][0])
+        for skey, (entity, _) in list(self._orphans.items()):
+            overlay[skey] = entity
+        return overlay
+
+    def _matcher(self, tenant: Any, criteria: Dict[str, Any]) -> Callable[[Any], bool]:
+        """In-memory equivalent of the SQL filter for `tenant` and `criteria`."""
+        tenant_attr, wanted_tenant = self.tenant_attr, index_value(tenant)
+        wanted = [(field_name, index_value(value)) for field_name, value in criteria.items()]
+        index_values = self._index_values
+
+        def matches(entity: Any) -> bool:
+            if tenant is not None and index_value(getattr(entity, tenant_attr)) != wanted_tenant:
+                return False
+            for field_name, value in wanted:
+                if value not in index_values(getattr(entity, field_name, None)):
+                    return False
+            return True
+        return matches
+
+    def _stored(self, skeys: Sequence[str]) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Stored (seq, tenant) of the keys that have a row."""
+        known = self._row_cache
+        missing = [skey for skey in skeys if skey not in known]
+        for start in range(0, len(missing), _KEY_CHUNK):
+            chunk = missing[start:start + _KEY_CHUNK]
+            known.update(dict.fromkeys(chunk))
+            rows = self._conn.execute(
+                "SELECT key, seq, tenant FROM entities WHERE collection = ?"
+                f" AND key IN ({', '.join('?' * len(chunk))})",
+                (self.name, *chunk),
+            )
+            known.update((skey, (seq, tenant)) for skey, seq, tenant in rows)
+        return {skey: known[skey] for skey in skeys if known.get(skey) is not None}
+
+    def _count(self, tenant: Any = None) -> int:
+        with self.repository._lock:
+            if tenant is None:
+                total = self._conn.execute(
+                    "SELECT COUNT(*) FROM entities WHERE collection = ?", (self.name,)
+                ).fetchone()[0]
+            else:
+                total = self._conn.execute(
+                    "SELECT COUNT(*) FROM entities WHERE collection = ? AND tenant = ?",
+                    (self.name, index_value(tenant)),
+                ).fetchone()[0]
+
+            overlay = self._overlay()
+            if not overlay and not self._deleted:
+                return total
+            # Stored rows the overlay replaces or deletes, then the overlay itself
+            wanted = index_value(tenant)
+            for _, stored_tenant in self._stored([*overlay, *self._deleted]).values():
+                if tenant is None or stored_tenant == wanted:
+                    total -= 1
+            if tenant is None:
+                return total + len(overlay)
+            matches = self._matcher(tenant, {})
+            return total + sum(1 for entity in overlay.values() if matches(entity))
+
+    def _scan(
+        self,
+        tenant: Any = None,
+        criteria: Optional[Dict[str, Any]] = None,
+        load: bool = True,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (key, entity) pairs matching `tenant` and `criteria` in seq order.
+
+        Stored rows come from SQL; keys with pending changes are matched
+        in memory instead and merged in at their stored position (new
+        keys last, in assignment order). With `load=False` entities are
+        not materialized and None is yielded in their place.
+        """
+        criteria = criteria or {}
+        where = ["e.collection = ?"]
+        params: List[Any] = [self.name]
+        if tenant is not None:
+            where.append("e.tenant = ?")
+            params.append(index_value(tenant))
+        for field_name, value in criteria.items():
+            where.append(
+                "e.key IN (SELECT key FROM entity_index"
+                " WHERE collection = ? AND field = ? AND value IS ?)"
+            )
+            params.extend((self.name, field_name, index_value(value)))
+        columns = "e.key, e.seq, e.data, e.version" if load else "e.key, e.seq, NULL, NULL"
+
+        with self.repository._lock:
+            overlay = self._overlay()
+            replaced = set(overlay) | set(self._deleted)
+            matches = self._matcher(tenant, criteria)
+            pending = [skey for skey, entity in overlay.items() if matches(entity)]
+            seqs = {
+                skey: seq for skey, (seq, _) in
+                self._stored([k for k in pending if k not in self._deleted]).items()
+            }
+            last = float("inf")
+            pending.sort(key=lambda skey: seqs.get(skey, last))
+            cursor = self._conn.execute(
+                f"SELECT {columns} FROM entities e WHERE {' AND '.join(where)}"
+                " ORDER BY e.seq",
+                params,
+            )
+
+        position = 0
+        while True:
+            with self.repository._lock:
+                rows = cursor.fetchmany(256)
+            if not rows:
+                break
+            for skey, seq, data, version in rows:
+                if skey in replaced:
+                    continue
+                while position < len(pending) and seqs.get(pending[position], last) < seq:
+                    yield from self._pending_entry(pending[position], load)
+                    position += 1
+                yield skey, self._resolve(skey, data, version) if load else None
+        for skey in pending[position:]:
+            yield from self._pending_entry(skey, load)
+
+    def _pending_entry(self, skey: str, load: bool) -> Iterator[Tuple[str, Any]]:
+        if not load:
+            yield skey, None
+            return
+        entity = self.get(skey, _MISSING)
+        if entity is not _MISSING:  # not deleted while iterating
+            yield skey, entity
+
+    # ------------------------------------------------------------------
+    # Identity map
+    # ------------------------------------------------------------------
+
+    def _cached(self, skey: str, stored: Any = _MISSING) -> Optional[Any]:
+        """
+        Entity for `skey` still held in memory (mapped, detached or orphaned),
+        reconciled with its stored row; `stored` is that row's (data, version)
+        when the caller already read it.
+        """
+        cached = self._identity.get(skey)
+        if cached is not None:
+            self._identity.move_to_end(skey)
+            self._touched.add(skey)
+            return cached[0] if self._reconcile(skey, stored) else None
+
+        entity = None
+        entry = self._detached.get(skey)
+        if entry is not None:
+            entity = entry.ref()
+            if entity is None:
+                # Released, callback not run yet: keep its changes as an orphan
+                self._release(skey, entry.ref)
+            else:
+                del self._detached[skey]
+                snapshot = entry.snapshot
+        if entity is None:
+            if skey not in self._orphans:
+                return None
+            entity, snapshot = self._orphans.pop(skey)
+        self._identity[skey] = (entity, snapshot)
+        self._touched.add(skey)
+        if not self._reconcile(skey, stored):
+            return None
+        self._evict()
+        return entity
+
+    def _reconcile(self, skey: str, stored: Any = _MISSING) -> bool:
+        """
+        Refresh a mapped entity in place if another connection rewrote its
+        row since this one read or wrote it; False if the row was deleted.
+
+        Assigned entities and entities mutated since their snapshot keep
+        their local state (their next write replaces the row).
+        """
+        if skey in self._dirty:
+            return True
+        version = self._versions.get(skey)
+        if stored is _MISSING:
+            if version is not None:
+                row = self._conn.execute(
+                    "SELECT version FROM entities WHERE collection = ? AND key = ?",
+                    (self.name, skey),
+                ).fetchone()
+                if row is not None and row[0] == version:
+                    return True
+            stored = self._conn.execute(
+                "SELECT data, version FROM entities WHERE collection = ? AND key = ?",
+                (self.name, skey),
+            ).fetchone()
+        elif stored[1] == version:
+            return True
+
+        entity, snapshot = self._identity[skey]
+        if stored is not None and stored[0] == snapshot:
+            self._versions[skey] = stored[1]
+            return True
+        if encode_entity(entity) != snapshot:
+            return True
+        if stored is None:
+            del self._identity[skey]
+            self._touched.discard(skey)
+            self._versions.pop(skey, None)
+            return False
+
+        data, self._versions[skey] = stored
+        fresh = decode_entity(self.entity_type, data)
+        for f in fields(self.entity_type):
+            object.__setattr__(entity, f.name, getattr(fresh, f.name))
+        if self.on_load is not None:
+            self.on_load(entity)
+        self._identity[skey] = (entity, data)
+        self._row_cache.pop(skey, None)
+        return True
+
+    def _resolve(self, skey: str, data: str, version: int) -> Any:
+        with self.repository._lock:
+            entity = self._cached(skey, (data, version))
+            if entity is not None:
+                return entity
+            return self._materialize(skey, data, version)
+
+    def _materialize(self, skey: str, data: str, version: int) -> Any:
+        entity = decode_entity(self.entity_type, data)
+        if self.on_load is not None:
+            self.on_load(entity)
+        self._identity[skey] = (entity, data)
+        self._versions[skey] = version
+        self._touched.add(skey)
+        self._evict()
+        return entity
+
+    def _evict(self) -> None:
+        while len(self._identity) > self.cache_size:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        skey, (entity, snapshot) = self._identity.popitem(last=False)
+        data = encode_entity(entity)
+        if skey in self._dirty or data != snapshot:
+            self._write(skey, entity, data)
+        self._dirty.pop(skey, None)
+        self._touched.discard(skey)
+        self._versions.pop(skey, None)
+
+        # Keep tracking it while callers hold it; its __dict__ outlives it
+        state = getattr(entity, "__dict__", None)
+        if state is None:
+            return
+        try:
+            ref = weakref.ref(entity, partial(self._release, skey))
+        except TypeError:
+            return
+        self._detached[skey] = _Detached(ref, state, data)
+
+    def _release(self, skey: str, ref: "weakref.ref") -> None:
+        """Last reference to an evicted entity dropped: keep unwritten changes."""
+        with self.repository._lock:
+            entry = self._detached.get(skey)
+            if entry is None or entry.ref is not ref:
+                return
+            del self._detached[skey]
+            entity = self.entity_type.__new__(self.entity_type)
+            entity.__dict__.update(entry.state)
+            if encode_entity(entity) != entry.snapshot:
+                if self.on_load is not None:
+                    self.on_load(entity)
+                self._orphans[skey] = (entity, entry.snapshot)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _pending_count(self) -> int:
+        return len(self._dirty) + len(self._deleted) + len(self._orphans) + self._staged
+
+    def _buffered(self) -> bool:
+        """Changes (possibly) held in memory that only a flush writes."""
+        return bool(self._dirty or self._touched or self._deleted or self._orphans)
+
+    def _stage(self, final: bool = False) -> None:
+        """
+        Write assigned and changed entities into the open transaction;
+        the next flush commits them.
+
+        Only entities fetched since the last stage are compared with their
+        stored JSON; `final` compares everything in the identity map.
+        """
+        for skey in self._dirty:
+            entity = self._identity[skey][0]
+            data = encode_entity(entity)
+            self._write(skey, entity, data)
+            self._identity[skey] = (entity, data)
+        self._staged += len(self._dirty)
+
+        for skey in list(self._identity if final else self._touched):
+            if skey in self._dirty:
+                continue
+            entity, snapshot = self._identity[skey]
+            data = encode_entity(entity)
+            if data != snapshot:
+                self._write(skey, entity, data)
+                self._identity[skey] = (entity, data)
+                self._staged += 1
+        self._dirty.clear()
+        self._touched.clear()
+
+    def _write_pending(self, final: bool = False) -> None:
+        """Write deletions, assigned and changed entities (`final`: all still referenced)."""
+        for skey in list(self._deleted):
+            if skey not in self._dirty:  # re-added keys are rewritten below
+                self._delete_row(skey)
+                del self._deleted[skey]
+
+        self._stage(final)
+        self._staged = 0
+
+        for skey, (entity, _) in list(self._orphans.items()):
+            self._write(skey, entity, encode_entity(entity))
+        self._orphans.clear()
+
+        if final:
+            for skey, entry in list(self._detached.items()):
+                entity = entry.ref()
+                if entity is None:
+                    continue
+                data = encode_entity(entity)
+                if data != entry.snapshot:
+                    self._write(skey, entity, data)
+                    entry.snapshot = data
+
+    def _write(self, skey: str, entity: Any, data: str) -> None:
+        self._row_cache.pop(skey, None)
+        if skey in self._deleted:
+            # Deleted then re-added: drop the old row so the key moves to the end
+            self._delete_row(skey)
+            del self._deleted[skey]
+        tenant = index_value(getattr(entity, self.tenant_attr)) if self.tenant_attr else None
+        version = self._conn.execute(
+            "INSERT INTO entities (collection, key, tenant, data) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (collection, key) DO UPDATE"
+            " SET tenant = excluded.tenant, data = excluded.data, version = version + 1"
+            " RETURNING version",
+            (self.name, skey, tenant, data),
+        ).fetchone()[0]
+        if skey in self._identity:
+            self._versions[skey] = version
+        if not self.indexes:
+            return
+        self._conn.execute(
+            "DELETE FROM entity_index WHERE collection = ? AND key = ?", (self.name, skey)
+        )
+        self._conn.executemany(
+            "INSERT INTO entity_index (collection, key, field, value) VALUES (?, ?, ?, ?)",
+            [(self.name, skey, field_name, value)
+             for field_name in self.indexes
+             for value in self._index_values(getattr(entity, field_name, None))],
+        )
+
+    def _delete_row(self, skey: str) -> None:
+        self._row_cache.pop(skey, None)
+        self._versions.pop(skey, None)
+        self._conn.execute(
+            "DELETE FROM entities WHERE collection = ? AND key = ?", (self.name, skey)
+        )
+        self._conn.execute(
+            "DELETE FROM entity_index WHERE collection = ? AND key = ?", (self.name, skey)
+        )
+
+    @staticmethod
+    def _index_values(value: Any) -> Iterable[Optional[str]]:
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [index_value(v) for v in value]
+        return [index_value(value)]
+
+
+class TenantView(MutableMapping):
+    """One tenant's slice of a collection; loads its entities on demand."""
+
+    def __init__(self, collection: Collection, tenant: Any):
+        self.collection = collection
+        self.tenant = tenant
+
+    def _owns(self, entity: Any) -> bool:
+        return getattr(entity, self.collection.tenant_attr) == self.tenant
+
+    def __getitem__(self, key: Any) -> Any:
+        entity = self.collection.get(key, _MISSING)
+        if entity is _MISSING or not self._owns(entity):
+            raise KeyError(key)
+        return entity
+
+    def __setitem__(self, key: Any, entity: Any) -> None:
+        if not self._owns(entity):
+            raise ValueError(
+                f"Entity belongs to {self.collection.tenant_attr}="
+                f"{getattr(entity, self.collection.tenant_attr)!r}, not {self.tenant!r}"
+            )
+        self.collection[key] = entity
+
+    def __delitem__(self, key: Any) -> None:
+        self[key]
+        del self.collection[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        for skey, _ in self.collection._scan(self.tenant, load=False):
+            yield self.collection.key_type(skey)
+
+    def __len__(self) -> int:
+        return self.collection._count(self.tenant)
+
+    def values(self) -> Iterator[Any]:  # type: ignore[override]
+        for _, entity in self.collection._scan(self.tenant):
+            yield entity
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:  # type: ignore[override]
+        for skey, entity in self.collection._scan(self.tenant):
+            yield self.collection.key_type(skey), entity
+
+
+class TenantPartitions(MutableMapping):
+    """
+    Tenant -> TenantView mapping over a partitioned collection.
+
+    Stands in for nested `Dict[tenant, Dict[key, entity]]` stores: any
+    tenant can be indexed (an unknown tenant is simply empty), and
+    assigning a mapping replaces that tenant's entities.
+    """
+
+    def __init__(self, collection: Collection):
+        self.collection = collection
+
+    def __getitem__(self, tenant: Any) -> TenantView:
+        return self.collection.tenant(tenant)
+
+    def get(self, tenant: Any, default: Any = None) -> TenantView:  # type: ignore[override]
+        return self.collection.tenant(tenant)
+
+    def __setitem__(self, tenant: Any, entities: MutableMapping) -> None:
+        view = self.collection.tenant(tenant)
+        view.clear()
+        view.update(entities)
+
+    def __delitem__(self, tenant: Any) -> None:
+        self.collection.tenant(tenant).clear()
+
+    def __contains__(self, tenant: Any) -> bool:
+        return len(self.collection.tenant(tenant)) > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        collection = self.collection
+        with collection.repository._lock:
+            rows = collection._conn.execute(
+                "SELECT tenant FROM entities WHERE collection = ?"
+                " GROUP BY tenant ORDER BY MIN(seq)",
+                (collection.name,),
+            ).fetchall()
+            overlay = collection._overlay()
+            changed = set(overlay) | set(collection._deleted)
+            affected = {t for _, t in collection._stored(changed).values()}
+
+        # Tenants whose stored rows have pending changes may have emptied
+        tenants = [t for (t,) in rows if t not in affected or len(collection.tenant(t)) > 0]
+        seen = set(tenants)
+        for entity in overlay.values():
+            tenant = index_value(getattr(entity, collection.tenant_attr))
+            if tenant not in seen:
+                seen.add(tenant)
+                tenants.append(tenant)
+        return iter(tenants)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
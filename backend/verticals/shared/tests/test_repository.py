@@ -0,0 +1,353 @@
+"""
+CHE·NU™ V68 - Shared Entity Repository Tests
+"""
+
+import json
+import pytest
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared import repository as repository_module
+from shared.repository import EntityRepository
+
+
+class Status(str, Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+
+@dataclass
+class Item:
+    id: UUID
+    user_id: str
+    status: Status = Status.OPEN
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Address:
+    city: str
+    postal_code: str = ""
+
+
+@dataclass
+class Record:
+    id: str
+    amount: Decimal
+    due: date
+    updated_at: datetime
+    address: Optional[Address] = None
+    counts: Dict[Status, int] = field(default_factory=dict)
+    owner: Optional[UUID] = None
+
+
+def make_items(count: int) -> List[Item]:
+    return [
+        Item(id=uuid4(), user_id=f"user_{i % 2}", tags=["even"] if i % 2 == 0 else [])
+        for i in range(count)
+    ]
+
+
+def open_items(repository: EntityRepository):
+    return repository.collection(
+        "items", Item, key_type=UUID, tenant="user_id", indexes=("status", "tags")
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "entities.db")
+
+
+class TestCollection:
+    """Dict-compatible collection behaviour."""
+
+    def test_behaves_like_dict(self, db_path):
+        items = open_items(EntityRepository(db_path))
+        stored = make_items(4)
+        for item in stored:
+            items[item.id] = item
+
+        assert len(items) == 4
+        assert list(items) == [i.id for i in stored]
+        assert items[stored[1].id] is stored[1]
+        assert stored[2].id in items
+        assert items.get(uuid4()) is None
+
+        del items[stored[0].id]
+        assert stored[0].id not in items
+        with pytest.raises(KeyError):
+            items[stored[0].id]
+
+    def test_reinserted_key_moves_to_end(self, db_path):
+        items = open_items(EntityRepository(db_path))
+        stored = make_items(3)
+        for item in stored:
+            items[item.id] = item
+
+        del items[stored[0].id]
+        items[stored[0].id] = stored[0]
+
+        assert list(items) == [stored[1].id, stored[2].id, stored[0].id]
+
+
+class TestDurability:
+    """Write-behind flushing and restarts."""
+
+    def test_writes_are_batched(self, db_path):
+        repository = EntityRepository(db_path, batch_size=3, flush_interval=3600)
+        items = open_items(repository)
+        stored = make_items(5)
+        for item in stored[:2]:
+            items[item.id] = item
+
+        # Nothing committed yet: another connection sees no rows
+        assert len(open_items(EntityRepository(db_path))) == 0
+
+        items[stored[2].id] = stored[2]
+        assert len(open_items(EntityRepository(db_path))) == 3
+
+    def test_in_place_mutations_survive_restart(self, db_path):
+        repository = EntityRepository(db_path, cache_size=2)
+        items = open_items(repository)
+        stored = make_items(6)
+        for item in stored:
+            items[item.id] = item
+
+        items[stored[0].id].status = Status.CLOSED
+        repository.close()
+
+        reopened = open_items(EntityRepository(db_path))
+        assert [i.id for i in reopened.values()] == [i.id for i in stored]
+        assert reopened[stored[0].id].status == Status.CLOSED
+
+    def test_identity_map_is_bounded(self, db_path):
+        items = open_items(EntityRepository(db_path, cache_size=3))
+        for item in make_items(10):
+            items[item.id] = item
+
+        assert sum(1 for _ in items.values()) == 10
+        assert len(items._identity) == 3
+
+
+class TestSharing:
+    """Several workers on one database file."""
+
+    def test_idle_worker_holds_no_write_lock(self, db_path):
+        repository = EntityRepository(db_path, batch_size=1000, flush_interval=3600, cache_size=2)
+        items = open_items(repository)
+        for item in make_items(6):
+            items[item.id] = item  # evictions write rows
+
+        other = repository_module.sqlite3.connect(db_path, timeout=0)
+        other.execute("BEGIN IMMEDIATE")  # "database is locked" if a write is still open
+        other.rollback()
+        assert len(open_items(EntityRepository(db_path))) == 4
+
+    def test_buffered_changes_are_flushed_by_timer(self, db_path):
+        repository = EntityRepository(db_path, batch_size=1000, flush_interval=0.05)
+        items = open_items(repository)
+        item = make_items(1)[0]
+        items[item.id] = item
+
+        other = open_items(EntityRepository(db_path, flush_interval=3600))
+        deadline = time.monotonic() + 5
+        while item.id not in other and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert item.id in other
+        assert repository._timer is None
+
+    def test_cached_entities_see_other_workers_writes(self, db_path):
+        mine = EntityRepository(db_path, flush_interval=3600)
+        theirs = EntityRepository(db_path, flush_interval=3600)
+        items, their_items = open_items(mine), open_items(theirs)
+        stored = make_items(2)
+        for item in stored:
+            items[item.id] = item
+        mine.flush()
+
+        their_items[stored[0].id].status = Status.CLOSED
+        del their_items[stored[1].id]
+        theirs.flush()
+
+        # Refreshed in place: callers keep the same object
+        assert items[stored[0].id] is stored[0]
+        assert stored[0].status == Status.CLOSED
+        assert items.get(stored[1].id) is None
+        assert list(items) == [stored[0].id]
+
+    def test_local_changes_are_not_overwritten_by_refresh(self, db_path):
+        mine = EntityRepository(db_path, flush_interval=3600)
+        theirs = EntityRepository(db_path, flush_interval=3600)
+        items, their_items = open_items(mine), open_items(theirs)
+        item = make_items(1)[0]
+        items[item.id] = item
+        mine.flush()
+
+        item.tags.append("mine")
+        their_items[item.id].status = Status.CLOSED
+        theirs.flush()
+
+        assert items[item.id].tags == ["even", "mine"]
+        mine.flush()
+        assert open_items(EntityRepository(db_path))[item.id].status == Status.OPEN
+
+
+class TestQueries:
+    """Secondary indexes and tenant views."""
+
+    def test_find_by_index(self, db_path):
+        items = open_items(EntityRepository(db_path))
+        stored = make_items(6)
+        for item in stored:
+            items[item.id] = item
+        stored[1].status = Status.CLOSED  # picked up before querying
+
+        assert items.find(status=Status.CLOSED) == [stored[1]]
+        assert items.find(tags="even") == stored[0::2]
+        assert items.find(tenant="user_1", status=Status.OPEN) == [stored[3], stored[5]]
+
+        with pytest.raises(ValueError):
+            items.find(user_id="user_1")
+
+    def test_tenant_views(self, db_path):
+        items = open_items(EntityRepository(db_path))
+        stored = make_items(5)
+        for item in stored:
+            items[item.id] = item
+
+        view = items.tenant("user_0")
+        assert len(view) == 3
+        assert list(view.values()) == stored[0::2]
+        with pytest.raises(KeyError):
+            view[stored[1].id]
+        with pytest.raises(ValueError):
+            view[stored[1].id] = stored[1]
+
+        partitions = items.by_tenant()
+        assert list(partitions) == ["user_0", "user_1"]
+        assert "user_2" not in partitions
+        assert len(partitions.get("user_2", {})) == 0
+
+    def test_pending_changes_are_visible_without_flushing(self, db_path):
+        repository = EntityRepository(db_path, batch_size=1000, flush_interval=3600)
+        items = open_items(repository)
+        stored = make_items(6)
+        for item in stored[:4]:
+            items[item.id] = item
+        repository.flush()
+
+        del items[stored[0].id]
+        items[stored[4].id] = stored[4]
+        items[stored[1].id].user_id = "user_0"   # moved tenant in place
+        items[stored[2].id].status = Status.CLOSED
+
+        assert len(items) == 4
+        assert len(items.tenant("user_1")) == 1
+        assert list(items) == [i.id for i in stored[1:5]]
+        assert list(items.tenant("user_0").values()) == [stored[1], stored[2], stored[4]]
+        assert items.find(status=Status.OPEN) == [stored[1], stored[3], stored[4]]
+        assert items.find(tenant="user_0", status=Status.CLOSED) == [stored[2]]
+        assert list(items.by_tenant()) == ["user_0", "user_1"]
+
+        # None of the reads above wrote anything
+        assert set(items._dirty) == {str(stored[4].id)}
+        assert set(items._deleted) == {str(stored[0].id)}
+        other = open_items(EntityRepository(db_path))
+        assert list(other) == [i.id for i in stored[:4]]
+        assert other[stored[2].id].status == Status.OPEN
+
+
+class TestStorage:
+    """JSON encoding and change tracking."""
+
+    def test_entities_are_stored_as_json(self, db_path):
+        repository = EntityRepository(db_path)
+        records = repository.collection("records", Record)
+        record = Record(
+            id="r1",
+            amount=Decimal("12.50"),
+            due=date(2026, 3, 1),
+            updated_at=datetime(2026, 2, 1, 9, 30),
+            address=Address(city="Montreal"),
+            counts={Status.OPEN: 2},
+            owner=uuid4(),
+        )
+        records[record.id] = record
+        repository.close()
+
+        (data,) = repository_module.sqlite3.connect(db_path).execute(
+            "SELECT data FROM entities WHERE collection = 'records'"
+        ).fetchone()
+        assert json.loads(data)["amount"] == "12.50"
+
+        reloaded = EntityRepository(db_path).collection("records", Record)["r1"]
+        assert reloaded == record
+        assert isinstance(reloaded.address, Address)
+        assert list(reloaded.counts) == [Status.OPEN]
+
+    def test_flush_writes_only_changed_entities(self, db_path):
+        repository = EntityRepository(db_path, batch_size=1000, flush_interval=3600)
+        items = open_items(repository)
+        stored = make_items(50)
+        for item in stored:
+            items[item.id] = item
+        repository.flush()
+
+        statements = []
+        repository._conn.set_trace_callback(statements.append)
+        items[stored[7].id].status = Status.CLOSED
+        items[stored[8].id]  # read, unchanged
+        repository.flush()
+
+        writes = [s for s in statements if s.startswith("INSERT INTO entities")]
+        assert len(writes) == 1 and str(stored[7].id) in writes[0]
+
+    def test_work_per_insert_is_constant(self, db_path, monkeypatch):
+        encoded = []
+        encode = repository_module.encode_entity
+        monkeypatch.setattr(
+            repository_module, "encode_entity", lambda e: encoded.append(e) or encode(e)
+        )
+        items = open_items(EntityRepository(db_path, batch_size=50, flush_interval=3600))
+        for item in make_items(500):
+            items[item.id] = item
+            len(items)
+            items.find(status=Status.CLOSED)
+
+        # Each entity is encoded once when written, not once per flush or read
+        assert len(encoded) <= 500
+
+    def test_writes_through_evicted_references_are_kept(self, db_path):
+        repository = EntityRepository(db_path, cache_size=2)
+        items = open_items(repository)
+        stored = make_items(6)
+        for item in stored:
+            items[item.id] = item
+        assert str(stored[0].id) not in items._identity
+
+        # Still referenced by the caller: the same object comes back
+        held = stored[0]
+        held.status = Status.CLOSED
+        assert items[held.id] is held
+
+        # Mutated after eviction, then released before any flush
+        items.evict()
+        stored[1].tags.append("late")
+        del stored[:]
+        held = None
+        repository.close()
+
+        reopened = open_items(EntityRepository(db_path))
+        values = list(reopened.values())
+        assert values[0].status == Status.CLOSED
+        assert values[1].tags == ["late"]
@@ -20,8 +20,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 import uuid
-import hashlib
-import json
+
+try:
+    from ..canonical import content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import content_hash
 
 
 # ============================================================================
@@ -32,13 +35,7 @@ def generate_id() -> str:
     return str(uuid.uuid4())
 
 def compute_hash(data: Any) -> str:
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif isinstance(data, bytes):
-        pass
-    else:
-        data = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data)
 
 
 # ============================================================================
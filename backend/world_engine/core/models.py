@@ -13,8 +13,11 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Callable
 from pydantic import BaseModel, Field, computed_field
 import uuid
-import hashlib
-import json
+
+try:
+    from ...canonical import HashMemoModel, canonical_hash
+except ImportError:  # imported as a top-level package
+    from canonical import HashMemoModel, canonical_hash
 
 
 # ============================================================================
@@ -129,7 +132,7 @@ class Slot(BaseModel):
 # WORLD STATE
 # ============================================================================
 
-class WorldState(BaseModel):
+class WorldState(HashMemoModel):
     """
     WorldState = Immutable snapshot of the entire simulation at tick T.
     
@@ -166,16 +169,13 @@ class WorldState(BaseModel):
     @property
     def state_hash(self) -> str:
         """Compute state hash for verification"""
-        content = {
+        return self.memoized_hash("state_hash", lambda: canonical_hash({
             "simulation_id": self.simulation_id,
             "scenario_id": self.scenario_id,
             "tick": self.tick,
             "slots": {k: v.value for k, v in self.slots.items()},
             "previous_state_hash": self.previous_state_hash,
-        }
-        return hashlib.sha256(
-            json.dumps(content, sort_keys=True).encode()
-        ).hexdigest()
+        }))
     
     def get_slot(self, name: str) -> Optional[Slot]:
         """Get slot by name"""
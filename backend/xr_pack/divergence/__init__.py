@@ -2,6 +2,8 @@
 from .calculator import (
     TimelineSnapshot,
     Timeline,
+    AlignedTimelines,
+    align_timelines,
     DivergenceCalculator,
     create_timeline_from_states,
     calculate_divergence,
@@ -10,6 +12,8 @@ from .calculator import (
 __all__ = [
     "TimelineSnapshot",
     "Timeline",
+    "AlignedTimelines",
+    "align_timelines",
     "DivergenceCalculator",
     "create_timeline_from_states",
     "calculate_divergence",
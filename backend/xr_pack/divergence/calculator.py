@@ -8,11 +8,14 @@ Principle: Help executives see WHERE and WHY trajectories diverge
 ============================================================================
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 import math
 
+import numpy as np
+
 from ..models.artifacts import (
     DivergencePoint,
     DivergenceConfig,
@@ -74,6 +77,85 @@ class Timeline:
         return list(first.slots.keys())
 
 
+# ============================================================================
+# ALIGNMENT
+# ============================================================================
+
+@dataclass
+class AlignedTimelines:
+    """
+    Baseline and scenarios aligned on the baseline step axis.
+    
+    Attributes:
+        steps: Baseline steps (T), ascending
+        slots: Union of baseline and scenario slots (K)
+        baseline: (T, K) baseline values
+        values: (S, T, K) scenario values
+        step_mask: (S, T) True where the scenario has a snapshot at the step
+        slot_mask: (S, K) True where the slot belongs to baseline ∪ scenario
+    """
+    steps: List[int]
+    slots: List[str]
+    baseline: np.ndarray
+    values: np.ndarray
+    step_mask: np.ndarray
+    slot_mask: np.ndarray
+
+
+def align_timelines(baseline: Timeline, scenarios: List[Timeline]) -> AlignedTimelines:
+    """
+    Align a baseline and scenarios into dense step×slot matrices.
+    
+    Each snapshot is read exactly once. Missing slot values default
+    to 0.0, matching TimelineSnapshot.get_value.
+    """
+    steps = baseline.steps
+    step_index = {step: i for i, step in enumerate(steps)}
+    
+    # Ordered union: baseline slots first, then new slots per scenario
+    slot_index: Dict[str, int] = {}
+    for slot in baseline.slots:
+        slot_index.setdefault(slot, len(slot_index))
+    scenario_slots = [scenario.slots for scenario in scenarios]
+    for slots in scenario_slots:
+        for slot in slots:
+            slot_index.setdefault(slot, len(slot_index))
+    slots = list(slot_index)
+    
+    num_steps, num_slots = len(steps), len(slots)
+    
+    base_matrix = np.zeros((num_steps, num_slots), dtype=np.float64)
+    for step, t_idx in step_index.items():
+        snap_slots = baseline.snapshots[step].slots
+        base_matrix[t_idx] = [snap_slots.get(slot, 0.0) for slot in slots]
+    
+    values = np.zeros((len(scenarios), num_steps, num_slots), dtype=np.float64)
+    step_mask = np.zeros((len(scenarios), num_steps), dtype=bool)
+    slot_mask = np.zeros((len(scenarios), num_slots), dtype=bool)
+    base_slot_idx = [slot_index[slot] for slot in baseline.slots]
+    
+    for s_idx, scenario in enumerate(scenarios):
+        slot_mask[s_idx, base_slot_idx] = True
+        slot_mask[s_idx, [slot_index[slot] for slot in scenario_slots[s_idx]]] = True
+        
+        for step, snapshot in scenario.snapshots.items():
+            t_idx = step_index.get(step)
+            if t_idx is None:
+                continue
+            snap_slots = snapshot.slots
+            values[s_idx, t_idx] = [snap_slots.get(slot, 0.0) for slot in slots]
+            step_mask[s_idx, t_idx] = True
+    
+    return AlignedTimelines(
+        steps=steps,
+        slots=slots,
+        baseline=base_matrix,
+        values=values,
+        step_mask=step_mask,
+        slot_mask=slot_mask,
+    )
+
+
 # ============================================================================
 # DIVERGENCE CALCULATOR
 # ============================================================================
@@ -139,8 +221,7 @@ class DivergenceCalculator:
         # Calculate for each scenario
         all_divergence_points: List[DivergencePoint] = []
         
-        for scenario in self.scenarios:
-            scenario_diff, points = self._calculate_scenario_diff(scenario)
+        for scenario_diff, points in self._calculate_scenario_diffs(self.scenarios):
             diff.scenarios.append(scenario_diff)
             all_divergence_points.extend(points)
         
@@ -170,80 +251,96 @@ class DivergenceCalculator:
         scenario: Timeline,
     ) -> Tuple[ScenarioDiff, List[DivergencePoint]]:
         """Calculate diff for a single scenario"""
+        return self._calculate_scenario_diffs([scenario])[0]
+    
+    def _calculate_scenario_diffs(
+        self,
+        scenarios: List[Timeline],
+    ) -> List[Tuple[ScenarioDiff, List[DivergencePoint]]]:
+        """
+        Calculate diffs for all scenarios in one batched pass.
+        
+        Timelines are aligned once on the baseline step axis into a
+        (scenario × step × slot) tensor; deltas, threshold masks and
+        summary stats are array operations. Only divergent cells are
+        turned back into Python objects.
+        """
         if self.baseline is None:
             raise ValueError("Baseline not set")
         
-        scenario_diff = ScenarioDiff(
-            baseline_id=self.baseline.scenario_id,
-            scenario_id=scenario.scenario_id,
-            scenario_name=scenario.scenario_name,
+        if not scenarios:
+            return []
+        
+        aligned = align_timelines(self.baseline, scenarios)
+        thresholds = np.array(
+            [self._get_threshold_for_slot(slot) for slot in aligned.slots],
+            dtype=np.float64,
         )
         
-        divergence_points: List[DivergencePoint] = []
+        # (S, T, K) deltas; cells outside valid steps or outside a
+        # scenario's own slot set are zeroed so they never count.
+        deltas = aligned.values - aligned.baseline[np.newaxis, :, :]
+        cell_mask = aligned.step_mask[:, :, np.newaxis] & aligned.slot_mask[:, np.newaxis, :]
+        deltas = np.where(cell_mask, deltas, 0.0)
+        abs_deltas = np.abs(deltas)
         
-        # Get all steps
-        all_steps = sorted(set(self.baseline.steps) | set(scenario.steps))
-        all_slots = list(set(self.baseline.slots) | set(scenario.slots))
+        exceeds = abs_deltas > thresholds[np.newaxis, np.newaxis, :]
+        exceeds &= cell_mask
+        divergent_steps = exceeds.any(axis=2)
         
-        # Initialize deltas
-        for slot in all_slots:
-            scenario_diff.deltas[slot] = []
+        max_deltas = abs_deltas.max(axis=(1, 2), initial=0.0)
+        total_divergence = abs_deltas.sum(axis=(1, 2))
         
-        max_delta = 0
-        total_divergence = 0
+        results: List[Tuple[ScenarioDiff, List[DivergencePoint]]] = []
         
-        for step in all_steps:
-            base_snap = self.baseline.get_snapshot(step)
-            scen_snap = scenario.get_snapshot(step)
+        for s_idx, scenario in enumerate(scenarios):
+            scenario_diff = ScenarioDiff(
+                baseline_id=self.baseline.scenario_id,
+                scenario_id=scenario.scenario_id,
+                scenario_name=scenario.scenario_name,
+            )
             
-            if base_snap is None or scen_snap is None:
-                continue
+            valid = aligned.step_mask[s_idx]
+            scenario_deltas = deltas[s_idx][valid]
+            for k_idx, slot in enumerate(aligned.slots):
+                if aligned.slot_mask[s_idx, k_idx]:
+                    scenario_diff.deltas[slot] = scenario_deltas[:, k_idx].tolist()
             
-            step_signals: Dict[str, float] = {}
-            step_reasons: List[str] = []
-            is_divergent = False
+            scenario_diff.max_delta = float(max_deltas[s_idx])
+            scenario_diff.total_divergence = float(total_divergence[s_idx])
             
-            for slot in all_slots:
-                base_val = base_snap.get_value(slot)
-                scen_val = scen_snap.get_value(slot)
-                delta = scen_val - base_val
-                
-                scenario_diff.deltas[slot].append(delta)
-                
-                abs_delta = abs(delta)
-                max_delta = max(max_delta, abs_delta)
-                total_divergence += abs_delta
+            divergence_points: List[DivergencePoint] = []
+            
+            for t_idx in np.flatnonzero(divergent_steps[s_idx]):
+                step = aligned.steps[t_idx]
+                step_signals: Dict[str, float] = {}
+                step_reasons: List[str] = []
                 
-                # Check thresholds
-                threshold = self._get_threshold_for_slot(slot)
-                if abs_delta > threshold:
-                    is_divergent = True
+                for k_idx in np.flatnonzero(exceeds[s_idx, t_idx]):
+                    slot = aligned.slots[k_idx]
+                    delta = float(deltas[s_idx, t_idx, k_idx])
                     step_signals[f"{slot}_delta"] = delta
                     
-                    # Generate reason
                     direction = "increased" if delta > 0 else "decreased"
-                    step_reasons.append(f"{slot} {direction} by {abs_delta:.2f}")
-            
-            # Add events as reasons
-            if scen_snap.events:
-                step_reasons.extend(scen_snap.events[:3])
-            
-            if is_divergent:
-                severity = self._calculate_severity(step_signals)
+                    step_reasons.append(f"{slot} {direction} by {abs(delta):.2f}")
+                
+                # Add events as reasons
+                scen_snap = scenario.get_snapshot(step)
+                if scen_snap is not None and scen_snap.events:
+                    step_reasons.extend(scen_snap.events[:3])
                 
                 point = DivergencePoint(
                     step=step,
                     signals=step_signals,
                     top_reasons=step_reasons[:5],
                     summary=self._generate_point_summary(step, step_signals, scenario),
-                    severity=severity,
+                    severity=self._calculate_severity(step_signals),
                 )
                 divergence_points.append(point)
+            
+            results.append((scenario_diff, divergence_points))
         
-        scenario_diff.max_delta = max_delta
-        scenario_diff.total_divergence = total_divergence
-        
-        return scenario_diff, divergence_points
+        return results
     
     def _get_threshold_for_slot(self, slot: str) -> float:
         """Get threshold for a slot"""
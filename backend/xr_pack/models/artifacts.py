@@ -14,7 +14,11 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, computed_field
 import uuid
 import hashlib
-import json
+
+try:
+    from ...canonical import CanonicalHasher, HashMemoModel
+except ImportError:  # imported as a top-level package
+    from canonical import CanonicalHasher, HashMemoModel
 
 
 # ============================================================================
@@ -317,7 +321,7 @@ class ReplayFrame(BaseModel):
     highlights: List[str] = Field(default_factory=list)
 
 
-class ReplayChunk(BaseModel):
+class ReplayChunk(HashMemoModel):
     """
     Single replay chunk (replay/chunk_XXXX.v1.json)
     """
@@ -334,8 +338,10 @@ class ReplayChunk(BaseModel):
     @property
     def sha256(self) -> str:
         """Compute chunk hash"""
-        content = json.dumps([f.model_dump() for f in self.frames], sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()
+        return self.memoized_hash(
+            "sha256",
+            lambda: CanonicalHasher(f.model_dump() for f in self.frames).hexdigest(),
+        )
 
 
 class ChunkReference(BaseModel):
@@ -239,6 +239,83 @@ class TestDivergenceCalculator:
         assert diff.scenarios[0].scenario_id == "aggressive"
         assert diff.scenarios[1].scenario_id == "conservative"
 
+    def test_scenario_diff_expected_values(self):
+        """Only steps present in both timelines are compared"""
+        calculator = DivergenceCalculator(DivergenceConfig(budget_threshold=10000))
+
+        baseline = Timeline("baseline", "Baseline")
+        for i in range(10):
+            baseline.add_snapshot(TimelineSnapshot(step=i, slots={"Budget": 1000000}))
+        calculator.set_baseline(baseline)
+
+        scen = Timeline("scen", "Scenario")
+        for i in range(2, 12):
+            scen.add_snapshot(TimelineSnapshot(step=i, slots={"Budget": 1000000 - i * 15000}))
+
+        scenario_diff, points = calculator._calculate_scenario_diff(scen)
+
+        assert scenario_diff.deltas == {"Budget": [-15000.0 * i for i in range(2, 10)]}
+        assert scenario_diff.max_delta == 135000.0
+        assert scenario_diff.total_divergence == 15000.0 * sum(range(2, 10))
+        assert [p.step for p in points] == list(range(2, 10))
+        assert points[0].signals == {"Budget_delta": -30000.0}
+        assert points[0].top_reasons == ["Budget decreased by 30000.00"]
+
+    def test_batched_matches_reference(self):
+        """Batched diffs match a plain per-step, per-slot reference"""
+        config = DivergenceConfig(budget_threshold=10000, risk_threshold=0.05)
+        calculator = DivergenceCalculator(config)
+
+        baseline = Timeline("baseline", "Baseline")
+        for i in range(12):
+            baseline.add_snapshot(TimelineSnapshot(
+                step=i,
+                slots={"Budget": 1000000 - i * 1000, "Risk": 0.1},
+            ))
+        calculator.set_baseline(baseline)
+
+        scenarios = []
+        for factor in (1, 3, 5):
+            scen = Timeline(f"scen_{factor}", f"Scenario {factor}")
+            for i in range(factor, 14, 1 + factor % 2):
+                slots = {"Budget": 1000000 - i * 7000 * factor, "Risk": 0.1 + i * 0.01 * factor}
+                if factor == 5:
+                    slots["Velocity"] = i * 0.05
+                    del slots["Risk"]
+                scen.add_snapshot(TimelineSnapshot(step=i, slots=slots))
+            scenarios.append(scen)
+
+        def reference(scen):
+            slots = list(baseline.slots) + [s for s in scen.slots if s not in baseline.slots]
+            deltas = {slot: [] for slot in slots}
+            divergent_steps = []
+            for step in baseline.steps:
+                scen_snap = scen.get_snapshot(step)
+                if scen_snap is None:
+                    continue
+                base_snap = baseline.get_snapshot(step)
+                divergent = False
+                for slot in slots:
+                    delta = scen_snap.get_value(slot) - base_snap.get_value(slot)
+                    deltas[slot].append(delta)
+                    if abs(delta) > calculator._get_threshold_for_slot(slot):
+                        divergent = True
+                if divergent:
+                    divergent_steps.append(step)
+            return deltas, divergent_steps
+
+        batched = calculator._calculate_scenario_diffs(scenarios)
+
+        for scen, (scenario_diff, points) in zip(scenarios, batched):
+            deltas, divergent_steps = reference(scen)
+            assert scenario_diff.deltas.keys() == deltas.keys()
+            for slot, values in deltas.items():
+                assert scenario_diff.deltas[slot] == pytest.approx(values)
+            all_deltas = [abs(d) for values in deltas.values() for d in values]
+            assert scenario_diff.max_delta == pytest.approx(max(all_deltas))
+            assert scenario_diff.total_divergence == pytest.approx(sum(all_deltas))
+            assert [p.step for p in points] == divergent_steps
+
 
 # ============================================================================
 # XR PACK BUILDER TESTS
@@ -16,9 +16,13 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import uuid
-import hashlib
 import json
 
+try:
+    from ..canonical import content_hash
+except ImportError:  # imported as a top-level package
+    from canonical import content_hash
+
 
 # ============================================================================
 # ENUMS
@@ -321,11 +325,7 @@ def generate_id() -> str:
 
 def compute_hash(data: Any) -> str:
     """Compute hash of data"""
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    elif not isinstance(data, bytes):
-        data = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
-    return hashlib.sha256(data).hexdigest()
+    return content_hash(data)
 
 
 def sign_xr_pack(pack: XRPack, signer_id: str) -> str: